@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import ast
-import json
+import contextlib
+import hashlib
 import os
 import re
 import shutil
 import subprocess
+import time
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -22,10 +24,16 @@ from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeEl
 from specfact_cli.analyzers.contract_extractor import ContractExtractor
 from specfact_cli.analyzers.control_flow_analyzer import ControlFlowAnalyzer
 from specfact_cli.analyzers.requirement_extractor import RequirementExtractor
+from specfact_cli.analyzers.semgrep_index import SemgrepBatchRunner, SemgrepFindingIndex
 from specfact_cli.analyzers.test_pattern_extractor import TestPatternExtractor
 from specfact_cli.migrations.plan_migrator import get_current_schema_version
 from specfact_cli.models.plan import Feature, Idea, Metadata, PlanBundle, Product, Story
+from specfact_cli.utils.analysis_cache import AnalysisCache, hash_config_files
+from specfact_cli.utils.ast_cache import get_parsed_module_cache
+from specfact_cli.utils.executors import ExecutorConfig, ExecutorKind, run_ordered
 from specfact_cli.utils.feature_keys import to_classname_key, to_sequential_key
+from specfact_cli.utils.profiling import profile_phase, record_file_timing
+from specfact_cli.utils.repo_walker import DEFAULT_EXCLUDED_DIRS, ROOT_EXCLUDED_DIRS, list_python_files
 
 
 console = Console()
@@ -58,6 +66,9 @@ class CodeAnalyzer:
         plan_name: str | None = None,
         entry_point: Path | None = None,
         incremental_callback: Any | None = None,
+        analysis_cache: AnalysisCache | None = None,
+        executor_config: ExecutorConfig | None = None,
+        semgrep_enabled: bool | None = None,
     ) -> None:
         """
         Initialize code analyzer.
@@ -69,12 +80,20 @@ class CodeAnalyzer:
             plan_name: Custom plan name (will be used for idea.title, optional)
             entry_point: Optional entry point path for partial analysis (relative to repo_path)
             incremental_callback: Optional callback function(features_count, themes) for incremental results (Phase 4.9)
+            analysis_cache: Optional persistent cache for per-file results (unchanged files are not re-analyzed)
+            executor_config: Executor for per-file analysis (thread/process/serial; default: chosen from core count and repo size)
+            semgrep_enabled: Whether to use Semgrep (default: if a rule set is found and `semgrep` is installed;
+                False skips the availability check)
         """
         self.repo_path = Path(repo_path).resolve()
         self.confidence_threshold = confidence_threshold
         self.key_format = key_format
         self.plan_name = plan_name
         self.incremental_callback = incremental_callback
+        self.analysis_cache = analysis_cache
+        self.cached_file_count = 0  # Files whose Phase 3 results were served from analysis_cache
+        self.executor_config = executor_config or ExecutorConfig()
+        self.last_executor_config: ExecutorConfig | None = None  # Resolved executor used by the last analyze()
         self.entry_point: Path | None = None
         if entry_point is not None:
             # Resolve entry point relative to repo_path
@@ -120,9 +139,37 @@ class CodeAnalyzer:
             self.semgrep_quality_config = tools_quality_config
         # Disable if Semgrep not available or config missing
         # Check TEST_MODE first to avoid any subprocess calls in tests
-        if os.environ.get("TEST_MODE") == "true" or self.semgrep_config is None or not self._check_semgrep_available():
+        if (
+            semgrep_enabled is False
+            or os.environ.get("TEST_MODE") == "true"
+            or self.semgrep_config is None
+            or (semgrep_enabled is None and not self._check_semgrep_available())
+        ):
             self.semgrep_enabled = False
 
+        # Settings that change per-file results (part of the persistent cache key); story acceptance
+        # criteria are derived from the repository's test files, so they are part of it as well
+        self._cache_settings: dict[str, Any] = {
+            "confidence_threshold": self.confidence_threshold,
+            "key_format": self.key_format,
+            "semgrep_rules": (
+                hash_config_files([self.semgrep_config, self.semgrep_quality_config]) if self.semgrep_enabled else None
+            ),
+            "test_files": self._test_files_digest(analysis_cache) if analysis_cache is not None else None,
+        }
+
+        # Batched Semgrep: files are scanned in shards before Phase 3 and findings looked up per file
+        self.semgrep_index = SemgrepFindingIndex()
+        self.semgrep_runner: SemgrepBatchRunner | None = None
+        if self.semgrep_enabled and self.semgrep_config is not None:
+            configs = [self.semgrep_config]
+            # Also include code-quality config if available (for anti-patterns)
+            if self.semgrep_quality_config is not None:
+                configs.append(self.semgrep_quality_config)
+            self.semgrep_runner = SemgrepBatchRunner(
+                configs, analysis_cache=analysis_cache, rules_hash=self._cache_settings["semgrep_rules"]
+            )
+
     @beartype
     @ensure(lambda result: isinstance(result, PlanBundle), "Must return PlanBundle")
     @ensure(
@@ -150,188 +197,105 @@ class CodeAnalyzer:
             console=console,
         ) as progress:
             # Phase 1: Discover Python files
-            task1 = progress.add_task("[cyan]Phase 1: Discovering Python files...", total=None)
-            if self.entry_point:
-                # Scope analysis to entry point directory
-                python_files = list(self.entry_point.rglob("*.py"))
-                entry_point_rel = self.entry_point.relative_to(self.repo_path)
-                progress.update(
-                    task1,
-                    description=f"[green]✓ Found {len(python_files)} Python files in {entry_point_rel}",
-                )
-            else:
-                # Full repository analysis
-                python_files = list(self.repo_path.rglob("*.py"))
-                progress.update(task1, description=f"[green]✓ Found {len(python_files)} Python files")
-            progress.remove_task(task1)
+            with profile_phase("discovery") as phase:
+                task1 = progress.add_task("[cyan]Phase 1: Discovering Python files...", total=None)
+                if self.entry_point:
+                    # Scope analysis to entry point directory
+                    python_files = list_python_files(self.repo_path, subdir=self.entry_point)
+                    entry_point_rel = self.entry_point.relative_to(self.repo_path)
+                    progress.update(
+                        task1,
+                        description=f"[green]✓ Found {len(python_files)} Python files in {entry_point_rel}",
+                    )
+                else:
+                    # Full repository analysis
+                    python_files = list_python_files(self.repo_path)
+                    progress.update(task1, description=f"[green]✓ Found {len(python_files)} Python files")
+                progress.remove_task(task1)
+                if phase is not None:
+                    phase.attributes["files"] = len(python_files)
 
             # Phase 2: Build dependency graph
-            task2 = progress.add_task("[cyan]Phase 2: Building dependency graph...", total=None)
-            self._build_dependency_graph(python_files)
-            progress.update(task2, description="[green]✓ Dependency graph built")
-            progress.remove_task(task2)
+            with profile_phase("dependency_graph", files=len(python_files)):
+                task2 = progress.add_task("[cyan]Phase 2: Building dependency graph...", total=None)
+                self._build_dependency_graph(python_files)
+                progress.update(task2, description="[green]✓ Dependency graph built")
+                progress.remove_task(task2)
 
             # Phase 3: Analyze files and extract features (parallelized)
-            task3 = progress.add_task(
-                "[cyan]Phase 3: Analyzing files and extracting features...", total=len(python_files)
-            )
+            with profile_phase("analysis", files=len(python_files)) as phase:
+                task3 = progress.add_task(
+                    "[cyan]Phase 3: Analyzing files and extracting features...", total=len(python_files)
+                )
 
-            # Filter out files to skip
-            files_to_analyze = [f for f in python_files if not self._should_skip_file(f)]
+                # Filter out files to skip
+                files_to_analyze = [f for f in python_files if not self._should_skip_file(f)]
+
+                # Process files on the configured executor (thread pool, process pool or serial).
+                # Results are merged in file order, so output is deterministic across executor modes.
+                for completed_count, (file_path, results, error) in enumerate(
+                    self._iter_file_results(files_to_analyze), start=1
+                ):
+                    if error is not None:
+                        console.print(f"[dim]⚠ Warning: Failed to analyze {file_path}: {error}[/dim]")
+                    elif results is not None:
+                        prev_features_count = len(self.features)
+                        self._merge_analysis_results(results)
+
+                        # Phase 4.9: Report incremental results for quick first value
+                        if self.incremental_callback and len(self.features) > prev_features_count:
+                            # Only call callback when new features are discovered
+                            self.incremental_callback(len(self.features), sorted(self.themes))
+
+                    # Update progress with feature count in description
+                    features_count = len(self.features)
+                    progress.update(
+                        task3,
+                        completed=completed_count,
+                        description=f"[cyan]Phase 3: Analyzing files and extracting features... ({features_count} features discovered)",
+                    )
 
-            # Process files in parallel
-            # In test mode, use fewer workers to avoid resource contention
-            if os.environ.get("TEST_MODE") == "true":
-                max_workers = max(1, min(2, len(files_to_analyze)))  # Max 2 workers in test mode
-            else:
-                max_workers = max(
-                    1, min(os.cpu_count() or 4, 8, len(files_to_analyze))
-                )  # Cap at 8 workers, ensure at least 1
-            completed_count = 0
-
-            def analyze_file_safe(file_path: Path) -> dict[str, Any]:
-                """Analyze a file and return results (thread-safe)."""
-                return self._analyze_file_parallel(file_path)
-
-            if files_to_analyze:
-                # In test mode, use sequential processing to avoid ThreadPoolExecutor deadlocks
-                is_test_mode = os.environ.get("TEST_MODE") == "true"
-                if is_test_mode:
-                    # Sequential processing in test mode - avoids ThreadPoolExecutor deadlocks entirely
-                    for file_path in files_to_analyze:
-                        try:
-                            results = analyze_file_safe(file_path)
-                            prev_features_count = len(self.features)
-                            self._merge_analysis_results(results)
-                            completed_count += 1
-                            # Update progress with feature count in description
-                            features_count = len(self.features)
-                            progress.update(
-                                task3,
-                                completed=completed_count,
-                                description=f"[cyan]Phase 3: Analyzing files and extracting features... ({features_count} features discovered)",
-                            )
+                # Update progress for skipped files
+                skipped_count = len(python_files) - len(files_to_analyze)
+                if skipped_count > 0:
+                    features_count = len(self.features)
+                    progress.update(
+                        task3,
+                        completed=len(python_files),
+                        description=f"[cyan]Phase 3: Analyzing files and extracting features... ({features_count} features discovered)",
+                    )
 
-                            # Phase 4.9: Report incremental results for quick first value
-                            if self.incremental_callback and len(self.features) > prev_features_count:
-                                # Only call callback when new features are discovered
-                                self.incremental_callback(len(self.features), sorted(self.themes))
-                        except Exception as e:
-                            console.print(f"[dim]⚠ Warning: Failed to analyze {file_path}: {e}[/dim]")
-                            completed_count += 1
-                            features_count = len(self.features)
-                            progress.update(
-                                task3,
-                                completed=completed_count,
-                                description=f"[cyan]Phase 3: Analyzing files and extracting features... ({features_count} features discovered)",
-                            )
-                else:
-                    executor = ThreadPoolExecutor(max_workers=max_workers)
-                    interrupted = False
-                    # In test mode, use wait=False to avoid hanging on shutdown
-                    wait_on_shutdown = not is_test_mode
-                    try:
-                        # Submit all tasks
-                        future_to_file = {executor.submit(analyze_file_safe, f): f for f in files_to_analyze}
-
-                        # Collect results as they complete
-                        try:
-                            for future in as_completed(future_to_file):
-                                try:
-                                    results = future.result()
-                                    # Merge results into instance variables (sequential merge is fast)
-                                    prev_features_count = len(self.features)
-                                    self._merge_analysis_results(results)
-                                    completed_count += 1
-                                    # Update progress with feature count in description
-                                    features_count = len(self.features)
-                                    progress.update(
-                                        task3,
-                                        completed=completed_count,
-                                        description=f"[cyan]Phase 3: Analyzing files and extracting features... ({features_count} features discovered)",
-                                    )
-
-                                    # Phase 4.9: Report incremental results for quick first value
-                                    if self.incremental_callback and len(self.features) > prev_features_count:
-                                        # Only call callback when new features are discovered
-                                        self.incremental_callback(len(self.features), sorted(self.themes))
-                                except KeyboardInterrupt:
-                                    # Cancel remaining tasks and break out of loop immediately
-                                    interrupted = True
-                                    for f in future_to_file:
-                                        if not f.done():
-                                            f.cancel()
-                                    break
-                                except Exception as e:
-                                    # Log error but continue processing
-                                    file_path = future_to_file[future]
-                                    console.print(f"[dim]⚠ Warning: Failed to analyze {file_path}: {e}[/dim]")
-                                    completed_count += 1
-                                    features_count = len(self.features)
-                                    progress.update(
-                                        task3,
-                                        completed=completed_count,
-                                        description=f"[cyan]Phase 3: Analyzing files and extracting features... ({features_count} features discovered)",
-                                    )
-                        except KeyboardInterrupt:
-                            # Also catch KeyboardInterrupt from as_completed() itself
-                            interrupted = True
-                            for f in future_to_file:
-                                if not f.done():
-                                    f.cancel()
-
-                        # If interrupted, re-raise KeyboardInterrupt after breaking out of loop
-                        if interrupted:
-                            raise KeyboardInterrupt
-                    except KeyboardInterrupt:
-                        # Gracefully shutdown executor on interrupt (cancel pending tasks, don't wait)
-                        interrupted = True
-                        executor.shutdown(wait=False, cancel_futures=True)
-                        raise
-                    finally:
-                        # Ensure executor is properly shutdown
-                        # If interrupted, don't wait for tasks (they're already cancelled)
-                        # shutdown() is safe to call multiple times
-                        # In test mode, use wait=False to avoid hanging
-                        if not interrupted:
-                            executor.shutdown(wait=wait_on_shutdown)
-                        else:
-                            # Already shutdown with wait=False, just ensure cleanup
-                            executor.shutdown(wait=False)
-
-            # Update progress for skipped files
-            skipped_count = len(python_files) - len(files_to_analyze)
-            if skipped_count > 0:
-                features_count = len(self.features)
+                cached_note = f" ({self.cached_file_count} unchanged, from cache)" if self.cached_file_count else ""
                 progress.update(
                     task3,
-                    completed=len(python_files),
-                    description=f"[cyan]Phase 3: Analyzing files and extracting features... ({features_count} features discovered)",
+                    description=f"[green]✓ Analyzed {len(python_files)} files{cached_note}, extracted {len(self.features)} features",
                 )
-
-            progress.update(
-                task3,
-                description=f"[green]✓ Analyzed {len(python_files)} files, extracted {len(self.features)} features",
-            )
-            progress.remove_task(task3)
+                progress.remove_task(task3)
+                if phase is not None:
+                    phase.attributes["cached_files"] = self.cached_file_count
 
             # Phase 4: Analyze commit history
-            task4 = progress.add_task("[cyan]Phase 4: Analyzing commit history...", total=None)
-            self._analyze_commit_history()
-            progress.update(task4, description="[green]✓ Commit history analyzed")
-            progress.remove_task(task4)
+            with profile_phase("commit_history"):
+                task4 = progress.add_task("[cyan]Phase 4: Analyzing commit history...", total=None)
+                self._analyze_commit_history()
+                progress.update(task4, description="[green]✓ Commit history analyzed")
+                progress.remove_task(task4)
 
             # Phase 5: Enhance features with dependencies
-            task5 = progress.add_task("[cyan]Phase 5: Enhancing features with dependency information...", total=None)
-            self._enhance_features_with_dependencies()
-            progress.update(task5, description="[green]✓ Features enhanced")
-            progress.remove_task(task5)
+            with profile_phase("dependency_enhancement"):
+                task5 = progress.add_task(
+                    "[cyan]Phase 5: Enhancing features with dependency information...", total=None
+                )
+                self._enhance_features_with_dependencies()
+                progress.update(task5, description="[green]✓ Features enhanced")
+                progress.remove_task(task5)
 
             # Phase 6: Extract technology stack
-            task6 = progress.add_task("[cyan]Phase 6: Extracting technology stack...", total=None)
-            technology_constraints = self._extract_technology_stack_from_dependencies()
-            progress.update(task6, description="[green]✓ Technology stack extracted")
-            progress.remove_task(task6)
+            with profile_phase("technology_stack"):
+                task6 = progress.add_task("[cyan]Phase 6: Extracting technology stack...", total=None)
+                technology_constraints = self._extract_technology_stack_from_dependencies()
+                progress.update(task6, description="[green]✓ Technology stack extracted")
+                progress.remove_task(task6)
 
         # If sequential format, update all keys now that we know the total count
         if self.key_format == "sequential":
@@ -482,7 +446,10 @@ class CodeAnalyzer:
 
     def _run_semgrep_patterns(self, file_path: Path) -> list[dict[str, Any]]:
         """
-        Run Semgrep for pattern detection on a single file.
+        Get Semgrep findings for a single file.
+
+        Findings come from the batch index built before Phase 3; files not in the
+        index (e.g., analyzed outside analyze()) are scanned on demand.
 
         Returns:
             List of Semgrep findings (empty list if Semgrep not available or error)
@@ -491,58 +458,158 @@ class CodeAnalyzer:
         if os.environ.get("TEST_MODE") == "true":
             return []
 
-        if not self.semgrep_enabled or self.semgrep_config is None:
+        if not self.semgrep_enabled or self.semgrep_runner is None:
             return []
 
-        try:
-            # Run feature detection
-            configs = [str(self.semgrep_config)]
-            # Also include code-quality config if available (for anti-patterns)
-            if self.semgrep_quality_config is not None:
-                configs.append(str(self.semgrep_quality_config))
-
-            result = subprocess.run(
-                ["semgrep", "--config", *configs, "--json", str(file_path)],
-                capture_output=True,
-                text=True,
-                timeout=10,  # Reduced timeout for faster failure in tests
-            )
-
-            # Semgrep may return non-zero for valid findings
-            # Only fail if stderr indicates actual error
-            if result.returncode != 0 and ("error" in result.stderr.lower() or "not found" in result.stderr.lower()):
-                return []
-
-            # Parse JSON results
-            findings = json.loads(result.stdout)
-            return findings.get("results", [])
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError, ValueError):
-            # Semgrep not available or config missing - continue without it
-            return []
+        if file_path not in self.semgrep_index:
+            self.semgrep_runner.scan([file_path], self.semgrep_index)
+        return self.semgrep_index.findings_for(file_path)
 
     def _should_skip_file(self, file_path: Path) -> bool:
-        """Check if file should be skipped."""
-        skip_patterns = [
-            "__pycache__",
-            ".git",
-            "venv",
-            ".venv",
-            "env",
-            ".pytest_cache",
-            "htmlcov",
-            "dist",
-            "build",
-            ".eggs",
-            "tests",  # Skip test files
-        ]
+        """
+        Check if file should be skipped.
 
-        return any(pattern in str(file_path) for pattern in skip_patterns)
+        Matches whole directory names (not substrings), so modules such as
+        `environment.py` or packages such as `build_tools/` are still analyzed.
+        """
+        try:
+            parts = file_path.relative_to(self.repo_path).parts
+        except ValueError:
+            parts = file_path.parts
+        directories = parts[:-1]
+        if "tests" in directories:  # Skip test files
+            return True
+        if directories and directories[0] in ROOT_EXCLUDED_DIRS:
+            return True
+        return any(part in DEFAULT_EXCLUDED_DIRS or part.endswith(".egg-info") for part in directories)
 
     def _analyze_file(self, file_path: Path) -> None:
         """Analyze a single Python file (legacy sequential version)."""
         results = self._analyze_file_parallel(file_path)
         self._merge_analysis_results(results)
 
+    def _iter_file_results(self, files: list[Path]) -> Iterator[tuple[Path, dict[str, Any] | None, Exception | None]]:
+        """
+        Analyze files on the configured executor and yield results in file order.
+
+        Unchanged files are served from the persistent analysis cache (if configured)
+        without being dispatched; freshly analyzed results are written back to it.
+
+        Args:
+            files: Python files to analyze
+
+        Yields:
+            Tuples of (file_path, results, error) where results has the structure
+            returned by _analyze_file_parallel
+        """
+        cached: dict[Path, dict[str, Any]] = {}
+        if self.analysis_cache is not None:
+            for file_path in files:
+                payload = self.analysis_cache.get("code_analyzer", file_path, self._cache_settings)
+                if payload is None:
+                    continue
+                # Corrupt or outdated entries are re-analyzed
+                with contextlib.suppress(KeyError, TypeError, ValueError):
+                    cached[file_path] = self._results_from_payload(payload)
+        self.cached_file_count = len(cached)
+
+        pending = [f for f in files if f not in cached]
+
+        # Run Semgrep once per shard over all files to analyze (findings are cached per file hash)
+        if self.semgrep_runner is not None and pending and os.environ.get("TEST_MODE") != "true":
+            self.semgrep_runner.scan(pending, self.semgrep_index)
+
+        config = self.executor_config.resolve(len(pending))
+        self.last_executor_config = config
+        use_processes = config.kind == ExecutorKind.PROCESS
+        if use_processes:
+            computed = run_ordered(
+                _analyze_file_in_worker,
+                pending,
+                config,
+                initializer=_init_analysis_worker,
+                initargs=(self._worker_options(),),
+            )
+        else:
+            computed = run_ordered(self._analyze_file_timed, pending, config)
+
+        try:
+            for file_path in files:
+                if file_path in cached:
+                    yield file_path, cached[file_path], None
+                    continue
+                _, output, error = next(computed)
+                if error is not None or output is None:
+                    yield file_path, None, error
+                    continue
+                # Process workers return compact payloads; thread/serial workers return results
+                payload = output if use_processes else None
+                if payload is not None:
+                    record_file_timing(file_path, payload.pop("analysis_seconds", 0.0), "analysis")
+                results = self._results_from_payload(output) if use_processes else output
+                if self.analysis_cache is not None:
+                    self.analysis_cache.put(
+                        "code_analyzer",
+                        file_path,
+                        payload if payload is not None else self._results_to_payload(results),
+                        self._cache_settings,
+                    )
+                yield file_path, results, None
+        finally:
+            computed.close()
+
+    def _test_files_digest(self, analysis_cache: AnalysisCache) -> str:
+        """Digest over the paths and content of the test files that story acceptance criteria come from."""
+        digest = hashlib.sha256()
+        for test_file in sorted(self.test_extractor.test_files):
+            try:
+                rel_path = test_file.resolve().relative_to(self.repo_path).as_posix()
+            except ValueError:
+                rel_path = test_file.as_posix()
+            digest.update(rel_path.encode("utf-8"))
+            digest.update((analysis_cache.file_digest(test_file) or "<unreadable>").encode("utf-8"))
+        return digest.hexdigest()
+
+    def _analyze_file_timed(self, file_path: Path) -> dict[str, Any]:
+        """Analyze a file in this process and record its analysis time in the active profile."""
+        start = time.perf_counter()
+        try:
+            return self._analyze_file_parallel(file_path)
+        finally:
+            record_file_timing(file_path, time.perf_counter() - start, "analysis")
+
+    def _worker_options(self) -> dict[str, Any]:
+        """Get picklable settings for re-creating this analyzer in a worker process."""
+        return {
+            "repo_path": self.repo_path,
+            "confidence_threshold": self.confidence_threshold,
+            "key_format": self.key_format,
+            "entry_point": self.entry_point,
+            "semgrep_enabled": self.semgrep_enabled,
+            "semgrep_index": self.semgrep_index,
+            "cache_settings": self._cache_settings,
+        }
+
+    @staticmethod
+    def _results_to_payload(results: dict[str, Any]) -> dict[str, Any]:
+        """Convert per-file results to a compact, JSON-serializable payload (cache and worker transport)."""
+        return {
+            "themes": sorted(results["themes"]),
+            "type_hints": results["type_hints"],
+            "async_patterns": results["async_patterns"],
+            "features": [f.model_dump(mode="json") for f in results["features"]],
+        }
+
+    @staticmethod
+    def _results_from_payload(payload: dict[str, Any]) -> dict[str, Any]:
+        """Restore per-file results from a payload created by _results_to_payload."""
+        return {
+            "themes": set(payload["themes"]),
+            "type_hints": payload["type_hints"],
+            "async_patterns": payload["async_patterns"],
+            "features": [Feature.model_validate(f) for f in payload["features"]],
+        }
+
     def _analyze_file_parallel(self, file_path: Path) -> dict[str, Any]:
         """
         Analyze a single Python file and return results (thread-safe).
@@ -562,8 +629,7 @@ class CodeAnalyzer:
         }
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(content)
+            tree = get_parsed_module_cache().get_tree(file_path)
 
             # Extract module-level info (return themes instead of modifying self)
             themes = self._extract_themes_from_imports_parallel(tree)
@@ -604,7 +670,13 @@ class CodeAnalyzer:
                     if feature:
                         # Enhance feature with detailed Semgrep findings (outcomes, constraints, themes)
                         self._enhance_feature_with_semgrep(
-                            feature, semgrep_findings, file_path, node.name, class_start_line, class_end_line
+                            feature,
+                            semgrep_findings,
+                            file_path,
+                            node.name,
+                            class_start_line,
+                            class_end_line,
+                            themes=results["themes"],
                         )
                         results["features"].append(feature)
 
@@ -842,6 +914,7 @@ class CodeAnalyzer:
         class_name: str,
         class_start_line: int | None = None,
         class_end_line: int | None = None,
+        themes: set[str] | None = None,
     ) -> None:
         """
         Enhance feature with Semgrep pattern detection results.
@@ -853,9 +926,13 @@ class CodeAnalyzer:
             class_name: Name of the class this feature represents
             class_start_line: Starting line number of the class definition
             class_end_line: Ending line number of the class definition
+            themes: Theme set to add detected themes to (default: self.themes; per-file
+                results pass their own set so themes survive caching and worker processes)
         """
         if not semgrep_findings:
             return
+        if themes is None:
+            themes = self.themes
 
         # Filter findings relevant to this class
         relevant_findings = []
@@ -930,7 +1007,7 @@ class CodeAnalyzer:
                 if method and path:
                     api_endpoints.append(f"{method} {path}")
                     # Add API theme (confidence already calculated with evidence)
-                    self.themes.add("API")
+                    themes.add("API")
 
             # Database model detection
             elif "model-detection" in rule_id.lower():
@@ -938,14 +1015,14 @@ class CodeAnalyzer:
                 if model_name:
                     data_models.append(model_name)
                     # Add Database theme (confidence already calculated with evidence)
-                    self.themes.add("Database")
+                    themes.add("Database")
 
             # Auth pattern detection
             elif "auth" in rule_id.lower():
                 permission = str(metadata.get("permission", ""))
                 auth_patterns.append(permission or "authentication required")
                 # Add security theme (confidence already calculated with evidence)
-                self.themes.add("Security")
+                themes.add("Security")
 
             # CRUD operation detection
             elif "crud" in rule_id.lower():
@@ -1403,40 +1480,116 @@ class CodeAnalyzer:
             modules[module_name] = file_path
             self.dependency_graph.add_node(module_name, path=file_path)
 
-        # Second pass: add edges based on imports
+        # Second pass: add edges based on imports (raw import names are collected on the configured executor)
+        collected_imports = self._collect_imports_for_files(list(modules.values()))
         for module_name, file_path in modules.items():
-            try:
-                content = file_path.read_text(encoding="utf-8")
-                tree = ast.parse(content)
-
-                # Extract imports
-                imports = self._extract_imports_from_ast(tree, file_path)
-                for imported_module in imports:
-                    # Only add edges for modules we know about (within repo)
-                    # Try exact match first, then partial match
-                    if imported_module in modules:
-                        self.dependency_graph.add_edge(module_name, imported_module)
-                    else:
-                        # Try to find matching module (e.g., "module_a" matches "src.module_a")
-                        matching_module = None
-                        for known_module in modules:
-                            # Check if imported name matches the module name (last part)
-                            if imported_module == known_module.split(".")[-1]:
-                                matching_module = known_module
-                                break
-                        if matching_module:
-                            self.dependency_graph.add_edge(module_name, matching_module)
-                        elif self.entry_point and not any(
-                            imported_module.startswith(prefix) for prefix in ["src.", "lib.", "app.", "main.", "core."]
-                        ):
-                            # Track external dependencies when using entry point
-                            # Check if it's a standard library or third-party import
-                            # (heuristic: if it doesn't start with known repo patterns)
-                            # Likely external dependency
-                            self.external_dependencies.add(imported_module)
-            except (SyntaxError, UnicodeDecodeError):
+            raw_imports = collected_imports.get(file_path)
+            if raw_imports is None:
                 # Skip files that can't be parsed
                 continue
+            self._add_import_edges(module_name, self._resolve_imports(raw_imports, file_path), modules)
+
+    def _add_import_edges(self, module_name: str, imports: list[str], modules: dict[str, Path]) -> None:
+        """Add dependency edges from a module to the known modules it imports."""
+        for imported_module in imports:
+            # Only add edges for modules we know about (within repo)
+            # Try exact match first, then partial match
+            if imported_module in modules:
+                self.dependency_graph.add_edge(module_name, imported_module)
+            else:
+                # Try to find matching module (e.g., "module_a" matches "src.module_a",
+                # "app.core" matches "src.app.core")
+                matching_module = None
+                suffix = f".{imported_module}"
+                for known_module in modules:
+                    # Check if imported name matches the trailing part(s) of the module name
+                    if known_module.endswith(suffix):
+                        matching_module = known_module
+                        break
+                if matching_module:
+                    self.dependency_graph.add_edge(module_name, matching_module)
+                elif "." not in imported_module and self.entry_point and not any(
+                    imported_module.startswith(prefix) for prefix in ["src.", "lib.", "app.", "main.", "core."]
+                ):
+                    # Track external dependencies when using entry point
+                    # Check if it's a standard library or third-party import
+                    # (heuristic: if it doesn't start with known repo patterns)
+                    # Likely external dependency
+                    self.external_dependencies.add(imported_module)
+
+    @beartype
+    @require(lambda python_files: isinstance(python_files, list), "Python files must be list")
+    @ensure(lambda result: result is None, "Must return None")
+    def build_dependency_graph(self, python_files: list[Path]) -> None:
+        """
+        Build the module dependency graph without extracting features (e.g., for watch mode).
+
+        Args:
+            python_files: Python files to include
+        """
+        self._build_dependency_graph(python_files)
+
+    @beartype
+    @require(lambda file_path: isinstance(file_path, Path), "File path must be Path")
+    @ensure(lambda result: isinstance(result, list), "Must return list")
+    def update_file_dependencies(self, file_path: Path) -> list[Path]:
+        """
+        Re-read one file's imports and replace its edges in the dependency graph.
+
+        Deleted or skipped files are removed from the graph.
+
+        Args:
+            file_path: Python file that changed
+
+        Returns:
+            Files the module imports (known modules only)
+        """
+        module_name = self._path_to_module_name(file_path)
+        if not file_path.exists() or self._should_skip_file(file_path):
+            if module_name in self.dependency_graph:
+                self.dependency_graph.remove_node(module_name)
+            return []
+
+        if module_name in self.dependency_graph:
+            self.dependency_graph.remove_edges_from(list(self.dependency_graph.out_edges(module_name)))
+        self.dependency_graph.add_node(module_name, path=file_path)
+        try:
+            raw_imports = set(self._collect_file_imports(file_path))
+        except (SyntaxError, UnicodeDecodeError, OSError):
+            return []
+
+        modules: dict[str, Path] = {
+            name: data["path"] for name, data in self.dependency_graph.nodes(data=True) if "path" in data
+        }
+        self._add_import_edges(module_name, self._resolve_imports(raw_imports, file_path), modules)
+        return [
+            modules[imported]
+            for imported in self.dependency_graph.successors(module_name)
+            if imported in modules and imported != module_name
+        ]
+
+    @beartype
+    @require(lambda files: isinstance(files, list), "Files must be list")
+    @ensure(lambda result: isinstance(result, dict), "Must return dict")
+    def analyze_files(self, files: list[Path]) -> dict[Path, list[Feature]]:
+        """
+        Extract features from specific files only (e.g., files changed in watch mode).
+
+        Skipped files (tests, excluded directories) and files that fail to parse
+        map to an empty list. Instance state (features, themes) is not modified.
+
+        Args:
+            files: Python files to analyze
+
+        Returns:
+            Dictionary mapping file path to the features extracted from it
+        """
+        features_by_file: dict[Path, list[Feature]] = {file_path: [] for file_path in files}
+        files_to_analyze = [f for f in files if f.exists() and not self._should_skip_file(f)]
+        for file_path, results, _error in self._iter_file_results(files_to_analyze):
+            if results is not None:
+                features_by_file[file_path] = list(results["features"])
+        return features_by_file
 
     def _path_to_module_name(self, file_path: Path) -> str:
         """Convert file path to module name (e.g., src/foo/bar.py -> src.foo.bar)."""
@@ -1458,6 +1611,55 @@ class CodeAnalyzer:
         Returns:
             List of module names (relative to repo root if possible)
         """
+        return self._resolve_imports(self._collect_imports(tree), file_path)
+
+    def _collect_imports_for_files(self, files: list[Path]) -> dict[Path, set[str]]:
+        """
+        Collect import names for files on the configured executor.
+
+        Raw import names are cached per file content in the persistent analysis cache
+        (if configured). Files that can't be parsed are omitted from the result.
+
+        Args:
+            files: Python files to scan
+
+        Returns:
+            Dictionary mapping file path to import names
+        """
+        collected: dict[Path, set[str]] = {}
+        if self.analysis_cache is not None:
+            for file_path in files:
+                cached = self.analysis_cache.get("module_imports", file_path)
+                if cached is not None and isinstance(cached.get("imports"), list):
+                    collected[file_path] = set(cached["imports"])
+
+        pending = [f for f in files if f not in collected]
+        config = self.executor_config.resolve(len(pending))
+        if config.kind == ExecutorKind.PROCESS:
+            results = run_ordered(_collect_imports_in_worker, pending, config)
+        else:
+            results = run_ordered(self._collect_file_imports, pending, config)
+        for file_path, imports, error in results:
+            if error is not None or imports is None:
+                continue
+            collected[file_path] = set(imports)
+            if self.analysis_cache is not None:
+                self.analysis_cache.put("module_imports", file_path, {"imports": sorted(imports)})
+        return collected
+
+    def _collect_file_imports(self, file_path: Path) -> list[str]:
+        """Collect sorted import names for a file (raises SyntaxError for unparseable files)."""
+        return sorted(self._collect_imports(get_parsed_module_cache().get_tree(file_path)))
+
+    @staticmethod
+    def _collect_imports(tree: ast.AST) -> set[str]:
+        """
+        Collect module names imported by a module (no resolution).
+
+        Both root names (foo.bar.baz -> foo) and full dotted names are collected, so
+        imports of package submodules (e.g., `from app.core import X`) link to the
+        submodule rather than only to the package.
+        """
         imports: set[str] = set()
 
         for node in ast.walk(tree):
@@ -1468,8 +1670,7 @@ class CodeAnalyzer:
                         # Extract root module (e.g., foo.bar.baz -> foo)
                         root_module = alias.name.split(".")[0]
                         imports.add(root_module)
-                    else:
-                        imports.add(alias.name)
+                    imports.add(alias.name)
 
             elif isinstance(node, ast.ImportFrom) and node.module:
                 # From imports (e.g., from foo.bar import baz)
@@ -1477,9 +1678,19 @@ class CodeAnalyzer:
                     # Extract root module
                     root_module = node.module.split(".")[0]
                     imports.add(root_module)
-                else:
-                    imports.add(node.module)
+                imports.add(node.module)
+                # Imported names may be submodules (e.g., from app import core)
+                imports.update(f"{node.module}.{alias.name}" for alias in node.names if alias.name != "*")
 
+        return imports
+
+    def _resolve_imports(self, imports: set[str], file_path: Path) -> list[str]:
+        """
+        Resolve collected import names against the repository's modules.
+
+        Returns:
+            List of module names (relative to repo root if possible)
+        """
         # Try to resolve local imports (relative to current file)
         resolved_imports: list[str] = []
         current_module = self._path_to_module_name(file_path)
@@ -1962,3 +2173,42 @@ class CodeAnalyzer:
             return []
 
         return list(self.dependency_graph.successors(module_name))
+
+
+# Per-process analyzer for process-pool workers (set by _init_analysis_worker)
+_worker_analyzer: CodeAnalyzer | None = None
+
+
+def _init_analysis_worker(options: dict[str, Any]) -> None:
+    """Create the per-process analyzer used by _analyze_file_in_worker."""
+    global _worker_analyzer
+    # Semgrep is resolved by the parent (which already scanned all files in batches), so workers
+    # neither check for the semgrep binary nor hash its rule files
+    analyzer = CodeAnalyzer(
+        options["repo_path"],
+        confidence_threshold=options["confidence_threshold"],
+        key_format=options["key_format"],
+        entry_point=options["entry_point"],
+        executor_config=ExecutorConfig(kind=ExecutorKind.SERIAL),
+        semgrep_enabled=False,
+    )
+    analyzer.semgrep_enabled = options["semgrep_enabled"]
+    analyzer.semgrep_index = options["semgrep_index"]
+    analyzer._cache_settings = options["cache_settings"]
+    _worker_analyzer = analyzer
+
+
+def _collect_imports_in_worker(file_path: Path) -> list[str]:
+    """Collect sorted import names for a file in a worker process."""
+    return sorted(CodeAnalyzer._collect_imports(get_parsed_module_cache().get_tree(file_path)))
+
+
+def _analyze_file_in_worker(file_path: Path) -> dict[str, Any]:
+    """Analyze a file in a worker process and return a compact, picklable payload."""
+    if _worker_analyzer is None:
+        raise RuntimeError("Analysis worker not initialized")
+    start = time.perf_counter()
+    payload = _worker_analyzer._results_to_payload(_worker_analyzer._analyze_file_parallel(file_path))
+    # Timed in the worker; the parent records it in its profile (and drops it before caching)
+    payload["analysis_seconds"] = time.perf_counter() - start
+    return payload
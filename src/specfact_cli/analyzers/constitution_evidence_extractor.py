@@ -13,6 +13,8 @@ from typing import Any
 from beartype import beartype
 from icontract import ensure, require
 
+from specfact_cli.utils.ast_cache import get_parsed_module_cache
+
 
 class ConstitutionEvidenceExtractor:
     """
@@ -212,8 +214,7 @@ class ConstitutionEvidenceExtractor:
                 continue
 
             try:
-                content = py_file.read_text(encoding="utf-8")
-                tree = ast.parse(content, filename=str(py_file))
+                tree = get_parsed_module_cache().get_tree(py_file)
 
                 for node in ast.walk(tree):
                     if isinstance(node, ast.Import):
@@ -320,8 +321,7 @@ class ConstitutionEvidenceExtractor:
                 continue
 
             try:
-                content = py_file.read_text(encoding="utf-8")
-                tree = ast.parse(content, filename=str(py_file))
+                tree = get_parsed_module_cache().get_tree(py_file)
 
                 for node in ast.walk(tree):
                     if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
@@ -17,6 +17,9 @@ import networkx as nx
 from beartype import beartype
 from icontract import ensure, require
 
+from specfact_cli.utils.ast_cache import get_parsed_module_cache
+from specfact_cli.utils.executors import ExecutorConfig, ExecutorKind, available_cpu_count, run_ordered
+
 
 class GraphAnalyzer:
     """
@@ -28,14 +31,16 @@ class GraphAnalyzer:
 
     @beartype
     @require(lambda repo_path: isinstance(repo_path, Path), "Repo path must be Path")
-    def __init__(self, repo_path: Path) -> None:
+    def __init__(self, repo_path: Path, executor_config: ExecutorConfig | None = None) -> None:
         """
         Initialize graph analyzer.
 
         Args:
             repo_path: Path to repository root
+            executor_config: Executor for import analysis (thread/process/serial; default: chosen from core count and repo size)
         """
         self.repo_path = repo_path.resolve()
+        self.executor_config = executor_config or ExecutorConfig()
         self.call_graphs: dict[str, dict[str, list[str]]] = {}  # file -> {function -> [called_functions]}
         self.dependency_graph: nx.DiGraph = nx.DiGraph()
 
@@ -147,57 +152,36 @@ class GraphAnalyzer:
             module_name = self._path_to_module_name(file_path)
             graph.add_node(module_name, path=str(file_path))
 
-        # Add edges from AST imports (parallelized for performance)
-        import multiprocessing
-
-        # In test mode, use fewer workers to avoid resource contention
-        import os
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        if os.environ.get("TEST_MODE") == "true":
-            max_workers = max(1, min(2, len(python_files)))  # Max 2 workers in test mode
-        else:
-            max_workers = max(
-                1, min(multiprocessing.cpu_count() or 4, 16, len(python_files))
-            )  # Increased for faster processing, ensure at least 1
-
         # Get list of known modules for matching (needed for parallel processing)
         known_modules = list(graph.nodes())
 
-        # Process AST imports in parallel
-        def process_imports(file_path: Path) -> list[tuple[str, str]]:
-            """Process imports for a single file and return (module_name, matching_module) tuples."""
-            module_name = self._path_to_module_name(file_path)
-            imports = self._extract_imports_from_ast(file_path)
-            edges: list[tuple[str, str]] = []
-            for imported in imports:
-                # Try exact match first
-                if imported in known_modules:
-                    edges.append((module_name, imported))
-                else:
-                    # Try to find matching module (intelligent matching)
-                    matching_module = self._find_matching_module(imported, known_modules)
-                    if matching_module:
-                        edges.append((module_name, matching_module))
-            return edges
-
-        # Process AST imports in parallel
+        # Add edges from AST imports on the configured executor (CPU-bound module matching)
+        config = self.executor_config.resolve(len(python_files), max_thread_workers=16)
+        if config.kind == ExecutorKind.PROCESS:
+            edge_results = run_ordered(
+                _import_edges_in_worker,
+                python_files,
+                config,
+                initializer=_init_graph_worker,
+                initargs=(self.repo_path, known_modules),
+            )
+        else:
+            edge_results = run_ordered(lambda f: self._import_edges(f, known_modules), python_files, config)
+        for _file_path, edges, error in edge_results:
+            if error is not None or edges is None:
+                continue
+            for module_name, matching_module in edges:
+                graph.add_edge(module_name, matching_module)
+
+        # Call graph extraction runs pyan3 subprocesses (I/O-bound), so it uses threads unless serial
         import os
+        from concurrent.futures import ThreadPoolExecutor, as_completed
 
-        executor1 = ThreadPoolExecutor(max_workers=max_workers)
+        if config.kind == ExecutorKind.SERIAL:
+            max_workers = 1
+        else:
+            max_workers = max(1, min(available_cpu_count(), 16, len(python_files)))
         wait_on_shutdown = os.environ.get("TEST_MODE") != "true"
-        try:
-            future_to_file = {executor1.submit(process_imports, file_path): file_path for file_path in python_files}
-
-            for future in as_completed(future_to_file):
-                try:
-                    edges = future.result()
-                    for module_name, matching_module in edges:
-                        graph.add_edge(module_name, matching_module)
-                except Exception:
-                    continue
-        finally:
-            executor1.shutdown(wait=wait_on_shutdown)
 
         # Extract call graphs using pyan (if available) - parallelized for performance
         executor2 = ThreadPoolExecutor(max_workers=max_workers)
@@ -225,6 +209,22 @@ class GraphAnalyzer:
         self.dependency_graph = graph
         return graph
 
+    def _import_edges(self, file_path: Path, known_modules: list[str]) -> list[tuple[str, str]]:
+        """Process imports for a single file and return (module_name, matching_module) tuples."""
+        module_name = self._path_to_module_name(file_path)
+        imports = self._extract_imports_from_ast(file_path)
+        edges: list[tuple[str, str]] = []
+        for imported in imports:
+            # Try exact match first
+            if imported in known_modules:
+                edges.append((module_name, imported))
+            else:
+                # Try to find matching module (intelligent matching)
+                matching_module = self._find_matching_module(imported, known_modules)
+                if matching_module:
+                    edges.append((module_name, matching_module))
+        return edges
+
     @beartype
     @require(lambda file_path: isinstance(file_path, Path), "File path must be Path")
     @ensure(lambda result: isinstance(result, str), "Must return str")
@@ -284,8 +284,7 @@ class GraphAnalyzer:
         }
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(content)
+            tree = get_parsed_module_cache().get_tree(file_path)
 
             for node in ast.walk(tree):
                 if isinstance(node, ast.Import):
@@ -373,7 +372,7 @@ class GraphAnalyzer:
         # Simple heuristic: search for function name in files
         for file_path in python_files:
             try:
-                content = file_path.read_text(encoding="utf-8")
+                content = get_parsed_module_cache().get_source(file_path)
                 if f"def {function_name}" in content or f"class {function_name}" in content:
                     return self._path_to_module_name(file_path)
             except (UnicodeDecodeError, Exception):
@@ -400,3 +399,22 @@ class GraphAnalyzer:
             "dependencies": [{"from": source, "to": target} for source, target in self.dependency_graph.edges()],
             "call_graphs": {file_key: len(calls) for file_key, calls in self.call_graphs.items()},
         }
+
+
+# Per-process state for process-pool workers (set by _init_graph_worker)
+_worker_analyzer: GraphAnalyzer | None = None
+_worker_known_modules: list[str] = []
+
+
+def _init_graph_worker(repo_path: Path, known_modules: list[str]) -> None:
+    """Create the per-process analyzer and module list used by _import_edges_in_worker."""
+    global _worker_analyzer, _worker_known_modules
+    _worker_analyzer = GraphAnalyzer(repo_path)
+    _worker_known_modules = known_modules
+
+
+def _import_edges_in_worker(file_path: Path) -> list[tuple[str, str]]:
+    """Compute import edges for a file in a worker process."""
+    if _worker_analyzer is None:
+        raise RuntimeError("Graph worker not initialized")
+    return _worker_analyzer._import_edges(file_path, _worker_known_modules)
@@ -8,15 +8,18 @@ understanding of the codebase structure.
 from __future__ import annotations
 
 import ast
-import os
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 from beartype import beartype
 from icontract import ensure, require
 
+from specfact_cli.utils.analysis_cache import AnalysisCache
+from specfact_cli.utils.ast_cache import get_parsed_module_cache
+from specfact_cli.utils.executors import ExecutorConfig, ExecutorKind, run_ordered
+
 
 class RelationshipMapper:
     """
@@ -31,14 +34,23 @@ class RelationshipMapper:
 
     @beartype
     @require(lambda repo_path: isinstance(repo_path, Path), "Repo path must be Path")
-    def __init__(self, repo_path: Path) -> None:
+    def __init__(
+        self,
+        repo_path: Path,
+        analysis_cache: AnalysisCache | None = None,
+        executor_config: ExecutorConfig | None = None,
+    ) -> None:
         """
         Initialize relationship mapper.
 
         Args:
             repo_path: Path to repository root
+            analysis_cache: Optional persistent cache for per-file results (unchanged files are not re-analyzed)
+            executor_config: Executor for per-file analysis (thread/process/serial; default: chosen from core count and repo size)
         """
         self.repo_path = repo_path.resolve()
+        self.analysis_cache = analysis_cache
+        self.executor_config = executor_config or ExecutorConfig()
         self.imports: dict[str, list[str]] = defaultdict(list)  # file -> [imported_modules]
         self.dependencies: dict[str, list[str]] = defaultdict(list)  # module -> [dependencies]
         self.interfaces: dict[str, dict[str, Any]] = {}  # interface_name -> interface_info
@@ -58,8 +70,7 @@ class RelationshipMapper:
             Dictionary with relationships found in file
         """
         try:
-            with file_path.open(encoding="utf-8") as f:
-                tree = ast.parse(f.read(), filename=str(file_path))
+            tree = get_parsed_module_cache().get_tree(file_path)
 
             file_imports: list[str] = []
             file_dependencies: list[str] = []
@@ -181,6 +192,54 @@ class RelationshipMapper:
             # Skip files with syntax errors
             return {"imports": [], "dependencies": [], "interfaces": [], "routes": []}
 
+    def _iter_file_results(
+        self, files: list[Path]
+    ) -> Iterator[tuple[Path, tuple[str, dict[str, Any]] | None, Exception | None]]:
+        """
+        Analyze files on the configured executor and yield results in file order.
+
+        Unchanged files are served from the persistent analysis cache (if configured)
+        without being dispatched; freshly analyzed results are written back to it.
+
+        Args:
+            files: Python files to analyze
+
+        Yields:
+            Tuples of (file_path, (file_key, relationships_dict), error)
+        """
+        cached: dict[Path, tuple[str, dict[str, Any]]] = {}
+        if self.analysis_cache is not None:
+            for file_path in files:
+                payload = self.analysis_cache.get("relationships", file_path)
+                if payload is not None and isinstance(payload.get("result"), dict):
+                    cached[file_path] = (payload["file_key"], payload["result"])
+
+        pending = [f for f in files if f not in cached]
+        config = self.executor_config.resolve(len(pending), max_thread_workers=16)
+        if config.kind == ExecutorKind.PROCESS:
+            computed = run_ordered(
+                _analyze_file_in_worker,
+                pending,
+                config,
+                initializer=_init_relationship_worker,
+                initargs=(self.repo_path,),
+            )
+        else:
+            computed = run_ordered(self._analyze_file_parallel, pending, config)
+
+        try:
+            for file_path in files:
+                if file_path in cached:
+                    yield file_path, cached[file_path], None
+                    continue
+                _, output, error = next(computed)
+                if error is None and output is not None and self.analysis_cache is not None:
+                    file_key, result = output
+                    self.analysis_cache.put("relationships", file_path, {"file_key": file_key, "result": result})
+                yield file_path, output, error
+        finally:
+            computed.close()
+
     def _analyze_file_parallel(self, file_path: Path) -> tuple[str, dict[str, Any]]:
         """
         Analyze a single file for relationships (thread-safe version).
@@ -204,28 +263,26 @@ class RelationshipMapper:
             pass
 
         try:
-            with file_path.open(encoding="utf-8") as f:
-                content = f.read()
-                # For large files (>100KB), only extract imports (faster)
-                if len(content) > 100 * 1024:  # ~100KB
-                    tree = ast.parse(content, filename=str(file_path))
-                    large_file_imports: list[str] = []
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.Import):
-                            for alias in node.names:
-                                large_file_imports.append(alias.name)
-                        if isinstance(node, ast.ImportFrom) and node.module:
-                            large_file_imports.append(node.module)
-                    try:
-                        file_key = str(file_path.relative_to(self.repo_path))
-                    except ValueError:
-                        file_key = str(file_path)
-                    return (
-                        file_key,
-                        {"imports": large_file_imports, "dependencies": [], "interfaces": {}, "routes": []},
-                    )
-
-                tree = ast.parse(content, filename=str(file_path))
+            ast_cache = get_parsed_module_cache()
+            content = ast_cache.get_source(file_path)
+            tree = ast_cache.get_tree(file_path)
+            # For large files (>100KB), only extract imports (faster)
+            if len(content) > 100 * 1024:  # ~100KB
+                large_file_imports: list[str] = []
+                for node in ast.walk(tree):
+                    if isinstance(node, ast.Import):
+                        for alias in node.names:
+                            large_file_imports.append(alias.name)
+                    if isinstance(node, ast.ImportFrom) and node.module:
+                        large_file_imports.append(node.module)
+                try:
+                    file_key = str(file_path.relative_to(self.repo_path))
+                except ValueError:
+                    file_key = str(file_path)
+                return (
+                    file_key,
+                    {"imports": large_file_imports, "dependencies": [], "interfaces": {}, "routes": []},
+                )
 
             file_imports: list[str] = []
             file_dependencies: list[str] = []
@@ -379,60 +436,21 @@ class RelationshipMapper:
                 "routes": {},
             }
 
-        # Use ThreadPoolExecutor for parallel processing
-        # In test mode, use fewer workers to avoid resource contention
-        if os.environ.get("TEST_MODE") == "true":
-            max_workers = max(1, min(2, len(python_files)))  # Max 2 workers in test mode
-        else:
-            max_workers = min(os.cpu_count() or 4, 16, len(python_files))  # Cap at 16 workers for faster processing
-
-        executor = ThreadPoolExecutor(max_workers=max_workers)
-        interrupted = False
-        # In test mode, use wait=False to avoid hanging on shutdown
-        wait_on_shutdown = os.environ.get("TEST_MODE") != "true"
-        try:
-            # Submit all tasks
-            future_to_file = {executor.submit(self._analyze_file_parallel, f): f for f in python_files}
-
-            # Collect results as they complete
-            try:
-                for future in as_completed(future_to_file):
-                    try:
-                        file_key, result = future.result()
-                        # Merge results into instance variables
-                        self.imports[file_key] = result["imports"]
-                        self.dependencies[file_key] = result["dependencies"]
-                        # Merge interfaces
-                        for interface_name, interface_info in result["interfaces"].items():
-                            self.interfaces[interface_name] = interface_info
-                        # Store routes
-                        if result["routes"]:
-                            self.framework_routes[file_key] = result["routes"]
-                    except KeyboardInterrupt:
-                        interrupted = True
-                        for f in future_to_file:
-                            if not f.done():
-                                f.cancel()
-                        break
-                    except Exception:
-                        # Skip files that fail to process
-                        pass
-            except KeyboardInterrupt:
-                interrupted = True
-                for f in future_to_file:
-                    if not f.done():
-                        f.cancel()
-            if interrupted:
-                raise KeyboardInterrupt
-        except KeyboardInterrupt:
-            interrupted = True
-            executor.shutdown(wait=False, cancel_futures=True)
-            raise
-        finally:
-            if not interrupted:
-                executor.shutdown(wait=wait_on_shutdown)
-            else:
-                executor.shutdown(wait=False)
+        # Analyze on the configured executor; merge in file order so later interfaces win deterministically
+        for _file_path, output, error in self._iter_file_results(python_files):
+            if error is not None or output is None:
+                # Skip files that fail to process
+                continue
+            file_key, result = output
+            # Merge results into instance variables
+            self.imports[file_key] = result["imports"]
+            self.dependencies[file_key] = result["dependencies"]
+            # Merge interfaces
+            for interface_name, interface_info in result["interfaces"].items():
+                self.interfaces[interface_name] = interface_info
+            # Store routes
+            if result["routes"]:
+                self.framework_routes[file_key] = result["routes"]
 
         return {
             "imports": dict(self.imports),
@@ -456,3 +474,20 @@ class RelationshipMapper:
             "interfaces": list(self.interfaces.keys()),
             "routes": dict(self.framework_routes),
         }
+
+
+# Per-process mapper for process-pool workers (set by _init_relationship_worker)
+_worker_mapper: RelationshipMapper | None = None
+
+
+def _init_relationship_worker(repo_path: Path) -> None:
+    """Create the per-process mapper used by _analyze_file_in_worker."""
+    global _worker_mapper
+    _worker_mapper = RelationshipMapper(repo_path)
+
+
+def _analyze_file_in_worker(file_path: Path) -> tuple[str, dict[str, Any]]:
+    """Analyze a file in a worker process and return picklable (file_key, relationships_dict)."""
+    if _worker_mapper is None:
+        raise RuntimeError("Relationship worker not initialized")
+    return _worker_mapper._analyze_file_parallel(file_path)
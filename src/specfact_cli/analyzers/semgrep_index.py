@@ -0,0 +1,204 @@
+"""
+Batched Semgrep execution with a per-file findings index.
+
+Runs Semgrep once per shard of files (instead of once per file) and indexes the
+JSON results by file path. Findings are cached per file content hash in the
+persistent analysis cache, so re-imports only rescan changed files.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+from typing import Any
+
+from beartype import beartype
+from icontract import ensure, require
+
+from specfact_cli.utils.analysis_cache import AnalysisCache
+
+
+# Files per Semgrep invocation (amortizes Semgrep start-up and rule compilation)
+DEFAULT_SHARD_SIZE = 300
+
+# Timeout per shard: base plus per-file allowance (seconds)
+SHARD_TIMEOUT_BASE = 30.0
+SHARD_TIMEOUT_PER_FILE = 0.5
+
+
+class SemgrepFindingIndex:
+    """
+    Semgrep findings indexed by file path.
+
+    Findings for each file are kept sorted by start line. The index is a plain
+    mapping, so it can be sent to worker processes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._by_path: dict[Path, list[dict[str, Any]]] = {}
+
+    @beartype
+    @require(lambda file_path: isinstance(file_path, Path), "File path must be Path")
+    def add(self, file_path: Path, findings: list[dict[str, Any]]) -> None:
+        """
+        Add findings for a scanned file (an empty list records "scanned, no findings").
+
+        Args:
+            file_path: Scanned file
+            findings: Semgrep results for the file
+        """
+        self._by_path[file_path.resolve()] = sorted(findings, key=_finding_line)
+
+    @beartype
+    @require(lambda file_path: isinstance(file_path, Path), "File path must be Path")
+    @ensure(lambda result: isinstance(result, list), "Must return list")
+    def findings_for(self, file_path: Path) -> list[dict[str, Any]]:
+        """
+        Get findings for a file, sorted by start line.
+
+        Args:
+            file_path: File to look up
+
+        Returns:
+            Findings (empty if the file has none or was not scanned)
+        """
+        return self._by_path.get(file_path.resolve(), [])
+
+    def __contains__(self, file_path: object) -> bool:
+        """Check whether a file was scanned."""
+        return isinstance(file_path, Path) and file_path.resolve() in self._by_path
+
+    def __len__(self) -> int:
+        """Number of scanned files."""
+        return len(self._by_path)
+
+
+def _finding_line(finding: dict[str, Any]) -> int:
+    """Get a finding's start line (0 if unknown)."""
+    start = finding.get("start", {})
+    return start.get("line", 0) if isinstance(start, dict) else 0
+
+
+class SemgrepBatchRunner:
+    """
+    Runs Semgrep over many files in shards and builds a findings index.
+    """
+
+    CACHE_KIND = "semgrep"
+
+    @beartype
+    @require(lambda configs: len(configs) > 0, "At least one Semgrep config is required")
+    @require(lambda shard_size: shard_size > 0, "Shard size must be positive")
+    def __init__(
+        self,
+        configs: list[Path],
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        analysis_cache: AnalysisCache | None = None,
+        rules_hash: str | None = None,
+    ) -> None:
+        """
+        Initialize batch runner.
+
+        Args:
+            configs: Semgrep rule files
+            shard_size: Maximum files per Semgrep invocation
+            analysis_cache: Optional persistent cache for per-file findings
+            rules_hash: Hash of the rule files (part of the cache key)
+        """
+        self.configs = configs
+        self.shard_size = shard_size
+        self.analysis_cache = analysis_cache
+        self._cache_settings = {"rules": rules_hash}
+        self.scanned_file_count = 0
+        self.cached_file_count = 0
+        self.shard_count = 0
+
+    @beartype
+    @require(lambda files: isinstance(files, list), "Files must be list")
+    @ensure(lambda result: isinstance(result, SemgrepFindingIndex), "Must return SemgrepFindingIndex")
+    def scan(self, files: list[Path], index: SemgrepFindingIndex | None = None) -> SemgrepFindingIndex:
+        """
+        Scan files, serving unchanged files from the cache.
+
+        Files in shards that fail (timeout, invalid output) are indexed without
+        findings for this run but not cached, so they are rescanned next run.
+
+        Args:
+            files: Files to scan
+            index: Existing index to add findings to (default: new index)
+
+        Returns:
+            Index with findings for every file
+        """
+        index = index if index is not None else SemgrepFindingIndex()
+        pending: list[Path] = []
+        for file_path in files:
+            cached = (
+                self.analysis_cache.get(self.CACHE_KIND, file_path, self._cache_settings)
+                if self.analysis_cache
+                else None
+            )
+            if cached is not None and isinstance(cached.get("findings"), list):
+                index.add(file_path, cached["findings"])
+                self.cached_file_count += 1
+            else:
+                pending.append(file_path)
+
+        for start in range(0, len(pending), self.shard_size):
+            shard = pending[start : start + self.shard_size]
+            findings_by_path = self._run_shard(shard)
+            if findings_by_path is None:
+                for file_path in shard:
+                    index.add(file_path, [])
+                continue
+            for file_path in shard:
+                findings = findings_by_path.get(file_path.resolve(), [])
+                index.add(file_path, findings)
+                if self.analysis_cache is not None:
+                    self.analysis_cache.put(self.CACHE_KIND, file_path, {"findings": findings}, self._cache_settings)
+            self.scanned_file_count += len(shard)
+
+        return index
+
+    def _run_shard(self, shard: list[Path]) -> dict[Path, list[dict[str, Any]]] | None:
+        """
+        Run Semgrep once over a shard of files.
+
+        Returns:
+            Findings grouped by resolved file path, or None if Semgrep failed
+        """
+        config_args: list[str] = []
+        for config in self.configs:
+            config_args.extend(["--config", str(config)])
+        timeout = SHARD_TIMEOUT_BASE + SHARD_TIMEOUT_PER_FILE * len(shard)
+
+        try:
+            result = subprocess.run(
+                ["semgrep", *config_args, "--json", *[str(f) for f in shard]],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+            self.shard_count += 1
+
+            # Semgrep may return non-zero for valid findings
+            # Only fail if there is no JSON result list
+            try:
+                output = json.loads(result.stdout)
+            except json.JSONDecodeError:
+                return None
+            if not isinstance(output, dict) or not isinstance(output.get("results"), list):
+                return None
+        except (subprocess.TimeoutExpired, FileNotFoundError, OSError, ValueError):
+            # Semgrep not available or shard too slow - continue without it
+            return None
+
+        findings_by_path: dict[Path, list[dict[str, Any]]] = {}
+        for finding in output["results"]:
+            path = finding.get("path") if isinstance(finding, dict) else None
+            if not path:
+                continue
+            findings_by_path.setdefault(Path(path).resolve(), []).append(finding)
+        return findings_by_path
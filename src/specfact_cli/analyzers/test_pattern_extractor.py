@@ -12,6 +12,8 @@ from pathlib import Path
 from beartype import beartype
 from icontract import ensure, require
 
+from specfact_cli.utils.ast_cache import get_parsed_module_cache
+
 
 class TestPatternExtractor:
     """
@@ -93,8 +95,7 @@ class TestPatternExtractor:
     ) -> list[str]:
         """Parse a test file and extract test patterns for the given class."""
         try:
-            content = test_file.read_text(encoding="utf-8")
-            tree = ast.parse(content, filename=str(test_file))
+            tree = get_parsed_module_cache().get_tree(test_file)
         except Exception:
             return []
 
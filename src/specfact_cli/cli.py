@@ -52,28 +52,9 @@ from rich.console import Console
 from rich.panel import Panel
 
 from specfact_cli import __version__, runtime
-
-# Import command modules
-from specfact_cli.commands import (
-    analyze,
-    bridge,
-    contract_cmd,
-    drift,
-    enforce,
-    generate,
-    implement,
-    import_cmd,
-    init,
-    migrate,
-    plan,
-    project_cmd,
-    repro,
-    sdd,
-    spec,
-    sync,
-)
+from specfact_cli.commands import COMMANDS
 from specfact_cli.modes import OperationalMode, detect_mode
-from specfact_cli.utils.progressive_disclosure import ProgressiveDisclosureGroup
+from specfact_cli.utils.lazy_commands import LazyCommandGroup
 from specfact_cli.utils.structured_io import StructuredFormat
 
 
@@ -117,13 +98,19 @@ def normalize_shell_in_argv() -> None:
 # We don't normalize at module load time because sys.argv may not be set yet
 
 
+class SpecFactCommandGroup(LazyCommandGroup):
+    """Root command group: progressive disclosure help, command modules imported on first use."""
+
+    lazy_commands = COMMANDS
+
+
 app = typer.Typer(
     name="specfact",
     help="SpecFact CLI - Spec → Contract → Sentinel for Contract-Driven Development",
     add_completion=True,  # Enable Typer's built-in completion (works natively for bash/zsh/fish without extensions)
     rich_markup_mode="rich",
     context_settings={"help_option_names": ["-h", "--help", "--help-advanced", "-ha"]},  # Add aliases for help
-    cls=ProgressiveDisclosureGroup,  # Use custom group for progressive disclosure
+    cls=SpecFactCommandGroup,  # Progressive disclosure help and lazily imported command modules
 )
 
 console = Console()
@@ -258,6 +245,11 @@ def main(
             help="Force interaction mode (default auto based on CI/CD detection)",
         ),
     ] = None,
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Profile the command: write a phase timing tree, slowest files and peak memory to .specfact/reports/profile/ (JSON and collapsed stacks for flamegraphs)",
+    ),
 ) -> None:
     """
     SpecFact CLI - Spec→Contract→Sentinel for contract-driven development.
@@ -299,63 +291,33 @@ def main(
         ctx.obj = {}
     ctx.obj["mode"] = get_current_mode()
 
+    if profile:
+        _start_command_profile(ctx)
 
-# Register command groups in logical workflow order
-# 1. Setup & Initialization
-app.add_typer(init.app, name="init", help="Initialize SpecFact for IDE integration")
-
-# 2. Import & Analysis
-app.add_typer(
-    import_cmd.app, name="import", help="Import codebases and external tool projects (e.g., Spec-Kit, Linear, Jira)"
-)
-
-# 2.5. Migration
-app.add_typer(migrate.app, name="migrate", help="Migrate project bundles between formats")
-
-# 3. Planning
-app.add_typer(plan.app, name="plan", help="Manage development plans")
 
-# 3.5. Project Bundle Management
-app.add_typer(project_cmd.app, name="project", help="Manage project bundles with persona workflows")
+def _start_command_profile(ctx: typer.Context) -> None:
+    """Profile the invoked command and write the profile when the command finishes (--profile)."""
+    from specfact_cli.utils.profiling import start_profiling, stop_profiling
 
-# 4. Code Generation
-app.add_typer(generate.app, name="generate", help="Generate artifacts from SDD and plans")
+    start_profiling(f"specfact {ctx.invoked_subcommand}")
 
-# 5. Code Implementation
-app.add_typer(implement.app, name="implement", help="Execute tasks and generate code")
+    def write_profile() -> None:
+        from specfact_cli.utils.structure import SpecFactStructure
 
-# 6. Quality Enforcement
-app.add_typer(enforce.app, name="enforce", help="Configure quality gates")
-
-# 7. Workflow Orchestration
-
-# 8. Validation
-app.add_typer(repro.app, name="repro", help="Run validation suite")
-
-# 9. SDD Management
-app.add_typer(sdd.app, name="sdd", help="Manage SDD (Spec-Driven Development) manifests")
-
-# 10. API Contract Testing
-app.add_typer(spec.app, name="spec", help="Specmatic integration for API contract testing")
-
-# 10.5. OpenAPI Contract Management
-app.add_typer(contract_cmd.app, name="contract", help="Manage OpenAPI contracts for project bundles")
-
-# 11. Synchronization
-app.add_typer(sync.app, name="sync", help="Synchronize Spec-Kit artifacts and repository changes")
-
-# 11.5. Drift Detection
-app.add_typer(drift.app, name="drift", help="Detect drift between code and specifications")
-
-# 11.6. Analysis
-app.add_typer(analyze.app, name="analyze", help="Analyze codebase for contract coverage and quality")
+        profiler = stop_profiling()
+        if profiler is None:
+            return
+        try:
+            json_path, collapsed_path = profiler.write(
+                SpecFactStructure.get_timestamped_report_path("profile", extension="json")
+            )
+        except OSError as e:
+            console.print(f"[yellow]⚠ Could not write profile: {e}[/yellow]")
+            return
+        console.print(f"[dim]Profile written to: {json_path} (flamegraph stacks: {collapsed_path.name})[/dim]")
 
-# 12. External Tool Integration
-app.add_typer(
-    bridge.bridge_app,
-    name="bridge",
-    help="Bridge adapters for external tool integration (Spec-Kit, Linear, Jira, etc.)",
-)
+    # The root context closes after the subcommand finished, failed or was interrupted
+    ctx.call_on_close(write_profile)
 
 
 def cli_main() -> None:
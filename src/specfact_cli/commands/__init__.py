@@ -1,32 +1,26 @@
 """
 SpecFact CLI commands package.
 
-This package contains all CLI command implementations.
+This package contains all CLI command implementations. Command modules are
+imported on first attribute access so that importing the package (or running
+`specfact --help`) does not load every command.
 """
 
-from specfact_cli.commands import (
-    analyze,
-    bridge,
-    contract_cmd,
-    drift,
-    enforce,
-    generate,
-    implement,
-    import_cmd,
-    init,
-    migrate,
-    plan,
-    project_cmd,
-    repro,
-    sdd,
-    spec,
-    sync,
-)
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+from beartype import beartype
+from icontract import require
+
+from specfact_cli.utils.lazy_commands import LazyCommand
 
 
 __all__ = [
     "analyze",
     "bridge",
+    "cache_cmd",
     "contract_cmd",
     "drift",
     "enforce",
@@ -38,8 +32,75 @@ __all__ = [
     "plan",
     "project_cmd",
     "repro",
-    "run",
     "sdd",
     "spec",
     "sync",
 ]
+
+
+# Top-level commands in logical workflow order. The help text is defined only here: it is
+# shown by `specfact --help` (without importing the command module) and used as the help
+# of each command module's Typer app.
+COMMANDS: tuple[LazyCommand, ...] = (
+    # 1. Setup & Initialization
+    LazyCommand("init", "specfact_cli.commands.init", "Initialize SpecFact for IDE integration"),
+    # 2. Import & Analysis
+    LazyCommand(
+        "import",
+        "specfact_cli.commands.import_cmd",
+        "Import codebases and external tool projects (e.g., Spec-Kit, Linear, Jira)",
+    ),
+    # 2.5. Migration
+    LazyCommand("migrate", "specfact_cli.commands.migrate", "Migrate project bundles between formats"),
+    # 3. Planning
+    LazyCommand("plan", "specfact_cli.commands.plan", "Manage development plans"),
+    # 3.5. Project Bundle Management
+    LazyCommand("project", "specfact_cli.commands.project_cmd", "Manage project bundles with persona workflows"),
+    # 4. Code Generation
+    LazyCommand("generate", "specfact_cli.commands.generate", "Generate artifacts from SDD and plans"),
+    # 5. Code Implementation
+    LazyCommand("implement", "specfact_cli.commands.implement", "Execute tasks and generate code"),
+    # 6. Quality Enforcement
+    LazyCommand("enforce", "specfact_cli.commands.enforce", "Configure quality gates"),
+    # 7. Workflow Orchestration
+    # 8. Validation
+    LazyCommand("repro", "specfact_cli.commands.repro", "Run validation suite"),
+    # 9. SDD Management
+    LazyCommand("sdd", "specfact_cli.commands.sdd", "Manage SDD (Spec-Driven Development) manifests"),
+    # 10. API Contract Testing
+    LazyCommand("spec", "specfact_cli.commands.spec", "Specmatic integration for API contract testing"),
+    # 10.5. OpenAPI Contract Management
+    LazyCommand("contract", "specfact_cli.commands.contract_cmd", "Manage OpenAPI contracts for project bundles"),
+    # 11. Synchronization
+    LazyCommand("sync", "specfact_cli.commands.sync", "Synchronize Spec-Kit artifacts and repository changes"),
+    # 11.5. Drift Detection
+    LazyCommand("drift", "specfact_cli.commands.drift", "Detect drift between code and specifications"),
+    # 11.6. Analysis
+    LazyCommand("analyze", "specfact_cli.commands.analyze", "Analyze codebase for contract coverage and quality"),
+    # 11.7. Local Cache Management
+    LazyCommand("cache", "specfact_cli.commands.cache_cmd", "Manage local SpecFact caches (.specfact/cache)"),
+    # 12. External Tool Integration
+    LazyCommand(
+        "bridge",
+        "specfact_cli.commands.bridge",
+        "Bridge adapters for external tool integration (Spec-Kit, Linear, Jira, etc.)",
+        attribute="bridge_app",
+    ),
+)
+
+
+@beartype
+@require(lambda name: any(spec.name == name for spec in COMMANDS), "Command must be registered")
+def command_help(name: str) -> str:
+    """Return the help text of a registered top-level command."""
+    return next(spec.help for spec in COMMANDS if spec.name == name)
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
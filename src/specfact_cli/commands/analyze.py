@@ -16,6 +16,7 @@ from icontract import ensure, require
 from rich.console import Console
 from rich.table import Table
 
+from specfact_cli.commands import command_help
 from specfact_cli.models.quality import CodeQuality, QualityTracking
 from specfact_cli.telemetry import telemetry
 from specfact_cli.utils import print_error, print_success
@@ -23,7 +24,7 @@ from specfact_cli.utils.progress import load_bundle_with_progress
 from specfact_cli.utils.structure import SpecFactStructure
 
 
-app = typer.Typer(help="Analyze codebase for contract coverage and quality")
+app = typer.Typer(help=command_help("analyze"))
 console = Console()
 
 
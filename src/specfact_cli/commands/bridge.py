@@ -15,11 +15,12 @@ from beartype import beartype
 from icontract import ensure, require
 from rich.console import Console
 
+from specfact_cli.commands import command_help
 from specfact_cli.enrichers.constitution_enricher import ConstitutionEnricher
 from specfact_cli.utils import print_error, print_info, print_success
 
 
-bridge_app = typer.Typer(help="Bridge adapters for external tool integration (Spec-Kit, Linear, Jira, etc.)")
+bridge_app = typer.Typer(help=command_help("bridge"))
 console = Console()
 
 # Constitution subcommand group
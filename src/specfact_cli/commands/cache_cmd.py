@@ -0,0 +1,93 @@
+"""
+Cache command - Manage SpecFact's local caches.
+
+This module provides commands for inspecting and pruning the ephemeral caches
+stored under `.specfact/cache/` (e.g., the persistent analysis cache used by
+`specfact import from-code`).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+from beartype import beartype
+from icontract import ensure, require
+from rich.console import Console
+
+from specfact_cli.commands import command_help
+from specfact_cli.utils import print_success
+
+
+app = typer.Typer(help=command_help("cache"))
+console = Console()
+
+
+def _format_size(num_bytes: int) -> str:
+    """Format a byte count for display."""
+    if num_bytes < 1024:
+        return f"{num_bytes} B"
+    size = num_bytes / 1024
+    for unit in ("KB", "MB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+@app.command("prune")
+@beartype
+@require(lambda repo: isinstance(repo, Path), "Repository path must be Path")
+@require(lambda max_size: max_size >= 0, "Max size must be non-negative")
+@ensure(lambda result: result is None, "Must return None")
+def prune(
+    # Target/Input
+    repo: Path = typer.Option(
+        Path("."),
+        "--repo",
+        help="Path to repository. Default: current directory (.)",
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+    ),
+    # Behavior/Options
+    max_size: int = typer.Option(
+        512,
+        "--max-size",
+        help="Maximum cache size in MB; least recently used entries are evicted first. Default: 512",
+    ),
+    clear: bool = typer.Option(
+        False,
+        "--all",
+        help="Remove all cache entries. Default: False",
+    ),
+) -> None:
+    """
+    Prune the local caches with size-based LRU eviction.
+
+    Entries of the analysis, contract validation, repro result and CrossHair shard
+    caches are ordered by last use (cache hits refresh an entry's timestamp) and
+    the oldest are removed until the caches fit in --max-size. Other state under
+    `.specfact/cache` (e.g., the file stat index and repro durations) is kept.
+
+    **Parameter Groups:**
+    - **Target/Input**: --repo
+    - **Behavior/Options**: --max-size, --all
+
+    **Examples:**
+        specfact cache prune --repo .
+        specfact cache prune --repo . --max-size 100
+        specfact cache prune --repo . --all
+    """
+    from specfact_cli.utils.analysis_cache import LRU_CACHE_SUBDIRS, prune_cache_dirs
+    from specfact_cli.utils.structure import SpecFactStructure
+
+    cache_root = repo.resolve() / SpecFactStructure.CACHE
+    max_bytes = 0 if clear else max_size * 1024 * 1024
+
+    result = prune_cache_dirs([cache_root / subdir for subdir in LRU_CACHE_SUBDIRS], max_bytes)
+
+    print_success(
+        f"Removed {result.removed_entries} cache entries ({_format_size(result.removed_bytes)}), "
+        f"{result.remaining_entries} remaining ({_format_size(result.remaining_bytes)})"
+    )
@@ -16,21 +16,27 @@ from icontract import ensure, require
 from rich.console import Console
 from rich.table import Table
 
+from specfact_cli.commands import command_help
 from specfact_cli.models.contract import (
     ContractIndex,
     ContractStatus,
     count_endpoints,
     load_openapi_contract,
-    validate_openapi_schema,
 )
 from specfact_cli.models.project import FeatureIndex, ProjectBundle
 from specfact_cli.telemetry import telemetry
 from specfact_cli.utils import print_error, print_info, print_section, print_success, print_warning
 from specfact_cli.utils.progress import load_bundle_with_progress, save_bundle_with_progress
 from specfact_cli.utils.structure import SpecFactStructure
+from specfact_cli.validators.contract_cache import (
+    OPENAPI_SCHEMA_VALIDATOR,
+    OPENAPI_SCHEMA_VALIDATOR_VERSION,
+    ContractValidationCache,
+)
+from specfact_cli.validators.openapi_validator import validate_openapi_file
 
 
-app = typer.Typer(help="Manage OpenAPI contracts for project bundles")
+app = typer.Typer(help=command_help("contract"))
 console = Console()
 
 
@@ -123,7 +129,8 @@ def init_contract(
             print_error(f"Project bundle not found: {bundle_dir}")
             raise typer.Exit(1)
 
-        bundle_obj = load_bundle_with_progress(bundle_dir, validate_hashes=False, console_instance=console)
+        # Only the target feature's file is read (features are loaded on demand)
+        bundle_obj = load_bundle_with_progress(bundle_dir, validate_hashes=False, console_instance=console, lazy=True)
 
         # Check feature exists
         if feature not in bundle_obj.features:
@@ -311,19 +318,28 @@ def validate_contract(
         "--no-interactive",
         help="Non-interactive mode (for CI/CD automation). Default: False (interactive mode)",
     ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Validate all contracts again, bypassing cached results. Default: False",
+    ),
 ) -> None:
     """
     Validate OpenAPI contract schema.
 
-    Validates OpenAPI schema structure (supports both 3.0.x and 3.1.x).
+    Validates OpenAPI structure in-process (supports both 3.0.x and 3.1.x): required
+    fields, `$ref` resolution, unique operationIds, parameter locations and responses.
     For comprehensive validation including Specmatic, use 'specfact spec validate'.
 
+    Results are cached in `.specfact/cache/contracts/` by contract content; unchanged
+    contracts are not parsed again. Use --force to bypass the cache.
+
     Note: Accepts both OpenAPI 3.0.x and 3.1.x for forward compatibility.
     Specmatic currently supports 3.0.x; 3.1.x support is planned.
 
     **Parameter Groups:**
     - **Target/Input**: --repo, --bundle, --feature
-    - **Behavior/Options**: --no-interactive
+    - **Behavior/Options**: --no-interactive, --force
 
     **Examples:**
         specfact contract validate --bundle legacy-api --feature FEATURE-001
@@ -409,26 +425,44 @@ def validate_contract(
         table.add_column("Status", style="green")
         table.add_column("Endpoints", style="yellow")
 
+        # Results are cached by contract content and validator version
+        validation_cache = ContractValidationCache(repo)
         all_valid = True
+        invalid_contracts: list[tuple[str, list[str]]] = []
         for feature_key, contract_path in contracts_to_validate:
-            try:
-                contract_data = load_openapi_contract(contract_path)
-                is_valid = validate_openapi_schema(contract_data)
-                endpoint_count = count_endpoints(contract_data)
-
-                if is_valid:
-                    status = "✓ Valid"
-                    table.add_row(feature_key, contract_path.name, status, str(endpoint_count))
-                else:
-                    status = "✗ Invalid"
-                    table.add_row(feature_key, contract_path.name, status, "0")
-                    all_valid = False
-            except Exception as e:
-                status = f"✗ Error: {e}"
+            cached = (
+                None
+                if force
+                else validation_cache.get(OPENAPI_SCHEMA_VALIDATOR, OPENAPI_SCHEMA_VALIDATOR_VERSION, contract_path)
+            )
+            outcome = cached.result if cached is not None else _validate_contract_schema(contract_path)
+            if cached is None:
+                validation_cache.put(OPENAPI_SCHEMA_VALIDATOR, OPENAPI_SCHEMA_VALIDATOR_VERSION, contract_path, outcome)
+
+            if outcome.get("valid"):
+                status = "✓ Valid"
+                table.add_row(feature_key, contract_path.name, status, str(outcome.get("endpoints", 0)))
+            else:
+                issues = list(outcome.get("issues", []))
+                status = f"✗ Invalid ({len(issues)} issue(s))" if issues else "✗ Invalid"
                 table.add_row(feature_key, contract_path.name, status, "0")
+                invalid_contracts.append((feature_key, issues))
                 all_valid = False
 
         console.print(table)
+        cache_stats = validation_cache.get_stats()
+        if cache_stats.hits:
+            print_info(
+                f"{cache_stats.hits} of {len(contracts_to_validate)} result(s) replayed from cache (--force to re-run)"
+            )
+        validation_cache.prune()
+
+        for feature_key, issues in invalid_contracts:
+            console.print(f"\n[bold red]{feature_key}:[/bold red]")
+            for issue in issues[:10]:
+                console.print(f"  • {issue}")
+            if len(issues) > 10:
+                console.print(f"  ... and {len(issues) - 10} more issues")
 
         if not all_valid:
             print_error("Some contracts failed validation")
@@ -439,6 +473,12 @@ def validate_contract(
         record({"valid": True, "contracts_count": len(contracts_to_validate)})
 
 
+def _validate_contract_schema(contract_path: Path) -> dict[str, Any]:
+    """Validate a contract's OpenAPI structure (cacheable outcome: valid, endpoints, issues)."""
+    result = validate_openapi_file(contract_path)
+    return {"valid": result.is_valid, "endpoints": result.endpoints, "issues": result.errors}
+
+
 @app.command("coverage")
 @beartype
 @require(lambda repo: isinstance(repo, Path), "Repository path must be Path")
@@ -797,6 +837,14 @@ def verify_contract(
         "--no-interactive",
         help="Non-interactive mode (for CI/CD automation). Default: False (interactive mode)",
     ),
+    # Advanced
+    max_parallel: int | None = typer.Option(
+        None,
+        "--max-parallel",
+        min=1,
+        help="Maximum Specmatic processes run at the same time (default: one per CPU, up to 8)",
+        hidden=True,  # Hidden by default, shown with --help-advanced
+    ),
 ) -> None:
     """
     Verify OpenAPI contract - validate, generate examples, and test mock server.
@@ -808,10 +856,12 @@ def verify_contract(
     4. Runs basic connectivity tests
 
     Perfect for verifying contracts work correctly without a real API implementation.
+    Examples for several contracts are generated concurrently (bounded by --max-parallel).
 
     **Parameter Groups:**
     - **Target/Input**: --repo, --bundle, --feature
     - **Behavior/Options**: --port, --skip-mock, --no-interactive
+    - **Advanced**: --max-parallel
 
     **Examples:**
         # Verify a specific contract
@@ -834,7 +884,7 @@ def verify_contract(
         from specfact_cli.integrations.specmatic import (
             check_specmatic_available,
             create_mock_server,
-            generate_specmatic_examples,
+            generate_specmatic_examples_for_specs,
         )
 
         print_section("SpecFact CLI - OpenAPI Contract Verification")
@@ -909,18 +959,12 @@ def verify_contract(
         console.print("\n[bold cyan]Step 1: Validating contracts...[/bold cyan]")
         validation_errors = []
         for feat_key, contract_path in contracts_to_verify:
-            try:
-                contract_data = load_openapi_contract(contract_path)
-                is_valid = validate_openapi_schema(contract_data)
-                if is_valid:
-                    endpoints = count_endpoints(contract_data)
-                    print_success(f"✓ {feat_key}: Valid ({endpoints} endpoints)")
-                else:
-                    print_error(f"✗ {feat_key}: Invalid schema")
-                    validation_errors.append(f"{feat_key}: Schema validation failed")
-            except Exception as e:
-                print_error(f"✗ {feat_key}: Error - {e!s}")
-                validation_errors.append(f"{feat_key}: {e!s}")
+            structure = validate_openapi_file(contract_path)
+            if structure.is_valid:
+                print_success(f"✓ {feat_key}: Valid ({structure.endpoints} endpoints)")
+            else:
+                print_error(f"✗ {feat_key}: Invalid schema ({len(structure.issues)} issue(s))")
+                validation_errors.extend(f"{feat_key}: {error}" for error in structure.errors)
 
         if validation_errors:
             console.print("\n[bold red]Validation Errors:[/bold red]")
@@ -938,16 +982,26 @@ def verify_contract(
         import asyncio
 
         examples_generated = 0
-        for feat_key, contract_path in contracts_to_verify:
-            try:
-                examples_dir = asyncio.run(generate_specmatic_examples(contract_path))
-                if examples_dir.exists() and any(examples_dir.iterdir()):
-                    examples_generated += 1
-                    print_success(f"✓ {feat_key}: Examples generated")
-                else:
-                    print_warning(f"⚠ {feat_key}: No examples generated (schema may not have examples)")
-            except Exception as e:
-                print_warning(f"⚠ {feat_key}: Example generation failed - {e!s}")
+        feature_keys = {contract_path: feat_key for feat_key, contract_path in contracts_to_verify}
+
+        def report_examples(contract_path: Path, outcome: Path | Exception) -> None:
+            """Report a contract's examples as soon as they are generated."""
+            nonlocal examples_generated
+            feat_key = feature_keys[contract_path]
+            if isinstance(outcome, Exception):
+                print_warning(f"⚠ {feat_key}: Example generation failed - {outcome!s}")
+            elif outcome.exists() and any(outcome.iterdir()):
+                examples_generated += 1
+                print_success(f"✓ {feat_key}: Examples generated")
+            else:
+                print_warning(f"⚠ {feat_key}: No examples generated (schema may not have examples)")
+
+        # All contracts run in one event loop, bounded by max_parallel Specmatic processes
+        asyncio.run(
+            generate_specmatic_examples_for_specs(
+                list(feature_keys), max_concurrency=max_parallel, on_result=report_examples
+            )
+        )
 
         record({"examples_generated": examples_generated})
 
@@ -15,11 +15,12 @@ from beartype import beartype
 from icontract import ensure, require
 from rich.console import Console
 
+from specfact_cli.commands import command_help
 from specfact_cli.telemetry import telemetry
 from specfact_cli.utils import print_error, print_success
 
 
-app = typer.Typer(help="Detect drift between code and specifications")
+app = typer.Typer(help=command_help("drift"))
 console = Console()
 
 
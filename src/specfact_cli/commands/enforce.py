@@ -16,6 +16,7 @@ from icontract import require
 from rich.console import Console
 from rich.table import Table
 
+from specfact_cli.commands import command_help
 from specfact_cli.models.deviation import Deviation, DeviationSeverity, DeviationType, ValidationReport
 from specfact_cli.models.enforcement import EnforcementConfig, EnforcementPreset
 from specfact_cli.models.sdd import SDDManifest
@@ -24,7 +25,7 @@ from specfact_cli.utils.structure import SpecFactStructure
 from specfact_cli.utils.yaml_utils import dump_yaml
 
 
-app = typer.Typer(help="Configure quality gates and enforcement modes")
+app = typer.Typer(help=command_help("enforce"))
 console = Console()
 
 
@@ -224,7 +225,7 @@ def enforce_sdd(
         try:
             # Load SDD manifest
             console.print(f"[dim]Loading SDD manifest: {sdd}[/dim]")
-            sdd_data = load_structured_file(sdd)
+            sdd_data = load_structured_file(sdd, round_trip=False)
             sdd_manifest = SDDManifest.model_validate(sdd_data)
 
             # Load project bundle with progress indicator
@@ -234,8 +235,10 @@ def enforce_sdd(
             project_bundle = load_bundle_with_progress(bundle_dir, validate_hashes=False, console_instance=console)
             console.print("[dim]Computing hash...[/dim]")
 
-            summary = project_bundle.compute_summary(include_hash=True)
-            project_hash = summary.content_hash
+            # Pre-Merkle hashes of SDD manifests written by earlier versions are accepted
+            project_hash, content_hashes = project_bundle.content_hash_tree(
+                expected=sdd_manifest.plan_bundle_hash, assume_unmodified=True
+            )
 
             if not project_hash:
                 console.print("[bold red]✗[/bold red] Failed to compute project bundle hash")
@@ -252,10 +255,12 @@ def enforce_sdd(
             # 1. Validate hash match
             console.print("\n[cyan]Validating hash match...[/cyan]")
             if sdd_manifest.plan_bundle_hash != project_hash:
+                content_changes = sdd_manifest.describe_content_changes(content_hashes)
                 deviation = Deviation(
                     type=DeviationType.HASH_MISMATCH,
                     severity=DeviationSeverity.HIGH,
-                    description=f"SDD bundle hash mismatch: expected {project_hash[:16]}..., got {sdd_manifest.plan_bundle_hash[:16]}...",
+                    description=f"SDD bundle hash mismatch: expected {project_hash[:16]}..., got {sdd_manifest.plan_bundle_hash[:16]}..."
+                    + (f" ({content_changes})" if content_changes else ""),
                     location=str(sdd),
                     fix_hint=f"Run 'specfact plan harden {bundle}' to update SDD manifest with current bundle hash",
                 )
@@ -408,7 +413,7 @@ def enforce_sdd(
             elif output_format_str == "json":
                 dump_structured_file(report.model_dump(mode="json"), out, StructuredFormat.JSON)
             else:  # yaml
-                dump_structured_file(report.model_dump(mode="json"), out, StructuredFormat.YAML)
+                dump_structured_file(report.model_dump(mode="json"), out, StructuredFormat.YAML, round_trip=False)
 
             # Display summary
             console.print("\n[bold cyan]Validation Summary[/bold cyan]")
@@ -13,6 +13,7 @@ from beartype import beartype
 from icontract import ensure, require
 from rich.console import Console
 
+from specfact_cli.commands import command_help
 from specfact_cli.generators.contract_generator import ContractGenerator
 from specfact_cli.migrations.plan_migrator import load_plan_bundle
 from specfact_cli.models.sdd import SDDManifest
@@ -29,7 +30,7 @@ from specfact_cli.utils.optional_deps import check_cli_tool_available
 from specfact_cli.utils.structured_io import load_structured_file
 
 
-app = typer.Typer(help="Generate artifacts from SDD and plans")
+app = typer.Typer(help=command_help("generate"))
 console = Console()
 
 
@@ -195,7 +196,7 @@ def generate_contracts(
 
             # Load SDD manifest
             print_info(f"Loading SDD manifest: {sdd_path}")
-            sdd_data = load_structured_file(sdd_path)
+            sdd_data = load_structured_file(sdd_path, round_trip=False)
             sdd_manifest = SDDManifest(**sdd_data)
 
             # Align base_path with plan path when a bundle directory is provided
@@ -210,15 +211,18 @@ def generate_contracts(
             format_type, _ = detect_bundle_format(plan_path)
 
             plan_hash = None
+            content_changes: str | None = None
             if format_type == BundleFormat.MODULAR or bundle:
                 # Load modular ProjectBundle and convert to PlanBundle for compatibility
                 from specfact_cli.commands.plan import _convert_project_bundle_to_plan_bundle
 
                 project_bundle = load_bundle_with_progress(plan_path, validate_hashes=False, console_instance=console)
 
-                # Compute hash from ProjectBundle (same way as plan harden does)
-                summary = project_bundle.compute_summary(include_hash=True)
-                plan_hash = summary.content_hash
+                # Compute hash from ProjectBundle (same way as plan harden does; accepts pre-Merkle SDD hashes)
+                plan_hash, content_hashes = project_bundle.content_hash_tree(
+                    expected=sdd_manifest.plan_bundle_hash, assume_unmodified=True
+                )
+                content_changes = sdd_manifest.describe_content_changes(content_hashes)
 
                 # Convert to PlanBundle for ContractGenerator compatibility
                 plan_bundle = _convert_project_bundle_to_plan_bundle(project_bundle)
@@ -241,6 +245,8 @@ def generate_contracts(
             # Verify hash match (SDD uses plan_bundle_hash field)
             if sdd_manifest.plan_bundle_hash != plan_hash:
                 print_error("SDD manifest hash does not match plan bundle hash")
+                if content_changes:
+                    print_info(f"Bundle content {content_changes}")
                 print_info("Run 'specfact plan harden' to update SDD manifest")
                 raise typer.Exit(1)
 
@@ -1476,7 +1482,7 @@ def generate_tasks(
 
             if sdd and sdd.exists():
                 print_info(f"Loading SDD manifest: {sdd}")
-                sdd_data = load_structured_file(sdd)
+                sdd_data = load_structured_file(sdd, round_trip=False)
                 sdd_manifest = SDDManifest.model_validate(sdd_data)
             else:
                 print_warning("No SDD manifest found - tasks will be generated without architecture context")
@@ -1716,7 +1722,7 @@ def generate_fix_prompt(
             # Load gap report
             from specfact_cli.utils.structured_io import load_structured_file
 
-            gap_data = load_structured_file(gap_report_path)
+            gap_data = load_structured_file(gap_report_path, round_trip=False)
             gaps = gap_data.get("gaps", [])
 
             if not gaps:
@@ -21,12 +21,13 @@ from beartype import beartype
 from icontract import ensure, require
 from rich.console import Console
 
+from specfact_cli.commands import command_help
 from specfact_cli.models.task import Task, TaskList, TaskPhase, TaskStatus
 from specfact_cli.utils import print_error, print_info, print_success, print_warning
 from specfact_cli.utils.structured_io import StructuredFormat, dump_structured_file, load_structured_file
 
 
-app = typer.Typer(help="[DEPRECATED] Execute tasks and generate code - Use 'generate fix-prompt' instead")
+app = typer.Typer(help=command_help("implement"))
 console = Console()
 
 
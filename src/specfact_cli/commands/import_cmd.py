@@ -20,16 +20,21 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 
 from specfact_cli import runtime
+from specfact_cli.commands import command_help
 from specfact_cli.models.bridge import AdapterType
 from specfact_cli.models.plan import Feature, PlanBundle
 from specfact_cli.models.project import BundleManifest, BundleVersions, ProjectBundle
 from specfact_cli.telemetry import telemetry
+from specfact_cli.utils.ast_cache import parsed_module_cache_scope
+from specfact_cli.utils.executors import ExecutorConfig, ExecutorKind
 from specfact_cli.utils.performance import track_performance
+from specfact_cli.utils.profiling import profile_phase
 from specfact_cli.utils.progress import save_bundle_with_progress
+from specfact_cli.utils.repo_walker import RepoFileIndex, list_python_files, repo_file_index_scope
 
 
 app = typer.Typer(
-    help="Import codebases and external tool projects (e.g., Spec-Kit, Linear, Jira) to contract format",
+    help=command_help("import"),
     context_settings={"help_option_names": ["-h", "--help", "--help-advanced", "-ha"]},
 )
 console = Console()
@@ -45,11 +50,6 @@ def _is_valid_output_path(path: Path | None) -> bool:
     return path is None or path.exists()
 
 
-def _count_python_files(repo: Path) -> int:
-    """Count Python files for anonymized telemetry metrics."""
-    return sum(1 for _ in repo.rglob("*.py"))
-
-
 def _convert_plan_bundle_to_project_bundle(plan_bundle: PlanBundle, bundle_name: str) -> ProjectBundle:
     """
     Convert PlanBundle (monolithic) to ProjectBundle (modular).
@@ -178,6 +178,8 @@ def _analyze_codebase(
     key_format: str,
     routing_result: Any,
     incremental_callback: Any | None = None,
+    analysis_cache: Any | None = None,
+    executor_config: Any | None = None,
 ) -> PlanBundle:
     """Analyze codebase using AI agent or AST fallback."""
     from specfact_cli.agents.analyze_agent import AnalyzeAgent
@@ -220,6 +222,8 @@ def _analyze_codebase(
         plan_name=bundle,
         entry_point=entry_point,
         incremental_callback=incremental_callback or on_incremental_update,
+        analysis_cache=analysis_cache,
+        executor_config=executor_config,
     )
 
     # Display plugin status
@@ -254,21 +258,29 @@ def _analyze_codebase(
     return analyzer.analyze()
 
 
-def _update_source_tracking(plan_bundle: PlanBundle, repo: Path) -> None:
-    """Update source tracking with file hashes (parallelized)."""
+def _update_source_tracking(plan_bundle: PlanBundle, repo: Path) -> str | None:
+    """
+    Update source tracking with file hashes (parallelized).
+
+    Returns:
+        Git commit the hashes were recorded at (None outside a git repository)
+    """
     import os
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
+    from specfact_cli.utils.git_changes import GitHashIndex
     from specfact_cli.utils.source_scanner import SourceArtifactScanner
 
     console.print("\n[cyan]🔗 Linking source files to features...[/cyan]")
     scanner = SourceArtifactScanner(repo)
     scanner.link_to_specs(plan_bundle.features, repo)
+    # Files shared by several features are hashed once; files unchanged per git or by stat data are not read
+    hash_index = GitHashIndex(repo)
 
     def update_file_hash(feature: Feature, file_path: Path) -> None:
         """Update hash for a single file (thread-safe)."""
         if file_path.exists() and feature.source_tracking is not None:
-            feature.source_tracking.update_hash(file_path)
+            feature.source_tracking.update_hash(file_path, hash_index.repo_path, hasher=hash_index.hash_file)
 
     hash_tasks: list[tuple[Feature, Path]] = []
     for feature in plan_bundle.features:
@@ -328,11 +340,13 @@ def _update_source_tracking(plan_bundle: PlanBundle, repo: Path) -> None:
                 else:
                     executor.shutdown(wait=False)
 
+    hash_index.save()
     for feature in plan_bundle.features:
         if feature.source_tracking:
             feature.source_tracking.update_sync_timestamp()
 
     console.print("[green]✓[/green] Source tracking complete")
+    return hash_index.head_commit
 
 
 def _extract_relationships_and_graph(
@@ -344,6 +358,8 @@ def _extract_relationships_and_graph(
     should_regenerate_relationships: bool,
     should_regenerate_graph: bool,
     include_tests: bool = True,
+    analysis_cache: Any | None = None,
+    executor_config: Any | None = None,
 ) -> tuple[dict[str, Any], dict[str, Any] | None]:
     """Extract relationships and graph dependencies."""
     relationships: dict[str, Any] = {}
@@ -368,7 +384,7 @@ def _extract_relationships_and_graph(
         )
         console.print("[dim]   Install with: pip install pyan3[/dim]")
 
-    relationship_mapper = RelationshipMapper(repo)
+    relationship_mapper = RelationshipMapper(repo, analysis_cache=analysis_cache, executor_config=executor_config)
 
     changed_files: set[Path] = set()
     if incremental_changes and plan_bundle:
@@ -386,9 +402,8 @@ def _extract_relationships_and_graph(
         python_files = list(changed_files)
         console.print(f"[dim]Analyzing {len(python_files)} changed file(s) for relationships...[/dim]")
     else:
-        python_files = list(repo.rglob("*.py"))
-        if entry_point:
-            python_files = [f for f in python_files if entry_point in f.parts]
+        # Excluded and ignored directories (.venv, node_modules, ...) are pruned by the walker
+        python_files = list_python_files(repo, subdir=entry_point)
 
         # Filter files based on --include-tests/--exclude-tests flag
         # Default: Include test files for comprehensive analysis
@@ -398,45 +413,27 @@ def _extract_relationships_and_graph(
         # - Test files import production code, but production code doesn't import tests
         # - Interfaces and routes are defined in production code, not tests
         # - Dependency graph flows from production code, so skipping tests has minimal impact
-        if not include_tests:
-            # Exclude test files when --exclude-tests is specified
-            python_files = [
-                f
-                for f in python_files
-                if not any(
-                    skip in str(f)
-                    for skip in [
-                        "/test_",
-                        "/tests/",
-                        "/vendor/",
-                        "/.venv/",
-                        "/venv/",
-                        "/node_modules/",
-                        "/__pycache__/",
-                    ]
-                )
-            ]
-        else:
-            # Default: Include test files, but still filter vendor/venv files
-            python_files = [
-                f
-                for f in python_files
-                if not any(
-                    skip in str(f) for skip in ["/vendor/", "/.venv/", "/venv/", "/node_modules/", "/__pycache__/"]
-                )
-            ]
+        skip_dirs = {"vendor"} if include_tests else {"vendor", "tests"}
+        python_files = [
+            f
+            for f in python_files
+            if not skip_dirs.intersection(f.relative_to(repo).parts[:-1])
+            and (include_tests or not f.name.startswith("test_"))
+        ]
 
     # Analyze relationships in parallel (optimized for speed)
-    relationships = relationship_mapper.analyze_files(python_files)
+    with profile_phase("relationships", files=len(python_files)):
+        relationships = relationship_mapper.analyze_files(python_files)
     console.print(f"[green]✓[/green] Mapped {len(relationships['imports'])} files with relationships")
 
     # Graph analysis is optional and can be slow - only run if explicitly needed
     # Skip by default for faster imports (can be enabled with --with-graph flag in future)
     if should_regenerate_graph and pyan3_available:
         console.print("[dim]Building dependency graph (this may take a moment)...[/dim]")
-        graph_analyzer = GraphAnalyzer(repo)
-        graph_analyzer.build_dependency_graph(python_files)
-        graph_summary = graph_analyzer.get_graph_summary()
+        graph_analyzer = GraphAnalyzer(repo, executor_config=executor_config)
+        with profile_phase("call_graph", files=len(python_files)):
+            graph_analyzer.build_dependency_graph(python_files)
+            graph_summary = graph_analyzer.get_graph_summary()
         if graph_summary:
             console.print(
                 f"[green]✓[/green] Built dependency graph: {graph_summary.get('nodes', 0)} modules, {graph_summary.get('edges', 0)} dependencies"
@@ -786,8 +783,9 @@ def _save_bundle_if_needed(
     should_regenerate_graph: bool,
     should_regenerate_contracts: bool,
     should_regenerate_enrichment: bool,
+    synced_commit: str | None = None,
 ) -> None:
-    """Save project bundle only if something changed."""
+    """Save project bundle only if something changed (recording the commit source hashes were taken at)."""
     any_artifact_changed = (
         should_regenerate_relationships
         or should_regenerate_graph
@@ -801,6 +799,10 @@ def _save_bundle_if_needed(
     if should_regenerate_bundle:
         console.print("\n[cyan]💾 Compiling and saving project bundle...[/cyan]")
         project_bundle = _convert_plan_bundle_to_project_bundle(plan_bundle, bundle)
+        if synced_commit:
+            from specfact_cli.utils.git_changes import SYNCED_COMMIT_KEY
+
+            project_bundle.manifest.bundle[SYNCED_COMMIT_KEY] = synced_commit
         save_bundle_with_progress(project_bundle, bundle_dir, atomic=True, console_instance=console)
     else:
         console.print("\n[dim]⏭ Skipping bundle save (no changes detected)[/dim]")
@@ -810,6 +812,8 @@ def _validate_bundle_contracts(bundle_dir: Path, plan_bundle: PlanBundle) -> tup
     """
     Validate OpenAPI/AsyncAPI contracts in bundle with Specmatic if available.
 
+    OpenAPI structure is checked in-process first; Specmatic runs only for contracts that pass.
+
     Args:
         bundle_dir: Path to bundle directory
         plan_bundle: Plan bundle containing features with contract references
@@ -819,16 +823,16 @@ def _validate_bundle_contracts(bundle_dir: Path, plan_bundle: PlanBundle) -> tup
     """
     import asyncio
 
-    from specfact_cli.integrations.specmatic import check_specmatic_available, validate_spec_with_specmatic
+    from specfact_cli.integrations.specmatic import (
+        check_specmatic_available,
+        prevalidate_spec_structure,
+        validate_spec_with_specmatic,
+    )
 
     # Skip validation in test mode to avoid long-running subprocess calls
     if os.environ.get("TEST_MODE") == "true":
         return 0, 0
 
-    is_available, _error_msg = check_specmatic_available()
-    if not is_available:
-        return 0, 0
-
     validated_count = 0
     failed_count = 0
     contract_files = []
@@ -845,8 +849,24 @@ def _validate_bundle_contracts(bundle_dir: Path, plan_bundle: PlanBundle) -> tup
     if not contract_files:
         return 0, 0
 
-    console.print(f"\n[cyan]🔍 Validating {len(contract_files)} contract(s) in bundle with Specmatic...[/cyan]")
-    for contract_path, feature_key in contract_files[:5]:  # Validate up to 5 contracts
+    # Structural pre-pass (in-process, no Specmatic needed)
+    passing_files = []
+    for contract_path, feature_key in contract_files:
+        failure = prevalidate_spec_structure(contract_path)
+        if failure is None:
+            passing_files.append((contract_path, feature_key))
+            continue
+        console.print(f"  [yellow]⚠[/yellow] {contract_path.name} (from {feature_key}) has structural errors")
+        for error in failure.errors[:2]:
+            console.print(f"    - {error}")
+        failed_count += 1
+
+    is_available, _error_msg = check_specmatic_available()
+    if not is_available or not passing_files:
+        return validated_count, failed_count
+
+    console.print(f"\n[cyan]🔍 Validating {len(passing_files)} contract(s) in bundle with Specmatic...[/cyan]")
+    for contract_path, feature_key in passing_files[:5]:  # Validate up to 5 contracts
         console.print(f"[dim]Validating {contract_path.relative_to(bundle_dir)} (from {feature_key})...[/dim]")
         try:
             result = asyncio.run(validate_spec_with_specmatic(contract_path))
@@ -863,9 +883,9 @@ def _validate_bundle_contracts(bundle_dir: Path, plan_bundle: PlanBundle) -> tup
             console.print(f"  [yellow]⚠[/yellow] Validation error: {e!s}")
             failed_count += 1
 
-    if len(contract_files) > 5:
+    if len(passing_files) > 5:
         console.print(
-            f"[dim]... and {len(contract_files) - 5} more contract(s) (run 'specfact spec validate' to validate all)[/dim]"
+            f"[dim]... and {len(passing_files) - 5} more contract(s) (run 'specfact spec validate' to validate all)[/dim]"
         )
 
     return validated_count, failed_count
@@ -1505,6 +1525,11 @@ def from_code(
         "--include-tests/--exclude-tests",
         help="Include/exclude test files in relationship mapping. Default: --include-tests (test files are included for comprehensive analysis). Use --exclude-tests to optimize speed.",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Disable the persistent analysis cache (.specfact/cache/analysis) and re-analyze every file. Default: False",
+    ),
     # Advanced/Configuration (hidden by default, use --help-advanced to see)
     confidence: float = typer.Option(
         0.5,
@@ -1520,6 +1545,20 @@ def from_code(
         help="Feature key format: 'classname' (FEATURE-CLASSNAME) or 'sequential' (FEATURE-001). Default: classname",
         hidden=True,  # Hidden by default, shown with --help-advanced
     ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        min=1,
+        help="Number of analysis workers. Default: auto (based on CPU cores and repository size)",
+        hidden=True,  # Hidden by default, shown with --help-advanced
+    ),
+    executor: ExecutorKind | None = typer.Option(
+        None,
+        "--executor",
+        case_sensitive=False,
+        help="Executor for per-file analysis: 'thread', 'process' (multi-core AST analysis) or 'serial'. Default: auto (process for large repositories)",
+        hidden=True,  # Hidden by default, shown with --help-advanced
+    ),
 ) -> None:
     """
     Import plan bundle from existing codebase (one-way import).
@@ -1534,8 +1573,8 @@ def from_code(
     **Parameter Groups:**
     - **Target/Input**: bundle (required argument), --repo, --entry-point, --enrichment
     - **Output/Results**: --report
-    - **Behavior/Options**: --shadow-only, --enrich-for-speckit, --force, --include-tests/--exclude-tests
-    - **Advanced/Configuration**: --confidence, --key-format
+    - **Behavior/Options**: --shadow-only, --enrich-for-speckit, --force, --include-tests/--exclude-tests, --no-cache
+    - **Advanced/Configuration**: --confidence, --key-format, --workers, --executor
 
     **Examples:**
         specfact import from-code legacy-api --repo .
@@ -1543,6 +1582,8 @@ def from_code(
         specfact import from-code my-project --repo . --confidence 0.7 --shadow-only
         specfact import from-code my-project --repo . --force  # Force full regeneration
         specfact import from-code my-project --repo . --exclude-tests  # Exclude test files for faster processing
+        specfact import from-code my-project --repo . --no-cache  # Re-analyze every file
+        specfact import from-code my-project --repo . --workers 32 --executor process  # Multi-core analysis
     """
     from specfact_cli.cli import get_current_mode
     from specfact_cli.modes import get_router
@@ -1563,7 +1604,9 @@ def from_code(
     router = get_router()
     routing_result = router.route("import from-code", mode, {"repo": str(repo), "confidence": confidence})
 
-    python_file_count = _count_python_files(repo)
+    # Discover Python files once; every analysis phase shares this list
+    repo_files = RepoFileIndex()
+    python_file_count = len(repo_files.files(repo))
 
     from specfact_cli.utils.structure import SpecFactStructure
 
@@ -1590,6 +1633,14 @@ def from_code(
     if shadow_only:
         console.print("[yellow]→ Shadow mode - observe without enforcement[/yellow]")
 
+    # Persistent per-file analysis cache (unchanged files are merged from cache instead of re-analyzed)
+    from specfact_cli.utils.analysis_cache import AnalysisCache
+
+    analysis_cache = None if no_cache else AnalysisCache(repo)
+
+    # Executor for per-file analysis (unset values are chosen from core count and repository size)
+    executor_config = ExecutorConfig(kind=executor, workers=workers)
+
     telemetry_metadata = {
         "bundle": bundle,
         "mode": mode.value,
@@ -1602,6 +1653,8 @@ def from_code(
     with (
         track_performance("import.from_code", threshold=5.0) as perf_monitor,
         telemetry.track_command("import.from_code", telemetry_metadata) as record_event,
+        parsed_module_cache_scope() as ast_cache,
+        repo_file_index_scope(repo_files),
     ):
         try:
             # If enrichment is provided, try to load existing bundle
@@ -1649,6 +1702,8 @@ def from_code(
                             key_format,
                             routing_result,
                             incremental_callback=on_incremental_update,
+                            analysis_cache=analysis_cache,
+                            executor_config=executor_config,
                         )
                     if plan_bundle is None:
                         console.print("[bold red]✗ Failed to analyze codebase[/bold red]")
@@ -1668,7 +1723,7 @@ def from_code(
 
             # Add source tracking to features
             with perf_monitor.track("update_source_tracking"):
-                _update_source_tracking(plan_bundle, repo)
+                synced_commit = _update_source_tracking(plan_bundle, repo)
 
             # Enhanced Analysis Phase: Extract relationships, contracts, and graph dependencies
             # Check if we need to regenerate these artifacts
@@ -1692,6 +1747,8 @@ def from_code(
                     should_regenerate_relationships,
                     should_regenerate_graph,
                     include_tests,
+                    analysis_cache=analysis_cache,
+                    executor_config=executor_config,
                 )
 
             # Phase 4.10: Track contract extraction performance
@@ -1728,6 +1785,7 @@ def from_code(
                     should_regenerate_graph,
                     should_regenerate_contracts,
                     should_regenerate_enrichment,
+                    synced_commit=synced_commit,
                 )
 
             console.print("\n[bold green]✓ Import complete![/bold green]")
@@ -1757,6 +1815,23 @@ def from_code(
 
             _generate_report(repo, bundle_dir, plan_bundle, confidence, enrichment, report)
 
+            # Report parse-once AST cache effectiveness for this run
+            ast_cache_stats = ast_cache.get_stats()
+            console.print(
+                f"[dim]AST cache: {ast_cache_stats.hits} hits, {ast_cache_stats.misses} misses"
+                f" ({ast_cache_stats.entries} files cached)[/dim]"
+            )
+            record_event({"ast_cache_hits": ast_cache_stats.hits, "ast_cache_misses": ast_cache_stats.misses})
+            if analysis_cache is not None:
+                from specfact_cli.utils.analysis_cache import DEFAULT_MAX_CACHE_BYTES
+
+                analysis_cache_stats = analysis_cache.get_stats()
+                console.print(
+                    f"[dim]Analysis cache: {analysis_cache_stats.hits} hits, {analysis_cache_stats.misses} misses[/dim]"
+                )
+                # Keep the cache bounded (least recently used entries are evicted first)
+                analysis_cache.prune(DEFAULT_MAX_CACHE_BYTES)
+
             # Phase 4.10: Print performance report if slow operations detected
             perf_report = perf_monitor.get_report()
             if perf_report.slow_operations and not os.environ.get("CI"):
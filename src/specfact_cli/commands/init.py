@@ -17,6 +17,7 @@ from icontract import ensure, require
 from rich.console import Console
 from rich.panel import Panel
 
+from specfact_cli.commands import command_help
 from specfact_cli.telemetry import telemetry
 from specfact_cli.utils.env_manager import EnvManager, build_tool_command, detect_env_manager
 from specfact_cli.utils.ide_setup import (
@@ -28,7 +29,7 @@ from specfact_cli.utils.ide_setup import (
 )
 
 
-app = typer.Typer(help="Initialize SpecFact for IDE integration")
+app = typer.Typer(help=command_help("init"))
 console = Console()
 
 
@@ -16,6 +16,7 @@ from beartype import beartype
 from icontract import ensure, require
 from rich.console import Console
 
+from specfact_cli.commands import command_help
 from specfact_cli.models.plan import Feature
 from specfact_cli.utils import print_error, print_info, print_success, print_warning
 from specfact_cli.utils.progress import load_bundle_with_progress, save_bundle_with_progress
@@ -23,7 +24,7 @@ from specfact_cli.utils.structure import SpecFactStructure
 from specfact_cli.utils.structured_io import StructuredFormat
 
 
-app = typer.Typer(help="Migrate project bundles between formats")
+app = typer.Typer(help=command_help("migrate"))
 console = Console()
 
 
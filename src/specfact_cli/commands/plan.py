@@ -21,6 +21,7 @@ from rich.table import Table
 
 from specfact_cli import runtime
 from specfact_cli.analyzers.ambiguity_scanner import AmbiguityFinding
+from specfact_cli.commands import command_help
 from specfact_cli.comparators.plan_comparator import PlanComparator
 from specfact_cli.generators.report_generator import ReportFormat, ReportGenerator
 from specfact_cli.models.deviation import Deviation, DeviationSeverity, DeviationType, ValidationReport
@@ -42,19 +43,20 @@ from specfact_cli.utils import (
     prompt_list,
     prompt_text,
 )
+from specfact_cli.utils.profiling import profile_phase
 from specfact_cli.utils.progress import load_bundle_with_progress, save_bundle_with_progress
 from specfact_cli.utils.structured_io import StructuredFormat, load_structured_file
 from specfact_cli.validators.schema import validate_plan_bundle
 
 
-app = typer.Typer(help="Manage development plans, features, and stories")
+app = typer.Typer(help=command_help("plan"))
 console = Console()
 
 
 # Use shared progress utilities for consistency (aliased to maintain existing function names)
-def _load_bundle_with_progress(bundle_dir: Path, validate_hashes: bool = False) -> ProjectBundle:
+def _load_bundle_with_progress(bundle_dir: Path, validate_hashes: bool = False, lazy: bool = False) -> ProjectBundle:
     """Load project bundle with unified progress display."""
-    return load_bundle_with_progress(bundle_dir, validate_hashes=validate_hashes, console_instance=console)
+    return load_bundle_with_progress(bundle_dir, validate_hashes=validate_hashes, console_instance=console, lazy=lazy)
 
 
 def _save_bundle_with_progress(bundle: ProjectBundle, bundle_dir: Path, atomic: bool = True) -> None:
@@ -590,22 +592,15 @@ def add_story(
         print_section("SpecFact CLI - Add Story")
 
         try:
-            # Load existing project bundle
-            project_bundle = _load_bundle_with_progress(bundle_dir, validate_hashes=False)
-
-            # Convert to PlanBundle for compatibility
-            plan_bundle = _convert_project_bundle_to_plan_bundle(project_bundle)
+            # Load existing project bundle (only the parent feature's file is read)
+            project_bundle = _load_bundle_with_progress(bundle_dir, validate_hashes=False, lazy=True)
 
             # Find parent feature
-            parent_feature = None
-            for f in plan_bundle.features:
-                if f.key == feature:
-                    parent_feature = f
-                    break
+            parent_feature = project_bundle.get_feature(feature)
 
             if parent_feature is None:
                 print_error(f"Feature '{feature}' not found in bundle")
-                console.print(f"[dim]Available features: {', '.join(f.key for f in plan_bundle.features)}[/dim]")
+                console.print(f"[dim]Available features: {', '.join(project_bundle.features)}[/dim]")
                 raise typer.Exit(1)
 
             # Check if story key already exists in feature
@@ -634,10 +629,10 @@ def add_story(
 
             # Add story to feature
             parent_feature.stories.append(new_story)
+            project_bundle.update_feature(feature, parent_feature)
 
-            # Convert back to ProjectBundle and save
-            updated_project_bundle = _convert_plan_bundle_to_project_bundle(plan_bundle, bundle)
-            _save_bundle_with_progress(updated_project_bundle, bundle_dir, atomic=True)
+            # Save (only the changed feature file and the manifest are rewritten)
+            _save_bundle_with_progress(project_bundle, bundle_dir, atomic=True)
 
             record(
                 {
@@ -925,11 +920,8 @@ def update_feature(
         print_section("SpecFact CLI - Update Feature")
 
         try:
-            # Load existing project bundle
-            project_bundle = _load_bundle_with_progress(bundle_dir, validate_hashes=False)
-
-            # Convert to PlanBundle for compatibility
-            existing_plan = _convert_project_bundle_to_plan_bundle(project_bundle)
+            # Load existing project bundle (feature files are read only for the features being updated)
+            project_bundle = _load_bundle_with_progress(bundle_dir, validate_hashes=False, lazy=True)
 
             # Handle batch updates
             if batch_updates:
@@ -938,7 +930,7 @@ def update_feature(
                     raise typer.Exit(1)
 
                 print_info(f"Loading batch updates from: {batch_updates}")
-                batch_data = load_structured_file(batch_updates)
+                batch_data = load_structured_file(batch_updates, round_trip=False)
 
                 if not isinstance(batch_data, list):
                     print_error("Batch updates file must contain a list of update objects")
@@ -961,11 +953,7 @@ def update_feature(
                     total_updates += 1
 
                     # Find feature to update
-                    feature_to_update = None
-                    for f in existing_plan.features:
-                        if f.key == update_key:
-                            feature_to_update = f
-                            break
+                    feature_to_update = project_bundle.get_feature(update_key)
 
                     if feature_to_update is None:
                         failed_updates.append({"key": update_key, "error": f"Feature '{update_key}' not found in plan"})
@@ -1030,22 +1018,21 @@ def update_feature(
                         updates_made.append("draft")
 
                     if updates_made:
+                        project_bundle.update_feature(update_key, feature_to_update)
                         successful_updates += 1
                         console.print(f"[dim]✓ Updated {update_key}: {', '.join(updates_made)}[/dim]")
                     else:
                         failed_updates.append({"key": update_key, "error": "No valid update fields provided"})
 
-                # Convert back to ProjectBundle and save
-                print_info("Validating updated plan...")
-                updated_project_bundle = _convert_plan_bundle_to_project_bundle(existing_plan, bundle)
-                _save_bundle_with_progress(updated_project_bundle, bundle_dir, atomic=True)
+                # Save (only changed feature files and the manifest are rewritten)
+                _save_bundle_with_progress(project_bundle, bundle_dir, atomic=True)
 
                 record(
                     {
                         "batch_total": total_updates,
                         "batch_successful": successful_updates,
                         "batch_failed": len(failed_updates),
-                        "total_features": len(existing_plan.features),
+                        "total_features": len(project_bundle.features),
                     }
                 )
 
@@ -1064,15 +1051,11 @@ def update_feature(
                     raise typer.Exit(1)
 
                 # Find feature to update
-                feature_to_update = None
-                for f in existing_plan.features:
-                    if f.key == key:
-                        feature_to_update = f
-                        break
+                feature_to_update = project_bundle.get_feature(key)
 
                 if feature_to_update is None:
                     print_error(f"Feature '{key}' not found in plan")
-                    console.print(f"[dim]Available features: {', '.join(f.key for f in existing_plan.features)}[/dim]")
+                    console.print(f"[dim]Available features: {', '.join(project_bundle.features)}[/dim]")
                     raise typer.Exit(1)
 
                 # Track what was updated
@@ -1120,15 +1103,14 @@ def update_feature(
                     )
                     raise typer.Exit(1)
 
-                # Convert back to ProjectBundle and save
-                print_info("Validating updated plan...")
-                updated_project_bundle = _convert_plan_bundle_to_project_bundle(existing_plan, bundle)
-                _save_bundle_with_progress(updated_project_bundle, bundle_dir, atomic=True)
+                # Save (only the changed feature file and the manifest are rewritten)
+                project_bundle.update_feature(key, feature_to_update)
+                _save_bundle_with_progress(project_bundle, bundle_dir, atomic=True)
 
                 record(
                     {
                         "updates": updates_made,
-                        "total_features": len(existing_plan.features),
+                        "total_features": len(project_bundle.features),
                     }
                 )
 
@@ -1271,7 +1253,7 @@ def update_story(
                     raise typer.Exit(1)
 
                 print_info(f"Loading batch updates from: {batch_updates}")
-                batch_data = load_structured_file(batch_updates)
+                batch_data = load_structured_file(batch_updates, round_trip=False)
 
                 if not isinstance(batch_data, list):
                     print_error("Batch updates file must contain a list of update objects")
@@ -3223,7 +3205,11 @@ def _deduplicate_features(bundle: PlanBundle) -> int:
     "Must return (bool, SDDManifest | None, ValidationReport) tuple",
 )
 def _validate_sdd_for_bundle(
-    bundle: PlanBundle, bundle_name: str, require_sdd: bool = False, project_hash: str | None = None
+    bundle: PlanBundle,
+    bundle_name: str,
+    require_sdd: bool = False,
+    project_hash: str | None = None,
+    content_hashes: dict[str, str] | None = None,
 ) -> tuple[bool, SDDManifest | None, ValidationReport]:
     """
     Validate SDD manifest for project bundle.
@@ -3233,6 +3219,7 @@ def _validate_sdd_for_bundle(
         bundle_name: Project bundle name
         require_sdd: If True, return False if SDD is missing (for promotion gates)
         project_hash: Optional hash computed from ProjectBundle BEFORE modifications (for consistency with plan harden)
+        content_hashes: Leaf hashes of project_hash (`ProjectBundle.content_hashes()`), used to name changed features
 
     Returns:
         Tuple of (is_valid, sdd_manifest, validation_report)
@@ -3264,7 +3251,7 @@ def _validate_sdd_for_bundle(
 
     # Load SDD manifest
     try:
-        sdd_data = load_structured_file(sdd_path)
+        sdd_data = load_structured_file(sdd_path, round_trip=False)
         sdd_manifest = SDDManifest.model_validate(sdd_data)
     except Exception as e:
         deviation = Deviation(
@@ -3288,10 +3275,12 @@ def _validate_sdd_for_bundle(
         bundle_hash = bundle.metadata.summary.content_hash if bundle.metadata and bundle.metadata.summary else None
 
     if bundle_hash and sdd_manifest.plan_bundle_hash != bundle_hash:
+        content_changes = sdd_manifest.describe_content_changes(content_hashes) if content_hashes else None
         deviation = Deviation(
             type=DeviationType.HASH_MISMATCH,
             severity=DeviationSeverity.HIGH,
-            description=f"SDD bundle hash mismatch: expected {bundle_hash[:16]}..., got {sdd_manifest.plan_bundle_hash[:16]}...",
+            description=f"SDD bundle hash mismatch: expected {bundle_hash[:16]}..., got {sdd_manifest.plan_bundle_hash[:16]}..."
+            + (f" ({content_changes})" if content_changes else ""),
             location=str(sdd_path),
             fix_hint=f"Run 'specfact plan harden {bundle_name}' to update SDD manifest",
         )
@@ -3360,7 +3349,7 @@ def _validate_sdd_for_plan(
 
     # Load SDD manifest
     try:
-        sdd_data = load_structured_file(sdd_path)
+        sdd_data = load_structured_file(sdd_path, round_trip=False)
         sdd_manifest = SDDManifest.model_validate(sdd_data)
     except Exception as e:
         deviation = Deviation(
@@ -3413,6 +3402,20 @@ def _validate_sdd_for_plan(
     return (is_valid, sdd_manifest, report)
 
 
+def _recorded_sdd_hash(bundle_name: str) -> str | None:
+    """Read the bundle hash recorded in a bundle's SDD manifest (None if missing or unreadable)."""
+    from specfact_cli.utils.sdd_discovery import find_sdd_for_bundle
+
+    sdd_path = find_sdd_for_bundle(bundle_name, Path.cwd())
+    if sdd_path is None:
+        return None
+    try:
+        recorded = load_structured_file(sdd_path, round_trip=False).get("plan_bundle_hash")
+    except Exception:
+        return None
+    return recorded if isinstance(recorded, str) and recorded else None
+
+
 @beartype
 @require(lambda project_bundle: isinstance(project_bundle, ProjectBundle), "Project bundle must be ProjectBundle")
 @require(lambda bundle_dir: isinstance(bundle_dir, Path), "Bundle dir must be Path")
@@ -3436,10 +3439,11 @@ def _prepare_review_bundle(
     """
     # Compute hash from ProjectBundle BEFORE any modifications (same as plan harden does)
     # This ensures hash consistency with SDD manifest created by plan harden
-    project_summary = project_bundle.compute_summary(include_hash=True)
-    project_hash = project_summary.content_hash
-    if not project_hash:
-        print_warning("Failed to compute project bundle hash for SDD validation")
+    # (the pre-Merkle hash of an SDD manifest written by an earlier version is accepted).
+    # The bundle was just loaded, so the leaf hashes recorded on load are reused.
+    project_hash, content_hashes = project_bundle.content_hash_tree(
+        expected=_recorded_sdd_hash(bundle_name), assume_unmodified=True
+    )
 
     # Convert to PlanBundle for compatibility with review functions
     plan_bundle = _convert_project_bundle_to_plan_bundle(project_bundle)
@@ -3462,7 +3466,7 @@ def _prepare_review_bundle(
     # Pass project_hash computed BEFORE modifications to ensure consistency
     print_info("Checking SDD manifest...")
     sdd_valid, sdd_manifest, sdd_report = _validate_sdd_for_bundle(
-        plan_bundle, bundle_name, require_sdd=False, project_hash=project_hash
+        plan_bundle, bundle_name, require_sdd=False, project_hash=project_hash, content_hashes=content_hashes
     )
 
     if sdd_manifest is None:
@@ -4242,7 +4246,8 @@ def review(
         try:
             # Load and prepare bundle
             project_bundle = _load_bundle_with_progress(bundle_dir, validate_hashes=False)
-            plan_bundle, current_stage = _prepare_review_bundle(project_bundle, bundle_dir, bundle, auto_enrich)
+            with profile_phase("prepare", auto_enrich=auto_enrich):
+                plan_bundle, current_stage = _prepare_review_bundle(project_bundle, bundle_dir, bundle, auto_enrich)
 
             if current_stage not in ("draft", "review"):
                 print_warning("Review is typically run on 'draft' or 'review' stage plans")
@@ -4252,9 +4257,10 @@ def review(
                     print_info("Continuing in non-interactive mode")
 
             # Scan and prepare questions
-            questions_to_ask, report, scanner = _scan_and_prepare_questions(
-                plan_bundle, bundle_dir, category, max_questions
-            )
+            with profile_phase("ambiguity_scan", features=len(plan_bundle.features)):
+                questions_to_ask, report, scanner = _scan_and_prepare_questions(
+                    plan_bundle, bundle_dir, category, max_questions
+                )
 
             # Handle --list-findings mode
             if list_findings:
@@ -4610,12 +4616,9 @@ def harden(
             # Load project bundle with progress indicator
             project_bundle = _load_bundle_with_progress(bundle_dir, validate_hashes=False)
 
-            # Compute project bundle hash
-            summary = project_bundle.compute_summary(include_hash=True)
-            project_hash = summary.content_hash
-            if not project_hash:
-                print_error("Failed to compute project bundle hash")
-                raise typer.Exit(1)
+            # Compute project bundle hash (Merkle root over the aspect and feature hashes; the bundle
+            # was just loaded, so the leaf hashes recorded on load are reused)
+            project_hash, content_hashes = project_bundle.content_hash_tree(assume_unmodified=True)
 
             # Determine SDD output path (bundle-specific: .specfact/projects/<bundle-name>/sdd.yaml, Phase 8.5)
             from specfact_cli.utils.sdd_discovery import get_default_sdd_path_for_bundle
@@ -4640,9 +4643,15 @@ def harden(
                 try:
                     from specfact_cli.utils.structured_io import load_structured_file
 
-                    existing_sdd_data = load_structured_file(sdd_path)
+                    existing_sdd_data = load_structured_file(sdd_path, round_trip=False)
                     existing_sdd = SDDManifest.model_validate(existing_sdd_data)
-                    if existing_sdd.plan_bundle_hash == project_hash:
+                    recorded_hash = existing_sdd.plan_bundle_hash
+                    if (
+                        recorded_hash == project_hash
+                        # Also accept a pre-Merkle hash of unchanged content
+                        or project_bundle.compute_content_hash(expected=recorded_hash, assume_unmodified=True)
+                        == recorded_hash
+                    ):
                         # Hash matches - reuse existing SDD sections
                         print_info("SDD manifest exists with matching hash - reusing existing sections")
                         why = existing_sdd.why
@@ -4654,8 +4663,13 @@ def harden(
                             f"SDD manifest exists but is linked to a different bundle version.\n"
                             f"  Existing bundle hash: {existing_sdd.plan_bundle_hash[:16]}...\n"
                             f"  New bundle hash: {project_hash[:16]}...\n"
-                            f"  This will overwrite the existing SDD manifest.\n"
-                            f"  Note: SDD manifests are linked to specific bundle versions."
+                            + (
+                                f"  Bundle content {content_changes}\n"
+                                if (content_changes := existing_sdd.describe_content_changes(content_hashes))
+                                else ""
+                            )
+                            + "  This will overwrite the existing SDD manifest.\n"
+                            "  Note: SDD manifests are linked to specific bundle versions."
                         )
                         if not is_non_interactive:
                             # In interactive mode, ask for confirmation
@@ -4693,6 +4707,7 @@ def harden(
                 version="1.0.0",
                 plan_bundle_id=plan_bundle_id,
                 plan_bundle_hash=project_hash,
+                content_hashes=content_hashes,
                 why=why,
                 what=what,
                 how=how,
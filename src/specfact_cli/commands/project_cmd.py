@@ -20,6 +20,7 @@ from icontract import ensure, require
 from rich.console import Console
 from rich.table import Table
 
+from specfact_cli.commands import command_help
 from specfact_cli.models.project import (
     BundleManifest,
     PersonaMapping,
@@ -33,7 +34,7 @@ from specfact_cli.utils.structure import SpecFactStructure
 from specfact_cli.versioning import ChangeAnalyzer, bump_version, validate_semver
 
 
-app = typer.Typer(help="Manage project bundles with persona workflows")
+app = typer.Typer(help=command_help("project"))
 version_app = typer.Typer(help="Manage project bundle versions")
 app.add_typer(version_app, name="version")
 console = Console()
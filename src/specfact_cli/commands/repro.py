@@ -17,13 +17,24 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.table import Table
 
+from specfact_cli.commands import command_help
 from specfact_cli.telemetry import telemetry
 from specfact_cli.utils.env_manager import check_tool_in_env, detect_env_manager, detect_source_directories
+from specfact_cli.utils.repo_walker import list_python_files
 from specfact_cli.utils.structure import SpecFactStructure
-from specfact_cli.validators.repro_checker import ReproChecker
-
-
-app = typer.Typer(help="Run validation suite for reproducibility")
+from specfact_cli.validators.repro_checker import CheckResult, ReproChecker
+from specfact_cli.validators.repro_stream import (
+    ReproStreamState,
+    ReproStreamWriter,
+    find_resumable_stream,
+    read_repro_stream,
+    run_finished_record,
+    run_resumed_record,
+    run_started_record,
+)
+
+
+app = typer.Typer(help=command_help("repro"))
 console = Console()
 
 
@@ -118,9 +129,41 @@ def _is_valid_output_path(path: Path | None) -> bool:
     return path is None or path.exists()
 
 
+_STATUS_ICONS = {
+    "passed": "[green]✓[/green]",
+    "failed": "[red]✗[/red]",
+    "timeout": "[yellow]⏱[/yellow]",
+    "skipped": "[dim]⊘[/dim]",
+}
+
+
+def _default_report_path(repo: Path) -> Path:
+    """Timestamped enforcement report path (bundle-specific if a bundle is active, Phase 8.5)."""
+    # Try to detect bundle from active plan
+    bundle_name = SpecFactStructure.get_active_bundle_name(repo)
+    if bundle_name:
+        # Use bundle-specific enforcement report path (Phase 8.5)
+        return SpecFactStructure.get_bundle_enforcement_report_path(bundle_name=bundle_name, base_path=repo)
+    # Fallback to global path (backward compatibility during transition)
+    return SpecFactStructure.get_timestamped_report_path("enforcement", repo, "yaml")
+
+
+def _find_interrupted_run(repo: Path, out: Path | None) -> ReproStreamState | None:
+    """Find the stream of an interrupted run to resume (the one next to `out`, if given)."""
+    if out is None:
+        return find_resumable_stream(_default_report_path(repo).parent, repo)
+    stream_path = out.with_suffix(".jsonl")
+    if not stream_path.exists():
+        return None
+    state = read_repro_stream(stream_path)
+    if state.finished or state.run.get("repo_path") != str(repo.resolve()):
+        return None
+    return state
+
+
 def _count_python_files(path: Path) -> int:
     """Count Python files for anonymized telemetry reporting."""
-    return sum(1 for _ in path.rglob("*.py"))
+    return len(list_python_files(path))
 
 
 @app.callback(invoke_without_command=True, no_args_is_help=False)
@@ -167,6 +210,23 @@ def main(
         help="Time budget in seconds (must be > 0)",
         hidden=True,  # Hidden by default, shown with --help-advanced
     ),
+    max_parallel: int | None = typer.Option(
+        None,
+        "--max-parallel",
+        min=1,
+        help="Maximum checks run at the same time (default: up to 4, by CPU count)",
+        hidden=True,  # Hidden by default, shown with --help-advanced
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Continue the last interrupted run: reuse its report and re-run only checks without a result",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Run every check even if its tool, configuration and input files are unchanged since a cached run",
+    ),
 ) -> None:
     """
     Run full validation suite for reproducibility.
@@ -183,12 +243,25 @@ def main(
     - Property tests (pytest tests/contracts/) - optional, only if directory exists
     - Smoke tests (pytest tests/smoke/) - optional, only if directory exists
 
+    Independent checks run in parallel (--max-parallel) and each result is shown as
+    soon as its check finishes. The time budget is split between checks based on
+    their durations in previous runs.
+
+    While checks run, every check start, finding and result is appended to a JSON Lines
+    stream next to the report (`report-<timestamp>.jsonl`). If a run is interrupted,
+    `--resume` continues it and only runs the checks that have no result yet.
+
+    Results of ruff, Semgrep and basedpyright are cached by tool version, configuration
+    files and input file contents (.specfact/cache/repro/results) and replayed when nothing
+    changed; ruff re-checks only changed files. Use --no-cache to run every check.
+
     Works on external repositories without requiring SpecFact CLI adoption.
 
     Example:
         specfact repro --verbose --budget 120
         specfact repro --repo /path/to/external/repo --verbose
         specfact repro --fix --budget 120
+        specfact repro --resume
     """
     # If a subcommand was invoked, don't run the main validation
     if ctx.invoked_subcommand is not None:
@@ -211,11 +284,26 @@ def main(
         console.print("[dim]Fail-fast: enabled[/dim]")
     if fix:
         console.print("[dim]Auto-fix: enabled[/dim]")
-    console.print()
 
     # Ensure structure exists
     SpecFactStructure.ensure_structure(repo)
 
+    # Report path (Phase 8.5: try to use bundle-specific path); the stream is written next to it
+    resumed: ReproStreamState | None = None
+    if resume:
+        resumed = _find_interrupted_run(repo, out)
+        if resumed is None:
+            console.print("[dim]No interrupted run found; starting a new run[/dim]")
+        else:
+            out = Path(resumed.run["report_path"])
+            console.print(f"[dim]Resuming interrupted run ({len(resumed.results)} check(s) already finished)[/dim]")
+    if out is None:
+        out = _default_report_path(repo)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    stream_path = out.with_suffix(".jsonl")
+    console.print(f"[dim]Streaming results to: {stream_path}[/dim]")
+    console.print()
+
     python_file_count = _count_python_files(repo)
 
     telemetry_metadata = {
@@ -223,9 +311,25 @@ def main(
         "files_analyzed": python_file_count,
     }
 
-    with telemetry.track_command("repro.run", telemetry_metadata) as record_event:
+    with (
+        telemetry.track_command("repro.run", telemetry_metadata) as record_event,
+        ReproStreamWriter(stream_path, append=resumed is not None) as stream,
+    ):
         # Run all checks
-        checker = ReproChecker(repo_path=repo, budget=budget, fail_fast=fail_fast, fix=fix)
+        checker = ReproChecker(
+            repo_path=repo,
+            budget=budget,
+            fail_fast=fail_fast,
+            fix=fix,
+            max_parallel=max_parallel,
+            on_event=stream.write,
+            completed=resumed.results if resumed is not None else None,
+            use_cache=not no_cache,
+        )
+        if resumed is not None:
+            stream.write(run_resumed_record(len(resumed.results)))
+        else:
+            stream.write(run_started_record(repo, out, budget, fix, fail_fast, checker.max_parallel))
 
         # Detect and display environment manager before starting progress spinner
         from specfact_cli.utils.env_manager import detect_env_manager
@@ -242,8 +346,18 @@ def main(
         ) as progress:
             progress.add_task("Running validation checks...", total=None)
 
-            # This will show progress for each check internally
-            report = checker.run_all_checks()
+            def show_result(result: CheckResult) -> None:
+                # Stream each result as soon as its check finishes (checks run in parallel)
+                duration_str = f" ({result.duration:.2f}s)" if result.duration else ""
+                if result.cache == "hit":
+                    duration_str += " [dim](cached)[/dim]"
+                elif result.cache == "partial":
+                    duration_str += " [dim](changed files only)[/dim]"
+                progress.console.print(
+                    f"{_STATUS_ICONS.get(result.status.value, '[dim]…[/dim]')} {result.name}{duration_str}"
+                )
+
+            report = checker.run_all_checks(on_result=show_result)
 
         # Display results
         console.print("\n[bold]Validation Results[/bold]\n")
@@ -303,24 +417,13 @@ def main(
                     console.print(f"\n[bold red]{check.name} Output:[/bold red]")
                     console.print(f"[dim]{check.output[:500]}[/dim]")  # Limit output
 
-        # Write report if requested (Phase 8.5: try to use bundle-specific path)
-        if out is None:
-            # Try to detect bundle from active plan
-            bundle_name = SpecFactStructure.get_active_bundle_name(repo)
-            if bundle_name:
-                # Use bundle-specific enforcement report path (Phase 8.5)
-                out = SpecFactStructure.get_bundle_enforcement_report_path(bundle_name=bundle_name, base_path=repo)
-            else:
-                # Fallback to global path (backward compatibility during transition)
-                out = SpecFactStructure.get_timestamped_report_path("enforcement", repo, "yaml")
-                SpecFactStructure.ensure_structure(repo)
-
-        out.parent.mkdir(parents=True, exist_ok=True)
+        # Write report
         dump_yaml(report.to_dict(), out)
         console.print(f"\n[dim]Report written to: {out}[/dim]")
 
         # Exit with appropriate code
         exit_code = report.get_exit_code()
+        stream.write(run_finished_record(exit_code, report.total_duration))
         if exit_code == 0:
             crosshair_failed = any(
                 check.tool == "crosshair" and check.status.value == "failed" for check in report.checks
@@ -15,13 +15,14 @@ from icontract import require
 from rich.console import Console
 from rich.table import Table
 
+from specfact_cli.commands import command_help
 from specfact_cli.utils.sdd_discovery import list_all_sdds
 from specfact_cli.utils.structure import SpecFactStructure
 
 
 app = typer.Typer(
     name="sdd",
-    help="Manage SDD (Spec-Driven Development) manifests",
+    help=command_help("sdd"),
     rich_markup_mode="rich",
 )
 
@@ -18,24 +18,28 @@ import typer
 from beartype import beartype
 from icontract import ensure, require
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.progress import Progress, SpinnerColumn, TaskID, TextColumn, TimeElapsedColumn
 from rich.table import Table
 
+from specfact_cli.commands import command_help
 from specfact_cli.integrations.specmatic import (
+    SpecValidationResult,
     check_backward_compatibility,
     check_specmatic_available,
     create_mock_server,
+    default_specmatic_concurrency,
     generate_specmatic_tests,
-    validate_spec_with_specmatic,
+    get_specmatic_version,
+    prevalidate_spec_structure,
+    validate_specs_with_specmatic,
 )
 from specfact_cli.utils import print_error, print_info, print_success, print_warning, prompt_text
 from specfact_cli.utils.progress import load_bundle_with_progress
 from specfact_cli.utils.structure import SpecFactStructure
+from specfact_cli.validators.contract_cache import SPECMATIC_VALIDATOR, ContractValidationCache
 
 
-app = typer.Typer(
-    help="Specmatic integration for API contract testing (OpenAPI/AsyncAPI validation, backward compatibility, mock servers)"
-)
+app = typer.Typer(help=command_help("spec"))
 console = Console()
 
 
@@ -63,6 +67,13 @@ def validate(
         exists=True,
         hidden=True,  # Hidden by default, shown with --help-advanced
     ),
+    max_parallel: int | None = typer.Option(
+        None,
+        "--max-parallel",
+        min=1,
+        help="Maximum Specmatic processes run at the same time (default: one per CPU, up to 8)",
+        hidden=True,  # Hidden by default, shown with --help-advanced
+    ),
     # Behavior/Options
     no_interactive: bool = typer.Option(
         False,
@@ -85,15 +96,20 @@ def validate(
 
     Can validate a single contract file or all contracts in a project bundle.
     Uses active plan (from 'specfact plan select') as default if --bundle not provided.
+    Contracts and their checks run concurrently (bounded by --max-parallel); results
+    are shown as each contract finishes, with per-contract timings. OpenAPI structure
+    ($refs, required fields, operationIds, parameters, responses) is checked in-process
+    first; Specmatic runs only for contracts that pass.
 
     **Caching:**
-    Validation results are cached in `.specfact/cache/specmatic-validation.json` based on
-    file content hashes. Unchanged contracts are automatically skipped on subsequent runs
-    to improve performance. Use --force to bypass cache and re-validate all contracts.
+    Validation results are cached in `.specfact/cache/contracts/` by contract content,
+    previous version content (--previous) and Specmatic version. Unchanged contracts are
+    replayed from the cache without running Specmatic (cached failures are shown again).
+    Use --force to bypass cache and re-validate all contracts.
 
     **Parameter Groups:**
     - **Target/Input**: spec_path (optional if --bundle provided), --bundle
-    - **Advanced**: --previous
+    - **Advanced**: --previous, --max-parallel
     - **Behavior/Options**: --no-interactive, --force
 
     **Examples:**
@@ -215,96 +231,100 @@ def validate(
             raise typer.Exit(1)
 
         import asyncio
-        from datetime import UTC, datetime
         from time import time
 
-        # Load validation cache
-        cache_dir = repo_path / SpecFactStructure.CACHE
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        cache_file = cache_dir / "specmatic-validation.json"
-        validation_cache: dict[str, dict[str, Any]] = {}
-        if cache_file.exists():
-            try:
-                validation_cache = json.loads(cache_file.read_text())
-            except Exception:
-                validation_cache = {}
-
-        def compute_file_hash(file_path: Path) -> str:
-            """Compute SHA256 hash of file content."""
-            try:
-                return hashlib.sha256(file_path.read_bytes()).hexdigest()
-            except Exception:
-                return ""
+        # Results are cached by contract content, previous version content and Specmatic version
+        specmatic_version = get_specmatic_version()
+        validation_cache = ContractValidationCache(repo_path) if specmatic_version else None
 
         validated_count = 0
         failed_count = 0
         skipped_count = 0
         total_count = len(spec_paths)
 
+        # Position and relative path of each contract; contracts without a cached result run
+        positions: dict[Path, tuple[int, Path]] = {}
+        pending: list[Path] = []
+        cached_results: list[tuple[Path, SpecValidationResult, str]] = []
         for idx, contract_path in enumerate(spec_paths, 1):
-            contract_relative = contract_path.relative_to(repo_path)
-            contract_key = str(contract_relative)
-            file_hash = compute_file_hash(contract_path) if contract_path.exists() else ""
-            cache_entry = validation_cache.get(contract_key, {})
-
-            # Check cache (only if no previous_version specified, as backward compat check can't be cached)
-            use_cache = (
-                not force
-                and not previous_version
-                and file_hash
-                and cache_entry
-                and cache_entry.get("hash") == file_hash
-                and cache_entry.get("status") == "success"
-                and cache_entry.get("is_valid") is True
+            positions[contract_path] = (idx, contract_path.relative_to(repo_path))
+            cached = (
+                validation_cache.get(SPECMATIC_VALIDATOR, specmatic_version, contract_path, previous_version)
+                if validation_cache is not None and specmatic_version and not force
+                else None
             )
-
-            if use_cache:
-                console.print(
-                    f"\n[dim][{idx}/{total_count}][/dim] [bold cyan]Validating specification:[/bold cyan] {contract_relative}"
-                )
-                console.print(
-                    f"[dim]⏭️  Skipping (cache hit - unchanged since {cache_entry.get('timestamp', 'unknown')})[/dim]"
-                )
-                validated_count += 1
-                skipped_count += 1
+            if cached is None:
+                pending.append(contract_path)
                 continue
-
+            try:
+                cached_results.append(
+                    (contract_path, SpecValidationResult.from_dict(cached.result, cached=True), cached.cached_at)
+                )
+            except (KeyError, TypeError, ValueError):
+                pending.append(contract_path)
+
+        # In-process structural pre-pass: Specmatic runs only for contracts that pass
+        structural_failures: list[tuple[Path, SpecValidationResult]] = []
+        for contract_path in pending:
+            failure = prevalidate_spec_structure(contract_path)
+            if failure is not None:
+                structural_failures.append((contract_path, failure))
+        failed_structure = {contract_path for contract_path, _ in structural_failures}
+        pending = [contract_path for contract_path in pending if contract_path not in failed_structure]
+
+        # Helper to format details with truncation
+        def format_details(items: list[str], max_length: int = 100) -> str:
+            """Format list of items, truncating if too long."""
+            if not items:
+                return ""
+            if len(items) == 1:
+                detail = items[0]
+                return detail[:max_length] + ("..." if len(detail) > max_length else "")
+            # Multiple items: show first with count
+            first = items[0][: max_length - 20]
+            if len(first) < len(items[0]):
+                first += "..."
+            return f"{first} (+{len(items) - 1} more)" if len(items) > 1 else first
+
+        def report_cached(contract_path: Path, result: SpecValidationResult, cached_at: str) -> None:
+            """Replay a cached result (failures are shown in full)."""
+            nonlocal validated_count, skipped_count
+            idx, contract_relative = positions[contract_path]
+            if not result.is_valid:
+                report_result(contract_path, result)
+                return
             console.print(
-                f"\n[bold yellow][{idx}/{total_count}][/bold yellow] [bold cyan]Validating specification:[/bold cyan] {contract_relative}"
+                f"\n[dim][{idx}/{total_count}][/dim] [bold cyan]Validating specification:[/bold cyan] {contract_relative}"
             )
+            console.print(f"[dim]⏭️  Skipping (cache hit - unchanged since {cached_at})[/dim]")
+            validated_count += 1
+            skipped_count += 1
 
-            # Run validation with progress
-            start_time = time()
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                TimeElapsedColumn(),
-                console=console,
-            ) as progress:
-                task = progress.add_task("Running Specmatic validation...", total=None)
-                result = asyncio.run(validate_spec_with_specmatic(contract_path, previous_version))
-                elapsed = time() - start_time
-                progress.update(task, description=f"✓ Validation complete ({elapsed:.2f}s)")
+        progress: Progress | None = None
+        task: TaskID | None = None
+
+        def report_result(contract_path: Path, result: SpecValidationResult, cache_result: bool = True) -> None:
+            """Display a contract's results as soon as it finishes and update the cache."""
+            nonlocal validated_count, failed_count
+            idx, contract_relative = positions[contract_path]
+            if progress is not None and task is not None and not result.cached:
+                progress.advance(task)
+
+            console.print(
+                f"\n[bold yellow][{idx}/{total_count}][/bold yellow] [bold cyan]Validated specification:[/bold cyan] "
+                f"{contract_relative} [dim]({'cached' if result.cached else f'{result.duration:.2f}s'})[/dim]"
+            )
 
             # Display results
             table = Table(title=f"Validation Results: {contract_path.name}")
             table.add_column("Check", style="cyan")
             table.add_column("Status", style="magenta")
+            table.add_column("Time", style="dim", justify="right")
             table.add_column("Details", style="white")
 
-            # Helper to format details with truncation
-            def format_details(items: list[str], max_length: int = 100) -> str:
-                """Format list of items, truncating if too long."""
-                if not items:
-                    return ""
-                if len(items) == 1:
-                    detail = items[0]
-                    return detail[:max_length] + ("..." if len(detail) > max_length else "")
-                # Multiple items: show first with count
-                first = items[0][: max_length - 20]
-                if len(first) < len(items[0]):
-                    first += "..."
-                return f"{first} (+{len(items) - 1} more)" if len(items) > 1 else first
+            def step_time(step: str) -> str:
+                seconds = result.step_durations.get(step)
+                return f"{seconds:.2f}s" if seconds is not None else ""
 
             # Get errors for each check type
             schema_errors = [
@@ -328,12 +348,14 @@ def validate(
             table.add_row(
                 "Schema Validation",
                 "✓ PASS" if result.schema_valid else "✗ FAIL",
+                step_time("schema"),
                 format_details(schema_errors) if not result.schema_valid else "",
             )
 
             table.add_row(
                 "Example Generation",
                 "✓ PASS" if result.examples_valid else "✗ FAIL",
+                step_time("examples"),
                 format_details(example_errors) if not result.examples_valid else "",
             )
 
@@ -343,6 +365,7 @@ def validate(
                 table.add_row(
                     "Backward Compatibility",
                     "✓ PASS" if result.backward_compatible else "✗ FAIL",
+                    step_time("backward_compatibility"),
                     format_details(compat_details) if not result.backward_compatible else "",
                 )
 
@@ -360,19 +383,17 @@ def validate(
                 for i, error in enumerate(result.errors, 1):
                     console.print(f"  {i}. {error}")
 
-            # Update cache (only if no previous_version, as backward compat can't be cached)
-            if not previous_version and file_hash:
-                validation_cache[contract_key] = {
-                    "hash": file_hash,
-                    "status": "success" if result.is_valid else "failure",
-                    "is_valid": result.is_valid,
-                    "schema_valid": result.schema_valid,
-                    "examples_valid": result.examples_valid,
-                    "timestamp": datetime.now(UTC).isoformat(),
-                }
-                # Save cache after each validation
-                with suppress(Exception):  # Don't fail validation if cache write fails
-                    cache_file.write_text(json.dumps(validation_cache, indent=2))
+            # Cache completed runs (timeouts and Specmatic errors run again next time)
+            if (
+                cache_result
+                and validation_cache is not None
+                and specmatic_version
+                and not result.cached
+                and not result.incomplete
+            ):
+                validation_cache.put(
+                    SPECMATIC_VALIDATOR, specmatic_version, contract_path, result.to_dict(), previous_version
+                )
 
             if result.is_valid:
                 print_success(f"✓ Specification is valid: {contract_path.name}")
@@ -385,6 +406,46 @@ def validate(
                         console.print(f"  - {error}")
                 failed_count += 1
 
+        for contract_path, result, cached_at in cached_results:
+            report_cached(contract_path, result, cached_at)
+        # Structural failures are cheap to recompute (and follow the validator's rules), so not cached
+        for contract_path, result in structural_failures:
+            report_result(contract_path, result, cache_result=False)
+
+        results: list[SpecValidationResult] = []
+        elapsed = 0.0
+        if pending:
+            concurrency = min(max_parallel or default_specmatic_concurrency(), len(pending))
+            if len(pending) == 1:
+                console.print(f"\n[bold cyan]Validating specification:[/bold cyan] {positions[pending[0]][1]}")
+            else:
+                console.print(
+                    f"\n[bold cyan]Validating specifications:[/bold cyan] {len(pending)} contracts "
+                    f"[dim](up to {concurrency} Specmatic processes at a time)[/dim]"
+                )
+
+            # One event loop for all contracts; results are displayed as they finish
+            start_time = time()
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                TimeElapsedColumn(),
+                console=console,
+            ) as progress:
+                task = progress.add_task("Running Specmatic validation...", total=len(pending))
+                results = asyncio.run(
+                    validate_specs_with_specmatic(
+                        pending,
+                        previous_version,
+                        max_concurrency=concurrency,
+                        on_result=report_result,
+                    )
+                )
+                elapsed = time() - start_time
+                progress.update(task, description=f"✓ Validation complete ({elapsed:.2f}s)")
+            if validation_cache is not None:
+                validation_cache.prune()
+
         # Summary
         if len(spec_paths) > 1:
             console.print("\n[bold]Summary:[/bold]")
@@ -392,8 +453,30 @@ def validate(
             if skipped_count > 0:
                 console.print(f"  Skipped (cache): {skipped_count}")
             console.print(f"  Failed: {failed_count}")
+            if structural_failures:
+                console.print(f"  Failed structure check (Specmatic not run): {len(structural_failures)}")
+            if len(results) > 1:
+                contract_seconds = sum(result.duration for result in results)
+                console.print(
+                    f"  Time: {elapsed:.2f}s [dim](Specmatic time across contracts: {contract_seconds:.2f}s)[/dim]"
+                )
+                by_duration = sorted(
+                    zip(pending, results, strict=True), key=lambda item: item[1].duration, reverse=True
+                )
+                slowest = by_duration[:3]
+                console.print(
+                    "  Slowest: "
+                    + ", ".join(f"{contract_path.name} ({result.duration:.2f}s)" for contract_path, result in slowest)
+                )
 
-        record({"validated": validated_count, "skipped": skipped_count, "failed": failed_count})
+        record(
+            {
+                "validated": validated_count,
+                "skipped": skipped_count,
+                "failed": failed_count,
+                "validation_seconds": round(elapsed, 3),
+            }
+        )
 
         if failed_count > 0:
             raise typer.Exit(1)
@@ -20,13 +20,14 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 
 from specfact_cli import runtime
+from specfact_cli.commands import command_help
 from specfact_cli.models.bridge import AdapterType
 from specfact_cli.models.plan import Feature, PlanBundle
 from specfact_cli.sync.speckit_sync import SpecKitSync
 from specfact_cli.telemetry import telemetry
 
 
-app = typer.Typer(help="Synchronize external tool artifacts and repository changes")
+app = typer.Typer(help=command_help("sync"))
 console = Console()
 
 
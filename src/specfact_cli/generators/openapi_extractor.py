@@ -22,6 +22,7 @@ from icontract import ensure, require
 
 from specfact_cli.integrations.specmatic import SpecValidationResult, validate_spec_with_specmatic
 from specfact_cli.models.plan import Feature
+from specfact_cli.utils.ast_cache import get_parsed_module_cache
 
 
 class OpenAPIExtractor:
@@ -202,8 +203,7 @@ class OpenAPIExtractor:
             openapi_spec: OpenAPI spec dictionary to update
         """
         try:
-            with file_path.open(encoding="utf-8") as f:
-                tree = ast.parse(f.read(), filename=str(file_path))
+            tree = get_parsed_module_cache().get_tree(file_path)
 
             # Track router instances and their prefixes
             router_prefixes: dict[str, str] = {}  # router_name -> prefix
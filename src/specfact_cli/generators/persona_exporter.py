@@ -260,7 +260,7 @@ class PersonaExporter:
 
                         for protocol_file in protocols_dir.glob("*.yaml"):
                             try:
-                                protocol_data = load_structured_file(protocol_file)
+                                protocol_data = load_structured_file(protocol_file, round_trip=False)
                                 protocol_name = protocol_file.stem.replace(".protocol", "")
                                 protocols[protocol_name] = protocol_data
                             except Exception:
@@ -275,7 +275,7 @@ class PersonaExporter:
 
                         for contract_file in contracts_dir.glob("*.yaml"):
                             try:
-                                contract_data = load_structured_file(contract_file)
+                                contract_data = load_structured_file(contract_file, round_trip=False)
                                 contract_name = contract_file.stem.replace(".openapi", "").replace(".asyncapi", "")
                                 contracts[contract_name] = contract_data
                             except Exception:
@@ -171,7 +171,7 @@ class ReportGenerator:
 
     def _generate_yaml_report(self, report: ValidationReport | DeviationReport, output_path: Path) -> None:
         """Generate YAML report."""
-        dump_structured_file(report.model_dump(mode="json"), output_path, StructuredFormat.YAML)
+        dump_structured_file(report.model_dump(mode="json"), output_path, StructuredFormat.YAML, round_trip=False)
 
     def render_markdown_string(self, report: ValidationReport | DeviationReport) -> str:
         """
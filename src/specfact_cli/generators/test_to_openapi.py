@@ -18,6 +18,8 @@ from typing import Any
 from beartype import beartype
 from icontract import ensure, require
 
+from specfact_cli.utils.ast_cache import get_parsed_module_cache
+
 
 class OpenAPITestConverter:
     """
@@ -167,7 +169,7 @@ class OpenAPITestConverter:
 
         # Parse test file with AST to get actual code
         try:
-            tree = ast.parse(test_path.read_text(encoding="utf-8"), filename=str(test_path))
+            tree = get_parsed_module_cache().get_tree(test_path)
         except Exception:
             return examples
 
@@ -353,7 +355,7 @@ class OpenAPITestConverter:
                 continue
 
             try:
-                tree = ast.parse(test_path.read_text(encoding="utf-8"), filename=str(test_path))
+                tree = get_parsed_module_cache().get_tree(test_path)
 
                 for node in ast.walk(tree):
                     if isinstance(node, ast.FunctionDef):
@@ -7,24 +7,48 @@ validation, backward compatibility checking, and mock server functionality.
 Specmatic is a contract testing tool that validates API specifications and
 generates mock servers for development. It complements SpecFact's code-level
 contracts (icontract, beartype, CrossHair) by providing service-level contract testing.
+
+Specmatic runs as a JVM subprocess per step. Batches of contracts
+(`validate_specs_with_specmatic`, `generate_specmatic_examples_for_specs`) run in
+one event loop with a shared semaphore bounding the number of Specmatic processes,
+and report each contract as soon as it finishes. Set `SPECFACT_SPECMATIC_CMD` to
+use another command (e.g., a wrapper script or a stand-in for tests).
+
+`prevalidate_spec_structure` checks an OpenAPI spec's structure in-process first,
+so callers can skip the JVM for contracts with structural errors.
 """
 
 from __future__ import annotations
 
 import asyncio
 import json
+import os
+import shlex
 import subprocess
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from beartype import beartype
-from icontract import require
+from icontract import ensure, require
 from rich.console import Console
 
+from specfact_cli.utils.executors import available_cpu_count
+
 
 console = Console()
 
+# Environment variable overriding the Specmatic command (shell-style string)
+SPECMATIC_COMMAND_ENV = "SPECFACT_SPECMATIC_CMD"
+
+# Upper bound for concurrent Specmatic processes (each one starts a JVM)
+MAX_SPECMATIC_CONCURRENCY = 8
+
+_T = TypeVar("_T")
+
 
 @dataclass
 class SpecValidationResult:
@@ -37,6 +61,16 @@ class SpecValidationResult:
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
     breaking_changes: list[str] = field(default_factory=list)
+    step_durations: dict[str, float] = field(default_factory=dict)
+    # A step timed out or could not run (the result is not deterministic, so not cached)
+    incomplete: bool = False
+    # Replayed from the contract validation cache
+    cached: bool = False
+
+    @property
+    def duration(self) -> float:
+        """Seconds spent running Specmatic for this spec (sum of step durations, excluding queueing)."""
+        return round(sum(self.step_durations.values()), 3)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -48,8 +82,27 @@ class SpecValidationResult:
             "errors": self.errors,
             "warnings": self.warnings,
             "breaking_changes": self.breaking_changes,
+            "duration": self.duration,
+            "step_durations": self.step_durations,
+            "incomplete": self.incomplete,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], cached: bool = False) -> SpecValidationResult:
+        """Create from a dictionary written by `to_dict()` (unknown keys are ignored)."""
+        return cls(
+            is_valid=bool(data["is_valid"]),
+            schema_valid=bool(data["schema_valid"]),
+            examples_valid=bool(data["examples_valid"]),
+            backward_compatible=data.get("backward_compatible"),
+            errors=list(data.get("errors", [])),
+            warnings=list(data.get("warnings", [])),
+            breaking_changes=list(data.get("breaking_changes", [])),
+            step_durations=dict(data.get("step_durations", {})),
+            incomplete=bool(data.get("incomplete", False)),
+            cached=cached,
+        )
+
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string."""
         return json.dumps(self.to_dict(), indent=indent)
@@ -68,6 +121,10 @@ def _get_specmatic_command() -> list[str] | None:
         Command list (e.g., ["specmatic"] or ["npx", "--yes", "specmatic"]) or None if not available
     """
     global _specmatic_command_cache
+    override = os.environ.get(SPECMATIC_COMMAND_ENV, "").strip()
+    if override:
+        # Explicit command (not probed or cached)
+        return shlex.split(override)
     if _specmatic_command_cache is not None:
         return _specmatic_command_cache
 
@@ -107,6 +164,32 @@ def _get_specmatic_command() -> list[str] | None:
     return None
 
 
+# Cache for `specmatic --version` output, by command
+_specmatic_version_cache: dict[tuple[str, ...], str | None] = {}
+
+
+@beartype
+def get_specmatic_version() -> str | None:
+    """
+    Get the version reported by the Specmatic command (run once per command).
+
+    Returns:
+        Output of `specmatic --version`, or None if Specmatic is unavailable or reports no version
+    """
+    cmd = _get_specmatic_command()
+    if not cmd:
+        return None
+    key = tuple(cmd)
+    if key not in _specmatic_version_cache:
+        try:
+            result = subprocess.run([*cmd, "--version"], capture_output=True, text=True, timeout=30)
+            version = result.stdout.strip() if result.returncode == 0 else ""
+        except (OSError, subprocess.SubprocessError):
+            version = ""
+        _specmatic_version_cache[key] = version or None
+    return _specmatic_version_cache[key]
+
+
 @beartype
 def check_specmatic_available() -> tuple[bool, str | None]:
     """
@@ -124,18 +207,124 @@ def check_specmatic_available() -> tuple[bool, str | None]:
     )
 
 
+@beartype
+@ensure(lambda result: 1 <= result <= MAX_SPECMATIC_CONCURRENCY, "Must return a bounded positive count")
+def default_specmatic_concurrency() -> int:
+    """Get the default number of concurrent Specmatic processes (one per CPU, capped)."""
+    return min(available_cpu_count(), MAX_SPECMATIC_CONCURRENCY)
+
+
+async def _run_specmatic(args: list[str], timeout: float, cwd: Path | None = None) -> subprocess.CompletedProcess[str]:
+    """
+    Run a Specmatic command as an asyncio subprocess (without blocking the event loop).
+
+    Args:
+        args: Command and arguments
+        timeout: Timeout in seconds
+        cwd: Optional working directory
+
+    Returns:
+        Completed process with decoded stdout and stderr
+
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeds the timeout (the process is killed)
+    """
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=str(cwd) if cwd is not None else None,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except TimeoutError:
+        process.kill()
+        await process.wait()
+        raise subprocess.TimeoutExpired(args, timeout) from None
+    except asyncio.CancelledError:
+        process.kill()
+        raise
+    return subprocess.CompletedProcess(
+        args,
+        process.returncode if process.returncode is not None else -1,
+        stdout.decode("utf-8", errors="replace"),
+        stderr.decode("utf-8", errors="replace"),
+    )
+
+
+# TypeVar instead of PEP 695 type parameters: the package still supports Python 3.11
+async def _run_for_specs(  # noqa: UP047
+    spec_paths: Sequence[Path],
+    run_one: Callable[[Path], Awaitable[_T]],
+    on_result: Callable[[Path, _T], None] | None,
+) -> list[_T]:
+    """Run one coroutine per spec concurrently, reporting each result as it finishes (input order returned)."""
+
+    async def indexed(index: int, spec_path: Path) -> tuple[int, _T]:
+        return index, await run_one(spec_path)
+
+    results: dict[int, _T] = {}
+    for finished in asyncio.as_completed([indexed(i, spec_path) for i, spec_path in enumerate(spec_paths)]):
+        index, outcome = await finished
+        results[index] = outcome
+        if on_result is not None:
+            on_result(spec_paths[index], outcome)
+    return [results[index] for index in range(len(spec_paths))]
+
+
+@beartype
+def prevalidate_spec_structure(spec_path: Path) -> SpecValidationResult | None:
+    """
+    Check an OpenAPI spec's structure in-process, before running Specmatic.
+
+    Args:
+        spec_path: Path to OpenAPI/AsyncAPI specification file
+
+    Returns:
+        A failed SpecValidationResult listing the structural errors, or None if the spec
+        passes (or is not an OpenAPI document, e.g. AsyncAPI) and Specmatic should run
+    """
+    from specfact_cli.utils.structured_io import load_structured_file
+    from specfact_cli.validators.openapi_validator import validate_openapi_document
+
+    started = time.perf_counter()
+    try:
+        document = load_structured_file(spec_path, round_trip=False)
+    except Exception as e:
+        errors = [f"Schema validation failed: cannot parse {spec_path.name}: {e}"]
+    else:
+        if isinstance(document, dict) and "asyncapi" in document:
+            return None
+        structure = validate_openapi_document(document, base_path=spec_path)
+        if structure.is_valid:
+            return None
+        errors = [f"Schema validation failed: {error}" for error in structure.errors]
+    return SpecValidationResult(
+        is_valid=False,
+        schema_valid=False,
+        examples_valid=False,
+        errors=errors,
+        warnings=["Specmatic was not run: fix the structural errors first"],
+        step_durations={"schema": round(time.perf_counter() - started, 3)},
+    )
+
+
 @beartype
 @require(lambda spec_path: spec_path.exists(), "Spec file must exist")
 async def validate_spec_with_specmatic(
     spec_path: Path,
     previous_version: Path | None = None,
+    semaphore: asyncio.Semaphore | None = None,
 ) -> SpecValidationResult:
     """
     Validate OpenAPI/AsyncAPI specification using Specmatic.
 
+    The validation steps (schema, examples, backward compatibility) run concurrently.
+
     Args:
         spec_path: Path to OpenAPI/AsyncAPI specification file
         previous_version: Optional path to previous version for backward compatibility check
+        semaphore: Optional semaphore bounding concurrent Specmatic processes (shared across specs)
 
     Returns:
         SpecValidationResult with validation status and details
@@ -148,6 +337,7 @@ async def validate_spec_with_specmatic(
             schema_valid=False,
             examples_valid=False,
             errors=[f"Specmatic not available: {error_msg}"],
+            incomplete=True,
         )
 
     # Get specmatic command (direct or npx)
@@ -158,6 +348,7 @@ async def validate_spec_with_specmatic(
             schema_valid=False,
             examples_valid=False,
             errors=["Specmatic command not available"],
+            incomplete=True,
         )
 
     result = SpecValidationResult(
@@ -166,87 +357,129 @@ async def validate_spec_with_specmatic(
         examples_valid=True,
     )
 
-    # Schema validation
-    try:
-        schema_result = await asyncio.to_thread(
-            subprocess.run,
-            [*specmatic_cmd, "validate", str(spec_path)],
-            capture_output=True,
-            text=True,
-            timeout=30,
+    steps: dict[str, tuple[list[str], float]] = {
+        "schema": ([*specmatic_cmd, "validate", str(spec_path)], 30),
+        "examples": ([*specmatic_cmd, "examples", str(spec_path), "--validate"], 30),
+    }
+    if previous_version and previous_version.exists():
+        steps["backward_compatibility"] = (
+            [*specmatic_cmd, "backward-compatibility-check", str(previous_version), str(spec_path)],
+            60,
         )
-        result.schema_valid = schema_result.returncode == 0
-        if not result.schema_valid:
-            result.errors.append(f"Schema validation failed: {schema_result.stderr}")
-            result.is_valid = False
-    except subprocess.TimeoutExpired:
+
+    async def run_step(name: str, args: list[str], timeout: float) -> subprocess.CompletedProcess[str]:
+        async with semaphore if semaphore is not None else nullcontext():
+            started = time.perf_counter()
+            try:
+                return await _run_specmatic(args, timeout)
+            finally:
+                result.step_durations[name] = round(time.perf_counter() - started, 3)
+
+    # The steps are independent, so they run concurrently
+    outcomes = dict(
+        zip(
+            steps,
+            await asyncio.gather(
+                *(run_step(name, args, timeout) for name, (args, timeout) in steps.items()),
+                return_exceptions=True,
+            ),
+            strict=True,
+        )
+    )
+
+    # Schema validation
+    schema_result = outcomes["schema"]
+    if isinstance(schema_result, subprocess.TimeoutExpired):
         result.schema_valid = False
         result.errors.append("Schema validation timed out")
         result.is_valid = False
-    except Exception as e:
+        result.incomplete = True
+    elif isinstance(schema_result, BaseException):
         result.schema_valid = False
-        result.errors.append(f"Schema validation error: {e!s}")
+        result.errors.append(f"Schema validation error: {schema_result!s}")
         result.is_valid = False
+        result.incomplete = True
+    else:
+        result.schema_valid = schema_result.returncode == 0
+        if not result.schema_valid:
+            result.errors.append(f"Schema validation failed: {schema_result.stderr}")
+            result.is_valid = False
 
     # Example generation test
-    try:
-        examples_result = await asyncio.to_thread(
-            subprocess.run,
-            [*specmatic_cmd, "examples", str(spec_path), "--validate"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        result.examples_valid = examples_result.returncode == 0
-        if not result.examples_valid:
-            result.errors.append(f"Example generation failed: {examples_result.stderr}")
-            result.is_valid = False
-    except subprocess.TimeoutExpired:
+    examples_result = outcomes["examples"]
+    if isinstance(examples_result, subprocess.TimeoutExpired):
         result.examples_valid = False
         result.errors.append("Example generation timed out")
         result.is_valid = False
-    except Exception as e:
+        result.incomplete = True
+    elif isinstance(examples_result, BaseException):
         result.examples_valid = False
-        result.errors.append(f"Example generation error: {e!s}")
+        result.errors.append(f"Example generation error: {examples_result!s}")
         result.is_valid = False
+        result.incomplete = True
+    else:
+        result.examples_valid = examples_result.returncode == 0
+        if not result.examples_valid:
+            result.errors.append(f"Example generation failed: {examples_result.stderr}")
+            result.is_valid = False
 
     # Backward compatibility check (if previous version provided)
-    if previous_version and previous_version.exists():
-        try:
-            compat_result = await asyncio.to_thread(
-                subprocess.run,
-                [
-                    *specmatic_cmd,
-                    "backward-compatibility-check",
-                    str(previous_version),
-                    str(spec_path),
-                ],
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
-            result.backward_compatible = compat_result.returncode == 0
-            if not result.backward_compatible:
-                # Parse breaking changes from output
-                output_lines = compat_result.stdout.split("\n") + compat_result.stderr.split("\n")
-                breaking = [
-                    line for line in output_lines if "breaking" in line.lower() or "incompatible" in line.lower()
-                ]
-                result.breaking_changes = breaking
-                result.errors.append("Backward compatibility check failed")
-                result.is_valid = False
-        except subprocess.TimeoutExpired:
-            result.backward_compatible = False
-            result.errors.append("Backward compatibility check timed out")
-            result.is_valid = False
-        except Exception as e:
-            result.backward_compatible = False
-            result.errors.append(f"Backward compatibility check error: {e!s}")
+    compat_result = outcomes.get("backward_compatibility")
+    if isinstance(compat_result, subprocess.TimeoutExpired):
+        result.backward_compatible = False
+        result.errors.append("Backward compatibility check timed out")
+        result.is_valid = False
+        result.incomplete = True
+    elif isinstance(compat_result, BaseException):
+        result.backward_compatible = False
+        result.errors.append(f"Backward compatibility check error: {compat_result!s}")
+        result.is_valid = False
+        result.incomplete = True
+    elif compat_result is not None:
+        result.backward_compatible = compat_result.returncode == 0
+        if not result.backward_compatible:
+            # Parse breaking changes from output
+            output_lines = compat_result.stdout.split("\n") + compat_result.stderr.split("\n")
+            breaking = [line for line in output_lines if "breaking" in line.lower() or "incompatible" in line.lower()]
+            result.breaking_changes = breaking
+            result.errors.append("Backward compatibility check failed")
             result.is_valid = False
 
     return result
 
 
+@beartype
+@require(lambda max_concurrency: max_concurrency is None or max_concurrency >= 1, "Max concurrency must be positive")
+@ensure(lambda spec_paths, result: len(result) == len(spec_paths), "Must return one result per spec")
+async def validate_specs_with_specmatic(
+    spec_paths: Sequence[Path],
+    previous_version: Path | None = None,
+    max_concurrency: int | None = None,
+    on_result: Callable[[Path, SpecValidationResult], None] | None = None,
+) -> list[SpecValidationResult]:
+    """
+    Validate several specifications concurrently with Specmatic.
+
+    All specs and their validation steps share one semaphore, so at most
+    max_concurrency Specmatic processes run at a time.
+
+    Args:
+        spec_paths: Specification files to validate
+        previous_version: Optional previous version for backward compatibility checks
+        max_concurrency: Maximum concurrent Specmatic processes (default: `default_specmatic_concurrency()`)
+        on_result: Optional callback called with each spec's result as soon as it finishes
+
+    Returns:
+        Validation results in the order of spec_paths
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or default_specmatic_concurrency())
+    return await _run_for_specs(
+        spec_paths,
+        lambda spec_path: validate_spec_with_specmatic(spec_path, previous_version, semaphore=semaphore),
+        on_result,
+    )
+
+
 @beartype
 @require(lambda old_spec: old_spec.exists(), "Old spec file must exist")
 @require(lambda new_spec: new_spec.exists(), "New spec file must exist")
@@ -270,7 +503,9 @@ async def check_backward_compatibility(
 
 @beartype
 @require(lambda spec_path: spec_path.exists(), "Spec file must exist")
-async def generate_specmatic_examples(spec_path: Path, examples_dir: Path | None = None) -> Path:
+async def generate_specmatic_examples(
+    spec_path: Path, examples_dir: Path | None = None, semaphore: asyncio.Semaphore | None = None
+) -> Path:
     """
     Generate example JSON files from OpenAPI specification using Specmatic.
 
@@ -280,6 +515,7 @@ async def generate_specmatic_examples(spec_path: Path, examples_dir: Path | None
     Args:
         spec_path: Path to OpenAPI/AsyncAPI specification
         examples_dir: Optional output directory for examples (default: same dir as spec with _examples suffix)
+        semaphore: Optional semaphore bounding concurrent Specmatic processes (shared across specs)
 
     Returns:
         Path to generated examples directory
@@ -300,14 +536,12 @@ async def generate_specmatic_examples(spec_path: Path, examples_dir: Path | None
         # We need to run it from the examples directory parent and let it create the directory
         # Format: specmatic examples generate <spec_file>
         # This generates example files based on the schema
-        result = await asyncio.to_thread(
-            subprocess.run,
-            [*specmatic_cmd, "examples", "generate", str(spec_path)],
-            capture_output=True,
-            text=True,
-            timeout=60,
-            cwd=str(examples_dir.parent),  # Run from parent directory
-        )
+        async with semaphore if semaphore is not None else nullcontext():
+            result = await _run_specmatic(
+                [*specmatic_cmd, "examples", "generate", str(spec_path)],
+                60,
+                cwd=examples_dir.parent,  # Run from parent directory
+            )
         if result.returncode != 0:
             # If generation failed, it might be because the directory structure is different
             # Try creating a simple example file structure manually as fallback
@@ -323,6 +557,36 @@ async def generate_specmatic_examples(spec_path: Path, examples_dir: Path | None
         return examples_dir
 
 
+@beartype
+@require(lambda max_concurrency: max_concurrency is None or max_concurrency >= 1, "Max concurrency must be positive")
+@ensure(lambda spec_paths, result: len(result) == len(spec_paths), "Must return one result per spec")
+async def generate_specmatic_examples_for_specs(
+    spec_paths: Sequence[Path],
+    max_concurrency: int | None = None,
+    on_result: Callable[[Path, Path | Exception], None] | None = None,
+) -> list[Path | Exception]:
+    """
+    Generate examples for several specifications concurrently with Specmatic.
+
+    Args:
+        spec_paths: Specification files (examples go to `<spec stem>_examples` next to each spec)
+        max_concurrency: Maximum concurrent Specmatic processes (default: `default_specmatic_concurrency()`)
+        on_result: Optional callback called with each spec's outcome as soon as it finishes
+
+    Returns:
+        Examples directory, or the error raised for that spec, in the order of spec_paths
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or default_specmatic_concurrency())
+
+    async def generate(spec_path: Path) -> Path | Exception:
+        try:
+            return await generate_specmatic_examples(spec_path, semaphore=semaphore)
+        except Exception as e:
+            return e
+
+    return await _run_for_specs(spec_paths, generate, on_result)
+
+
 @beartype
 @require(lambda spec_path: spec_path.exists(), "Spec file must exist")
 async def generate_specmatic_tests(spec_path: Path, output_dir: Path | None = None) -> Path:
@@ -48,7 +48,7 @@ def load_plan_bundle(plan_path: Path) -> PlanBundle:
     Returns:
         PlanBundle instance (may be from older schema)
     """
-    plan_data = load_structured_file(plan_path)
+    plan_data = load_structured_file(plan_path, round_trip=False)
     return PlanBundle.model_validate(plan_data)
 
 
@@ -190,7 +190,7 @@ class PlanMigrator:
             Tuple of (needs_migration, reason)
         """
         try:
-            plan_data = load_structured_file(plan_path)
+            plan_data = load_structured_file(plan_path, round_trip=False)
             bundle_version = plan_data.get("version", "1.0")
             current_version = get_current_schema_version()
 
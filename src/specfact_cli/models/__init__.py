@@ -3,42 +3,68 @@ SpecFact CLI data models.
 
 This package contains Pydantic models for plan bundles, protocols,
 features, stories, and validation results.
+
+Models are imported on first access so that importing one model module does
+not load every model (and its dependencies).
 """
 
-from specfact_cli.models.bridge import (
-    AdapterType,
-    ArtifactMapping,
-    BridgeConfig,
-    CommandMapping,
-    TemplateMapping,
-)
-from specfact_cli.models.deviation import Deviation, DeviationReport, DeviationSeverity, DeviationType, ValidationReport
-from specfact_cli.models.enforcement import EnforcementAction, EnforcementConfig, EnforcementPreset
-from specfact_cli.models.persona_template import PersonaTemplate, SectionType, SectionValidation, TemplateSection
-from specfact_cli.models.plan import Business, Feature, Idea, Metadata, PlanBundle, PlanSummary, Product, Release, Story
-from specfact_cli.models.project import (
-    BundleChecksums,
-    BundleFormat,
-    BundleManifest,
-    BundleVersions,
-    FeatureIndex,
-    PersonaMapping,
-    ProjectBundle,
-    ProjectMetadata,
-    ProtocolIndex,
-    SchemaMetadata,
-    SectionLock,
-)
-from specfact_cli.models.protocol import Protocol, Transition
-from specfact_cli.models.sdd import (
-    SDDCoverageThresholds,
-    SDDEnforcementBudget,
-    SDDHow,
-    SDDManifest,
-    SDDWhat,
-    SDDWhy,
-)
-from specfact_cli.models.source_tracking import SourceTracking
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from specfact_cli.models.bridge import (
+        AdapterType,
+        ArtifactMapping,
+        BridgeConfig,
+        CommandMapping,
+        TemplateMapping,
+    )
+    from specfact_cli.models.deviation import (
+        Deviation,
+        DeviationReport,
+        DeviationSeverity,
+        DeviationType,
+        ValidationReport,
+    )
+    from specfact_cli.models.enforcement import EnforcementAction, EnforcementConfig, EnforcementPreset
+    from specfact_cli.models.persona_template import PersonaTemplate, SectionType, SectionValidation, TemplateSection
+    from specfact_cli.models.plan import (
+        Business,
+        Feature,
+        Idea,
+        Metadata,
+        PlanBundle,
+        PlanSummary,
+        Product,
+        Release,
+        Story,
+    )
+    from specfact_cli.models.project import (
+        BundleChecksums,
+        BundleFormat,
+        BundleManifest,
+        BundleVersions,
+        FeatureIndex,
+        PersonaMapping,
+        ProjectBundle,
+        ProjectMetadata,
+        ProtocolIndex,
+        SchemaMetadata,
+        SectionLock,
+    )
+    from specfact_cli.models.protocol import Protocol, Transition
+    from specfact_cli.models.sdd import (
+        SDDCoverageThresholds,
+        SDDEnforcementBudget,
+        SDDHow,
+        SDDManifest,
+        SDDWhat,
+        SDDWhy,
+    )
+    from specfact_cli.models.source_tracking import SourceTracking
 
 
 __all__ = [
@@ -89,3 +115,66 @@ __all__ = [
     "Transition",
     "ValidationReport",
 ]
+
+# Public name -> defining submodule; imported on first attribute access
+_LAZY_EXPORTS: dict[str, str] = {
+    "AdapterType": "specfact_cli.models.bridge",
+    "ArtifactMapping": "specfact_cli.models.bridge",
+    "BridgeConfig": "specfact_cli.models.bridge",
+    "BundleChecksums": "specfact_cli.models.project",
+    "BundleFormat": "specfact_cli.models.project",
+    "BundleManifest": "specfact_cli.models.project",
+    "BundleVersions": "specfact_cli.models.project",
+    "Business": "specfact_cli.models.plan",
+    "CommandMapping": "specfact_cli.models.bridge",
+    "Deviation": "specfact_cli.models.deviation",
+    "DeviationReport": "specfact_cli.models.deviation",
+    "DeviationSeverity": "specfact_cli.models.deviation",
+    "DeviationType": "specfact_cli.models.deviation",
+    "EnforcementAction": "specfact_cli.models.enforcement",
+    "EnforcementConfig": "specfact_cli.models.enforcement",
+    "EnforcementPreset": "specfact_cli.models.enforcement",
+    "Feature": "specfact_cli.models.plan",
+    "FeatureIndex": "specfact_cli.models.project",
+    "Idea": "specfact_cli.models.plan",
+    "Metadata": "specfact_cli.models.plan",
+    "PersonaMapping": "specfact_cli.models.project",
+    "PersonaTemplate": "specfact_cli.models.persona_template",
+    "PlanBundle": "specfact_cli.models.plan",
+    "PlanSummary": "specfact_cli.models.plan",
+    "Product": "specfact_cli.models.plan",
+    "ProjectBundle": "specfact_cli.models.project",
+    "ProjectMetadata": "specfact_cli.models.project",
+    "Protocol": "specfact_cli.models.protocol",
+    "ProtocolIndex": "specfact_cli.models.project",
+    "Release": "specfact_cli.models.plan",
+    "SDDCoverageThresholds": "specfact_cli.models.sdd",
+    "SDDEnforcementBudget": "specfact_cli.models.sdd",
+    "SDDHow": "specfact_cli.models.sdd",
+    "SDDManifest": "specfact_cli.models.sdd",
+    "SDDWhat": "specfact_cli.models.sdd",
+    "SDDWhy": "specfact_cli.models.sdd",
+    "SchemaMetadata": "specfact_cli.models.project",
+    "SectionLock": "specfact_cli.models.project",
+    "SectionType": "specfact_cli.models.persona_template",
+    "SectionValidation": "specfact_cli.models.persona_template",
+    "SourceTracking": "specfact_cli.models.source_tracking",
+    "Story": "specfact_cli.models.plan",
+    "TemplateMapping": "specfact_cli.models.bridge",
+    "TemplateSection": "specfact_cli.models.persona_template",
+    "Transition": "specfact_cli.models.protocol",
+    "ValidationReport": "specfact_cli.models.deviation",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -134,7 +134,7 @@ class BridgeConfig(BaseModel):
         Returns:
             Loaded BridgeConfig instance
         """
-        data = load_structured_file(path)
+        data = load_structured_file(path, round_trip=False)
         return cls(**data)
 
     @beartype
@@ -9,9 +9,14 @@ support dual versioning (schema + project).
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
-from collections.abc import Callable
+import shutil
+import threading
+from collections.abc import Callable, ItemsView, Iterator, KeysView, ValuesView
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
@@ -19,7 +24,7 @@ from typing import Any
 
 from beartype import beartype
 from icontract import ensure, require
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from specfact_cli.models.contract import ContractIndex
 from specfact_cli.models.plan import (
@@ -142,6 +147,280 @@ class BundleManifest(BaseModel):
     )
 
 
+def _data_fingerprint(data: dict[str, Any]) -> str:
+    """Hash dumped model data (used to detect changes since load or the last save)."""
+    serialized = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _model_fingerprint(model: BaseModel) -> str:
+    """Hash a model's content (e.g., an aspect or a feature)."""
+    return _data_fingerprint(model.model_dump())
+
+
+# First line of the data hashed into a bundle's Merkle content hash
+_MERKLE_HASH_HEADER = b"specfact-bundle-content/merkle-v1\n"
+
+
+@beartype
+@ensure(lambda result: len(result) == 64, "Must return SHA256 hex digest")
+def merkle_content_hash(leaf_hashes: dict[str, str]) -> str:
+    """
+    Combine leaf hashes (see `ProjectBundle.content_hashes`) into a bundle content hash.
+
+    Args:
+        leaf_hashes: Hash per aspect and feature, by leaf name
+
+    Returns:
+        SHA256 hex digest over the leaves sorted by name (independent of dict order)
+    """
+    digest = hashlib.sha256(_MERKLE_HASH_HEADER)
+    for name in sorted(leaf_hashes):
+        digest.update(f"{name}\t{leaf_hashes[name]}\n".encode())
+    return digest.hexdigest()
+
+
+@beartype
+def diff_content_hashes(expected: dict[str, str], actual: dict[str, str]) -> list[str]:
+    """
+    Find the leaves whose content differs between two sets of leaf hashes.
+
+    Args:
+        expected: Leaf hashes recorded earlier (e.g., in an SDD manifest)
+        actual: Current leaf hashes
+
+    Returns:
+        Sorted names of leaves that were added, removed or changed (e.g., "feature:FEATURE-001")
+    """
+    return sorted(name for name in expected.keys() | actual.keys() if expected.get(name) != actual.get(name))
+
+
+@dataclass
+class _SaveBaseline:
+    """Content of a bundle directory as of the last load or save (for incremental saves)."""
+
+    bundle_dir: Path
+    aspects: dict[str, str] = field(default_factory=dict)  # aspect file name -> fingerprint
+    feature_files: dict[str, str] = field(default_factory=dict)  # feature key -> file name
+    feature_fingerprints: dict[str, str] = field(default_factory=dict)  # feature key -> fingerprint
+
+
+def _write_artifact(data: dict[str, Any], artifact_path: Path) -> None:
+    """Write an artifact atomically (temporary file in the same directory, then rename)."""
+    from specfact_cli.utils.structured_io import StructuredFormat, dump_structured_file
+
+    temp_path = artifact_path.with_name(f".{artifact_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        dump_structured_file(data, temp_path, format=StructuredFormat.from_path(artifact_path))
+        os.replace(temp_path, artifact_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+class LazyFeatureDict(dict[str, Feature]):
+    """
+    Feature mapping that loads and validates each feature file on first access.
+
+    Keys come from the manifest's feature index, so membership tests, `len()` and
+    iterating keys never read feature files. A feature is loaded when it is first
+    accessed (`[key]`, `get()`, `values()`, `items()`); features that are never
+    accessed are not parsed. Each loaded feature's content hash is kept so that
+    `save_to_directory()` only rewrites features that changed.
+
+    Only loaded features are stored in the underlying dict, so C-level consumers
+    that bypass the mapping methods (e.g., pydantic serialization) must call
+    `load_all()` first (`ProjectBundle.model_dump()` does this).
+    """
+
+    def __init__(self, features_dir: Path, files: dict[str, str]) -> None:
+        """
+        Initialize lazy mapping.
+
+        Args:
+            features_dir: Directory containing the feature files
+            files: Feature file name (relative to features_dir) per key, in manifest order
+        """
+        super().__init__()
+        self.features_dir = features_dir
+        self._files = dict(files)
+        self._keys: dict[str, None] = dict.fromkeys(files)
+        self._fingerprints: dict[str, str] = {}
+        self._lock = threading.RLock()
+
+    def __missing__(self, key: str) -> Feature:
+        """Load a feature on first access."""
+        with self._lock:
+            if dict.__contains__(self, key):
+                return dict.__getitem__(self, key)
+            if key not in self._keys or key not in self._files:
+                raise KeyError(key)
+            from specfact_cli.utils.structured_io import load_structured_file
+
+            file_name = self._files[key]
+            try:
+                feature = Feature.model_validate(load_structured_file(self.features_dir / file_name, round_trip=False))
+            except Exception as e:
+                raise ValueError(f"Failed to load features/{file_name}: {e}") from e
+            dict.__setitem__(self, key, feature)
+            self._fingerprints[key] = _model_fingerprint(feature)
+            return feature
+
+    def __setitem__(self, key: str, value: Feature) -> None:
+        """Set a feature (the load-time hash is kept, so re-assigning unchanged content is not a change)."""
+        with self._lock:
+            dict.__setitem__(self, key, value)
+            self._keys[key] = None
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a feature."""
+        with self._lock:
+            if key not in self._keys:
+                raise KeyError(key)
+            del self._keys[key]
+            self._files.pop(key, None)
+            self._fingerprints.pop(key, None)
+            dict.pop(self, key, None)
+
+    def __contains__(self, key: object) -> bool:
+        """Check membership without loading."""
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate keys (in manifest order, then added keys) without loading."""
+        return iter(list(self._keys))
+
+    def __reversed__(self) -> Iterator[str]:
+        """Iterate keys in reverse order without loading."""
+        return iter(list(reversed(self._keys)))
+
+    def __len__(self) -> int:
+        """Number of features (loaded or not)."""
+        return len(self._keys)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare contents (loads all features)."""
+        if not isinstance(other, dict):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Short representation (does not load features)."""
+        return f"LazyFeatureDict({len(self._keys)} features, {dict.__len__(self)} loaded)"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Copy and pickle as a plain dict (loads all features)."""
+        return (dict, (dict(self.items()),))
+
+    def keys(self) -> KeysView[str]:  # type: ignore[override]
+        """Feature keys (does not load features)."""
+        return KeysView(self)
+
+    def values(self) -> ValuesView[Feature]:  # type: ignore[override]
+        """Features (each is loaded when reached)."""
+        return ValuesView(self)
+
+    def items(self) -> ItemsView[str, Feature]:  # type: ignore[override]
+        """(key, feature) pairs (each feature is loaded when reached)."""
+        return ItemsView(self)
+
+    def get(self, key: str, default: Any = None) -> Any:  # type: ignore[override]
+        """Get a feature (loading it if needed), or default if the key is unknown."""
+        if key not in self._keys:
+            return default
+        return self[key]
+
+    def pop(self, key: str, *default: Any) -> Any:  # type: ignore[override]
+        """Remove and return a feature."""
+        if key not in self._keys:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self) -> tuple[str, Feature]:
+        """Remove and return the last (key, feature) pair."""
+        if not self._keys:
+            raise KeyError("popitem(): dictionary is empty")
+        key = next(reversed(self._keys))
+        return key, self.pop(key)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:  # type: ignore[override]
+        """Get a feature, setting it to default if the key is unknown."""
+        if key not in self._keys:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore[override]
+        """Set features from a mapping or iterable of pairs."""
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        """Remove all features."""
+        with self._lock:
+            dict.clear(self)
+            self._keys.clear()
+            self._files.clear()
+            self._fingerprints.clear()
+
+    def copy(self) -> dict[str, Feature]:  # type: ignore[override]
+        """Plain dict copy (loads all features)."""
+        return dict(self.items())
+
+    def load_all(self) -> None:
+        """Load every feature that has not been loaded yet."""
+        for key in self:
+            self.get(key)
+
+    def is_loaded(self, key: str) -> bool:
+        """Check whether a feature has been loaded (or set) in memory."""
+        return dict.__contains__(self, key)
+
+    def loaded_count(self) -> int:
+        """Number of features loaded (or set) in memory."""
+        return dict.__len__(self)
+
+    def source_file(self, key: str) -> str | None:
+        """File name (relative to features_dir) a feature was indexed under, if it came from disk."""
+        return self._files.get(key)
+
+    def is_modified(self, key: str) -> bool:
+        """
+        Check whether a feature must be written on save.
+
+        Features that were never loaded are unchanged; features that were added (not
+        loaded from disk) are always written.
+        """
+        if not dict.__contains__(self, key):
+            return key not in self._files
+        fingerprint = self._fingerprints.get(key)
+        return fingerprint is None or _model_fingerprint(dict.__getitem__(self, key)) != fingerprint
+
+    def mark_saved(self, keys: list[str], files: dict[str, str]) -> None:
+        """
+        Record features as saved to features_dir (their current content becomes the baseline).
+
+        Args:
+            keys: Saved feature keys
+            files: File name per saved key
+        """
+        with self._lock:
+            for key in keys:
+                if dict.__contains__(self, key):
+                    self._fingerprints[key] = _model_fingerprint(dict.__getitem__(self, key))
+                    self._files[key] = files[key]
+
+
+def _load_feature(key: str, data: dict[str, Any]) -> tuple[str, Feature, str]:
+    """Validate a loaded feature file and fingerprint it (runs in the loader's worker threads)."""
+    feature = Feature.model_validate(data)
+    return key, feature, _model_fingerprint(feature)
+
+
 class ProjectBundle(BaseModel):
     """Modular project bundle (replaces monolithic PlanBundle)."""
 
@@ -153,13 +432,21 @@ class ProjectBundle(BaseModel):
     features: dict[str, Feature] = Field(default_factory=dict, description="Feature dictionary (key -> Feature)")
     clarifications: Clarifications | None = None
 
+    # Directory content as of the last load or save; lets in-place saves rewrite only what changed
+    _baseline: _SaveBaseline | None = PrivateAttr(default=None)
+    # Leaf name -> (model, leaf hash) of the Merkle content hash as of the last load, save or hash computation
+    _content_hash_cache: dict[str, tuple[BaseModel, str]] = PrivateAttr(default_factory=dict)
+
     @classmethod
     @beartype
     @require(lambda bundle_dir: isinstance(bundle_dir, Path), "Bundle directory must be Path")
     @require(lambda bundle_dir: bundle_dir.exists(), "Bundle directory must exist")
     @ensure(lambda result: isinstance(result, ProjectBundle), "Must return ProjectBundle")
     def load_from_directory(
-        cls, bundle_dir: Path, progress_callback: Callable[[int, int, str], None] | None = None
+        cls,
+        bundle_dir: Path,
+        progress_callback: Callable[[int, int, str], None] | None = None,
+        lazy: bool = False,
     ) -> ProjectBundle:
         """
         Load project bundle from directory structure.
@@ -167,6 +454,8 @@ class ProjectBundle(BaseModel):
         Args:
             bundle_dir: Path to project bundle directory (e.g., .specfact/projects/legacy-api/)
             progress_callback: Optional callback function(current: int, total: int, artifact: str) for progress updates
+            lazy: Load features on first access instead of up front (see `LazyFeatureDict`); for
+                commands that only touch a few features of a large bundle
 
         Returns:
             ProjectBundle instance loaded from directory
@@ -183,7 +472,7 @@ class ProjectBundle(BaseModel):
 
         # Count total artifacts to load for progress tracking
         features_dir = bundle_dir / "features"
-        num_features = len(list(features_dir.glob("*.yaml")) if features_dir.exists() else [])
+        num_features = 0 if lazy else len(list(features_dir.glob("*.yaml")) if features_dir.exists() else [])
         # Base artifacts: manifest, product (required), idea, business, clarifications (optional)
         total_artifacts = (
             2
@@ -198,7 +487,7 @@ class ProjectBundle(BaseModel):
         # Load manifest first (required for feature index)
         if progress_callback:
             progress_callback(current + 1, total_artifacts, "bundle.manifest.yaml")
-        manifest_data = load_structured_file(manifest_path)
+        manifest_data = load_structured_file(manifest_path, round_trip=False)
         manifest = BundleManifest.model_validate(manifest_data)
         current += 1
 
@@ -208,6 +497,7 @@ class ProjectBundle(BaseModel):
         product: Product | None = None  # Will be set from parallel loading (required)
         clarifications: Clarifications | None = None
         features: dict[str, Feature] = {}
+        feature_fingerprints: dict[str, str] = {}
 
         # Prepare tasks for parallel loading
         load_tasks: list[tuple[str, Path, Callable]] = []
@@ -233,7 +523,7 @@ class ProjectBundle(BaseModel):
             )
 
         # Add feature loading tasks (from manifest index)
-        if features_dir.exists():
+        if features_dir.exists() and not lazy:
             for feature_index in manifest.features:
                 feature_path = features_dir / feature_index.file
                 if feature_path.exists():
@@ -241,7 +531,7 @@ class ProjectBundle(BaseModel):
                         (
                             f"features/{feature_index.file}",
                             feature_path,
-                            lambda data, key=feature_index.key: (key, Feature.model_validate(data)),
+                            lambda data, key=feature_index.key: _load_feature(key, data),
                         )
                     )
 
@@ -255,7 +545,7 @@ class ProjectBundle(BaseModel):
 
         def load_artifact(artifact_name: str, artifact_path: Path, validator: Callable) -> tuple[str, Any]:
             """Load a single artifact and return (name, validated_data)."""
-            data = load_structured_file(artifact_path)
+            data = load_structured_file(artifact_path, round_trip=False)
             validated = validator(data)
             return (artifact_name, validated)
 
@@ -291,11 +581,12 @@ class ProjectBundle(BaseModel):
                             elif artifact_name == "clarifications.yaml":
                                 clarifications = result  # type: ignore[assignment]  # Validated by validator
                             elif (
-                                artifact_name.startswith("features/") and isinstance(result, tuple) and len(result) == 2
+                                artifact_name.startswith("features/") and isinstance(result, tuple) and len(result) == 3
                             ):
-                                # Result is (key, Feature) tuple for features
-                                key, feature = result
+                                # Result is (key, Feature, fingerprint) tuple for features
+                                key, feature, fingerprint = result
                                 features[key] = feature
+                                feature_fingerprints[key] = fingerprint
                         except KeyboardInterrupt:
                             interrupted = True
                             for f in future_to_task:
@@ -329,7 +620,7 @@ class ProjectBundle(BaseModel):
 
         bundle_name = bundle_dir.name
 
-        return cls(
+        bundle = cls(
             manifest=manifest,
             bundle_name=bundle_name,
             idea=idea,
@@ -338,6 +629,23 @@ class ProjectBundle(BaseModel):
             features=features,
             clarifications=clarifications,
         )
+        feature_files: dict[str, str] = {}
+        if features_dir.exists():
+            for feature_index in manifest.features:
+                if (features_dir / feature_index.file).exists():
+                    feature_files[feature_index.key] = feature_index.file
+        if lazy:
+            # Only the manifest's feature index is read now; feature files are loaded on first access
+            # Assigned after construction: pydantic validation would copy the mapping into a plain dict
+            bundle.features = LazyFeatureDict(features_dir, feature_files)
+        bundle._baseline = _SaveBaseline(
+            bundle_dir=bundle_dir.resolve(),
+            aspects=bundle._aspect_fingerprints(),
+            feature_files=feature_files,
+            feature_fingerprints=feature_fingerprints,
+        )
+        bundle._seed_content_hashes(bundle._baseline.aspects, feature_fingerprints)
+        return bundle
 
     @beartype
     @require(lambda self, bundle_dir: isinstance(bundle_dir, Path), "Bundle directory must be Path")
@@ -348,6 +656,12 @@ class ProjectBundle(BaseModel):
         """
         Save project bundle to directory structure.
 
+        Saving back to the directory the bundle was loaded from (or last saved to) is
+        incremental: only aspects and features that changed since then are rewritten,
+        files of removed aspects and features are deleted, and only their checksum
+        entries are updated. Each file is replaced atomically and the manifest is
+        written last.
+
         Args:
             bundle_dir: Path to project bundle directory (e.g., .specfact/projects/legacy-api/)
             progress_callback: Optional callback function(current: int, total: int, artifact: str) for progress updates
@@ -355,22 +669,9 @@ class ProjectBundle(BaseModel):
         Raises:
             ValueError: If bundle structure is invalid
         """
-
-        from specfact_cli.utils.structured_io import dump_structured_file
-
         # Ensure directory exists
         bundle_dir.mkdir(parents=True, exist_ok=True)
-
-        # Count total artifacts to save for progress tracking
-        num_features = len(self.features)
-        total_artifacts = (
-            1  # manifest (always saved last)
-            + (1 if self.idea else 0)
-            + (1 if self.business else 0)
-            + 1  # product (always saved)
-            + (1 if self.clarifications else 0)
-            + num_features
-        )
+        baseline = self._baseline if self.can_save_incrementally(bundle_dir) else None
 
         # Update manifest bundle metadata
         now = datetime.now(UTC).isoformat()
@@ -381,20 +682,18 @@ class ProjectBundle(BaseModel):
 
         # Prepare tasks for parallel saving (all artifacts except manifest)
         save_tasks: list[tuple[str, Path, dict[str, Any]]] = []
-
-        # Add aspect saving tasks
-        if self.idea:
-            save_tasks.append(("idea.yaml", bundle_dir / "idea.yaml", self.idea.model_dump()))
-
-        if self.business:
-            save_tasks.append(("business.yaml", bundle_dir / "business.yaml", self.business.model_dump()))
-
-        save_tasks.append(("product.yaml", bundle_dir / "product.yaml", self.product.model_dump()))
-
-        if self.clarifications:
-            save_tasks.append(
-                ("clarifications.yaml", bundle_dir / "clarifications.yaml", self.clarifications.model_dump())
-            )
+        removed_files: list[str] = []
+
+        # Add aspect saving tasks (unchanged aspects are skipped on incremental saves)
+        aspect_fingerprints = self._aspect_fingerprints()
+        for file_name, aspect in self._aspects().items():
+            if aspect is None:
+                if baseline is not None and file_name in baseline.aspects:
+                    removed_files.append(file_name)
+                continue
+            if baseline is not None and baseline.aspects.get(file_name) == aspect_fingerprints[file_name]:
+                continue
+            save_tasks.append((file_name, bundle_dir / file_name, aspect.model_dump()))
 
         # Prepare feature saving tasks
         features_dir = bundle_dir / "features"
@@ -404,17 +703,48 @@ class ProjectBundle(BaseModel):
         if not isinstance(self.features, dict):
             raise ValueError(f"Expected features to be dict, got {type(self.features)}")
 
-        for key, feature in self.features.items():
+        # Lazily loaded bundles only rewrite features that were loaded and changed; eagerly
+        # loaded bundles compare against the fingerprints taken at load time (or the last save)
+        lazy_features = self.features if isinstance(self.features, LazyFeatureDict) else None
+        unchanged_keys: list[str] = []
+        feature_fingerprints: dict[str, str] = {}
+
+        for key in self.features:
             # Ensure key is a string, not a FeatureIndex or other object
             if not isinstance(key, str):
                 raise ValueError(f"Expected feature key to be string, got {type(key)}: {key}")
+            if lazy_features is not None and not lazy_features.is_modified(key):
+                unchanged_keys.append(key)
+                continue
+            feature = self.features[key]
             # Ensure feature is a Feature object, not a FeatureIndex
             if not isinstance(feature, Feature):
                 raise ValueError(f"Expected feature to be Feature, got {type(feature)}: {feature}")
 
+            data = feature.model_dump()
+            if lazy_features is None:
+                feature_fingerprints[key] = _data_fingerprint(data)
+                if (
+                    baseline is not None
+                    and key in baseline.feature_files
+                    and baseline.feature_fingerprints.get(key) == feature_fingerprints[key]
+                ):
+                    unchanged_keys.append(key)
+                    continue
+
             feature_file = f"{key}.yaml"
             feature_path = features_dir / feature_file
-            save_tasks.append((f"features/{feature_file}", feature_path, feature.model_dump()))
+            save_tasks.append((f"features/{feature_file}", feature_path, data))
+            if baseline is not None and baseline.feature_files.get(key, feature_file) != feature_file:
+                removed_files.append(f"features/{baseline.feature_files[key]}")
+
+        if baseline is not None:
+            removed_files.extend(
+                f"features/{file_name}" for key, file_name in baseline.feature_files.items() if key not in self.features
+            )
+
+        # Count total artifacts to save for progress tracking (manifest is always saved last)
+        total_artifacts = len(save_tasks) + 1
 
         # Save artifacts in parallel using ThreadPoolExecutor
         # In test mode, use fewer workers to avoid resource contention
@@ -428,7 +758,7 @@ class ProjectBundle(BaseModel):
 
         def save_artifact(artifact_name: str, artifact_path: Path, data: dict[str, Any]) -> tuple[str, str]:
             """Save a single artifact and return (name, checksum)."""
-            dump_structured_file(data, artifact_path)
+            _write_artifact(data, artifact_path)
             # Compute checksum after file is written (static method)
             checksum = ProjectBundle._compute_file_checksum(artifact_path)
             return (artifact_name, checksum)
@@ -504,6 +834,19 @@ class ProjectBundle(BaseModel):
                 else:
                     executor.shutdown(wait=False)
 
+        # Keep the feature index in feature order (tasks complete in arbitrary order)
+        feature_order = {key: position for position, key in enumerate(self.features)}
+        feature_indices.sort(key=lambda index: feature_order.get(index.key, len(feature_order)))
+        if unchanged_keys:
+            feature_indices = self._merge_unchanged_features(
+                unchanged_keys, feature_indices, features_dir, now, lazy_features, baseline
+            )
+
+        # Delete files of removed aspects and features (incremental saves only)
+        for file_name in removed_files:
+            (bundle_dir / file_name).unlink(missing_ok=True)
+            self.manifest.checksums.files.pop(file_name, None)
+
         # Update manifest with checksums and feature indices
         self.manifest.checksums.files.update(checksums)
         self.manifest.features = feature_indices
@@ -512,7 +855,230 @@ class ProjectBundle(BaseModel):
         if progress_callback:
             progress_callback(total_artifacts, total_artifacts, "bundle.manifest.yaml")
         manifest_path = bundle_dir / "bundle.manifest.yaml"
-        dump_structured_file(self.manifest.model_dump(mode="json"), manifest_path)
+        _write_artifact(self.manifest.model_dump(mode="json"), manifest_path)
+
+        # The saved content becomes the baseline for the next incremental save
+        self._baseline = _SaveBaseline(
+            bundle_dir=bundle_dir.resolve(),
+            aspects=aspect_fingerprints,
+            feature_files={index.key: index.file for index in feature_indices},
+            feature_fingerprints=feature_fingerprints,
+        )
+        self._seed_content_hashes(aspect_fingerprints, feature_fingerprints)
+
+    def _merge_unchanged_features(
+        self,
+        unchanged_keys: list[str],
+        written_indices: list[FeatureIndex],
+        features_dir: Path,
+        now: str,
+        lazy_features: LazyFeatureDict | None,
+        baseline: _SaveBaseline | None,
+    ) -> list[FeatureIndex]:
+        """
+        Keep the files and index entries of features that were not rewritten.
+
+        Unchanged feature files of a lazily loaded bundle are copied when saving to
+        another directory (e.g., the temporary directory of an atomic save). Written
+        features become the new baseline of the lazy mapping when saving in place.
+
+        Returns:
+            Feature index entries in feature order
+        """
+        existing_indices = {index.key: index for index in self.manifest.features}
+        indices: dict[str, FeatureIndex] = {index.key: index for index in written_indices}
+        in_place = lazy_features is None or features_dir.resolve() == lazy_features.features_dir.resolve()
+
+        for key in unchanged_keys:
+            if lazy_features is not None:
+                file_name = lazy_features.source_file(key) or f"{key}.yaml"
+            else:
+                file_name = baseline.feature_files[key] if baseline is not None else f"{key}.yaml"
+            if not in_place and lazy_features is not None:
+                target_path = features_dir / file_name
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(lazy_features.features_dir / file_name, target_path)
+            index = existing_indices.get(key)
+            if index is None:
+                feature = self.features[key]
+                index = FeatureIndex(
+                    key=key,
+                    title=feature.title,
+                    file=file_name,
+                    status="active" if not feature.draft else "draft",
+                    stories_count=len(feature.stories),
+                    created_at=now,
+                    updated_at=now,
+                    contract=feature.contract,
+                    checksum=None,
+                )
+            indices[key] = index
+
+        if in_place and lazy_features is not None:
+            written_keys = [index.key for index in written_indices]
+            lazy_features.mark_saved(written_keys, {key: indices[key].file for key in written_keys})
+        return [indices[key] for key in self.features if key in indices]
+
+    @beartype
+    @require(lambda self, bundle_dir: isinstance(bundle_dir, Path), "Bundle directory must be Path")
+    def can_save_incrementally(self, bundle_dir: Path) -> bool:
+        """
+        Check whether saving to bundle_dir only needs to rewrite what changed.
+
+        True when the bundle was loaded from (or last saved to) bundle_dir and its
+        manifest is still there.
+
+        Args:
+            bundle_dir: Target bundle directory
+
+        Returns:
+            True if `save_to_directory(bundle_dir)` is incremental
+        """
+        return (
+            self._baseline is not None
+            and self._baseline.bundle_dir == bundle_dir.resolve()
+            and (bundle_dir / "bundle.manifest.yaml").exists()
+        )
+
+    @beartype
+    @require(lambda self, bundle_dir: isinstance(bundle_dir, Path), "Bundle directory must be Path")
+    @ensure(lambda result: result is None, "Must return None")
+    def mark_saved(self, bundle_dir: Path) -> None:
+        """
+        Record that the bundle's last saved content now lives in bundle_dir.
+
+        Used after the directory a bundle was saved to is moved into place (e.g., by an
+        atomic save), so the next save to bundle_dir is incremental.
+
+        Args:
+            bundle_dir: Directory the bundle was moved to
+        """
+        if self._baseline is None:
+            return
+        self._baseline.bundle_dir = bundle_dir.resolve()
+        if isinstance(self.features, LazyFeatureDict) and (
+            self.features.features_dir.resolve() == (bundle_dir / "features").resolve()
+        ):
+            files = self._baseline.feature_files
+            self.features.mark_saved([key for key in files if self.features.is_loaded(key)], files)
+
+    @beartype
+    @require(lambda self, bundle_dir: isinstance(bundle_dir, Path), "Bundle directory must be Path")
+    @require(lambda self: not isinstance(self.features, LazyFeatureDict), "All features must be loaded")
+    @ensure(lambda result: isinstance(result, dict), "Must return dict")
+    def snapshot_state(self, bundle_dir: Path) -> dict[str, Any]:
+        """
+        Return the bundle content and save baseline for a binary snapshot of bundle_dir.
+
+        Used by `utils.bundle_snapshot` right after the bundle was loaded from or saved
+        to bundle_dir, so the models match the YAML files there.
+
+        Args:
+            bundle_dir: Bundle directory the snapshot belongs to
+
+        Returns:
+            Models and baseline data accepted by `from_snapshot_state`
+        """
+        baseline = self._baseline if self.can_save_incrementally(bundle_dir) else None
+        if baseline is not None:
+            feature_files = dict(baseline.feature_files)
+            feature_fingerprints = dict(baseline.feature_fingerprints)
+        else:
+            feature_files = {index.key: index.file for index in self.manifest.features}
+            feature_fingerprints = {}
+        for key, feature in self.features.items():
+            if key not in feature_fingerprints:
+                feature_fingerprints[key] = _model_fingerprint(feature)
+        return {
+            "manifest": self.manifest,
+            "idea": self.idea,
+            "business": self.business,
+            "product": self.product,
+            "clarifications": self.clarifications,
+            "features": dict(self.features),
+            "feature_files": feature_files,
+            "feature_fingerprints": feature_fingerprints,
+        }
+
+    @classmethod
+    @beartype
+    @require(lambda bundle_dir: isinstance(bundle_dir, Path), "Bundle directory must be Path")
+    @ensure(lambda result: isinstance(result, ProjectBundle), "Must return ProjectBundle")
+    def from_snapshot_state(cls, bundle_dir: Path, state: dict[str, Any]) -> ProjectBundle:
+        """
+        Rebuild a bundle from `snapshot_state` output, as if loaded from bundle_dir.
+
+        Args:
+            bundle_dir: Bundle directory the snapshot belongs to
+            state: Snapshot state (models are used as-is, not re-validated)
+
+        Returns:
+            ProjectBundle whose next save to bundle_dir is incremental
+        """
+        bundle = cls(
+            manifest=state["manifest"],
+            bundle_name=bundle_dir.name,
+            idea=state["idea"],
+            business=state["business"],
+            product=state["product"],
+            features=state["features"],
+            clarifications=state["clarifications"],
+        )
+        bundle._baseline = _SaveBaseline(
+            bundle_dir=bundle_dir.resolve(),
+            aspects=bundle._aspect_fingerprints(),
+            feature_files=state["feature_files"],
+            feature_fingerprints=state["feature_fingerprints"],
+        )
+        bundle._seed_content_hashes(bundle._baseline.aspects, state["feature_fingerprints"])
+        return bundle
+
+    def _aspects(self) -> dict[str, BaseModel | None]:
+        """Aspect models by file name."""
+        return {
+            "idea.yaml": self.idea,
+            "business.yaml": self.business,
+            "product.yaml": self.product,
+            "clarifications.yaml": self.clarifications,
+        }
+
+    def _aspect_fingerprints(self) -> dict[str, str]:
+        """Fingerprints of the aspects that are present, by file name."""
+        return {
+            file_name: _model_fingerprint(aspect) for file_name, aspect in self._aspects().items() if aspect is not None
+        }
+
+    def _seed_content_hashes(self, aspect_fingerprints: dict[str, str], feature_fingerprints: dict[str, str]) -> None:
+        """
+        Cache leaf hashes from fingerprints taken while loading or saving (they are the same hashes).
+
+        Args:
+            aspect_fingerprints: Aspect fingerprints by file name
+            feature_fingerprints: Feature fingerprints by key (features that are not loaded are skipped)
+        """
+        for file_name, aspect in self._aspects().items():
+            name = file_name.removesuffix(".yaml")
+            if name != "clarifications" and aspect is not None and file_name in aspect_fingerprints:
+                self._content_hash_cache[name] = (aspect, aspect_fingerprints[file_name])
+        for key, fingerprint in feature_fingerprints.items():
+            # dict.get does not load features of lazily loaded bundles
+            feature = dict.get(self.features, key)
+            if feature is not None:
+                self._content_hash_cache[f"feature:{key}"] = (feature, fingerprint)
+
+    @beartype
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        """Dump the bundle (lazily loaded features are loaded first)."""
+        if isinstance(self.features, LazyFeatureDict):
+            self.features.load_all()
+        return super().model_dump(**kwargs)
+
+    @beartype
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Dump the bundle as JSON (lazily loaded features are loaded first)."""
+        if isinstance(self.features, LazyFeatureDict):
+            self.features.load_all()
+        return super().model_dump_json(**kwargs)
 
     @beartype
     @require(lambda self, key: isinstance(key, str) and len(key) > 0, "Feature key must be non-empty string")
@@ -540,6 +1106,7 @@ class ProjectBundle(BaseModel):
             feature: Feature to add
         """
         self.features[feature.key] = feature
+        self._content_hash_cache.pop(f"feature:{feature.key}", None)
         # Note: Actual file save happens in save_to_directory()
 
     @beartype
@@ -557,6 +1124,8 @@ class ProjectBundle(BaseModel):
         if key != feature.key:
             raise ValueError(f"Feature key mismatch: {key} != {feature.key}")
         self.features[key] = feature
+        # The feature may have been modified in place before being passed back
+        self._content_hash_cache.pop(f"feature:{key}", None)
         # Note: Actual file save happens in save_to_directory()
 
     @beartype
@@ -567,35 +1136,17 @@ class ProjectBundle(BaseModel):
         Compute summary from all aspects (for compatibility).
 
         Args:
-            include_hash: Whether to compute content hash
+            include_hash: Whether to compute content hash (see `compute_content_hash`)
 
         Returns:
             PlanSummary with counts and optional hash
         """
-        import hashlib
-        import json
-
         features_count = len(self.features)
         stories_count = sum(len(f.stories) for f in self.features.values())
         themes_count = len(self.product.themes) if self.product.themes else 0
         releases_count = len(self.product.releases) if self.product.releases else 0
 
-        content_hash = None
-        if include_hash:
-            # Compute hash of all aspects combined
-            # NOTE: Exclude clarifications from hash - they are review metadata, not plan content
-            # This ensures hash stability across review sessions (clarifications change but plan doesn't)
-            # IMPORTANT: Sort features by key to ensure deterministic hash regardless of dict insertion order
-            sorted_features = sorted(self.features.items(), key=lambda x: x[0])
-            bundle_dict = {
-                "idea": self.idea.model_dump() if self.idea else None,
-                "business": self.business.model_dump() if self.business else None,
-                "product": self.product.model_dump(),
-                "features": [f.model_dump() for _, f in sorted_features],
-                # Exclude clarifications - they are review metadata, not part of the plan content
-            }
-            bundle_json = json.dumps(bundle_dict, sort_keys=True, default=str)
-            content_hash = hashlib.sha256(bundle_json.encode("utf-8")).hexdigest()
+        content_hash = self.compute_content_hash() if include_hash else None
 
         return PlanSummary(
             features_count=features_count,
@@ -606,6 +1157,96 @@ class ProjectBundle(BaseModel):
             computed_at=datetime.now(UTC).isoformat(),
         )
 
+    @beartype
+    @ensure(lambda result: "product" in result, "Product must have a leaf hash")
+    def content_hashes(self, assume_unmodified: bool = False) -> dict[str, str]:
+        """
+        Compute the leaf hashes of the bundle's Merkle content hash.
+
+        There is one leaf per aspect ("idea", "business", "product") and per feature
+        ("feature:<key>"). Clarifications are excluded: they are review metadata, not plan
+        content, so the hash stays stable across review sessions.
+
+        Args:
+            assume_unmodified: Reuse the leaf hashes recorded when the bundle was loaded or
+                last saved (from the fingerprints taken then), so nothing is serialized again.
+                Only pass True if no model was modified in place since; replaced models
+                (e.g., via `add_feature`/`update_feature`) are always hashed again.
+
+        Returns:
+            Leaf hash (SHA256 of the model's canonical JSON) by leaf name
+        """
+        models: list[tuple[str, BaseModel]] = [("product", self.product)]
+        if self.idea is not None:
+            models.append(("idea", self.idea))
+        if self.business is not None:
+            models.append(("business", self.business))
+        models.extend((f"feature:{key}", feature) for key, feature in self.features.items())
+
+        cache: dict[str, tuple[BaseModel, str]] = {}
+        leaves: dict[str, str] = {}
+        for name, model in models:
+            cached = self._content_hash_cache.get(name) if assume_unmodified else None
+            leaf_hash = cached[1] if cached is not None and cached[0] is model else _model_fingerprint(model)
+            cache[name] = (model, leaf_hash)
+            leaves[name] = leaf_hash
+        # Entries of removed features are dropped
+        self._content_hash_cache = cache
+        return leaves
+
+    @beartype
+    @ensure(lambda result: isinstance(result, str) and len(result) == 64, "Must return SHA256 hex digest")
+    def compute_content_hash(self, expected: str | None = None, assume_unmodified: bool = False) -> str:
+        """
+        Compute the bundle's content hash (Merkle root over `content_hashes`).
+
+        The hash is identical across runs for the same content, independent of feature order.
+
+        Args:
+            expected: Hash recorded earlier (e.g., in an SDD manifest). If it is not the Merkle
+                hash but the pre-Merkle hash of the current content (one SHA256 over the whole
+                bundle's JSON), expected is returned, so manifests written by earlier versions
+                still match.
+            assume_unmodified: Reuse the leaf hashes recorded at load or save (see `content_hashes`)
+
+        Returns:
+            Content hash; compare it with expected to detect changes
+        """
+        return self.content_hash_tree(expected, assume_unmodified)[0]
+
+    @beartype
+    @ensure(lambda result: len(result[0]) == 64, "Must return SHA256 hex digest")
+    def content_hash_tree(
+        self, expected: str | None = None, assume_unmodified: bool = False
+    ) -> tuple[str, dict[str, str]]:
+        """
+        Compute the content hash and the leaf hashes it combines in one pass.
+
+        Args:
+            expected: Hash recorded earlier (see `compute_content_hash`)
+            assume_unmodified: Reuse the leaf hashes recorded at load or save (see `content_hashes`)
+
+        Returns:
+            Tuple of (content hash, leaf hashes by leaf name)
+        """
+        leaf_hashes = self.content_hashes(assume_unmodified)
+        content_hash = merkle_content_hash(leaf_hashes)
+        if expected is not None and expected != content_hash and expected == self._legacy_content_hash():
+            return expected, leaf_hashes
+        return content_hash, leaf_hashes
+
+    def _legacy_content_hash(self) -> str:
+        """Compute the pre-Merkle content hash (SHA256 over all aspects and features as one JSON document)."""
+        sorted_features = sorted(self.features.items(), key=lambda x: x[0])
+        bundle_dict = {
+            "idea": self.idea.model_dump() if self.idea else None,
+            "business": self.business.model_dump() if self.business else None,
+            "product": self.product.model_dump(),
+            "features": [f.model_dump() for _, f in sorted_features],
+        }
+        bundle_json = json.dumps(bundle_dict, sort_keys=True, default=str)
+        return hashlib.sha256(bundle_json.encode("utf-8")).hexdigest()
+
     @staticmethod
     @beartype
     @require(lambda file_path: isinstance(file_path, Path), "File path must be Path")
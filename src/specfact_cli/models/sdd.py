@@ -83,6 +83,10 @@ class SDDManifest(BaseModel):
     version: str = Field("1.0.0", description="SDD manifest schema version")
     plan_bundle_id: str = Field(..., description="Linked plan bundle ID (content hash)")
     plan_bundle_hash: str = Field(..., description="Plan bundle content hash")
+    content_hashes: dict[str, str] = Field(
+        default_factory=dict,
+        description="Content hash per aspect and feature (leaves of plan_bundle_hash; names what changed on mismatch)",
+    )
     created_at: str = Field(default_factory=lambda: datetime.now(UTC).isoformat(), description="Creation timestamp")
     updated_at: str = Field(default_factory=lambda: datetime.now(UTC).isoformat(), description="Last update timestamp")
 
@@ -130,6 +134,29 @@ class SDDManifest(BaseModel):
         """
         return True
 
+    @beartype
+    def describe_content_changes(self, content_hashes: dict[str, str], limit: int = 5) -> str | None:
+        """
+        Name the aspects and features that changed since the manifest was written.
+
+        Args:
+            content_hashes: Current leaf hashes (`ProjectBundle.content_hashes()`)
+            limit: Maximum number of names listed
+
+        Returns:
+            Description like "changed: feature:FEATURE-001, product", or None if nothing differs
+            or the manifest has no leaf hashes (written by an earlier version)
+        """
+        from specfact_cli.models.project import diff_content_hashes
+
+        if not self.content_hashes:
+            return None
+        changed = diff_content_hashes(self.content_hashes, content_hashes)
+        if not changed:
+            return None
+        more = f" (+{len(changed) - limit} more)" if len(changed) > limit else ""
+        return f"changed: {', '.join(changed[:limit])}{more}"
+
     @beartype
     def update_timestamp(self) -> None:
         """Update the updated_at timestamp."""
@@ -8,6 +8,7 @@ and actual code/tests with hash-based change detection.
 from __future__ import annotations
 
 import hashlib
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -54,40 +55,124 @@ class SourceTracking(BaseModel):
             raise FileNotFoundError(f"File not found: {file_path}")
         return hashlib.sha256(file_path.read_bytes()).hexdigest()
 
+    @beartype
+    @require(lambda self, file_path: isinstance(file_path, Path), "File path must be Path")
+    @ensure(lambda result: isinstance(result, str) and len(result) > 0, "Must return non-empty key")
+    def path_key(self, file_path: Path, repo_path: Path | None = None) -> str:
+        """
+        Normalize a file path to its `file_hashes` key (repository-relative POSIX path).
+
+        Without a repository root, absolute paths ending in one of the tracked
+        implementation/test files map to that file's relative path.
+
+        Args:
+            file_path: Absolute or repository-relative file path
+            repo_path: Repository root (None if unknown)
+
+        Returns:
+            Key for `file_hashes`
+        """
+        from specfact_cli.utils.file_hashes import repo_path_key
+
+        if repo_path is None and file_path.is_absolute():
+            posix_path = file_path.as_posix()
+            for tracked_file in (*self.implementation_files, *self.test_files):
+                tracked_key = Path(tracked_file).as_posix()
+                if posix_path.endswith(f"/{tracked_key}"):
+                    return tracked_key
+        return repo_path_key(file_path, repo_path)
+
+    @beartype
+    @require(lambda self, file_path: isinstance(file_path, Path), "File path must be Path")
+    def stored_hash(self, file_path: Path, repo_path: Path | None = None) -> str | None:
+        """
+        Get the hash recorded for a file at the last sync.
+
+        Also finds hashes stored under the absolute-path keys older bundles used.
+
+        Args:
+            file_path: Absolute or repository-relative file path
+            repo_path: Repository root (None if unknown)
+
+        Returns:
+            Stored SHA256 hash, or None if the file is not tracked
+        """
+        key = self.path_key(file_path, repo_path)
+        stored = self.file_hashes.get(key)
+        if stored is not None:
+            return stored
+        for stored_key, stored_value in list(self.file_hashes.items()):
+            stored_path = Path(stored_key)
+            if stored_path.is_absolute() and self.path_key(stored_path, repo_path) == key:
+                return stored_value
+        return None
+
     @beartype
     @require(lambda self, file_path: isinstance(file_path, Path), "File path must be Path")
     @ensure(lambda self, file_path, result: isinstance(result, bool), "Must return bool")
-    def has_changed(self, file_path: Path) -> bool:
+    def has_changed(
+        self,
+        file_path: Path,
+        repo_path: Path | None = None,
+        hasher: Callable[[Path], str | None] | None = None,
+    ) -> bool:
         """
         Check if file changed since last sync.
 
         Args:
             file_path: Path to file to check
+            repo_path: Repository root, for the `file_hashes` key (None: inferred from tracked files)
+            hasher: Shared hash function returning None for missing files (e.g.,
+                `FileHashIndex.hash_file`, which skips files whose stat data is unchanged)
 
         Returns:
             True if file hash changed, False otherwise
         """
-        if not file_path.exists():
-            return True  # File deleted
-        current_hash = self.compute_hash(file_path)
-        stored_hash = self.file_hashes.get(str(file_path))
-        return stored_hash != current_hash
+        if hasher is not None:
+            current_hash = hasher(file_path)
+            if current_hash is None:
+                return True  # File deleted
+        else:
+            if not file_path.exists():
+                return True  # File deleted
+            current_hash = self.compute_hash(file_path)
+        return self.stored_hash(file_path, repo_path) != current_hash
 
     @beartype
     @require(lambda self, file_path: isinstance(file_path, Path), "File path must be Path")
     @ensure(lambda result: result is None, "Must return None")
-    def update_hash(self, file_path: Path) -> None:
+    def update_hash(
+        self,
+        file_path: Path,
+        repo_path: Path | None = None,
+        hasher: Callable[[Path], str | None] | None = None,
+    ) -> None:
         """
         Update stored hash for a file.
 
         Args:
             file_path: Path to file to update
+            repo_path: Repository root, for the `file_hashes` key (None: inferred from tracked files)
+            hasher: Shared hash function returning None for missing files
         """
-        if file_path.exists():
-            self.file_hashes[str(file_path)] = self.compute_hash(file_path)
-        elif str(file_path) in self.file_hashes:
+        key = self.path_key(file_path, repo_path)
+        # Drop absolute-path keys older versions stored for this file
+        for stored_key in list(self.file_hashes):
+            if (
+                stored_key != key
+                and Path(stored_key).is_absolute()
+                and self.path_key(Path(stored_key), repo_path) == key
+            ):
+                self.file_hashes.pop(stored_key, None)
+        if hasher is not None:
+            current_hash = hasher(file_path)
+        else:
+            current_hash = self.compute_hash(file_path) if file_path.exists() else None
+        if current_hash is not None:
+            self.file_hashes[key] = current_hash
+        else:
             # File deleted, remove from tracking
-            del self.file_hashes[str(file_path)]
+            self.file_hashes.pop(key, None)
 
     @beartype
     @ensure(lambda result: result is None, "Must return None")
@@ -2,12 +2,18 @@
 Mode detection and routing for SpecFact CLI.
 
 This package provides operational mode detection (CI/CD vs CoPilot) and command routing.
+The router pulls in the agent registry, so it is imported on first use.
 """
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from specfact_cli.modes.detector import OperationalMode, detect_mode
-from specfact_cli.modes.router import CommandRouter, RoutingResult, get_router
+
+
+if TYPE_CHECKING:
+    from specfact_cli.modes.router import CommandRouter, RoutingResult, get_router
 
 
 __all__ = [
@@ -17,3 +23,13 @@ __all__ = [
     "detect_mode",
     "get_router",
 ]
+
+_ROUTER_EXPORTS = {"CommandRouter", "RoutingResult", "get_router"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _ROUTER_EXPORTS:
+        from specfact_cli.modes import router
+
+        return getattr(router, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -25,6 +25,7 @@ else:
 from specfact_cli.models.bridge import BridgeConfig
 from specfact_cli.sync.bridge_probe import BridgeProbe
 from specfact_cli.sync.bridge_sync import BridgeSync
+from specfact_cli.sync.incremental_code_sync import IncrementalCodeSync, format_sync_latency
 from specfact_cli.sync.watcher import FileChange, SyncEventHandler
 
 
@@ -152,6 +153,7 @@ class BridgeWatch:
         self.change_queue: deque[FileChange] = deque()
         self.running = False
         self.bridge_sync: BridgeSync | None = None
+        self.code_sync: IncrementalCodeSync | None = None
 
         if self.bridge_config is None:
             # Auto-detect and load bridge config
@@ -160,8 +162,26 @@ class BridgeWatch:
         if self.bundle_name and self.sync_callback is None:
             # Create default sync callback using BridgeSync
             self.bridge_sync = BridgeSync(self.repo_path, bridge_config=self.bridge_config)
+            self.code_sync = self._create_code_sync()
             self.sync_callback = self._create_default_sync_callback()
 
+    @beartype
+    def _create_code_sync(self) -> IncrementalCodeSync | None:
+        """
+        Create incremental code-to-spec sync if the project bundle exists.
+
+        Returns:
+            IncrementalCodeSync instance, or None if there is no bundle to patch
+        """
+        from specfact_cli.utils.structure import SpecFactStructure
+
+        if self.bundle_name is None:
+            return None
+        bundle_dir = SpecFactStructure.project_dir(base_path=self.repo_path, bundle_name=self.bundle_name)
+        if not bundle_dir.exists():
+            return None
+        return IncrementalCodeSync(self.repo_path, self.bundle_name)
+
     @beartype
     @ensure(lambda result: isinstance(result, BridgeConfig), "Must return BridgeConfig")
     def _load_or_generate_bridge_config(self) -> BridgeConfig:
@@ -204,6 +224,15 @@ class BridgeWatch:
             if not changes:
                 return
 
+            # Re-analyze changed code (and its importers) and patch affected features
+            code_changes = [c for c in changes if c.change_type == "code" and c.file_path.suffix == ".py"]
+            if self.code_sync is not None and code_changes:
+                try:
+                    code_result = self.code_sync.sync([c.file_path for c in code_changes])
+                    print(f"✓ {format_sync_latency(code_result, min(c.timestamp for c in code_changes))}")
+                except Exception as e:
+                    print(f"✗ Error syncing code changes: {e}")
+
             # Group changes by artifact type
             artifact_changes: dict[str, list[str]] = {}  # artifact_key -> [feature_ids]
             for change in changes:
@@ -354,6 +383,17 @@ class BridgeWatch:
                     if base_dir.exists():
                         base_dirs.add(base_dir)
 
+        # Watch source roots (top-level directories of analyzed Python files) for code changes
+        if self.code_sync is not None:
+            for file_path in self.code_sync.import_graph.files:
+                try:
+                    top_level = file_path.relative_to(self.repo_path).parts[0]
+                except (ValueError, IndexError):
+                    continue
+                source_root = self.repo_path / top_level
+                if source_root.is_dir():
+                    base_dirs.add(source_root)
+
         # Also watch .specfact directory for bundle changes
         specfact_dir = self.repo_path / ".specfact"
         if specfact_dir.exists():
@@ -373,6 +413,10 @@ class BridgeWatch:
             print("Bridge config not initialized")
             return
 
+        if self.code_sync is not None:
+            # Build the import graph before resolving watch paths (it determines the source roots)
+            self.code_sync.start()
+
         watch_paths = self._resolve_watch_paths()
 
         if not watch_paths:
@@ -14,6 +14,7 @@ from beartype import beartype
 from icontract import ensure, require
 
 from specfact_cli.models.plan import Feature
+from specfact_cli.utils.git_changes import GitHashIndex, read_synced_commit
 
 
 @dataclass
@@ -87,6 +88,11 @@ class ChangeDetector:
         """
         Detect changes using hash-based comparison.
 
+        Files are hashed through a `GitHashIndex`: in a git checkout, files unchanged
+        since the bundle's synced commit are resolved from their blobs; other files
+        whose stat data is unchanged since they were last hashed are not read.
+        Files shared by several features are checked once.
+
         Args:
             features: Dictionary of features to check
 
@@ -94,62 +100,44 @@ class ChangeDetector:
             ChangeSet with all detected changes
         """
         changeset = ChangeSet()
+        # Shared by all features: each file is stat'ed (and, if its stat data changed, read) once
+        from specfact_cli.utils.structure import SpecFactStructure
+
+        bundle_dir = SpecFactStructure.project_dir(base_path=self.repo_path, bundle_name=self.bundle_name)
+        hash_index = GitHashIndex(self.repo_path, read_synced_commit(bundle_dir))
 
         for feature_key, feature in features.items():
             if not feature.source_tracking:
                 continue
+            tracking = feature.source_tracking
 
             # Check implementation files
-            for impl_file in feature.source_tracking.implementation_files:
+            for impl_file in tracking.implementation_files:
                 file_path = self.repo_path / impl_file
-                if file_path.exists():
-                    if feature.source_tracking.has_changed(file_path):
-                        old_hash = feature.source_tracking.file_hashes.get(impl_file)
-                        new_hash = feature.source_tracking.compute_hash(file_path)
-                        changeset.code_changes.append(
-                            CodeChange(
-                                file_path=impl_file,
-                                feature_key=feature_key,
-                                old_hash=old_hash,
-                                new_hash=new_hash,
-                            )
-                        )
-                else:
-                    # File deleted
-                    old_hash = feature.source_tracking.file_hashes.get(impl_file)
+                old_hash = tracking.stored_hash(file_path, self.repo_path)
+                new_hash = hash_index.hash_file(file_path)  # None if the file was deleted
+                if new_hash is None or new_hash != old_hash:
                     changeset.code_changes.append(
                         CodeChange(
                             file_path=impl_file,
                             feature_key=feature_key,
                             old_hash=old_hash,
-                            new_hash=None,
+                            new_hash=new_hash,
                         )
                     )
 
             # Check test files
-            for test_file in feature.source_tracking.test_files:
+            for test_file in tracking.test_files:
                 file_path = self.repo_path / test_file
-                if file_path.exists():
-                    if feature.source_tracking.has_changed(file_path):
-                        old_hash = feature.source_tracking.file_hashes.get(test_file)
-                        new_hash = feature.source_tracking.compute_hash(file_path)
-                        changeset.test_changes.append(
-                            TestChange(
-                                file_path=test_file,
-                                feature_key=feature_key,
-                                old_hash=old_hash,
-                                new_hash=new_hash,
-                            )
-                        )
-                else:
-                    # File deleted
-                    old_hash = feature.source_tracking.file_hashes.get(test_file)
+                old_hash = tracking.stored_hash(file_path, self.repo_path)
+                new_hash = hash_index.hash_file(file_path)  # None if the file was deleted
+                if new_hash is None or new_hash != old_hash:
                     changeset.test_changes.append(
                         TestChange(
                             file_path=test_file,
                             feature_key=feature_key,
                             old_hash=old_hash,
-                            new_hash=None,
+                            new_hash=new_hash,
                         )
                     )
 
@@ -158,6 +146,8 @@ class ChangeDetector:
             # For now, we'll detect if contract/protocol files exist but feature doesn't reference them
             # or vice versa
 
+        hash_index.save()
+
         # Detect conflicts (both code and spec changed)
         self._detect_conflicts(changeset, features)
 
@@ -41,11 +41,13 @@ class CodeToSpecSync:
             bundle_name: Project bundle name
         """
         from specfact_cli.utils.bundle_loader import load_project_bundle, save_project_bundle
+        from specfact_cli.utils.git_changes import SYNCED_COMMIT_KEY, GitHashIndex
         from specfact_cli.utils.structure import SpecFactStructure
 
         # Load project bundle
         bundle_dir = SpecFactStructure.project_dir(base_path=self.repo_path, bundle_name=bundle_name)
         project_bundle = load_project_bundle(bundle_dir)
+        hash_index = GitHashIndex(self.repo_path, project_bundle.manifest.bundle.get(SYNCED_COMMIT_KEY))
 
         # Group changes by feature
         changes_by_feature: dict[str, list[CodeChange]] = {}
@@ -68,8 +70,12 @@ class CodeToSpecSync:
                     # This would use existing CodeAnalyzer to extract function signatures,
                     # contracts, etc., and update the feature accordingly
                     # For now, we'll just update the hash
-                    feature.source_tracking.update_hash(file_path)
+                    feature.source_tracking.update_hash(file_path, self.repo_path, hasher=hash_index.hash_file)
                     feature.source_tracking.update_sync_timestamp()
 
+        hash_index.save()
+        if hash_index.head_commit:
+            project_bundle.manifest.bundle[SYNCED_COMMIT_KEY] = hash_index.head_commit
+
         # Save updated project bundle
         save_project_bundle(project_bundle, bundle_dir, atomic=True)
@@ -14,6 +14,8 @@ from typing import Any
 from beartype import beartype
 from icontract import ensure, require
 
+from specfact_cli.utils.git_changes import SYNCED_COMMIT_KEY, GitHashIndex
+
 
 @dataclass
 class DriftReport:
@@ -70,6 +72,10 @@ class DriftDetector:
 
         # Track all files referenced in specs
         spec_tracked_files: set[str] = set()
+        # Shared by all features: files unchanged since the synced commit (per git) or by stat data
+        # are not read, shared files are checked once
+        hash_index = GitHashIndex(repo_path, project_bundle.manifest.bundle.get(SYNCED_COMMIT_KEY))
+        repo_root = hash_index.repo_path
 
         # Check each feature
         for feature_key, feature in project_bundle.features.items():
@@ -77,23 +83,25 @@ class DriftDetector:
                 # Check implementation files
                 for impl_file in feature.source_tracking.implementation_files:
                     spec_tracked_files.add(impl_file)
-                    file_path = repo_path / impl_file
+                    file_path = repo_root / impl_file
 
-                    if not file_path.exists():
+                    current_hash = hash_index.hash_file(file_path)
+                    if current_hash is None:
                         # File deleted but spec exists
                         report.removed_code.append(impl_file)
-                    elif feature.source_tracking.has_changed(file_path):
+                    elif current_hash != feature.source_tracking.stored_hash(file_path, repo_root):
                         # File modified
                         report.modified_code.append(impl_file)
 
                 # Check test files
                 for test_file in feature.source_tracking.test_files:
                     spec_tracked_files.add(test_file)
-                    file_path = repo_path / test_file
+                    file_path = repo_root / test_file
 
-                    if not file_path.exists():
+                    current_hash = hash_index.hash_file(file_path)
+                    if current_hash is None:
                         report.removed_code.append(test_file)
-                    elif feature.source_tracking.has_changed(file_path):
+                    elif current_hash != feature.source_tracking.stored_hash(file_path, repo_root):
                         report.modified_code.append(test_file)
 
                 # Check test coverage gaps
@@ -105,6 +113,8 @@ class DriftDetector:
                 # Feature has no source tracking - orphaned spec
                 report.orphaned_specs.append(feature_key)
 
+        hash_index.save()
+
         # Scan repository for untracked code files
         for pattern in ["src/**/*.py", "lib/**/*.py", "app/**/*.py"]:
             for file_path in repo_path.glob(pattern):
@@ -0,0 +1,359 @@
+"""
+Dependency-aware incremental code-to-spec sync for watch mode.
+
+`ImportGraph` keeps a live reverse-import graph of the repository's Python files.
+It is built once from the `CodeAnalyzer` module dependency graph and updated per
+changed file; each file's imports are stored in the watch hash cache
+(`FileHashCache.dependencies`).
+`IncrementalCodeSync` re-analyzes only changed files and their transitive
+importers, and patches only the features that track them in the project bundle.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from beartype import beartype
+from icontract import ensure, require
+
+from specfact_cli.analyzers.code_analyzer import CodeAnalyzer
+from specfact_cli.models.plan import Feature
+from specfact_cli.models.project import ProjectBundle
+from specfact_cli.models.source_tracking import SourceTracking
+from specfact_cli.utils.file_hashes import repo_path_key
+
+
+@dataclass
+class IncrementalSyncResult:
+    """Outcome of one incremental sync batch."""
+
+    changed_files: list[str] = field(default_factory=list)  # Repo-relative paths reported by the watcher
+    reanalyzed_files: list[str] = field(default_factory=list)  # Changed files plus their transitive importers
+    patched_features: list[str] = field(default_factory=list)
+    added_features: list[str] = field(default_factory=list)
+    duration: float = 0.0  # Seconds spent re-analyzing and patching the bundle
+
+
+class ImportGraph:
+    """
+    Live reverse-import graph over the repository's Python files.
+
+    Thread-safe; paths are resolved absolute paths.
+    """
+
+    @beartype
+    def __init__(self, analyzer: CodeAnalyzer, dependencies: dict[str, list[str]] | None = None) -> None:
+        """
+        Initialize import graph.
+
+        Args:
+            analyzer: Code analyzer whose dependency graph backs this graph
+            dependencies: Store for each file's imports (e.g., `FileHashCache.dependencies`; optional)
+        """
+        self.analyzer = analyzer
+        self.dependencies = dependencies
+        self._imports: dict[Path, set[Path]] = {}  # file -> files it imports
+        self._importers: dict[Path, set[Path]] = {}  # file -> files importing it
+        self._lock = threading.RLock()
+
+    @beartype
+    @ensure(lambda result: result is None, "Must return None")
+    def build(self, python_files: list[Path] | None = None) -> None:
+        """
+        Build the graph from the analyzer's module dependency graph.
+
+        Args:
+            python_files: Files to include (default: all Python files in the repository)
+        """
+        from specfact_cli.utils.repo_walker import list_python_files
+
+        if python_files is None:
+            python_files = list_python_files(self.analyzer.repo_path)
+        self.analyzer.build_dependency_graph(python_files)
+
+        graph = self.analyzer.dependency_graph
+        with self._lock:
+            self._imports.clear()
+            self._importers.clear()
+            for module_name, data in graph.nodes(data=True):
+                module_path = data.get("path")
+                if module_path is None:
+                    continue
+                imported_paths = {
+                    graph.nodes[imported]["path"]
+                    for imported in graph.successors(module_name)
+                    if imported != module_name and "path" in graph.nodes[imported]
+                }
+                self._set_imports(Path(module_path), {Path(p) for p in imported_paths})
+
+    @beartype
+    @require(lambda file_path: isinstance(file_path, Path), "File path must be Path")
+    @ensure(lambda result: result is None, "Must return None")
+    def update_file(self, file_path: Path) -> None:
+        """
+        Re-read one file's imports (deleted files are removed from the graph).
+
+        Args:
+            file_path: Changed Python file
+        """
+        file_path = file_path.resolve()
+        with self._lock:
+            imported_paths = self.analyzer.update_file_dependencies(file_path)
+            if file_path.exists():
+                self._set_imports(file_path, {Path(p).resolve() for p in imported_paths})
+            else:
+                self._set_imports(file_path, set())
+                self._imports.pop(file_path, None)
+                if self.dependencies is not None:
+                    self.dependencies.pop(str(file_path), None)
+
+    @property
+    def files(self) -> list[Path]:
+        """Python files currently in the graph."""
+        with self._lock:
+            return sorted(self._imports)
+
+    @beartype
+    @require(lambda file_path: isinstance(file_path, Path), "File path must be Path")
+    @ensure(lambda result: isinstance(result, set), "Must return set")
+    def importers(self, file_path: Path) -> set[Path]:
+        """
+        Get the files that import a file, directly or transitively.
+
+        Args:
+            file_path: Python file
+
+        Returns:
+            Transitive importers (excluding the file itself)
+        """
+        return self.affected_files([file_path]) - {file_path.resolve()}
+
+    @beartype
+    @ensure(lambda result: isinstance(result, set), "Must return set")
+    def affected_files(self, changed_files: Iterable[Path]) -> set[Path]:
+        """
+        Get changed files plus everything that imports them, transitively.
+
+        Args:
+            changed_files: Changed Python files
+
+        Returns:
+            Files to re-analyze
+        """
+        seeds = [file_path.resolve() for file_path in changed_files]
+        affected: set[Path] = set(seeds)
+        pending = deque(seeds)
+        with self._lock:
+            while pending:
+                for importer in self._importers.get(pending.popleft(), ()):
+                    if importer not in affected:
+                        affected.add(importer)
+                        pending.append(importer)
+        return affected
+
+    def _set_imports(self, file_path: Path, imported_paths: set[Path]) -> None:
+        """Replace a file's imports, keeping the reverse index and the hash cache in step."""
+        for previous in self._imports.get(file_path, set()) - imported_paths:
+            importers = self._importers.get(previous)
+            if importers is not None:
+                importers.discard(file_path)
+                if not importers:
+                    del self._importers[previous]
+        for imported in imported_paths:
+            self._importers.setdefault(imported, set()).add(file_path)
+        self._imports[file_path] = imported_paths
+        if self.dependencies is not None:
+            self.dependencies[str(file_path)] = [str(p) for p in sorted(imported_paths)]
+
+
+class IncrementalCodeSync:
+    """Re-analyze changed code and patch the affected features of a project bundle."""
+
+    @beartype
+    @require(lambda repo_path: isinstance(repo_path, Path), "Repository path must be Path")
+    @require(lambda bundle_name: isinstance(bundle_name, str) and len(bundle_name) > 0, "Bundle name required")
+    def __init__(
+        self,
+        repo_path: Path,
+        bundle_name: str,
+        dependencies: dict[str, list[str]] | None = None,
+        analyzer: CodeAnalyzer | None = None,
+    ) -> None:
+        """
+        Initialize incremental code sync.
+
+        Args:
+            repo_path: Path to repository root
+            bundle_name: Project bundle to patch
+            dependencies: Store for each file's imports (e.g., `FileHashCache.dependencies`; optional)
+            analyzer: Code analyzer (default: one using the persistent analysis cache)
+        """
+        from specfact_cli.utils.structure import SpecFactStructure
+
+        self.repo_path = repo_path.resolve()
+        self.bundle_dir = SpecFactStructure.project_dir(base_path=self.repo_path, bundle_name=bundle_name)
+        if analyzer is None:
+            from specfact_cli.utils.analysis_cache import AnalysisCache
+
+            analyzer = CodeAnalyzer(self.repo_path, analysis_cache=AnalysisCache(self.repo_path))
+        self.analyzer = analyzer
+        self.import_graph = ImportGraph(analyzer, dependencies)
+        self._features_by_file: dict[str, set[str]] = {}  # repo-relative file -> feature keys tracking it
+        self._lock = threading.Lock()
+
+    @beartype
+    @ensure(lambda result: result is None, "Must return None")
+    def start(self) -> None:
+        """Build the import graph and index which features track which files (one full bundle read)."""
+        from specfact_cli.utils.bundle_loader import load_project_bundle
+
+        self.import_graph.build()
+        self._features_by_file.clear()
+        if not self.bundle_dir.exists():
+            return
+        bundle = load_project_bundle(self.bundle_dir, validate_hashes=False)
+        for feature in bundle.features.values():
+            self._index_feature(feature)
+
+    @beartype
+    @require(lambda changed_files: isinstance(changed_files, list), "Changed files must be list")
+    @ensure(lambda result: isinstance(result, IncrementalSyncResult), "Must return IncrementalSyncResult")
+    def sync(self, changed_files: list[Path]) -> IncrementalSyncResult:
+        """
+        Re-analyze changed Python files and their transitive importers, then patch affected features.
+
+        Args:
+            changed_files: Files reported as created, modified or deleted
+
+        Returns:
+            IncrementalSyncResult for the batch
+        """
+        from specfact_cli.utils.ast_cache import get_parsed_module_cache
+        from specfact_cli.utils.bundle_loader import load_project_bundle, save_project_bundle
+
+        started = time.perf_counter()
+        result = IncrementalSyncResult()
+        python_files = sorted({f.resolve() for f in changed_files if f.suffix == ".py"})
+        if not python_files:
+            return result
+
+        with self._lock:
+            parsed_cache = get_parsed_module_cache()
+            for file_path in python_files:
+                parsed_cache.invalidate(file_path)
+                self.import_graph.update_file(file_path)
+            affected = sorted(self.import_graph.affected_files(python_files))
+            result.changed_files = [self._relative(f) for f in python_files]
+            result.reanalyzed_files = [self._relative(f) for f in affected]
+
+            if self.bundle_dir.exists():
+                features_by_file = self.analyzer.analyze_files([f for f in affected if f.exists()])
+                bundle = load_project_bundle(self.bundle_dir, validate_hashes=False, lazy=True)
+                self._patch_bundle(bundle, affected, set(python_files), features_by_file, result)
+                if result.patched_features or result.added_features:
+                    save_project_bundle(bundle, self.bundle_dir, atomic=True)
+
+        result.duration = time.perf_counter() - started
+        return result
+
+    def _patch_bundle(
+        self,
+        bundle: ProjectBundle,
+        affected: list[Path],
+        changed: set[Path],
+        features_by_file: dict[Path, list[Feature]],
+        result: IncrementalSyncResult,
+    ) -> None:
+        """Patch features tracking affected files; add features for new classes in changed files."""
+        patched: set[str] = set()
+        for file_path in affected:
+            relative = self._relative(file_path)
+            tracked_keys = sorted(self._features_by_file.get(relative, set()))
+            fresh_features = features_by_file.get(file_path, [])
+            fresh_by_key = {f.key: f for f in fresh_features}
+            fresh_by_title = {f.title: f for f in fresh_features}
+
+            for key in tracked_keys:
+                feature = bundle.get_feature(key)
+                if feature is None:
+                    continue
+                fresh = fresh_by_key.get(key) or fresh_by_title.get(feature.title)
+                if fresh is not None:
+                    _refresh_code_derived_fields(feature, fresh)
+                    fresh_by_key.pop(fresh.key, None)
+                if feature.source_tracking is not None and file_path in changed:
+                    feature.source_tracking.update_hash(file_path, self.repo_path)
+                    feature.source_tracking.update_sync_timestamp()
+                patched.add(key)
+
+            # New classes in changed files become new features (importers only get refreshed)
+            if file_path not in changed:
+                continue
+            for fresh in fresh_by_key.values():
+                if fresh.key in bundle.features or fresh.key == "FEATURE-PLACEHOLDER":
+                    continue
+                fresh.source_tracking = SourceTracking(implementation_files=[relative])
+                fresh.source_tracking.update_hash(file_path, self.repo_path)
+                fresh.source_tracking.update_sync_timestamp()
+                bundle.add_feature(fresh)
+                self._index_feature(fresh)
+                result.added_features.append(fresh.key)
+        result.patched_features = sorted(patched)
+
+    def _index_feature(self, feature: Feature) -> None:
+        """Record which files a feature tracks."""
+        if feature.source_tracking is None:
+            return
+        for tracked_file in (*feature.source_tracking.implementation_files, *feature.source_tracking.test_files):
+            self._features_by_file.setdefault(Path(tracked_file).as_posix(), set()).add(feature.key)
+
+    def _relative(self, file_path: Path) -> str:
+        """Get a file's repo-relative POSIX path."""
+        return repo_path_key(file_path, self.repo_path)
+
+
+def _refresh_code_derived_fields(feature: Feature, fresh: Feature) -> None:
+    """
+    Update a feature from a fresh analysis of its class without discarding manual edits.
+
+    Confidence is replaced; new stories are appended; existing stories (by key) get
+    their code-derived tasks, scenarios and contracts refreshed.
+    """
+    feature.confidence = fresh.confidence
+    existing_stories = {story.key: story for story in feature.stories}
+    for fresh_story in fresh.stories:
+        story = existing_stories.get(fresh_story.key)
+        if story is None:
+            feature.stories.append(fresh_story)
+            continue
+        story.tasks = fresh_story.tasks
+        story.scenarios = fresh_story.scenarios
+        story.contracts = fresh_story.contracts
+
+
+@beartype
+@ensure(lambda result: isinstance(result, str), "Must return string")
+def format_sync_latency(sync_result: IncrementalSyncResult, first_event_time: float) -> str:
+    """
+    Format the per-batch latency line shown in watch mode.
+
+    Args:
+        sync_result: Result of the incremental sync batch
+        first_event_time: Wall-clock time (`time.time()`) of the batch's earliest file event
+
+    Returns:
+        Human-readable summary with sync duration and edit-to-spec latency
+    """
+    latency_ms = max(0.0, time.time() - first_event_time) * 1000
+    features = len(sync_result.patched_features) + len(sync_result.added_features)
+    duration_ms = sync_result.duration * 1000
+    return (
+        f"Code sync: {len(sync_result.changed_files)} changed, {len(sync_result.reanalyzed_files)} re-analyzed, "
+        f"{features} feature(s) patched ({len(sync_result.added_features)} new) in {duration_ms:.0f} ms "
+        f"(edit-to-spec {latency_ms:.0f} ms)"
+    )
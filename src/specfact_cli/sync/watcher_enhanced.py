@@ -3,7 +3,9 @@ Enhanced file system watcher with hash-based change detection, dependency tracki
 
 This module provides enhanced watch mode capabilities including:
 - Hash-based change detection (only process files that actually changed)
-- Dependency tracking (track file dependencies for incremental processing)
+- Event pipeline: per-path coalescing with trailing-edge debounce, off-thread hashing
+  in a bounded worker pool and a bounded pending set with backpressure
+- Dependency tracking (live reverse-import graph; only changed files and their importers are re-analyzed)
 - LZ4 compression for cache (optional, faster cache I/O)
 """
 
@@ -11,6 +13,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import threading
 import time
 from collections import deque
 from collections.abc import Callable
@@ -39,7 +42,19 @@ else:
     from watchdog.events import FileSystemEvent, FileSystemEventHandler
     from watchdog.observers import Observer
 
+from specfact_cli.sync.incremental_code_sync import ImportGraph, IncrementalCodeSync, format_sync_latency
 from specfact_cli.utils import print_info, print_warning
+from specfact_cli.utils.executors import ExecutorConfig, ExecutorKind, run_ordered
+
+
+# Maximum time a batch is held back while events keep arriving (trailing-edge debounce cap)
+DEFAULT_MAX_BATCH_DELAY = 5.0
+
+# Maximum distinct paths pending in the event pipeline before event dispatch blocks (backpressure)
+DEFAULT_MAX_PENDING_PATHS = 50_000
+
+# Default worker cap for the hashing pool
+DEFAULT_HASH_WORKERS = 4
 
 
 @dataclass
@@ -51,7 +66,7 @@ class FileChange:
     event_type: str  # "created", "modified", "deleted"
     timestamp: float
     file_hash: str | None = None  # SHA256 hash of file content
-    dependencies: list[Path] = field(default_factory=list)  # Dependent files
+    dependencies: list[Path] = field(default_factory=list)  # Files importing this file (transitively)
 
     @beartype
     def __post_init__(self) -> None:
@@ -70,7 +85,9 @@ class FileHashCache:
 
     cache_file: Path
     hashes: dict[str, str] = field(default_factory=dict)  # file_path -> hash
-    dependencies: dict[str, list[str]] = field(default_factory=dict)  # file_path -> [dependencies]
+    dependencies: dict[str, list[str]] = field(default_factory=dict)  # file_path -> [files it imports]
+    # Hashes are written by the event pipeline's worker thread and saved from the watch loop
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
 
     @beartype
     def load(self) -> None:
@@ -102,7 +119,8 @@ class FileHashCache:
     def save(self) -> None:
         """Save hash cache to disk."""
         try:
-            data = {"hashes": self.hashes, "dependencies": self.dependencies}
+            with self._lock:
+                data = {"hashes": dict(self.hashes), "dependencies": dict(self.dependencies)}
             json_str = json.dumps(data, indent=2)
 
             if LZ4_AVAILABLE and LZ4_FRAME is not None:
@@ -129,7 +147,14 @@ class FileHashCache:
     @beartype
     def set_hash(self, file_path: Path, file_hash: str) -> None:
         """Set hash for a file."""
-        self.hashes[str(file_path)] = file_hash
+        with self._lock:
+            self.hashes[str(file_path)] = file_hash
+
+    @beartype
+    def remove_hash(self, file_path: Path) -> None:
+        """Forget the hash of a deleted file (so re-creating it is detected as a change)."""
+        with self._lock:
+            self.hashes.pop(str(file_path), None)
 
     @beartype
     def get_dependencies(self, file_path: Path) -> list[Path]:
@@ -174,8 +199,281 @@ def compute_file_hash(file_path: Path) -> str | None:
         return None
 
 
+@dataclass
+class PipelineStats:
+    """Counters for the watch event pipeline."""
+
+    events: int = 0  # File events submitted
+    coalesced: int = 0  # Events merged into an already pending path
+    batches: int = 0  # Batches flushed
+    hashed: int = 0  # Files hashed
+    unchanged: int = 0  # Files whose content hash did not change
+    backpressure_waits: int = 0  # Times event dispatch blocked on a full pending set
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert stats to dictionary."""
+        return {
+            "events": self.events,
+            "coalesced": self.coalesced,
+            "batches": self.batches,
+            "hashed": self.hashed,
+            "unchanged": self.unchanged,
+            "backpressure_waits": self.backpressure_waits,
+        }
+
+
+@dataclass
+class _PendingPath:
+    """Coalesced events for one path awaiting the trailing edge."""
+
+    first_event_type: str
+    first_seen: float  # Wall-clock time of the first event (for edit-to-spec latency)
+
+
+class WatchEventPipeline:
+    """
+    Coalescing, debounced and off-thread hashing pipeline for file events.
+
+    Events are recorded per path (later events for a pending path are merged) and
+    flushed as one batch once no event has arrived for `debounce_interval` seconds
+    (trailing edge), or after `max_batch_delay` seconds of continuous events. A
+    flushed batch is hashed on a bounded thread pool off the event-dispatch thread;
+    files whose content changed are appended to the change queue together, so a
+    `git checkout` touching thousands of files yields one batch. At most
+    `max_pending` paths are held; beyond that `submit()` blocks until the worker
+    drains them (backpressure).
+    """
+
+    @beartype
+    @require(lambda debounce_interval: debounce_interval >= 0, "Debounce interval must be non-negative")
+    @require(lambda max_batch_delay: max_batch_delay > 0, "Max batch delay must be positive")
+    @require(lambda max_pending: max_pending >= 1, "Max pending must be >= 1")
+    @require(lambda hash_workers: hash_workers >= 1, "Hash workers must be >= 1")
+    def __init__(
+        self,
+        change_queue: deque[FileChange],
+        hash_cache: FileHashCache,
+        change_classifier: Callable[[Path], str],
+        dependency_detector: Callable[[Path], list[Path]] | None = None,
+        debounce_interval: float = 0.5,
+        max_batch_delay: float = DEFAULT_MAX_BATCH_DELAY,
+        max_pending: int = DEFAULT_MAX_PENDING_PATHS,
+        hash_workers: int = DEFAULT_HASH_WORKERS,
+    ) -> None:
+        """
+        Initialize event pipeline.
+
+        Args:
+            change_queue: Queue receiving hash-verified changes
+            hash_cache: Hash cache for change detection
+            change_classifier: Function returning the change type ("spec_kit", "specfact", "code") of a path
+            dependency_detector: Function returning the files depending on a path (optional)
+            debounce_interval: Quiet period before a batch is flushed, in seconds (default: 0.5)
+            max_batch_delay: Maximum time a batch is held while events keep arriving (default: 5.0)
+            max_pending: Maximum pending paths before `submit()` blocks (default: 50,000)
+            hash_workers: Maximum threads hashing files (default: 4)
+        """
+        self.change_queue = change_queue
+        self.hash_cache = hash_cache
+        self.change_classifier = change_classifier
+        self.dependency_detector = dependency_detector
+        self.debounce_interval = debounce_interval
+        self.max_batch_delay = max_batch_delay
+        self.max_pending = max_pending
+        self.hash_workers = hash_workers
+        self.stats = PipelineStats()
+        self.batch_ready = threading.Event()  # Set whenever changes are appended to the queue
+
+        self._pending: dict[Path, _PendingPath] = {}
+        self._batch_started = 0.0  # Monotonic time of the first event of the pending batch
+        self._last_event = 0.0  # Monotonic time of the latest event
+        self._in_flight = 0  # Batches taken but not yet queued
+        self._condition = threading.Condition()
+        self._running = False
+        self._worker: threading.Thread | None = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of paths awaiting the trailing edge."""
+        with self._condition:
+            return len(self._pending)
+
+    @beartype
+    @ensure(lambda result: result is None, "Must return None")
+    def start(self) -> None:
+        """Start the background flush worker."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._worker = threading.Thread(target=self._run, name="specfact-watch-pipeline", daemon=True)
+        self._worker.start()
+
+    @beartype
+    @ensure(lambda result: result is None, "Must return None")
+    def stop(self) -> None:
+        """Stop the worker after flushing pending events."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._worker is not None:
+            self._worker.join(timeout=30)
+            self._worker = None
+        self.flush()
+
+    @beartype
+    @require(lambda file_path: isinstance(file_path, Path), "File path must be Path")
+    @require(
+        lambda event_type: event_type in ("created", "modified", "deleted"),
+        "Event type must be created, modified, or deleted",
+    )
+    @ensure(lambda result: result is None, "Must return None")
+    def submit(self, file_path: Path, event_type: str) -> None:
+        """
+        Record a file event (called on the event-dispatch thread; never hashes).
+
+        Args:
+            file_path: Path of the changed file
+            event_type: Event type ("created", "modified", "deleted")
+        """
+        with self._condition:
+            if file_path not in self._pending and len(self._pending) >= self.max_pending:
+                self.stats.backpressure_waits += 1
+                self._condition.notify_all()
+                while self._running and len(self._pending) >= self.max_pending:
+                    self._condition.wait(timeout=1.0)
+
+            now = time.monotonic()
+            self.stats.events += 1
+            if file_path in self._pending:
+                self.stats.coalesced += 1
+            else:
+                if not self._pending:
+                    self._batch_started = now
+                self._pending[file_path] = _PendingPath(first_event_type=event_type, first_seen=time.time())
+            self._last_event = now
+            self._condition.notify_all()
+
+    @beartype
+    @require(lambda timeout: timeout >= 0, "Timeout must be non-negative")
+    def wait_idle(self, timeout: float) -> bool:
+        """
+        Wait until no events are pending and no batch is being processed.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the pipeline became idle, False on timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._in_flight, timeout=timeout)
+
+    @beartype
+    @ensure(lambda result: result >= 0, "Must return non-negative count")
+    def flush(self) -> int:
+        """
+        Process all pending paths now, on the calling thread.
+
+        Returns:
+            Number of changes appended to the queue
+        """
+        with self._condition:
+            batch = self._take_batch()
+        return self._process_batch(batch)
+
+    def _run(self) -> None:
+        """Flush batches on the trailing edge until stopped."""
+        while True:
+            with self._condition:
+                while self._running and not self._pending:
+                    self._condition.wait()
+                if not self._running:
+                    return  # stop() flushes what is left
+                while self._running and len(self._pending) < self.max_pending:
+                    now = time.monotonic()
+                    quiet_remaining = self._last_event + self.debounce_interval - now
+                    delay_remaining = self._batch_started + self.max_batch_delay - now
+                    if quiet_remaining <= 0 or delay_remaining <= 0:
+                        break
+                    self._condition.wait(timeout=min(quiet_remaining, delay_remaining))
+                batch = self._take_batch()
+            try:
+                self._process_batch(batch)
+            except Exception as e:
+                print_warning(f"Failed to process file events: {e}")
+
+    def _take_batch(self) -> dict[Path, _PendingPath]:
+        """Remove and return the pending batch (caller holds the condition) and wake blocked submitters."""
+        batch = self._pending
+        self._pending = {}
+        if batch:
+            self._in_flight += 1
+        self._condition.notify_all()
+        return batch
+
+    def _process_batch(self, batch: dict[Path, _PendingPath]) -> int:
+        """Hash a batch on the worker pool and queue files whose content changed."""
+        if not batch:
+            return 0
+        try:
+            return self._queue_changed_files(batch)
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def _queue_changed_files(self, batch: dict[Path, _PendingPath]) -> int:
+        """Hash batch files and append those whose content changed to the queue (as one batch)."""
+
+        paths = list(batch)
+        config = ExecutorConfig(kind=ExecutorKind.THREAD, workers=self.hash_workers)
+        changes: list[FileChange] = []
+        for file_path, file_hash, _error in run_ordered(compute_file_hash, paths, config):
+            pending = batch[file_path]
+            if file_hash is None:
+                if file_path.exists():
+                    continue  # Unreadable file or not a regular file
+                if pending.first_event_type == "created" and self.hash_cache.get_hash(file_path) is None:
+                    continue  # Created and deleted within the batch (e.g., editor temp file)
+                self.hash_cache.remove_hash(file_path)
+                event_type = "deleted"
+            else:
+                self.stats.hashed += 1
+                if not self.hash_cache.has_changed(file_path, file_hash):
+                    self.stats.unchanged += 1
+                    continue
+                previously_known = self.hash_cache.get_hash(file_path) is not None
+                self.hash_cache.set_hash(file_path, file_hash)
+                event_type = "modified" if previously_known or pending.first_event_type == "modified" else "created"
+
+            dependencies = self.dependency_detector(file_path) if self.dependency_detector is not None else []
+            changes.append(
+                FileChange(
+                    file_path=file_path,
+                    change_type=self.change_classifier(file_path),
+                    event_type=event_type,
+                    timestamp=pending.first_seen,
+                    file_hash=file_hash,
+                    dependencies=dependencies,
+                )
+            )
+
+        self.stats.batches += 1
+        if changes:
+            self.change_queue.extend(changes)
+            self.batch_ready.set()
+        return len(changes)
+
+
 class EnhancedSyncEventHandler(FileSystemEventHandler):
-    """Enhanced event handler with hash-based change detection and dependency tracking."""
+    """
+    Enhanced event handler with hash-based change detection and dependency tracking.
+
+    Events are handed to a `WatchEventPipeline` (coalescing, trailing-edge debounce,
+    off-thread hashing); the pipeline must be started to flush batches in the
+    background (`EnhancedSyncWatcher` does this), or flushed explicitly.
+    """
 
     @beartype
     def __init__(
@@ -184,6 +482,8 @@ class EnhancedSyncEventHandler(FileSystemEventHandler):
         change_queue: deque[FileChange],
         hash_cache: FileHashCache,
         debounce_interval: float = 0.5,
+        import_graph: ImportGraph | None = None,
+        pipeline: WatchEventPipeline | None = None,
     ) -> None:
         """
         Initialize enhanced event handler.
@@ -192,13 +492,22 @@ class EnhancedSyncEventHandler(FileSystemEventHandler):
             repo_path: Path to repository root
             change_queue: Queue to store file change events
             hash_cache: Hash cache for change detection
-            debounce_interval: Debounce interval in seconds (default: 0.5)
+            debounce_interval: Quiet period before a batch of events is flushed, in seconds (default: 0.5)
+            import_graph: Live reverse-import graph for dependency detection (optional)
+            pipeline: Event pipeline (default: new pipeline feeding change_queue)
         """
         self.repo_path = Path(repo_path).resolve()
         self.change_queue = change_queue
         self.hash_cache = hash_cache
         self.debounce_interval = debounce_interval
-        self.last_event_time: dict[str, float] = {}
+        self.import_graph = import_graph
+        self.pipeline = pipeline or WatchEventPipeline(
+            change_queue,
+            hash_cache,
+            change_classifier=self._detect_change_type,
+            dependency_detector=self._detect_dependencies,
+            debounce_interval=debounce_interval,
+        )
 
     @beartype
     @require(lambda self, event: event is not None, "Event must not be None")
@@ -227,6 +536,18 @@ class EnhancedSyncEventHandler(FileSystemEventHandler):
 
         self._queue_change(event, "deleted")
 
+    @beartype
+    @require(lambda self, event: event is not None, "Event must not be None")
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle file move events (e.g., editors saving via a temporary file and rename)."""
+        if hasattr(event, "is_directory") and event.is_directory:
+            return
+
+        self._queue_change(event, "deleted")
+        dest_path = getattr(event, "dest_path", None)
+        if dest_path:
+            self._submit(Path(str(dest_path)), "modified")
+
     @beartype
     @require(
         lambda self, event, event_type: event is not None,
@@ -238,61 +559,21 @@ class EnhancedSyncEventHandler(FileSystemEventHandler):
     )
     @ensure(lambda result: result is None, "Must return None")
     def _queue_change(self, event: FileSystemEvent, event_type: str) -> None:
-        """Queue a file change event with debouncing and hash-based detection."""
+        """Hand a file event to the pipeline (coalesced, debounced and hashed off this thread)."""
         if not hasattr(event, "src_path"):
             return
 
-        file_path = Path(str(event.src_path))
+        self._submit(Path(str(event.src_path)), event_type)
 
-        # Skip if not in repository
+    def _submit(self, file_path: Path, event_type: str) -> None:
+        """Submit an event for a path inside the repository."""
+        file_path = file_path.resolve()
         try:
-            file_path.resolve().relative_to(self.repo_path)
+            file_path.relative_to(self.repo_path)
         except ValueError:
             return
 
-        # Debounce rapid changes to same file
-        file_key = str(file_path)
-        current_time = time.time()
-        last_time = self.last_event_time.get(file_key, 0)
-
-        if current_time - last_time < self.debounce_interval:
-            return
-
-        self.last_event_time[file_key] = current_time
-
-        # For deleted files, we can't compute hash
-        if event_type == "deleted":
-            change = FileChange(
-                file_path=file_path,
-                change_type=self._detect_change_type(file_path),
-                event_type=event_type,
-                timestamp=current_time,
-                file_hash=None,
-            )
-            self.change_queue.append(change)
-            return
-
-        # Compute hash for created/modified files
-        file_hash = compute_file_hash(file_path)
-
-        # Only queue if file actually changed (hash-based detection)
-        if file_hash and self.hash_cache.has_changed(file_path, file_hash):
-            # Update cache
-            self.hash_cache.set_hash(file_path, file_hash)
-
-            # Get dependencies (simplified - could be enhanced with AST analysis)
-            dependencies = self._detect_dependencies(file_path)
-
-            change = FileChange(
-                file_path=file_path,
-                change_type=self._detect_change_type(file_path),
-                event_type=event_type,
-                timestamp=current_time,
-                file_hash=file_hash,
-                dependencies=dependencies,
-            )
-
-            self.change_queue.append(change)
+        self.pipeline.submit(file_path, event_type)
 
     @beartype
     @require(lambda self, file_path: isinstance(file_path, Path), "File path must be Path")
@@ -325,10 +606,10 @@ class EnhancedSyncEventHandler(FileSystemEventHandler):
     @ensure(lambda result: isinstance(result, list), "Must return list")
     def _detect_dependencies(self, file_path: Path) -> list[Path]:
         """
-        Detect file dependencies (simplified implementation).
+        Detect files that depend on a file (import it directly or transitively).
 
-        This is a basic implementation. For Python files, could use AST analysis.
-        For now, we return cached dependencies or empty list.
+        Uses the live import graph if available; otherwise derives importers from
+        the imports stored in the hash cache.
 
         Args:
             file_path: Path to file
@@ -336,18 +617,25 @@ class EnhancedSyncEventHandler(FileSystemEventHandler):
         Returns:
             List of dependent file paths
         """
-        # Return cached dependencies if available
-        cached_deps = self.hash_cache.get_dependencies(file_path)
-        if cached_deps:
-            return cached_deps
-
-        # Basic dependency detection for Python files
-        if file_path.suffix == ".py":
-            # Could enhance with AST analysis here
-            # For now, return empty list
+        if file_path.suffix != ".py":
             return []
-
-        return []
+        if self.import_graph is not None:
+            return sorted(self.import_graph.importers(file_path))
+
+        # Reverse the cached file -> imports mapping
+        target = str(file_path.resolve())
+        importers: dict[str, list[str]] = {}
+        for importer, imports in self.hash_cache.dependencies.items():
+            for imported in imports:
+                importers.setdefault(imported, []).append(importer)
+        dependents: set[str] = set()
+        pending = [target]
+        while pending:
+            for importer in importers.get(pending.pop(), []):
+                if importer not in dependents and importer != target:
+                    dependents.add(importer)
+                    pending.append(importer)
+        return sorted(Path(d) for d in dependents)
 
 
 class EnhancedSyncWatcher:
@@ -375,6 +663,7 @@ class EnhancedSyncWatcher:
         interval: int = 5,
         debounce_interval: float = 0.5,
         cache_dir: Path | None = None,
+        bundle_name: str | None = None,
     ) -> None:
         """
         Initialize enhanced sync watcher.
@@ -383,8 +672,9 @@ class EnhancedSyncWatcher:
             repo_path: Path to repository root
             sync_callback: Callback function to handle sync operations
             interval: Watch interval in seconds (default: 5)
-            debounce_interval: Debounce interval in seconds (default: 0.5)
+            debounce_interval: Quiet period before a batch of events is flushed, in seconds (default: 0.5)
             cache_dir: Directory for hash cache (default: .specfact/.cache)
+            bundle_name: Project bundle to patch incrementally on code changes (optional)
         """
         self.repo_path = Path(repo_path).resolve()
         self.sync_callback = sync_callback
@@ -393,6 +683,7 @@ class EnhancedSyncWatcher:
         self.observer: Observer | None = None  # type: ignore[assignment]
         self.change_queue: deque[FileChange] = deque()
         self.running = False
+        self.handler: EnhancedSyncEventHandler | None = None
 
         # Initialize hash cache
         if cache_dir is None:
@@ -402,6 +693,11 @@ class EnhancedSyncWatcher:
         self.hash_cache = FileHashCache(cache_file=cache_file)
         self.hash_cache.load()
 
+        # Incremental code-to-spec sync (re-analyzes changed files and their importers only)
+        self.code_sync: IncrementalCodeSync | None = None
+        if bundle_name:
+            self.code_sync = IncrementalCodeSync(self.repo_path, bundle_name, dependencies=self.hash_cache.dependencies)
+
         if LZ4_AVAILABLE:
             print_info("LZ4 compression available for cache (faster I/O)")
 
@@ -413,11 +709,20 @@ class EnhancedSyncWatcher:
             print_warning("Watcher is already running")
             return
 
+        import_graph: ImportGraph | None = None
+        if self.code_sync is not None:
+            self.code_sync.start()
+            import_graph = self.code_sync.import_graph
+
         observer = Observer()
-        handler = EnhancedSyncEventHandler(self.repo_path, self.change_queue, self.hash_cache, self.debounce_interval)
+        handler = EnhancedSyncEventHandler(
+            self.repo_path, self.change_queue, self.hash_cache, self.debounce_interval, import_graph=import_graph
+        )
+        handler.pipeline.start()
         observer.schedule(handler, str(self.repo_path), recursive=True)
         observer.start()
 
+        self.handler = handler
         self.observer = observer
         self.running = True
         print_info(f"Watching for changes in: {self.repo_path}")
@@ -440,6 +745,10 @@ class EnhancedSyncWatcher:
             observer.join(timeout=5)  # type: ignore[unknown-member-type]
             self.observer = None
 
+        if self.handler is not None:
+            self.handler.pipeline.stop()
+            self.handler = None
+
         # Save hash cache
         self.hash_cache.save()
 
@@ -457,7 +766,12 @@ class EnhancedSyncWatcher:
 
         try:
             while self.running:
-                time.sleep(self.interval)
+                # Wake as soon as a hashed batch is queued (at most every interval otherwise)
+                if self.handler is not None:
+                    self.handler.pipeline.batch_ready.wait(timeout=self.interval)
+                    self.handler.pipeline.batch_ready.clear()
+                else:
+                    time.sleep(self.interval)
                 self._process_pending_changes()
         except KeyboardInterrupt:
             print_info("\nStopping watch mode...")
@@ -486,6 +800,11 @@ class EnhancedSyncWatcher:
             if actual_changes:
                 print_info(f"Detected {len(actual_changes)} file change(s) (hash-verified), triggering sync...")
                 try:
+                    if self.code_sync is not None:
+                        code_changes = [c.file_path for c in actual_changes if c.change_type == "code"]
+                        if code_changes:
+                            result = self.code_sync.sync(code_changes)
+                            print_info(format_sync_latency(result, min(c.timestamp for c in actual_changes)))
                     self.sync_callback(actual_changes)
                     # Save cache after processing
                     self.hash_cache.save()
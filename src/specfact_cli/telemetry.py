@@ -26,6 +26,7 @@ from beartype.typing import Callable, Iterator, Mapping
 from icontract import ensure, require
 
 from specfact_cli import __version__
+from specfact_cli.utils.profiling import ProfileSpan, get_profiler, profile_phase, start_profiling, stop_profiling
 
 
 try:
@@ -68,6 +69,8 @@ ALLOWED_FIELDS = {
     "session_id",
     "opt_in_source",
     "cli_version",
+    "ast_cache_hits",
+    "ast_cache_misses",
 }
 
 
@@ -454,8 +457,14 @@ class TelemetryManager:
         lambda self, result: hasattr(self, "_last_event") and self._last_event is not None,
         "Must set _last_event after emitting",
     )
-    def _emit_event(self, event: MutableMapping[str, Any]) -> None:
-        """Emit sanitized event to local storage and optional OTLP exporter."""
+    def _emit_event(self, event: MutableMapping[str, Any], phases: ProfileSpan | None = None) -> None:
+        """
+        Emit sanitized event to local storage and optional OTLP exporter.
+
+        Args:
+            event: Sanitized event
+            phases: Profiled span of the command; its phases are exported as child spans
+        """
         event.setdefault("cli_version", __version__)
         event.setdefault("opt_in_source", self._settings.opt_in_source)
 
@@ -468,13 +477,34 @@ class TelemetryManager:
         # Emit to OTLP exporter with error handling
         span_name = f"specfact.{event.get('command', 'unknown')}"
         try:
-            with self._tracer.start_as_current_span(span_name) as span:  # pragma: no cover - exercised indirectly
-                for key, value in self._last_event.items():
-                    span.set_attribute(f"specfact.{key}", value)
+            if phases is None:
+                with self._tracer.start_as_current_span(span_name) as span:  # pragma: no cover - exercised indirectly
+                    for key, value in self._last_event.items():
+                        span.set_attribute(f"specfact.{key}", value)
+            else:
+                self._export_profile_span(span_name, phases, None, self._last_event)
         except Exception as exc:  # pragma: no cover - collector failures
             # Log but don't fail - local storage already succeeded
             LOGGER.warning("Failed to export telemetry to OTLP collector: %s. Event stored locally only.", exc)
 
+    def _export_profile_span(
+        self, name: str, profile_span: ProfileSpan, parent: Any, attributes: Mapping[str, Any]
+    ) -> None:
+        """Export a profiled span and its phases as OTLP spans with the recorded start and end times."""
+        context = trace.set_span_in_context(parent) if parent is not None else None
+        span = self._tracer.start_span(name, context=context, start_time=profile_span.start_ns)
+        for key, value in attributes.items():
+            span.set_attribute(f"specfact.{key}", value)
+        for child in profile_span.children:
+            # Only numeric phase attributes (counts, sizes) are exported; names and paths stay local
+            child_attributes = {
+                f"phase.{key}": value
+                for key, value in child.attributes.items()
+                if isinstance(value, (int, float)) and not isinstance(value, bool)
+            }
+            self._export_profile_span(f"specfact.phase.{child.name}", child, span, child_attributes)
+        span.end(end_time=profile_span.end_ns)
+
     @contextmanager
     @beartype
     @require(lambda self, command, initial_metadata: hasattr(self, "_settings"), "Manager must be initialized")
@@ -505,13 +535,18 @@ class TelemetryManager:
         """
 
         if not self._enabled:
-            yield lambda _: None
+            with profile_phase(command):
+                yield lambda _: None
             return
 
         metadata: dict[str, Any] = self._sanitize(initial_metadata)
         start_time = time.perf_counter()
         success = False
         error_name: str | None = None
+        # Record phases for the OTLP child spans even without --profile
+        owns_profiler = get_profiler() is None
+        if owns_profiler:
+            start_profiling(command)
 
         @beartype
         @require(lambda extra: extra is None or isinstance(extra, Mapping), "Extra must be None or Mapping")
@@ -520,14 +555,18 @@ class TelemetryManager:
             if extra:
                 metadata.update(self._sanitize(extra))
 
+        phases: ProfileSpan | None = None
         try:
-            yield record
+            with profile_phase(command) as phases:
+                yield record
             success = True
         except Exception as exc:
             error_name = exc.__class__.__name__
             metadata["error"] = error_name
             raise
         finally:
+            if owns_profiler:
+                stop_profiling()
             metadata.setdefault("session_id", self._session_id)
             metadata["success"] = success
             if error_name:
@@ -535,7 +574,7 @@ class TelemetryManager:
             metadata["duration_ms"] = round((time.perf_counter() - start_time) * 1000, 2)
             metadata["command"] = command
             metadata["telemetry_version"] = self.TELEMETRY_VERSION
-            self._emit_event(metadata)
+            self._emit_event(metadata, phases)
 
 
 # Shared singleton used throughout the CLI.
@@ -3,44 +3,55 @@ SpecFact CLI utilities.
 
 This package contains utility functions for git operations,
 YAML processing, console output, and interactive prompts.
+
+Exports are imported on first access (the git and bundle helpers are heavy);
+`console` stays eager because it shares its name with the `console` submodule.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from specfact_cli.utils.console import console, print_validation_report
-from specfact_cli.utils.feature_keys import (
-    convert_feature_keys,
-    find_feature_by_normalized_key,
-    normalize_feature_key,
-    to_classname_key,
-    to_sequential_key,
-    to_underscore_key,
-)
-from specfact_cli.utils.git import GitOperations
-from specfact_cli.utils.progress import (
-    create_progress_callback,
-    load_bundle_with_progress,
-    save_bundle_with_progress,
-)
-from specfact_cli.utils.prompts import (
-    display_summary,
-    print_error,
-    print_info,
-    print_section,
-    print_success,
-    print_warning,
-    prompt_confirm,
-    prompt_dict,
-    prompt_list,
-    prompt_text,
-)
-from specfact_cli.utils.structured_io import (
-    StructuredFormat,
-    dump_structured_file,
-    dumps_structured_data,
-    load_structured_file,
-    loads_structured_data,
-    structured_extension,
-)
-from specfact_cli.utils.yaml_utils import YAMLUtils, dump_yaml, load_yaml, string_to_yaml, yaml_to_string
+
+
+if TYPE_CHECKING:
+    from specfact_cli.utils.feature_keys import (
+        convert_feature_keys,
+        find_feature_by_normalized_key,
+        normalize_feature_key,
+        to_classname_key,
+        to_sequential_key,
+        to_underscore_key,
+    )
+    from specfact_cli.utils.git import GitOperations
+    from specfact_cli.utils.progress import (
+        create_progress_callback,
+        load_bundle_with_progress,
+        save_bundle_with_progress,
+    )
+    from specfact_cli.utils.prompts import (
+        display_summary,
+        print_error,
+        print_info,
+        print_section,
+        print_success,
+        print_warning,
+        prompt_confirm,
+        prompt_dict,
+        prompt_list,
+        prompt_text,
+    )
+    from specfact_cli.utils.structured_io import (
+        StructuredFormat,
+        dump_structured_file,
+        dumps_structured_data,
+        load_structured_file,
+        loads_structured_data,
+        structured_extension,
+    )
+    from specfact_cli.utils.yaml_utils import YAMLUtils, dump_yaml, load_yaml, string_to_yaml, yaml_to_string
 
 
 __all__ = [
@@ -78,3 +89,51 @@ __all__ = [
     "to_underscore_key",
     "yaml_to_string",
 ]
+
+# Public name -> defining submodule; imported on first attribute access
+_LAZY_EXPORTS: dict[str, str] = {
+    "GitOperations": "specfact_cli.utils.git",
+    "StructuredFormat": "specfact_cli.utils.structured_io",
+    "YAMLUtils": "specfact_cli.utils.yaml_utils",
+    "convert_feature_keys": "specfact_cli.utils.feature_keys",
+    "create_progress_callback": "specfact_cli.utils.progress",
+    "display_summary": "specfact_cli.utils.prompts",
+    "dump_structured_file": "specfact_cli.utils.structured_io",
+    "dump_yaml": "specfact_cli.utils.yaml_utils",
+    "dumps_structured_data": "specfact_cli.utils.structured_io",
+    "find_feature_by_normalized_key": "specfact_cli.utils.feature_keys",
+    "load_bundle_with_progress": "specfact_cli.utils.progress",
+    "load_structured_file": "specfact_cli.utils.structured_io",
+    "load_yaml": "specfact_cli.utils.yaml_utils",
+    "loads_structured_data": "specfact_cli.utils.structured_io",
+    "normalize_feature_key": "specfact_cli.utils.feature_keys",
+    "print_error": "specfact_cli.utils.prompts",
+    "print_info": "specfact_cli.utils.prompts",
+    "print_section": "specfact_cli.utils.prompts",
+    "print_success": "specfact_cli.utils.prompts",
+    "print_warning": "specfact_cli.utils.prompts",
+    "prompt_confirm": "specfact_cli.utils.prompts",
+    "prompt_dict": "specfact_cli.utils.prompts",
+    "prompt_list": "specfact_cli.utils.prompts",
+    "prompt_text": "specfact_cli.utils.prompts",
+    "save_bundle_with_progress": "specfact_cli.utils.progress",
+    "string_to_yaml": "specfact_cli.utils.yaml_utils",
+    "structured_extension": "specfact_cli.utils.structured_io",
+    "to_classname_key": "specfact_cli.utils.feature_keys",
+    "to_sequential_key": "specfact_cli.utils.feature_keys",
+    "to_underscore_key": "specfact_cli.utils.feature_keys",
+    "yaml_to_string": "specfact_cli.utils.yaml_utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,315 @@
+"""
+Persistent, content-addressed analysis cache.
+
+This module stores per-file analysis results (code analyzer features, themes,
+type hints, async patterns and relationship mapper output) under
+`.specfact/cache/analysis/`, so re-imports only analyze files whose content
+changed since the previous run.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from beartype import beartype
+from icontract import ensure, require
+
+from specfact_cli import __version__
+from specfact_cli.utils.ast_cache import get_parsed_module_cache
+
+
+# Bump when the on-disk entry layout changes
+CACHE_FORMAT_VERSION = "1"
+
+# Default size cap for automatic pruning after an import (bytes)
+DEFAULT_MAX_CACHE_BYTES = 512 * 1024 * 1024
+
+# Subdirectories of .specfact/cache holding content-addressed entries that can be evicted
+# (analysis, contract validation, repro result and CrossHair shard caches). Other files
+# under .specfact/cache (stat index, repro durations, ...) are state, not cache entries.
+LRU_CACHE_SUBDIRS = ("analysis", "contracts", "repro/results", "repro/crosshair")
+
+
+@dataclass
+class AnalysisCacheStats:
+    """Hit/miss counters for a persistent analysis cache."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {"hits": self.hits, "misses": self.misses, "writes": self.writes}
+
+
+@dataclass
+class PruneResult:
+    """Outcome of a cache prune run."""
+
+    removed_entries: int
+    removed_bytes: int
+    remaining_entries: int
+    remaining_bytes: int
+
+
+@beartype
+@ensure(lambda result: len(result) == 64, "Must return SHA-256 hex digest")
+def hash_config_files(paths: Iterable[Path | None]) -> str:
+    """
+    Compute a combined hash over configuration files (e.g., Semgrep rules).
+
+    Missing or unset paths contribute a stable marker so enabling/disabling a
+    rule set changes the hash.
+
+    Args:
+        paths: Configuration file paths (None for "not configured")
+
+    Returns:
+        SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        if path is None or not path.exists():
+            digest.update(b"<none>")
+            continue
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """
+    Content-addressed cache for per-file analysis results.
+
+    Entries are keyed by the file's SHA-256, its repository-relative path (results
+    embed module names and paths), the analyzer version and the analyzer settings
+    that influence the result (thresholds, key format, Semgrep rule hash). Entry
+    access times are refreshed on every hit so ``prune()`` can evict least recently
+    used entries.
+    """
+
+    SUBDIR = "analysis"
+
+    @beartype
+    @require(lambda repo_path: isinstance(repo_path, Path), "Repo path must be Path")
+    def __init__(
+        self,
+        repo_path: Path,
+        analyzer_version: str = __version__,
+        cache_dir: Path | None = None,
+    ) -> None:
+        """
+        Initialize analysis cache.
+
+        Args:
+            repo_path: Path to repository root
+            analyzer_version: Analyzer version (entries from other versions are ignored)
+            cache_dir: Override cache directory (default: .specfact/cache/analysis)
+        """
+        from specfact_cli.utils.structure import SpecFactStructure
+
+        self.repo_path = repo_path.resolve()
+        self.cache_dir = cache_dir or (self.repo_path / SpecFactStructure.CACHE / self.SUBDIR)
+        self.analyzer_version = analyzer_version
+        self._lock = threading.Lock()
+        self._stats = AnalysisCacheStats()
+
+    @beartype
+    @require(lambda file_path: isinstance(file_path, Path), "File path must be Path")
+    def file_digest(self, file_path: Path) -> str | None:
+        """
+        Compute the content hash for a source file.
+
+        Uses the shared parse-once cache so the file is not read twice.
+
+        Returns:
+            SHA-256 hex digest, or None if the file cannot be read
+        """
+        try:
+            source = get_parsed_module_cache().get_source(file_path)
+        except (OSError, UnicodeDecodeError):
+            return None
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+    @beartype
+    @require(lambda kind: len(kind) > 0, "Kind must be non-empty")
+    def get(self, kind: str, file_path: Path, settings: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        """
+        Look up a cached result.
+
+        Args:
+            kind: Result kind (e.g., "code_analyzer", "relationships")
+            file_path: Source file the result was computed from
+            settings: Analyzer settings that influence the result
+
+        Returns:
+            Cached payload, or None on miss
+        """
+        entry_path = self._entry_path(kind, file_path, settings)
+        if entry_path is None or not entry_path.exists():
+            self._count("misses")
+            return None
+        try:
+            payload = json.loads(entry_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._count("misses")
+            return None
+        # Refresh access time for LRU pruning
+        with contextlib.suppress(OSError):
+            os.utime(entry_path)
+        self._count("hits")
+        return payload
+
+    @beartype
+    @require(lambda kind: len(kind) > 0, "Kind must be non-empty")
+    def put(self, kind: str, file_path: Path, payload: dict[str, Any], settings: dict[str, Any] | None = None) -> None:
+        """
+        Store a result (atomically; failures are ignored).
+
+        Args:
+            kind: Result kind
+            file_path: Source file the result was computed from
+            payload: JSON-serializable result
+            settings: Analyzer settings that influence the result
+        """
+        entry_path = self._entry_path(kind, file_path, settings)
+        if entry_path is None:
+            return
+        tmp_name: str | None = None
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, separators=(",", ":"))
+            os.replace(tmp_name, entry_path)
+            self._count("writes")
+        except (OSError, TypeError, ValueError):
+            if tmp_name is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_name)
+
+    @beartype
+    @ensure(lambda result: isinstance(result, AnalysisCacheStats), "Must return AnalysisCacheStats")
+    def get_stats(self) -> AnalysisCacheStats:
+        """Get hit/miss counters for this run."""
+        with self._lock:
+            return AnalysisCacheStats(hits=self._stats.hits, misses=self._stats.misses, writes=self._stats.writes)
+
+    @beartype
+    @require(lambda max_bytes: max_bytes >= 0, "Max bytes must be non-negative")
+    def prune(self, max_bytes: int) -> PruneResult:
+        """
+        Evict least recently used entries until the cache fits in max_bytes.
+
+        Args:
+            max_bytes: Target cache size in bytes (0 clears the cache)
+
+        Returns:
+            PruneResult with removed/remaining counts
+        """
+        return prune_cache_dir(self.cache_dir, max_bytes)
+
+    def _entry_path(self, kind: str, file_path: Path, settings: dict[str, Any] | None) -> Path | None:
+        """Compute the entry path for a file, or None if the file cannot be hashed."""
+        digest = self.file_digest(file_path)
+        if digest is None:
+            return None
+        try:
+            rel_path = file_path.resolve().relative_to(self.repo_path).as_posix()
+        except ValueError:
+            rel_path = file_path.resolve().as_posix()
+        key_material = json.dumps(
+            [
+                CACHE_FORMAT_VERSION,
+                kind,
+                self.analyzer_version,
+                digest,
+                rel_path,
+                settings or {},
+            ],
+            sort_keys=True,
+        )
+        key = hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _count(self, field_name: str) -> None:
+        """Increment a stats counter (thread-safe)."""
+        with self._lock:
+            setattr(self._stats, field_name, getattr(self._stats, field_name) + 1)
+
+
+@beartype
+@require(lambda max_bytes: max_bytes >= 0, "Max bytes must be non-negative")
+def prune_cache_dir(cache_dir: Path, max_bytes: int) -> PruneResult:
+    """
+    Evict least recently used files from a cache directory.
+
+    Files are ordered by modification time (refreshed on cache hits) and the
+    oldest are removed until the total size fits in max_bytes.
+
+    Args:
+        cache_dir: Cache directory to prune
+        max_bytes: Target size in bytes (0 clears the directory)
+
+    Returns:
+        PruneResult with removed/remaining counts
+    """
+    return prune_cache_dirs([cache_dir], max_bytes)
+
+
+@beartype
+@require(lambda max_bytes: max_bytes >= 0, "Max bytes must be non-negative")
+def prune_cache_dirs(cache_dirs: Iterable[Path], max_bytes: int) -> PruneResult:
+    """
+    Evict least recently used files from several cache directories under one size budget.
+
+    Args:
+        cache_dirs: Cache directories to prune (missing directories are skipped)
+        max_bytes: Target total size in bytes (0 clears the directories)
+
+    Returns:
+        PruneResult with removed/remaining counts
+    """
+    entries: list[tuple[float, int, Path]] = []
+    for cache_dir in cache_dirs:
+        if not cache_dir.exists():
+            continue
+        for root, _dirs, files in os.walk(cache_dir):
+            for name in files:
+                path = Path(root) / name
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    removed_entries = 0
+    removed_bytes = 0
+    for _mtime, size, path in sorted(entries, key=lambda item: item[0]):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed_entries += 1
+        removed_bytes += size
+
+    return PruneResult(
+        removed_entries=removed_entries,
+        removed_bytes=removed_bytes,
+        remaining_entries=len(entries) - removed_entries,
+        remaining_bytes=total,
+    )
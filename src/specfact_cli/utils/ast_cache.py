@@ -0,0 +1,277 @@
+"""
+Parse-once AST cache shared across analyzers.
+
+This module provides a bounded, thread-safe store of parsed Python modules
+keyed by path, modification time and size, so each source file is read and
+parsed once per run regardless of how many analyzers inspect it.
+"""
+
+from __future__ import annotations
+
+import ast
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, NoReturn
+
+from beartype import beartype
+from icontract import ensure, require
+
+
+@dataclass
+class _CacheEntry:
+    """Single cached module (source text, parsed tree or the parse error)."""
+
+    mtime_ns: int
+    size: int
+    source: str | None = None
+    tree: ast.Module | None = None
+    # Type and args of the read/parse error; a fresh exception is raised on every lookup
+    # (re-raising one shared instance would grow its traceback and race between threads)
+    error_type: type[Exception] | None = None
+    error_args: tuple[Any, ...] = ()
+
+    def raise_error(self) -> NoReturn:
+        """Raise a new instance of the cached error."""
+        assert self.error_type is not None
+        raise self.error_type(*self.error_args)
+
+
+@dataclass
+class ParsedModuleCacheStats:
+    """Hit/miss counters for a parsed module cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    source_bytes: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": self.entries,
+            "source_bytes": self.source_bytes,
+        }
+
+
+class ParsedModuleCache:
+    """
+    Bounded LRU store of source text and parsed ASTs.
+
+    Entries are validated against the file's ``st_mtime_ns`` and ``st_size`` on
+    every lookup, so edits made during a run (e.g. in watch mode) are picked up.
+    Parse failures are cached as well and re-raised on lookup, which keeps the
+    ``except (SyntaxError, UnicodeDecodeError)`` handling of callers unchanged.
+
+    Cached trees are shared between callers and threads: treat them as read-only.
+    """
+
+    DEFAULT_MAX_ENTRIES = 20_000
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # Source bytes; parsed trees are roughly proportional
+
+    @beartype
+    @require(lambda max_entries: max_entries > 0, "Max entries must be positive")
+    @require(lambda max_bytes: max_bytes > 0, "Max bytes must be positive")
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        Initialize parsed module cache.
+
+        Args:
+            max_entries: Maximum number of cached files before LRU eviction
+            max_bytes: Maximum total source size (in characters) before LRU eviction
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._source_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @beartype
+    @require(lambda file_path: isinstance(file_path, Path), "File path must be Path")
+    def get_source(self, file_path: Path) -> str:
+        """
+        Get source text for a file.
+
+        Args:
+            file_path: Path to Python file
+
+        Returns:
+            File content decoded as UTF-8
+
+        Raises:
+            OSError: If the file cannot be read
+            UnicodeDecodeError: If the file is not valid UTF-8
+        """
+        entry = self._lookup(file_path, need_tree=False)
+        if entry.source is None:
+            entry.raise_error()
+        return entry.source
+
+    @beartype
+    @require(lambda file_path: isinstance(file_path, Path), "File path must be Path")
+    @ensure(lambda result: isinstance(result, ast.Module), "Must return ast.Module")
+    def get_tree(self, file_path: Path) -> ast.Module:
+        """
+        Get parsed AST for a file.
+
+        Args:
+            file_path: Path to Python file
+
+        Returns:
+            Parsed module (shared, must not be mutated)
+
+        Raises:
+            OSError: If the file cannot be read
+            UnicodeDecodeError: If the file is not valid UTF-8
+            SyntaxError: If the file cannot be parsed
+        """
+        entry = self._lookup(file_path, need_tree=True)
+        if entry.tree is None:
+            entry.raise_error()
+        return entry.tree
+
+    @beartype
+    def invalidate(self, file_path: Path) -> None:
+        """Drop a single file from the cache."""
+        key = self._key(file_path)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._source_bytes -= len(entry.source or "")
+
+    @beartype
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._source_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    @beartype
+    @ensure(lambda result: isinstance(result, ParsedModuleCacheStats), "Must return ParsedModuleCacheStats")
+    def get_stats(self) -> ParsedModuleCacheStats:
+        """Get hit/miss counters."""
+        with self._lock:
+            return ParsedModuleCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                source_bytes=self._source_bytes,
+            )
+
+    def _key(self, file_path: Path) -> str:
+        """Normalise a path into a cache key."""
+        return str(file_path.resolve())
+
+    def _lookup(self, file_path: Path, need_tree: bool) -> _CacheEntry:
+        """Return a fresh entry for the file, reading/parsing it if necessary."""
+        key = self._key(file_path)
+        stat = file_path.stat()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                if not need_tree or entry.tree is not None or entry.error_type is not None:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry
+            else:
+                entry = None
+            self._misses += 1
+
+        # Read and parse outside the lock; concurrent misses on the same file are harmless
+        if entry is None:
+            entry = _CacheEntry(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            try:
+                entry.source = file_path.read_text(encoding="utf-8")
+            except UnicodeDecodeError as e:
+                entry.error_type, entry.error_args = UnicodeDecodeError, e.args
+        if need_tree and entry.source is not None and entry.tree is None:
+            try:
+                entry.tree = ast.parse(entry.source, filename=str(file_path))
+            except (SyntaxError, ValueError) as e:
+                # ValueError: source contains null bytes
+                entry.error_type = SyntaxError
+                entry.error_args = e.args if isinstance(e, SyntaxError) else (str(e),)
+
+        self._store(key, entry)
+        return entry
+
+    def _store(self, key: str, entry: _CacheEntry) -> None:
+        """Insert an entry and evict least recently used entries past the bounds."""
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._source_bytes -= len(previous.source or "")
+            self._entries[key] = entry
+            self._source_bytes += len(entry.source or "")
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._source_bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._source_bytes -= len(evicted.source or "")
+                self._evictions += 1
+
+
+# Process-wide default cache, replaced per run by parsed_module_cache_scope()
+_parsed_module_cache: ParsedModuleCache | None = None
+_cache_lock = threading.Lock()
+
+
+@beartype
+@ensure(lambda result: isinstance(result, ParsedModuleCache), "Must return ParsedModuleCache")
+def get_parsed_module_cache() -> ParsedModuleCache:
+    """Get the active parsed module cache (created on first use)."""
+    global _parsed_module_cache
+    with _cache_lock:
+        if _parsed_module_cache is None:
+            _parsed_module_cache = ParsedModuleCache()
+        return _parsed_module_cache
+
+
+@beartype
+def set_parsed_module_cache(cache: ParsedModuleCache | None) -> None:
+    """Set the active parsed module cache (None resets to a lazily created default)."""
+    global _parsed_module_cache
+    with _cache_lock:
+        _parsed_module_cache = cache
+
+
+@contextmanager
+def parsed_module_cache_scope(
+    max_entries: int = ParsedModuleCache.DEFAULT_MAX_ENTRIES,
+    max_bytes: int = ParsedModuleCache.DEFAULT_MAX_BYTES,
+) -> Iterator[ParsedModuleCache]:
+    """
+    Context manager that installs a fresh cache for the duration of a run.
+
+    Args:
+        max_entries: Maximum number of cached files
+        max_bytes: Maximum total source size
+
+    Yields:
+        ParsedModuleCache instance shared by all analyzers within the scope
+    """
+    global _parsed_module_cache
+    cache = ParsedModuleCache(max_entries=max_entries, max_bytes=max_bytes)
+    with _cache_lock:
+        previous = _parsed_module_cache
+        _parsed_module_cache = cache
+    try:
+        yield cache
+    finally:
+        with _cache_lock:
+            _parsed_module_cache = previous
@@ -16,6 +16,8 @@ from beartype import beartype
 from icontract import ensure, require
 
 from specfact_cli.models.project import BundleFormat, ProjectBundle
+from specfact_cli.utils.bundle_snapshot import SNAPSHOT_FILE, read_bundle_snapshot, write_bundle_snapshot
+from specfact_cli.utils.profiling import profile_phase
 from specfact_cli.utils.structured_io import load_structured_file
 
 
@@ -59,7 +61,7 @@ def detect_bundle_format(path: Path) -> tuple[BundleFormat, str | None]:
     if path.is_file() and path.suffix in [".yaml", ".yml", ".json"]:
         # Check if it's a monolithic bundle
         try:
-            data = load_structured_file(path)
+            data = load_structured_file(path, round_trip=False)
             if isinstance(data, dict):
                 # Monolithic bundle has all aspects in one file
                 if "idea" in data and "product" in data and "features" in data:
@@ -191,16 +193,23 @@ def load_project_bundle(
     bundle_dir: Path,
     validate_hashes: bool = False,
     progress_callback: Callable[[int, int, str], None] | None = None,
+    lazy: bool = False,
+    use_snapshot: bool = True,
 ) -> ProjectBundle:
     """
     Load modular project bundle from directory structure.
 
     This function wraps ProjectBundle.load_from_directory() with format validation
-    and optional hash consistency checking.
+    and optional hash consistency checking. When the bundle's binary snapshot
+    (see `utils.bundle_snapshot`) matches the YAML files, the bundle is read from
+    it instead; otherwise the YAML files are parsed and the snapshot is rebuilt.
 
     Args:
         bundle_dir: Path to project bundle directory (e.g., .specfact/projects/legacy-api/)
         validate_hashes: If True, validate file checksums against manifest
+        lazy: Load features on first access (for commands that touch only a few features);
+            ignored when a valid snapshot exists, which loads every feature faster
+        use_snapshot: Read and maintain the bundle's binary snapshot
 
     Returns:
         ProjectBundle instance loaded from directory
@@ -220,21 +229,29 @@ def load_project_bundle(
     if format_type != BundleFormat.MODULAR:
         raise BundleFormatError(f"Expected modular bundle format, got: {format_type}")
 
-    try:
-        # Load bundle using ProjectBundle method with progress callback
-        bundle = ProjectBundle.load_from_directory(bundle_dir, progress_callback=progress_callback)
-
-        # Validate hashes if requested
-        if validate_hashes:
-            _validate_bundle_hashes(bundle, bundle_dir)
-
-        return bundle
-    except FileNotFoundError as e:
-        raise BundleLoadError(f"Bundle file not found: {e}") from e
-    except ValueError as e:
-        raise BundleLoadError(f"Invalid bundle structure: {e}") from e
-    except Exception as e:
-        raise BundleLoadError(f"Failed to load bundle: {e}") from e
+    with profile_phase("bundle_load", bundle=bundle_dir.name):
+        try:
+            bundle = read_bundle_snapshot(bundle_dir) if use_snapshot else None
+            if bundle is not None:
+                if progress_callback:
+                    progress_callback(1, 1, SNAPSHOT_FILE)
+            else:
+                # Load bundle using ProjectBundle method with progress callback
+                bundle = ProjectBundle.load_from_directory(bundle_dir, progress_callback=progress_callback, lazy=lazy)
+                if use_snapshot and not lazy:
+                    write_bundle_snapshot(bundle, bundle_dir)
+
+            # Validate hashes if requested
+            if validate_hashes:
+                _validate_bundle_hashes(bundle, bundle_dir)
+
+            return bundle
+        except FileNotFoundError as e:
+            raise BundleLoadError(f"Bundle file not found: {e}") from e
+        except ValueError as e:
+            raise BundleLoadError(f"Invalid bundle structure: {e}") from e
+        except Exception as e:
+            raise BundleLoadError(f"Failed to load bundle: {e}") from e
 
 
 @beartype
@@ -251,12 +268,14 @@ def save_project_bundle(
     Save modular project bundle to directory structure.
 
     This function wraps ProjectBundle.save_to_directory() with atomic write support
-    and automatic hash computation.
+    and automatic hash computation, and refreshes the bundle's binary snapshot.
 
     Args:
         bundle: ProjectBundle instance to save
         bundle_dir: Path to project bundle directory (e.g., .specfact/projects/legacy-api/)
-        atomic: If True, use atomic writes (write to temp, then rename)
+        atomic: If True, use atomic writes (write to temp, then rename). A bundle saved back to
+            the directory it was loaded from only replaces the files that changed, each atomically,
+            and writes the manifest last (see `ProjectBundle.save_to_directory`)
 
     Raises:
         BundleSaveError: If bundle cannot be saved
@@ -266,68 +285,75 @@ def save_project_bundle(
         >>> bundle = ProjectBundle(...)
         >>> save_project_bundle(bundle, Path('.specfact/projects/legacy-api'))
     """
-    try:
-        if atomic:
-            # Atomic write: write to temp directory, then rename
-            # IMPORTANT: Preserve non-bundle directories (contracts, protocols, reports, logs, etc.)
-            import shutil
-
-            # Directories/files to preserve during atomic save
-            # Phase 8.5: Include bundle-specific reports and logs directories
-            preserve_items = ["contracts", "protocols", "reports", "logs", "enrichment_context.md"]
-
-            # Backup directories/files to preserve (use separate temp dir that persists)
-            preserved_data: dict[str, Path] = {}
-            backup_temp_dir = None
-            if bundle_dir.exists():
-                backup_temp_dir = tempfile.mkdtemp()
-                for preserve_name in preserve_items:
-                    preserve_path = bundle_dir / preserve_name
-                    if preserve_path.exists():
-                        backup_path = Path(backup_temp_dir) / preserve_name
-                        if preserve_path.is_dir():
-                            shutil.copytree(preserve_path, backup_path, dirs_exist_ok=True)
-                        else:
-                            backup_path.parent.mkdir(parents=True, exist_ok=True)
-                            shutil.copy2(preserve_path, backup_path)
-                        preserved_data[preserve_name] = backup_path
-
-            try:
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    temp_path = Path(temp_dir) / bundle_dir.name
-                    bundle.save_to_directory(temp_path, progress_callback=progress_callback)
-
-                    # Restore preserved directories/files to temp before moving
-                    for preserve_name, backup_path in preserved_data.items():
-                        restore_path = temp_path / preserve_name
-                        if backup_path.exists():
-                            if backup_path.is_dir():
-                                shutil.copytree(backup_path, restore_path, dirs_exist_ok=True)
+    with profile_phase("bundle_save", bundle=bundle_dir.name, features=len(bundle.features)):
+        try:
+            if atomic and bundle.can_save_incrementally(bundle_dir):
+                # Incremental in-place save: changed files are replaced one by one, manifest last
+                bundle.save_to_directory(bundle_dir, progress_callback=progress_callback)
+            elif atomic:
+                # Atomic write: write to temp directory, then rename
+                # IMPORTANT: Preserve non-bundle directories (contracts, protocols, reports, logs, etc.)
+                import shutil
+
+                # Directories/files to preserve during atomic save
+                # Phase 8.5: Include bundle-specific reports and logs directories
+                preserve_items = ["contracts", "protocols", "reports", "logs", "enrichment_context.md"]
+
+                # Backup directories/files to preserve (use separate temp dir that persists)
+                preserved_data: dict[str, Path] = {}
+                backup_temp_dir = None
+                if bundle_dir.exists():
+                    backup_temp_dir = tempfile.mkdtemp()
+                    for preserve_name in preserve_items:
+                        preserve_path = bundle_dir / preserve_name
+                        if preserve_path.exists():
+                            backup_path = Path(backup_temp_dir) / preserve_name
+                            if preserve_path.is_dir():
+                                shutil.copytree(preserve_path, backup_path, dirs_exist_ok=True)
                             else:
-                                restore_path.parent.mkdir(parents=True, exist_ok=True)
-                                shutil.copy2(backup_path, restore_path)
-
-                    # Ensure target directory parent exists
-                    bundle_dir.parent.mkdir(parents=True, exist_ok=True)
-
-                    # Remove existing directory if it exists
-                    if bundle_dir.exists():
-                        shutil.rmtree(bundle_dir)
-
-                    # Move temp directory to target
-                    temp_path.rename(bundle_dir)
-            finally:
-                # Clean up backup temp directory
-                if backup_temp_dir and Path(backup_temp_dir).exists():
-                    shutil.rmtree(backup_temp_dir, ignore_errors=True)
-        else:
-            # Direct write
-            bundle.save_to_directory(bundle_dir, progress_callback=progress_callback)
-    except Exception as e:
-        error_msg = "Failed to save bundle"
-        if str(e):
-            error_msg += f": {e}"
-        raise BundleSaveError(error_msg) from e
+                                backup_path.parent.mkdir(parents=True, exist_ok=True)
+                                shutil.copy2(preserve_path, backup_path)
+                            preserved_data[preserve_name] = backup_path
+
+                try:
+                    with tempfile.TemporaryDirectory() as temp_dir:
+                        temp_path = Path(temp_dir) / bundle_dir.name
+                        bundle.save_to_directory(temp_path, progress_callback=progress_callback)
+
+                        # Restore preserved directories/files to temp before moving
+                        for preserve_name, backup_path in preserved_data.items():
+                            restore_path = temp_path / preserve_name
+                            if backup_path.exists():
+                                if backup_path.is_dir():
+                                    shutil.copytree(backup_path, restore_path, dirs_exist_ok=True)
+                                else:
+                                    restore_path.parent.mkdir(parents=True, exist_ok=True)
+                                    shutil.copy2(backup_path, restore_path)
+
+                        # Ensure target directory parent exists
+                        bundle_dir.parent.mkdir(parents=True, exist_ok=True)
+
+                        # Remove existing directory if it exists
+                        if bundle_dir.exists():
+                            shutil.rmtree(bundle_dir)
+
+                        # Move temp directory to target
+                        temp_path.rename(bundle_dir)
+                        bundle.mark_saved(bundle_dir)
+                finally:
+                    # Clean up backup temp directory
+                    if backup_temp_dir and Path(backup_temp_dir).exists():
+                        shutil.rmtree(backup_temp_dir, ignore_errors=True)
+            else:
+                # Direct write
+                bundle.save_to_directory(bundle_dir, progress_callback=progress_callback)
+            # The saved models match the YAML files now, so the next load can use the snapshot
+            write_bundle_snapshot(bundle, bundle_dir)
+        except Exception as e:
+            error_msg = "Failed to save bundle"
+            if str(e):
+                error_msg += f": {e}"
+            raise BundleSaveError(error_msg) from e
 
 
 @beartype
@@ -0,0 +1,279 @@
+"""
+Workspace bundle registry (`.specfact/registry/`).
+
+`SpecFactStructure.list_plans` (behind `plan select` and the bundle resolution of
+most commands) used to validate every bundle manifest and walk every bundle
+directory to total its size, and SDD hash lookups parsed every SDD manifest of
+the workspace. The registry persists per-bundle metadata (feature and story
+counts, size, stage, content hash, SDD hash) and the plan bundle hash of every
+SDD manifest in `.specfact/registry/bundles.json`.
+
+An entry is reused while the modification time and size of its manifest (or SDD
+file) are unchanged, so listing bundles costs one `stat()` per bundle plus a
+single JSON read, and a hash lookup is a dictionary lookup confirmed by one
+`stat()`. Only changed files are parsed again.
+
+The registry is a cache: it can be deleted at any time and is rebuilt on the next
+read. A bundle's size is recomputed only when its manifest changes (every bundle
+save rewrites the manifest); files edited by hand without saving the bundle keep
+the previous size.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from beartype import beartype
+from icontract import ensure, require
+
+from specfact_cli.utils.structure import SpecFactStructure
+
+
+# Bump when the registry layout or the recorded metadata changes
+REGISTRY_FORMAT_VERSION = 1
+
+REGISTRY_FILE = "bundles.json"
+MANIFEST_FILE = "bundle.manifest.yaml"
+
+
+@dataclass
+class BundleRecord:
+    """Metadata of one project bundle, as listed by `plan select`."""
+
+    name: str
+    features: int
+    stories: int
+    size: int
+    modified: str
+    stage: str
+    content_hash: str | None
+    # False if the manifest could not be loaded (counts are 0, stage is "unknown")
+    valid: bool = True
+    sdd_path: str | None = None
+    sdd_hash: str | None = None
+
+
+class BundleRegistry:
+    """
+    Persisted index of project bundles and SDD manifests, invalidated by file modification time.
+
+    Call `save()` after reading to persist refreshed entries (a no-op when nothing changed).
+    """
+
+    @beartype
+    @require(lambda base_path: base_path is None or isinstance(base_path, Path), "Base path must be None or Path")
+    def __init__(self, base_path: Path | None = None) -> None:
+        """
+        Initialize registry (loaded lazily).
+
+        Args:
+            base_path: Repository root (default: current directory)
+        """
+        self.base_path = base_path if base_path is not None else Path(".")
+        self.registry_path = self.base_path / SpecFactStructure.REGISTRY / REGISTRY_FILE
+        # Manifests and SDD files parsed by this instance (registry misses)
+        self.parsed = 0
+        self._bundles: dict[str, dict[str, Any]] = {}
+        self._sdds: dict[str, dict[str, Any]] = {}
+        self._loaded = False
+        self._dirty = False
+
+    @beartype
+    @require(lambda bundle_dir: isinstance(bundle_dir, Path), "Bundle directory must be Path")
+    @ensure(lambda result: isinstance(result, BundleRecord), "Must return BundleRecord")
+    def bundle(self, bundle_dir: Path) -> BundleRecord:
+        """
+        Get a bundle's metadata, re-reading its manifest only if it changed.
+
+        Args:
+            bundle_dir: Project bundle directory (`.specfact/projects/<name>`)
+
+        Returns:
+            BundleRecord of the bundle
+        """
+        self._load()
+        manifest_path = bundle_dir / MANIFEST_FILE
+        signature = _signature(manifest_path)
+        entry = self._bundles.get(bundle_dir.name)
+        if entry is None or entry.get("signature") != signature:
+            entry = {"signature": signature, "record": asdict(_read_bundle(bundle_dir, manifest_path, signature))}
+            self._bundles[bundle_dir.name] = entry
+            self._dirty = True
+            self.parsed += 1
+        record = BundleRecord(**entry["record"])
+
+        # SDD manifests change independently of the bundle manifest
+        sdd_path = next((path for path in (bundle_dir / "sdd.yaml", bundle_dir / "sdd.json") if path.exists()), None)
+        record.sdd_path = self._relative(sdd_path) if sdd_path is not None else None
+        record.sdd_hash = self.sdd_hash(sdd_path) if sdd_path is not None else None
+        return record
+
+    @beartype
+    @require(lambda bundle_names: isinstance(bundle_names, (set, frozenset)), "Bundle names must be a set")
+    def retain_bundles(self, bundle_names: set[str] | frozenset[str]) -> None:
+        """Drop entries of bundles that no longer exist."""
+        self._load()
+        removed = [name for name in self._bundles if name not in bundle_names]
+        for name in removed:
+            del self._bundles[name]
+        self._dirty = self._dirty or bool(removed)
+
+    @beartype
+    @require(lambda sdd_path: isinstance(sdd_path, Path), "SDD path must be Path")
+    def sdd_hash(self, sdd_path: Path) -> str | None:
+        """
+        Get the plan bundle hash recorded in an SDD manifest, re-reading it only if it changed.
+
+        Args:
+            sdd_path: SDD manifest file
+
+        Returns:
+            Plan bundle hash, or None if the file is missing or not a valid SDD manifest
+        """
+        self._load()
+        key = self._relative(sdd_path)
+        signature = _signature(sdd_path)
+        entry = self._sdds.get(key)
+        if entry is None or entry.get("signature") != signature:
+            entry = {"signature": signature, "plan_bundle_hash": _read_sdd_hash(sdd_path) if signature else None}
+            self._sdds[key] = entry
+            self._dirty = True
+            self.parsed += 1
+        return entry["plan_bundle_hash"]
+
+    @beartype
+    @require(lambda plan_hash: len(plan_hash) > 0, "Plan hash must be non-empty")
+    def find_sdd_by_hash(self, plan_hash: str) -> Path | None:
+        """
+        Find the SDD manifest recording a plan bundle hash.
+
+        A registry hit is confirmed with one `stat()`; otherwise every SDD location is
+        checked (in `list_all_sdds` order), parsing only changed files.
+
+        Args:
+            plan_hash: Plan bundle content hash
+
+        Returns:
+            Path to the SDD manifest, or None if no SDD records the hash
+        """
+        from specfact_cli.utils.sdd_discovery import iter_sdd_candidates
+
+        self._load()
+        for key, entry in self._sdds.items():
+            if entry.get("plan_bundle_hash") == plan_hash:
+                candidate = self.base_path / key
+                if _signature(candidate) == entry.get("signature"):
+                    return candidate.resolve()
+                break
+
+        candidates = list(iter_sdd_candidates(self.base_path))
+        known = {self._relative(candidate) for candidate in candidates}
+        stale = [key for key in self._sdds if key not in known]
+        for key in stale:
+            del self._sdds[key]
+        self._dirty = self._dirty or bool(stale)
+        return next((candidate.resolve() for candidate in candidates if self.sdd_hash(candidate) == plan_hash), None)
+
+    @beartype
+    def save(self) -> None:
+        """Persist refreshed entries (atomically; failures are ignored, the registry is only a cache)."""
+        if not self._dirty:
+            return
+        payload = {"format": REGISTRY_FORMAT_VERSION, "bundles": self._bundles, "sdds": self._sdds}
+        tmp_name: str | None = None
+        try:
+            self.registry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.registry_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, separators=(",", ":"))
+            os.replace(tmp_name, self.registry_path)
+            self._dirty = False
+        except (OSError, TypeError, ValueError):
+            if tmp_name is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_name)
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            payload = json.loads(self.registry_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get("format") != REGISTRY_FORMAT_VERSION:
+            return
+        bundles = payload.get("bundles")
+        sdds = payload.get("sdds")
+        if isinstance(bundles, dict) and isinstance(sdds, dict):
+            self._bundles = bundles
+            self._sdds = sdds
+
+    def _relative(self, path: Path) -> str:
+        try:
+            return path.resolve().relative_to(self.base_path.resolve()).as_posix()
+        except ValueError:
+            return path.resolve().as_posix()
+
+
+def _signature(path: Path) -> list[int] | None:
+    """Modification time (ns) and size of a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _read_bundle(bundle_dir: Path, manifest_path: Path, signature: list[int] | None) -> BundleRecord:
+    """Read a bundle's metadata from its manifest and directory."""
+    from specfact_cli.models.project import BundleManifest
+    from specfact_cli.utils.structured_io import load_structured_file
+
+    modified = (
+        datetime.fromtimestamp(signature[0] / 1_000_000_000).isoformat() if signature else datetime.now().isoformat()
+    )
+    total_size = sum(f.stat().st_size for f in bundle_dir.rglob("*") if f.is_file())
+    try:
+        manifest = BundleManifest.model_validate(load_structured_file(manifest_path, round_trip=False))
+    except Exception:
+        # Minimal info if the manifest can't be loaded
+        return BundleRecord(
+            name=bundle_dir.name,
+            features=0,
+            stories=0,
+            size=total_size,
+            modified=modified,
+            stage="unknown",
+            content_hash=None,
+            valid=False,
+        )
+    return BundleRecord(
+        name=bundle_dir.name,
+        # Counts come from the manifest's feature index
+        features=len(manifest.features) if manifest.features else 0,
+        stories=sum(f.stories_count for f in manifest.features) if manifest.features else 0,
+        size=total_size,
+        modified=modified,
+        stage=manifest.bundle.get("stage", "draft") if manifest.bundle else "draft",
+        # Project version serves as the content hash identifier
+        content_hash=manifest.versions.project if manifest.versions else None,
+    )
+
+
+def _read_sdd_hash(sdd_path: Path) -> str | None:
+    """Read the plan bundle hash of an SDD manifest (None if it is not a valid manifest)."""
+    from specfact_cli.models.sdd import SDDManifest
+    from specfact_cli.utils.structured_io import load_structured_file
+
+    try:
+        return SDDManifest(**load_structured_file(sdd_path, round_trip=False)).plan_bundle_hash
+    except Exception:
+        return None
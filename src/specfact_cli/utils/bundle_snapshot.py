@@ -0,0 +1,268 @@
+"""
+Binary snapshots of project bundles for fast loads.
+
+Parsing a large bundle means reading and validating every feature YAML file,
+which takes seconds for thousands of features. A snapshot is
+a derived file next to `bundle.manifest.yaml` holding the already validated
+models in pickled form; loading it takes tens of milliseconds. The YAML files
+stay the source of truth:
+
+- The snapshot records size, mtime, inode and SHA-256 (the `BundleChecksums`
+  algorithm) of every YAML file it was built from. On load, files whose stat
+  data is unchanged are trusted; others are hashed, and any content change,
+  added or removed aspect file, or manifest change (including its checksums)
+  invalidates the snapshot, so the bundle is parsed from YAML and the snapshot
+  rebuilt.
+- Snapshots are versioned by snapshot format, SpecFact and pydantic versions;
+  a snapshot written by another version is rebuilt.
+- Unpickling only resolves SpecFact model classes, so a snapshot committed to
+  a repository cannot run code.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gc
+import hashlib
+import io
+import os
+import pickle
+import struct
+import tempfile
+import time
+from enum import Enum
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import pydantic
+from beartype import beartype
+from icontract import ensure, require
+from pydantic import BaseModel
+
+from specfact_cli import __version__
+from specfact_cli.models.project import LazyFeatureDict, ProjectBundle
+
+
+# Snapshot file name (in the bundle directory, next to bundle.manifest.yaml)
+SNAPSHOT_FILE = "bundle.snapshot.bin"
+
+# Bump when the snapshot layout or the snapshot state of ProjectBundle changes
+SNAPSHOT_FORMAT_VERSION = 1
+
+_MAGIC = b"SPECFACT-BUNDLE-SNAPSHOT\n"
+_HEADER_LENGTH = struct.Struct(">Q")
+
+# Optional aspect files; a snapshot is stale if one appears or disappears
+_OPTIONAL_ASPECTS = ("idea.yaml", "business.yaml", "clarifications.yaml")
+
+# Files modified this recently (nanoseconds) when the snapshot is written are re-hashed on the next load
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Unpickler that resolves only SpecFact model and enum classes (never arbitrary callables)."""
+
+    def __init__(self, file: BinaryIO, allow_models: bool) -> None:
+        super().__init__(file)
+        self._allow_models = allow_models
+
+    def find_class(self, module: str, name: str) -> Any:
+        if self._allow_models and module.startswith("specfact_cli.models."):
+            value = super().find_class(module, name)
+            if isinstance(value, type) and issubclass(value, (BaseModel, Enum)):
+                return value
+        raise pickle.UnpicklingError(f"Global not allowed in bundle snapshot: {module}.{name}")
+
+
+@beartype
+@require(lambda bundle_dir: isinstance(bundle_dir, Path), "Bundle directory must be Path")
+@ensure(lambda result: result is None or isinstance(result, ProjectBundle), "Must return ProjectBundle or None")
+def read_bundle_snapshot(bundle_dir: Path) -> ProjectBundle | None:
+    """
+    Load a project bundle from its snapshot, if the snapshot matches the YAML files.
+
+    Args:
+        bundle_dir: Path to project bundle directory
+
+    Returns:
+        Bundle loaded from the snapshot, or None if there is no usable snapshot
+        (missing, stale, from another version, or unreadable)
+    """
+    snapshot_path = bundle_dir / SNAPSHOT_FILE
+    try:
+        with snapshot_path.open("rb") as handle:
+            if handle.read(len(_MAGIC)) != _MAGIC:
+                return None
+            (header_length,) = _HEADER_LENGTH.unpack(handle.read(_HEADER_LENGTH.size))
+            header = _SnapshotUnpickler(io.BytesIO(handle.read(header_length)), allow_models=False).load()
+            if not _is_current_version(header):
+                return None
+            fresh_sources = _validate_sources(bundle_dir, header)
+            if fresh_sources is None:
+                return None
+            payload = handle.read()
+        # Building thousands of model objects triggers many useless GC passes
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            state = _SnapshotUnpickler(io.BytesIO(payload), allow_models=True).load()
+        finally:
+            if gc_enabled:
+                gc.enable()
+        bundle = ProjectBundle.from_snapshot_state(bundle_dir, state)
+    except Exception:
+        return None
+
+    if fresh_sources != header["sources"]:
+        # Files that were too recently modified to trust their stat data are settled now
+        _write_snapshot_file(snapshot_path, {**header, "sources": fresh_sources}, payload)
+    return bundle
+
+
+@beartype
+@require(lambda bundle: isinstance(bundle, ProjectBundle), "Bundle must be ProjectBundle")
+@require(lambda bundle_dir: isinstance(bundle_dir, Path), "Bundle directory must be Path")
+@ensure(lambda result: isinstance(result, bool), "Must return bool")
+def write_bundle_snapshot(bundle: ProjectBundle, bundle_dir: Path) -> bool:
+    """
+    Write the snapshot of a bundle that was just loaded from or saved to bundle_dir.
+
+    Best effort: failures leave no snapshot behind (loads fall back to YAML).
+
+    Args:
+        bundle: Bundle whose models match the YAML files in bundle_dir
+        bundle_dir: Path to project bundle directory
+
+    Returns:
+        True if the snapshot was written
+    """
+    snapshot_path = bundle_dir / SNAPSHOT_FILE
+    if isinstance(bundle.features, LazyFeatureDict):
+        # Not all features are loaded; drop a snapshot the save may have made stale
+        with contextlib.suppress(OSError):
+            snapshot_path.unlink(missing_ok=True)
+        return False
+    try:
+        state = bundle.snapshot_state(bundle_dir)
+        relative_paths = ["bundle.manifest.yaml", "product.yaml"]
+        relative_paths.extend(name for name in _OPTIONAL_ASPECTS if (bundle_dir / name).exists())
+        relative_paths.extend(f"features/{file_name}" for file_name in state["feature_files"].values())
+        previous = _read_header(snapshot_path)
+        previous_sources: dict[str, list[Any]] = previous.get("sources", {}) if previous else {}
+        now_ns = time.time_ns()
+        sources: dict[str, list[Any]] = {}
+        for relative_path in relative_paths:
+            stat = (bundle_dir / relative_path).stat()
+            entry = previous_sources.get(relative_path)
+            if entry is not None and entry[:3] == [stat.st_size, stat.st_mtime_ns, stat.st_ino] and not entry[4]:
+                sources[relative_path] = entry
+            else:
+                digest = _sha256_file(bundle_dir / relative_path)
+                racy = now_ns - stat.st_mtime_ns <= RACY_WINDOW_NS
+                sources[relative_path] = [stat.st_size, stat.st_mtime_ns, stat.st_ino, digest, racy]
+        header = {
+            "format": SNAPSHOT_FORMAT_VERSION,
+            "specfact": __version__,
+            "pydantic": pydantic.VERSION,
+            "sources": sources,
+        }
+        payload = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        with contextlib.suppress(OSError):
+            snapshot_path.unlink(missing_ok=True)
+        return False
+    return _write_snapshot_file(snapshot_path, header, payload)
+
+
+def _is_current_version(header: Any) -> bool:
+    """Check that a snapshot header was written by this snapshot format, SpecFact and pydantic version."""
+    return (
+        isinstance(header, dict)
+        and header.get("format") == SNAPSHOT_FORMAT_VERSION
+        and header.get("specfact") == __version__
+        and header.get("pydantic") == pydantic.VERSION
+        and isinstance(header.get("sources"), dict)
+    )
+
+
+def _validate_sources(bundle_dir: Path, header: dict[str, Any]) -> dict[str, list[Any]] | None:
+    """
+    Check the YAML files a snapshot was built from against the bundle directory.
+
+    Returns:
+        Source entries with settled stat data (equal to the header's if nothing had to
+        be re-hashed), or None if any file changed, appeared or disappeared
+    """
+    sources: dict[str, list[Any]] = header["sources"]
+    if "bundle.manifest.yaml" not in sources:
+        return None
+    for name in _OPTIONAL_ASPECTS:
+        if (name in sources) != (bundle_dir / name).exists():
+            return None
+
+    now_ns = time.time_ns()
+    fresh: dict[str, list[Any]] = {}
+    for relative_path, entry in sources.items():
+        file_path = bundle_dir / relative_path
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        size, mtime_ns, inode, digest, racy = entry
+        if stat.st_size != size:
+            return None
+        if not racy and (stat.st_mtime_ns, stat.st_ino) == (mtime_ns, inode):
+            fresh[relative_path] = entry
+            continue
+        if _sha256_file(file_path) != digest:
+            return None
+        fresh[relative_path] = [
+            stat.st_size,
+            stat.st_mtime_ns,
+            stat.st_ino,
+            digest,
+            now_ns - stat.st_mtime_ns <= RACY_WINDOW_NS,
+        ]
+    return fresh
+
+
+def _read_header(snapshot_path: Path) -> dict[str, Any] | None:
+    """Read a snapshot's header (None if missing, unreadable or from another version)."""
+    try:
+        with snapshot_path.open("rb") as handle:
+            if handle.read(len(_MAGIC)) != _MAGIC:
+                return None
+            (header_length,) = _HEADER_LENGTH.unpack(handle.read(_HEADER_LENGTH.size))
+            header = _SnapshotUnpickler(io.BytesIO(handle.read(header_length)), allow_models=False).load()
+    except Exception:
+        return None
+    return header if _is_current_version(header) else None
+
+
+def _write_snapshot_file(snapshot_path: Path, header: dict[str, Any], payload: bytes) -> bool:
+    """Write a snapshot atomically (temporary file in the same directory, then rename)."""
+    header_bytes = pickle.dumps(header, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_name: str | None = None
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=snapshot_path.parent, prefix=f".{SNAPSHOT_FILE}.", suffix=".tmp")
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(_MAGIC)
+            handle.write(_HEADER_LENGTH.pack(len(header_bytes)))
+            handle.write(header_bytes)
+            handle.write(payload)
+        os.replace(tmp_name, snapshot_path)
+    except OSError:
+        if tmp_name is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+        return False
+    return True
+
+
+def _sha256_file(file_path: Path) -> str:
+    """Compute a file's SHA-256 (streamed)."""
+    digest = hashlib.sha256()
+    with file_path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,225 @@
+"""
+Pluggable executors for per-file analysis work.
+
+Analyzers submit per-file tasks through `run_ordered()`, which runs them on a
+thread pool, a process pool or serially and yields results in input order, so
+merged output is deterministic regardless of the execution mode.
+
+Thread pools suit I/O-bound work (subprocesses, file reads). CPU-bound AST work
+is serialized by the GIL, so large repositories benefit from process pools:
+workers run a module-level task function and send compact, picklable per-file
+results back to the parent.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any
+
+from beartype import beartype
+from icontract import ensure, require
+
+
+# Minimum number of files before process mode is chosen automatically
+# (process start-up and result pickling outweigh the gain on small repositories)
+PROCESS_MODE_MIN_FILES = 400
+
+# Maximum tasks sent to a process worker per round trip
+MAX_PROCESS_CHUNK_SIZE = 32
+
+# Parsed-module cache size in worker processes. Each file is handled once per pool, so workers
+# keep only a small cache (tearing down thousands of cached ASTs makes worker shutdown slow).
+PROCESS_WORKER_AST_CACHE_ENTRIES = 16
+
+
+class ExecutorKind(StrEnum):
+    """Execution mode for per-file analysis tasks."""
+
+    THREAD = "thread"
+    PROCESS = "process"
+    SERIAL = "serial"
+
+
+@beartype
+@ensure(lambda result: result >= 1, "Must return at least 1")
+def available_cpu_count() -> int:
+    """
+    Get the number of CPUs usable by this process.
+
+    Respects CPU affinity (e.g., container or taskset limits) where supported.
+
+    Returns:
+        Number of usable CPUs (at least 1)
+    """
+    if hasattr(os, "sched_getaffinity"):
+        try:
+            return max(1, len(os.sched_getaffinity(0)))
+        except OSError:
+            pass
+    return max(1, os.cpu_count() or 1)
+
+
+@dataclass(frozen=True)
+class ExecutorConfig:
+    """
+    Executor settings for per-file analysis.
+
+    Unset fields are chosen automatically by `resolve()` from the core count and
+    the number of files to analyze.
+    """
+
+    kind: ExecutorKind | None = None
+    workers: int | None = None
+
+    @beartype
+    @require(lambda task_count: task_count >= 0, "Task count must be non-negative")
+    @require(lambda max_thread_workers: max_thread_workers >= 1, "Max thread workers must be >= 1")
+    @ensure(lambda result: result.kind is not None and result.workers is not None, "Must be fully resolved")
+    def resolve(self, task_count: int, max_thread_workers: int = 8) -> ExecutorConfig:
+        """
+        Resolve automatic settings for a batch of tasks.
+
+        Defaults:
+        - TEST_MODE: serial (avoids executor deadlocks in test runners)
+        - Large repositories (>= PROCESS_MODE_MIN_FILES files) on multi-core hosts: process pool
+          with one worker per core
+        - Otherwise: thread pool capped at max_thread_workers
+
+        Args:
+            task_count: Number of tasks to run
+            max_thread_workers: Default worker cap for thread pools
+
+        Returns:
+            ExecutorConfig with kind and workers set
+        """
+        cpu_count = available_cpu_count()
+        kind = self.kind
+        if kind is None:
+            if os.environ.get("TEST_MODE") == "true":
+                kind = ExecutorKind.SERIAL
+            elif cpu_count > 1 and task_count >= PROCESS_MODE_MIN_FILES:
+                kind = ExecutorKind.PROCESS
+            else:
+                kind = ExecutorKind.THREAD
+
+        if kind == ExecutorKind.SERIAL:
+            return ExecutorConfig(kind=kind, workers=1)
+
+        workers = self.workers
+        if workers is None:
+            workers = cpu_count if kind == ExecutorKind.PROCESS else min(cpu_count, max_thread_workers)
+        workers = max(1, min(workers, task_count))
+        return ExecutorConfig(kind=kind, workers=workers)
+
+
+def _init_process_worker(initializer: Callable[..., None] | None, initargs: tuple[Any, ...]) -> None:
+    """Set up a worker process (small parsed-module cache, then the caller's initializer)."""
+    from specfact_cli.utils.ast_cache import ParsedModuleCache, set_parsed_module_cache
+
+    set_parsed_module_cache(ParsedModuleCache(max_entries=PROCESS_WORKER_AST_CACHE_ENTRIES))
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _run_chunk(func: Callable[[Any], Any], chunk: list[Any]) -> list[tuple[Any, Exception | None]]:
+    """Run a chunk of tasks in a worker process, capturing per-task errors."""
+    results: list[tuple[Any, Exception | None]] = []
+    for item in chunk:
+        try:
+            results.append((func(item), None))
+        except Exception as e:
+            results.append((None, e))
+    return results
+
+
+def run_ordered(
+    func: Callable[[Any], Any],
+    items: Sequence[Any],
+    config: ExecutorConfig,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple[Any, ...] = (),
+) -> Iterator[tuple[Any, Any, Exception | None]]:
+    """
+    Run a task for each item and yield results in input order.
+
+    Errors raised by a task are yielded instead of propagated so callers can
+    skip failing files. KeyboardInterrupt cancels pending tasks and propagates.
+
+    In process mode, `func` must be a picklable module-level function; workers
+    are started with the "spawn" method (the parent runs progress display
+    threads, which makes forking unsafe) and `initializer(*initargs)` runs once
+    per worker to set up per-process state. The initializer is not called in
+    thread or serial mode.
+
+    Args:
+        func: Task function applied to each item
+        items: Items to process
+        config: Executor settings (resolved automatically if incomplete)
+        initializer: Per-process setup function (process mode only)
+        initargs: Arguments for initializer
+
+    Yields:
+        Tuples of (item, result, error); exactly one of result/error is set
+        unless the task returned None
+    """
+    if not items:
+        return
+    if config.kind is None or config.workers is None:
+        config = config.resolve(len(items))
+
+    if config.kind == ExecutorKind.SERIAL or (config.kind == ExecutorKind.THREAD and config.workers == 1):
+        for item in items:
+            try:
+                yield item, func(item), None
+            except Exception as e:
+                yield item, None, e
+        return
+
+    executor: Executor
+    interrupted = False
+    if config.kind == ExecutorKind.PROCESS:
+        executor = ProcessPoolExecutor(
+            max_workers=config.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_process_worker,
+            initargs=(initializer, initargs),
+        )
+    else:
+        executor = ThreadPoolExecutor(max_workers=config.workers)
+    try:
+        if config.kind == ExecutorKind.PROCESS:
+            # Chunk tasks to amortize inter-process round trips
+            workers = config.workers or 1
+            chunk_size = max(1, min(MAX_PROCESS_CHUNK_SIZE, len(items) // (workers * 4)))
+            chunks = [list(items[i : i + chunk_size]) for i in range(0, len(items), chunk_size)]
+            chunk_futures: list[Future[list[tuple[Any, Exception | None]]]] = [
+                executor.submit(_run_chunk, func, chunk) for chunk in chunks
+            ]
+            for chunk, future in zip(chunks, chunk_futures, strict=True):
+                try:
+                    chunk_results = future.result()
+                except Exception as e:
+                    # Worker crashed (e.g., BrokenProcessPool) - report every task in the chunk
+                    for item in chunk:
+                        yield item, None, e
+                    continue
+                for item, (result, error) in zip(chunk, chunk_results, strict=True):
+                    yield item, result, error
+        else:
+            futures = [executor.submit(func, item) for item in items]
+            for item, future in zip(items, futures, strict=True):
+                try:
+                    yield item, future.result(), None
+                except Exception as e:
+                    yield item, None, e
+    except KeyboardInterrupt:
+        interrupted = True
+        raise
+    finally:
+        # Cancel pending tasks if interrupted or the caller stopped iterating early
+        executor.shutdown(wait=not interrupted, cancel_futures=True)
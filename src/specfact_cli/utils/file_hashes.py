@@ -0,0 +1,287 @@
+"""
+Stat-first file content hashing for change and drift detection.
+
+`FileHashIndex` hashes each file at most once per run and persists the stat data
+(size, mtime_ns, inode) of every file it hashed under `.specfact/cache/`. On later
+runs a file whose stat data is unchanged is not read again; its stored SHA-256
+is reused. Files modified within the last few seconds are only memoized for the
+current run, since a further write within the file system's timestamp
+granularity would not change their stat data. The index can also remember the
+SHA-256 of git blobs, so git-backed change detection (`utils.git_changes`) can
+answer for files git reports as unchanged without touching them.
+
+All paths are keyed by their repository-relative POSIX path (see `repo_path_key`),
+the same key `SourceTracking.file_hashes` uses.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from beartype import beartype
+from icontract import ensure, require
+
+
+# Bump when the on-disk index layout changes
+INDEX_FORMAT_VERSION = "1"
+
+# Stat index file name (under .specfact/cache/)
+STAT_INDEX_FILE = "file_stat_index.json"
+
+# Files modified more recently than this (nanoseconds) are not persisted ("racily clean" files)
+RACY_WINDOW_NS = 2_000_000_000
+
+# Maximum number of git blob hashes kept in the index (least recently used are dropped)
+MAX_BLOB_ENTRIES = 100_000
+
+
+@beartype
+@require(lambda file_path: isinstance(file_path, Path), "File path must be Path")
+@ensure(lambda result: isinstance(result, str) and len(result) > 0, "Must return non-empty key")
+def repo_path_key(file_path: Path, repo_path: Path | None = None) -> str:
+    """
+    Normalize a file path to the key used for file hash lookups.
+
+    Args:
+        file_path: Absolute or repository-relative file path
+        repo_path: Repository root (None if unknown)
+
+    Returns:
+        Repository-relative POSIX path, or the absolute POSIX path for files outside the repository
+    """
+    if not file_path.is_absolute() or repo_path is None:
+        return file_path.as_posix()
+    try:
+        return file_path.relative_to(repo_path).as_posix()
+    except ValueError:
+        pass
+    resolved = file_path.resolve()
+    try:
+        return resolved.relative_to(repo_path.resolve()).as_posix()
+    except ValueError:
+        return resolved.as_posix()
+
+
+@dataclass
+class FileHashStats:
+    """Counters for one run of a file hash index."""
+
+    stat_hits: int = 0  # Served from the persisted stat index (file not read)
+    memo_hits: int = 0  # Served from this run's memo (file not even stat'ed)
+    blob_hits: int = 0  # Served from a known git blob hash (file not even stat'ed)
+    hashed: int = 0  # Files read and hashed
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "stat_hits": self.stat_hits,
+            "memo_hits": self.memo_hits,
+            "blob_hits": self.blob_hits,
+            "hashed": self.hashed,
+        }
+
+
+class FileHashIndex:
+    """
+    Per-run content-hash memo backed by a persisted stat index.
+
+    Thread-safe; one instance is meant to be shared by everything that hashes
+    files during a run (e.g., all features of a bundle), then `save()`d.
+    """
+
+    @beartype
+    @require(lambda repo_path: isinstance(repo_path, Path), "Repo path must be Path")
+    def __init__(self, repo_path: Path, index_path: Path | None = None, persist: bool = True) -> None:
+        """
+        Initialize file hash index.
+
+        Args:
+            repo_path: Path to repository root
+            index_path: Override stat index file (default: .specfact/cache/file_stat_index.json)
+            persist: Load and save the stat index (False keeps only the per-run memo)
+        """
+        from specfact_cli.utils.structure import SpecFactStructure
+
+        self.repo_path = repo_path.resolve()
+        self.index_path = index_path or (self.repo_path / SpecFactStructure.CACHE / STAT_INDEX_FILE)
+        self.persist = persist
+        self.stats = FileHashStats()
+        self._lock = threading.Lock()
+        self._memo: dict[str, str | None] = {}
+        self._entries: dict[str, list[Any]] = {}
+        self._blobs: dict[str, str] = {}
+        if persist:
+            self._load()
+        self._dirty = False
+
+    @beartype
+    @require(lambda file_path: isinstance(file_path, Path), "File path must be Path")
+    @ensure(lambda result: result is None or len(result) == 64, "Must return SHA-256 hex digest or None")
+    def hash_file(self, file_path: Path) -> str | None:
+        """
+        Get a file's SHA-256, reading it only if its stat data changed since it was last hashed.
+
+        Args:
+            file_path: File to hash (absolute or relative to the repository root)
+
+        Returns:
+            SHA-256 hex digest, or None if the file does not exist or cannot be read
+        """
+        if not file_path.is_absolute():
+            file_path = self.repo_path / file_path
+        key = repo_path_key(file_path, self.repo_path)
+        with self._lock:
+            if key in self._memo:
+                self.stats.memo_hits += 1
+                return self._memo[key]
+
+        digest = self._stat_and_hash(key, file_path)
+        with self._lock:
+            self._memo[key] = digest
+        return digest
+
+    @beartype
+    @require(lambda file_path: isinstance(file_path, Path), "File path must be Path")
+    def has_changed(self, file_path: Path, stored_hash: str | None) -> bool:
+        """
+        Check whether a file's content differs from a stored hash (missing files have changed).
+
+        Args:
+            file_path: File to check
+            stored_hash: Hash recorded at the last sync (None if never recorded)
+
+        Returns:
+            True if the file changed, was deleted, or has no stored hash
+        """
+        current_hash = self.hash_file(file_path)
+        return current_hash is None or current_hash != stored_hash
+
+    @beartype
+    @require(lambda oid: isinstance(oid, str) and len(oid) > 0, "Blob OID must be non-empty string")
+    def blob_hash(self, oid: str) -> str | None:
+        """
+        Get the SHA-256 recorded for a git blob.
+
+        Args:
+            oid: Git blob object ID
+
+        Returns:
+            SHA-256 hex digest of the blob content, or None if not recorded
+        """
+        with self._lock:
+            digest = self._blobs.pop(oid, None)
+            if digest is None:
+                return None
+            # Re-insert to keep recently used blobs at the end (evicted last)
+            self._blobs[oid] = digest
+            self.stats.blob_hits += 1
+        return digest
+
+    @beartype
+    @require(lambda oid: isinstance(oid, str) and len(oid) > 0, "Blob OID must be non-empty string")
+    @require(lambda digest: len(digest) == 64, "Digest must be SHA-256 hex digest")
+    @ensure(lambda result: result is None, "Must return None")
+    def record_blob(self, oid: str, digest: str) -> None:
+        """
+        Record the SHA-256 of a git blob's content.
+
+        Args:
+            oid: Git blob object ID
+            digest: SHA-256 hex digest of the blob content (as checked out)
+        """
+        with self._lock:
+            self._blobs.pop(oid, None)
+            self._blobs[oid] = digest
+            self._dirty = True
+
+    @beartype
+    @ensure(lambda result: result is None, "Must return None")
+    def save(self) -> None:
+        """Persist the stat index (atomically; failures are ignored)."""
+        if not self.persist:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            blobs = list(self._blobs.items())[-MAX_BLOB_ENTRIES:]
+            data = {"version": INDEX_FORMAT_VERSION, "entries": dict(self._entries), "blobs": dict(blobs)}
+            self._dirty = False
+        tmp_name: str | None = None
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.index_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(data, handle, separators=(",", ":"))
+            os.replace(tmp_name, self.index_path)
+        except (OSError, TypeError, ValueError):
+            if tmp_name is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_name)
+
+    def _stat_and_hash(self, key: str, file_path: Path) -> str | None:
+        """Stat a file and reuse its indexed hash if the stat data matches; hash it otherwise."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            with self._lock:
+                if self._entries.pop(key, None) is not None:
+                    self._dirty = True
+            return None
+        signature = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[:3] == signature:
+            with self._lock:
+                self.stats.stat_hits += 1
+            return str(entry[3])
+
+        try:
+            digest = _sha256_file(file_path)
+        except OSError:
+            return None
+        with self._lock:
+            self.stats.hashed += 1
+            if time.time_ns() - stat.st_mtime_ns > RACY_WINDOW_NS:
+                self._entries[key] = [*signature, digest]
+                self._dirty = True
+            elif self._entries.pop(key, None) is not None:
+                self._dirty = True
+        return digest
+
+    def _load(self) -> None:
+        """Load the persisted stat index (left empty if missing, unreadable or from another format version)."""
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != INDEX_FORMAT_VERSION:
+            return
+        entries = data.get("entries")
+        if isinstance(entries, dict):
+            self._entries = {
+                key: entry
+                for key, entry in entries.items()
+                if isinstance(entry, list) and len(entry) == 4 and isinstance(entry[3], str)
+            }
+        blobs = data.get("blobs")
+        if isinstance(blobs, dict):
+            self._blobs = {oid: digest for oid, digest in blobs.items() if isinstance(digest, str)}
+
+
+def _sha256_file(file_path: Path) -> str:
+    """Compute a file's SHA-256 (streamed)."""
+    digest = hashlib.sha256()
+    with file_path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
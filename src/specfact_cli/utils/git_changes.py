@@ -0,0 +1,244 @@
+"""
+Git-backed change detection for incremental import, sync and drift.
+
+`GitHashIndex` asks git which files changed since the commit a bundle was last
+synced at (`git diff --name-status <commit>`, one call) and which blob each
+unchanged file holds at that commit (`git ls-tree`, one call). Files git
+reports as unchanged are resolved through the SHA-256 recorded for their blob,
+so they are not even stat'ed once their blob has been hashed. Changed and
+untracked files, and every file outside a git repository, fall back to the
+stat-first `FileHashIndex`.
+
+The commit is stored in the bundle manifest (`bundle.synced_commit`) when
+source hashes are recorded.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from enum import StrEnum
+from pathlib import Path
+
+from beartype import beartype
+from git import Repo
+from git.exc import GitError
+from icontract import ensure, require
+
+from specfact_cli.utils.file_hashes import RACY_WINDOW_NS, FileHashIndex, repo_path_key
+
+
+# Manifest `bundle` key holding the commit source hashes were last recorded at
+SYNCED_COMMIT_KEY = "synced_commit"
+
+# Environment variable selecting the change detection mode
+CHANGE_DETECTION_ENV = "SPECFACT_CHANGE_DETECTION"
+
+
+class ChangeDetectionMode(StrEnum):
+    """How changed source files are detected."""
+
+    AUTO = "auto"  # Use git when the repository is a git checkout, hashing otherwise
+    HASH = "hash"  # Always hash files (stat-first)
+
+
+@beartype
+@ensure(lambda result: isinstance(result, ChangeDetectionMode), "Must return ChangeDetectionMode")
+def get_change_detection_mode() -> ChangeDetectionMode:
+    """
+    Get the change detection mode from `SPECFACT_CHANGE_DETECTION` (default: auto).
+
+    Returns:
+        Configured change detection mode (unknown values fall back to auto)
+    """
+    value = os.environ.get(CHANGE_DETECTION_ENV, "").strip().lower()
+    try:
+        return ChangeDetectionMode(value)
+    except ValueError:
+        return ChangeDetectionMode.AUTO
+
+
+@beartype
+@require(lambda bundle_dir: isinstance(bundle_dir, Path), "Bundle directory must be Path")
+def read_synced_commit(bundle_dir: Path) -> str | None:
+    """
+    Read the commit a bundle's source hashes were last recorded at.
+
+    Args:
+        bundle_dir: Path to project bundle directory
+
+    Returns:
+        Commit SHA, or None if the bundle has no manifest or no synced commit
+    """
+    from specfact_cli.utils.structured_io import load_structured_file
+
+    manifest_path = bundle_dir / "bundle.manifest.yaml"
+    if not manifest_path.exists():
+        return None
+    try:
+        manifest_data = load_structured_file(manifest_path, round_trip=False)
+    except Exception:
+        return None
+    bundle_data = manifest_data.get("bundle") if isinstance(manifest_data, dict) else None
+    commit = bundle_data.get(SYNCED_COMMIT_KEY) if isinstance(bundle_data, dict) else None
+    return commit if isinstance(commit, str) and commit else None
+
+
+class GitHashIndex:
+    """
+    File content hashes backed by git's view of the working tree.
+
+    Drop-in replacement for `FileHashIndex` (same `hash_file`, `has_changed` and
+    `save`); thread-safe.
+    """
+
+    @beartype
+    @require(lambda repo_path: isinstance(repo_path, Path), "Repo path must be Path")
+    def __init__(
+        self,
+        repo_path: Path,
+        base_commit: str | None = None,
+        hash_index: FileHashIndex | None = None,
+        mode: ChangeDetectionMode | None = None,
+    ) -> None:
+        """
+        Initialize git hash index.
+
+        Args:
+            repo_path: Path to repository root (may be a subdirectory of the git working tree)
+            base_commit: Commit to diff against (default: HEAD; unknown commits also fall back to HEAD)
+            hash_index: Fallback hash index (default: new `FileHashIndex` for repo_path)
+            mode: Change detection mode (default: from `SPECFACT_CHANGE_DETECTION`)
+        """
+        self.hash_index = hash_index or FileHashIndex(repo_path)
+        self.repo_path = self.hash_index.repo_path
+        self.stats = self.hash_index.stats
+        self.head_commit: str | None = None
+        self.base_commit: str | None = None
+        self.changed_paths: set[str] = set()  # Keys added, modified or deleted since base_commit
+        self._blobs: dict[str, str] = {}  # Key -> blob OID at base_commit
+        self._listed_at_ns = 0
+        self._lock = threading.Lock()
+        if (mode or get_change_detection_mode()) != ChangeDetectionMode.HASH:
+            self._load_git_state(base_commit)
+
+    @property
+    def available(self) -> bool:
+        """Whether git data is used (False: every file is hashed)."""
+        return self.base_commit is not None
+
+    @beartype
+    @require(lambda file_path: isinstance(file_path, Path), "File path must be Path")
+    @ensure(lambda result: result is None or len(result) == 64, "Must return SHA-256 hex digest or None")
+    def hash_file(self, file_path: Path) -> str | None:
+        """
+        Get a file's SHA-256, from its git blob if git reports it unchanged.
+
+        Args:
+            file_path: File to hash (absolute or relative to the repository root)
+
+        Returns:
+            SHA-256 hex digest, or None if the file does not exist or cannot be read
+        """
+        if not file_path.is_absolute():
+            file_path = self.repo_path / file_path
+        key = repo_path_key(file_path, self.repo_path)
+        oid = None if key in self.changed_paths else self._blobs.get(key)
+        if oid is None:
+            # Changed, untracked, or no git data: hash the file
+            return self.hash_index.hash_file(file_path)
+
+        digest = self.hash_index.blob_hash(oid)
+        if digest is not None:
+            return digest
+        digest = self.hash_index.hash_file(file_path)
+        if digest is not None and self._unmodified_since_listing(file_path):
+            self.hash_index.record_blob(oid, digest)
+        return digest
+
+    @beartype
+    @require(lambda file_path: isinstance(file_path, Path), "File path must be Path")
+    def has_changed(self, file_path: Path, stored_hash: str | None) -> bool:
+        """
+        Check whether a file's content differs from a stored hash (missing files have changed).
+
+        Args:
+            file_path: File to check
+            stored_hash: Hash recorded at the last sync (None if never recorded)
+
+        Returns:
+            True if the file changed, was deleted, or has no stored hash
+        """
+        current_hash = self.hash_file(file_path)
+        return current_hash is None or current_hash != stored_hash
+
+    @beartype
+    @ensure(lambda result: result is None, "Must return None")
+    def save(self) -> None:
+        """Persist the underlying stat and blob index."""
+        self.hash_index.save()
+
+    def _load_git_state(self, base_commit: str | None) -> None:
+        """Read the changed paths and blob OIDs since the base commit (leaves git unused on any failure)."""
+        try:
+            repo = Repo(self.repo_path, search_parent_directories=True)
+        except (GitError, OSError):
+            return
+        try:
+            if repo.working_tree_dir is None:
+                return
+            work_tree = Path(repo.working_tree_dir).resolve()
+            try:
+                pathspec = self.repo_path.relative_to(work_tree).as_posix()
+            except ValueError:
+                return
+            head_commit = _resolve_commit(repo, "HEAD")
+            resolved_base = (_resolve_commit(repo, base_commit) if base_commit else None) or head_commit
+            if resolved_base is None:
+                return  # No commits yet: everything is untracked
+
+            listed_at_ns = time.time_ns()
+            diff_output = repo.git.diff("--name-status", "--no-renames", "-z", resolved_base, "--", pathspec)
+            tree_output = repo.git.ls_tree("-r", "-z", resolved_base, "--", pathspec)
+        except (GitError, OSError, ValueError):
+            return
+        finally:
+            repo.close()
+
+        changed_paths: set[str] = set()
+        fields = diff_output.split("\0")
+        for status, git_path in zip(fields[::2], fields[1::2], strict=False):
+            if status and git_path:
+                changed_paths.add(repo_path_key(work_tree / git_path, self.repo_path))
+
+        blobs: dict[str, str] = {}
+        for record in tree_output.split("\0"):
+            meta, _, git_path = record.partition("\t")
+            parts = meta.split()
+            # Regular files only (skip symlinks and submodules)
+            if len(parts) == 3 and parts[1] == "blob" and parts[0] in {"100644", "100755"} and git_path:
+                blobs[repo_path_key(work_tree / git_path, self.repo_path)] = parts[2]
+
+        with self._lock:
+            self.head_commit = head_commit
+            self.base_commit = resolved_base
+            self.changed_paths = changed_paths
+            self._blobs = blobs
+            self._listed_at_ns = listed_at_ns
+
+    def _unmodified_since_listing(self, file_path: Path) -> bool:
+        """Check that a file was last written well before git was asked about it."""
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except OSError:
+            return False
+        return mtime_ns < self._listed_at_ns - RACY_WINDOW_NS
+
+
+def _resolve_commit(repo: Repo, ref: str) -> str | None:
+    """Resolve a ref to a commit SHA (None if it does not name a commit in this repository)."""
+    try:
+        return repo.git.rev_parse("--verify", "--quiet", f"{ref}^{{commit}}") or None
+    except GitError:
+        return None
@@ -92,7 +92,7 @@ def parse_repro_report(report_path: Path) -> dict[str, Any]:
         ValueError: If report is not valid YAML or doesn't match expected structure
     """
     try:
-        report = load_structured_file(report_path)
+        report = load_structured_file(report_path, round_trip=False)
         if not isinstance(report, dict):
             raise ValueError(f"Report must be a dictionary, got {type(report)}")
         return report
@@ -17,6 +17,7 @@ from beartype import beartype
 from icontract import ensure, require
 
 from specfact_cli.models.plan import Feature
+from specfact_cli.utils.git_changes import GitHashIndex, read_synced_commit
 
 
 @beartype
@@ -65,7 +66,7 @@ def check_incremental_changes(bundle_dir: Path, repo: Path, features: list[Featu
             if not manifest_path.exists():
                 return result
 
-            manifest_data = load_structured_file(manifest_path)
+            manifest_data = load_structured_file(manifest_path, round_trip=False)
             manifest = BundleManifest.model_validate(manifest_data)
 
             # Load only source_tracking sections from feature files in parallel
@@ -113,12 +114,12 @@ def check_incremental_changes(bundle_dir: Path, repo: Path, features: list[Featu
                     section_text = "\n".join(section_lines)
                     from specfact_cli.utils.structured_io import StructuredFormat, loads_structured_data
 
-                    section_data = loads_structured_data(section_text, StructuredFormat.YAML)
+                    section_data = loads_structured_data(section_text, StructuredFormat.YAML, round_trip=False)
                     return section_data.get("source_tracking") if isinstance(section_data, dict) else None
                 except Exception:
                     # Fallback to full parse if text extraction fails
                     try:
-                        feature_data = load_structured_file(file_path)
+                        feature_data = load_structured_file(file_path, round_trip=False)
                         return feature_data.get("source_tracking") if isinstance(feature_data, dict) else None
                     except Exception:
                         return None
@@ -220,6 +221,9 @@ def check_incremental_changes(bundle_dir: Path, repo: Path, features: list[Featu
             contract_checks.append((feature, contract_path))
 
     # Check files in parallel (early exit if any change detected)
+    # Files shared by several features are checked once; files unchanged since the synced commit
+    # (per git) or by stat data are not read
+    hash_index = GitHashIndex(repo, read_synced_commit(bundle_dir))
     if check_tasks:
         # In test mode, use fewer workers to avoid resource contention
         if os.environ.get("TEST_MODE") == "true":
@@ -234,7 +238,7 @@ def check_incremental_changes(bundle_dir: Path, repo: Path, features: list[Featu
                 return True  # File deleted
             if not feature.source_tracking:
                 return True  # No tracking means we should regenerate
-            return feature.source_tracking.has_changed(file_path)
+            return feature.source_tracking.has_changed(file_path, hash_index.repo_path, hasher=hash_index.hash_file)
 
         executor = ThreadPoolExecutor(max_workers=max_workers)
         interrupted = False
@@ -275,6 +279,7 @@ def check_incremental_changes(bundle_dir: Path, repo: Path, features: list[Featu
                 executor.shutdown(wait=wait_on_shutdown)
             else:
                 executor.shutdown(wait=False)
+        hash_index.save()
 
     # Check contracts (sequential, fast operation)
     for _feature, contract_path in contract_checks:
@@ -325,6 +330,7 @@ def get_changed_files(bundle_dir: Path, repo: Path, features: list[Feature]) ->
         Dictionary mapping feature_key -> list of changed file paths
     """
     changed_files: dict[str, list[str]] = {}
+    hash_index = GitHashIndex(repo, read_synced_commit(bundle_dir))
 
     for feature in features:
         if not feature.source_tracking:
@@ -336,7 +342,7 @@ def get_changed_files(bundle_dir: Path, repo: Path, features: list[Feature]) ->
         for impl_file in feature.source_tracking.implementation_files:
             file_path = repo / impl_file
             if file_path.exists():
-                if feature.source_tracking.has_changed(file_path):
+                if feature.source_tracking.has_changed(file_path, repo, hasher=hash_index.hash_file):
                     feature_changes.append(impl_file)
             else:
                 # File deleted
@@ -346,7 +352,7 @@ def get_changed_files(bundle_dir: Path, repo: Path, features: list[Feature]) ->
         for test_file in feature.source_tracking.test_files:
             file_path = repo / test_file
             if file_path.exists():
-                if feature.source_tracking.has_changed(file_path):
+                if feature.source_tracking.has_changed(file_path, repo, hasher=hash_index.hash_file):
                     feature_changes.append(test_file)
             else:
                 # File deleted
@@ -355,4 +361,5 @@ def get_changed_files(bundle_dir: Path, repo: Path, features: list[Feature]) ->
         if feature_changes:
             changed_files[feature.key] = feature_changes
 
+    hash_index.save()
     return changed_files
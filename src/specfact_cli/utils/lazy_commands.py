@@ -0,0 +1,115 @@
+"""
+Lazy command loading for the SpecFact CLI.
+
+Command modules pull in most of the package (analyzers, validators, adapters), so
+importing them all at startup makes `specfact --help`, `--version` and shell
+completion slow. This module provides a Typer group that registers sub-apps by
+name and imports a command module only when that command actually runs.
+"""
+
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+import click
+import typer
+from beartype import beartype
+from click.core import Context as ClickContext
+from icontract import ensure, require
+from typer.core import TyperGroup
+from typer.models import TyperInfo
+
+from specfact_cli.utils.progressive_disclosure import ProgressiveDisclosureGroup
+
+
+@dataclass(frozen=True)
+class LazyCommand:
+    """A sub-app registered by name and imported on first use."""
+
+    name: str
+    module: str  # Dotted module path, e.g. "specfact_cli.commands.plan"
+    help: str
+    attribute: str = "app"  # Name of the Typer app inside the module
+
+
+@beartype
+@require(lambda spec: spec.module.strip() != "", "Module path must not be empty")
+@ensure(lambda result: isinstance(result, typer.Typer), "Must return a Typer app")
+def load_typer_app(spec: LazyCommand) -> typer.Typer:
+    """
+    Import the module of a lazily registered command and return its Typer app.
+
+    Args:
+        spec: Registered command
+
+    Returns:
+        Typer app defined by the command module
+    """
+    module = importlib.import_module(spec.module)
+    return getattr(module, spec.attribute)
+
+
+class LazyCommandGroup(ProgressiveDisclosureGroup):
+    """
+    Typer group whose sub-commands are imported only when invoked.
+
+    Subclasses list their sub-apps in `lazy_commands` (in display order). Help
+    output and shell completion only need names and help text, so they get
+    lightweight placeholder groups; the command module is imported when Click
+    resolves the command for execution (or for help/completion *inside* it).
+    """
+
+    lazy_commands: ClassVar[tuple[LazyCommand, ...]] = ()
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._lazy_specs = {spec.name: spec for spec in self.lazy_commands}
+        self._placeholders: dict[str, click.Command] = {}
+
+    def list_commands(self, ctx: ClickContext) -> list[str]:
+        """Return eagerly added commands followed by lazy ones, in registration order."""
+        names = [name for name in super().list_commands(ctx) if name not in self._lazy_specs]
+        return names + list(self._lazy_specs)
+
+    def get_command(self, ctx: ClickContext, cmd_name: str) -> click.Command | None:
+        """Return the loaded command, or a placeholder carrying its help text without importing it."""
+        command = self.commands.get(cmd_name)
+        if command is not None:
+            return command
+        spec = self._lazy_specs.get(cmd_name)
+        if spec is None:
+            return None
+        if cmd_name not in self._placeholders:
+            self._placeholders[cmd_name] = TyperGroup(name=spec.name, help=spec.help)
+        return self._placeholders[cmd_name]
+
+    def resolve_command(self, ctx: ClickContext, args: list[str]) -> tuple[str | None, click.Command | None, list[str]]:
+        """Import the command module before Click dispatches to it."""
+        if args and args[0] in self._lazy_specs:
+            self.load_command(args[0])
+        return super().resolve_command(ctx, args)
+
+    def load_command(self, cmd_name: str) -> click.Command:
+        """
+        Import a lazily registered command and convert it to a Click group.
+
+        Args:
+            cmd_name: Registered command name
+
+        Returns:
+            Loaded Click command (cached on the group)
+        """
+        command = self.commands.get(cmd_name)
+        if command is not None:
+            return command
+        spec = self._lazy_specs[cmd_name]
+        command = typer.main.get_group_from_info(
+            TyperInfo(load_typer_app(spec), name=spec.name, help=spec.help),
+            pretty_exceptions_short=True,
+            suggest_commands=self.suggest_commands,
+            rich_markup_mode=self.rich_markup_mode,
+        )
+        self.add_command(command, spec.name)
+        return command
@@ -15,6 +15,8 @@ from typing import Any
 from beartype import beartype
 from rich.console import Console
 
+from specfact_cli.utils.profiling import profile_phase
+
 
 console = Console()
 
@@ -121,6 +123,8 @@ class PerformanceMonitor:
         """
         Track an operation's performance.
 
+        The operation is also recorded as a phase of the active profile (`--profile`).
+
         Args:
             operation: Operation name
             metadata: Optional metadata about the operation
@@ -134,7 +138,8 @@ class PerformanceMonitor:
 
         start = time.time()
         try:
-            yield
+            with profile_phase(operation, **(metadata or {})):
+                yield
         finally:
             duration = time.time() - start
             metric = PerformanceMetric(
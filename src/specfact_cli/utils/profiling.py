@@ -0,0 +1,348 @@
+"""
+Hot-path profiling for CLI commands (`specfact --profile <command>`).
+
+A `Profiler` records a tree of timed phases (e.g. discovery, dependency graph,
+analysis, source linking, relationships, contracts, enrichment, save), the
+slowest files per phase and the peak resident set size of the process and its
+worker processes. Code marks phases with `profile_phase()` and per-file work
+with `record_file_timing()`; both are no-ops (a global lookup) when no profiler
+is active, so instrumentation can stay in hot paths.
+
+Profiles are written as JSON (full tree, outliers, memory) and as a collapsed-stack
+file (`root;phase;sub-phase <self time in microseconds>` per line) that flamegraph
+tools such as `flamegraph.pl`, speedscope or inferno read directly. While telemetry
+is enabled, `TelemetryManager` exports the same phases as OTLP child spans.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from beartype import beartype
+from icontract import ensure, require
+
+
+# Slowest files kept per phase
+DEFAULT_MAX_FILE_OUTLIERS = 20
+
+# Bump when the JSON profile layout changes incompatibly
+PROFILE_FORMAT_VERSION = 1
+
+
+@dataclass
+class ProfileSpan:
+    """A timed phase of a profiled command (wall-clock start, monotonic duration)."""
+
+    name: str
+    start_ns: int
+    attributes: dict[str, Any] = field(default_factory=dict)
+    children: list[ProfileSpan] = field(default_factory=list)
+    duration_ns: int | None = None
+    _start_counter_ns: int = field(default=0, repr=False)
+
+    @property
+    def end_ns(self) -> int:
+        """Wall-clock end time (epoch nanoseconds); the span is treated as ending now while open."""
+        if self.duration_ns is None:
+            return self.start_ns + (time.perf_counter_ns() - self._start_counter_ns)
+        return self.start_ns + self.duration_ns
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (elapsed so far while the span is open)."""
+        return (self.end_ns - self.start_ns) / 1_000_000_000
+
+    @property
+    def self_time(self) -> float:
+        """Duration in seconds not covered by child spans."""
+        return max(0.0, self.duration - sum(child.duration for child in self.children))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary (recursive)."""
+        return {
+            "name": self.name,
+            "start": datetime.fromtimestamp(self.start_ns / 1_000_000_000).isoformat(),
+            "duration": round(self.duration, 6),
+            "self_time": round(self.self_time, 6),
+            "attributes": self.attributes,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+@dataclass(order=True)
+class FileTiming:
+    """Time spent on a single file within a phase."""
+
+    seconds: float
+    path: str = field(compare=False)
+    phase: str = field(compare=False)
+
+
+class Profiler:
+    """Collects the phase tree, per-file outliers and peak memory of one command run."""
+
+    @beartype
+    @require(lambda command: len(command) > 0, "Command must be non-empty")
+    @require(lambda max_file_outliers: max_file_outliers >= 0, "Outlier count must be non-negative")
+    def __init__(self, command: str, max_file_outliers: int = DEFAULT_MAX_FILE_OUTLIERS) -> None:
+        """
+        Start profiling a command (the root span starts now).
+
+        Args:
+            command: Command name, used as the root span name
+            max_file_outliers: Number of slowest files kept per phase
+        """
+        self.command = command
+        self.max_file_outliers = max_file_outliers
+        self.root = _open_span(command, {})
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._file_outliers: dict[str, list[FileTiming]] = {}
+        self._file_totals: dict[str, list[float]] = {}
+        self.peak_rss: dict[str, int] | None = None
+
+    def _stack(self) -> list[ProfileSpan]:
+        # Phases opened on other threads (thread pools) nest under the root span
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = [self.root]
+            self._local.stack = stack
+        return stack
+
+    @contextmanager
+    def phase(self, name: str, **attributes: Any) -> Iterator[ProfileSpan]:
+        """
+        Time a phase as a child of the innermost open phase of the current thread.
+
+        Args:
+            name: Phase name
+            **attributes: Attributes recorded with the phase (e.g. file counts)
+
+        Yields:
+            The open span (attributes may be added while it runs)
+        """
+        stack = self._stack()
+        span = _open_span(name, attributes)
+        with self._lock:
+            stack[-1].children.append(span)
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            _close_span(span)
+            stack.pop()
+
+    @beartype
+    def record_file(self, path: Path | str, seconds: float, phase: str) -> None:
+        """
+        Record the time spent on one file (thread-safe).
+
+        Args:
+            path: File path
+            seconds: Time spent on the file
+            phase: Phase the file was processed in (e.g. "analysis")
+        """
+        timing = FileTiming(seconds=seconds, path=str(path), phase=phase)
+        with self._lock:
+            totals = self._file_totals.setdefault(phase, [0, 0.0])
+            totals[0] += 1
+            totals[1] += seconds
+            outliers = self._file_outliers.setdefault(phase, [])
+            if len(outliers) < self.max_file_outliers:
+                heapq.heappush(outliers, timing)
+            elif outliers and seconds > outliers[0].seconds:
+                heapq.heapreplace(outliers, timing)
+
+    @beartype
+    def file_outliers(self, phase: str) -> list[FileTiming]:
+        """Get the slowest files recorded for a phase, slowest first."""
+        with self._lock:
+            return sorted(self._file_outliers.get(phase, []), reverse=True)
+
+    @beartype
+    def finish(self) -> None:
+        """Close the root span and sample peak memory (idempotent)."""
+        if self.root.duration_ns is None:
+            _close_span(self.root)
+            self.peak_rss = peak_rss_bytes()
+
+    @beartype
+    @ensure(lambda result: "root" in result, "Profile must contain the root span")
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the profile to a JSON-serializable dictionary."""
+        with self._lock:
+            files = {
+                phase: {
+                    "count": int(totals[0]),
+                    "total_seconds": round(totals[1], 6),
+                    "slowest": [
+                        {"path": timing.path, "seconds": round(timing.seconds, 6)}
+                        for timing in sorted(self._file_outliers.get(phase, []), reverse=True)
+                    ],
+                }
+                for phase, totals in self._file_totals.items()
+            }
+        return {
+            "format": PROFILE_FORMAT_VERSION,
+            "command": self.command,
+            "argv": sys.argv[1:],
+            "peak_rss_bytes": self.peak_rss,
+            "root": self.root.to_dict(),
+            "files": files,
+        }
+
+    @beartype
+    def collapsed_stacks(self) -> list[str]:
+        """
+        Get the phase tree as collapsed stacks (flamegraph input).
+
+        Returns:
+            Lines of `parent;child <self time in microseconds>`, one per phase with self time
+        """
+        lines: list[str] = []
+
+        def walk(span: ProfileSpan, prefix: str) -> None:
+            frame = f"{prefix};{_frame_name(span.name)}" if prefix else _frame_name(span.name)
+            self_us = round(span.self_time * 1_000_000)
+            if self_us > 0:
+                lines.append(f"{frame} {self_us}")
+            for child in span.children:
+                walk(child, frame)
+
+        walk(self.root, "")
+        return lines
+
+    @beartype
+    @require(lambda path: isinstance(path, Path), "Path must be Path")
+    @ensure(lambda result: len(result) == 2, "Must return JSON and collapsed-stack paths")
+    def write(self, path: Path) -> tuple[Path, Path]:
+        """
+        Write the profile as JSON and, next to it, as a `.collapsed` stack file.
+
+        Args:
+            path: JSON profile path (parent directories are created)
+
+        Returns:
+            Paths of the JSON profile and the collapsed-stack file
+        """
+        self.finish()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        collapsed_path = path.with_suffix(".collapsed")
+        path.write_text(json.dumps(self.to_dict(), indent=2, default=str), encoding="utf-8")
+        collapsed_path.write_text("\n".join(self.collapsed_stacks()) + "\n", encoding="utf-8")
+        return path, collapsed_path
+
+
+def _open_span(name: str, attributes: dict[str, Any]) -> ProfileSpan:
+    return ProfileSpan(
+        name=name, start_ns=time.time_ns(), attributes=dict(attributes), _start_counter_ns=time.perf_counter_ns()
+    )
+
+
+def _close_span(span: ProfileSpan) -> None:
+    span.duration_ns = time.perf_counter_ns() - span._start_counter_ns
+
+
+def _frame_name(name: str) -> str:
+    # ';' separates frames and the last space separates the sample count
+    return name.replace(";", ":").replace(" ", "_")
+
+
+@beartype
+def peak_rss_bytes() -> dict[str, int] | None:
+    """
+    Get the peak resident set size of this process and of its finished child processes.
+
+    Returns:
+        Dictionary with "self" and "children" in bytes, or None where
+        the `resource` module is unavailable (Windows)
+    """
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - Windows
+        return None
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return {
+        "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale,
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale,
+    }
+
+
+# Profiler of the running command (None when profiling is off)
+_active_profiler: Profiler | None = None
+
+
+@beartype
+def get_profiler() -> Profiler | None:
+    """Get the active profiler, if any."""
+    return _active_profiler
+
+
+@beartype
+def start_profiling(command: str) -> Profiler:
+    """
+    Start profiling a command; the profiler becomes the active one.
+
+    Args:
+        command: Command name (root span name)
+
+    Returns:
+        The new active profiler
+    """
+    global _active_profiler
+    _active_profiler = Profiler(command)
+    return _active_profiler
+
+
+@beartype
+def stop_profiling() -> Profiler | None:
+    """
+    Finish the active profiler and deactivate it.
+
+    Returns:
+        The finished profiler, or None if profiling was off
+    """
+    global _active_profiler
+    profiler = _active_profiler
+    _active_profiler = None
+    if profiler is not None:
+        profiler.finish()
+    return profiler
+
+
+@contextmanager
+def profile_phase(name: str, **attributes: Any) -> Iterator[ProfileSpan | None]:
+    """
+    Time a phase of the running command (no-op unless a profiler is active).
+
+    Args:
+        name: Phase name
+        **attributes: Attributes recorded with the phase
+
+    Yields:
+        The open span, or None when profiling is off
+    """
+    profiler = _active_profiler
+    if profiler is None:
+        yield None
+        return
+    with profiler.phase(name, **attributes) as span:
+        yield span
+
+
+def record_file_timing(path: Path | str, seconds: float, phase: str) -> None:
+    """Record the time spent on one file in a phase (no-op unless a profiler is active)."""
+    profiler = _active_profiler
+    if profiler is not None:
+        profiler.record_file(path, seconds, phase)
@@ -79,6 +79,7 @@ def load_bundle_with_progress(
     bundle_dir: Path,
     validate_hashes: bool = False,
     console_instance: Console | None = None,
+    lazy: bool = False,
 ) -> ProjectBundle:
     """
     Load project bundle with unified progress display.
@@ -90,6 +91,7 @@ def load_bundle_with_progress(
         bundle_dir: Path to bundle directory
         validate_hashes: Whether to validate file checksums
         console_instance: Optional Console instance (defaults to module console)
+        lazy: Load features on first access (for commands that touch only a few features)
 
     Returns:
         Loaded ProjectBundle instance
@@ -117,6 +119,7 @@ def load_bundle_with_progress(
                     bundle_dir,
                     validate_hashes=validate_hashes,
                     progress_callback=progress_callback,
+                    lazy=lazy,
                 )
                 elapsed = time() - start_time
                 progress.update(task, description=f"✓ Bundle loaded ({elapsed:.2f}s)")
@@ -130,6 +133,7 @@ def load_bundle_with_progress(
         bundle_dir,
         validate_hashes=validate_hashes,
         progress_callback=None,
+        lazy=lazy,
     )
 
 
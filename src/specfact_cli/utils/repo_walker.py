@@ -0,0 +1,463 @@
+"""
+Pruned, ignore-aware repository walker.
+
+Discovers source files with `os.scandir`, pruning excluded directories (VCS
+metadata, virtual environments, dependency and build output directories)
+before descending into them, and honouring `.gitignore` files and the
+repository's `.specfact/ignore` file (same syntax).
+
+Analyzers share one file list per run through `repo_file_index_scope()`, so
+the repository is walked once regardless of how many phases need it.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from beartype import beartype
+from icontract import ensure, require
+
+
+# Directory names never descended into (matched against the name, at any depth)
+DEFAULT_EXCLUDED_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        "__pycache__",
+        ".venv",
+        "venv",
+        "node_modules",
+        ".tox",
+        ".nox",
+        ".eggs",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".hypothesis",
+        "htmlcov",
+        "site-packages",
+        ".specfact",
+    }
+)
+
+# Directory names excluded only at the repository root (build outputs; a nested
+# package may legitimately be called "build")
+ROOT_EXCLUDED_DIRS = frozenset({"build", "dist"})
+
+# Marker file identifying a virtual environment regardless of its directory name
+VENV_MARKER = "pyvenv.cfg"
+
+GITIGNORE_FILE = ".gitignore"
+SPECFACT_IGNORE_FILE = ".specfact/ignore"
+
+
+@dataclass(frozen=True)
+class IgnorePattern:
+    """Single compiled `.gitignore`-style pattern."""
+
+    regex: re.Pattern[str]
+    base: str  # Directory (POSIX, relative to the walk root) containing the ignore file; "" for the root
+    negated: bool = False
+    dir_only: bool = False
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        """
+        Check whether the pattern matches a path.
+
+        Args:
+            rel_path: POSIX path relative to the walk root
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the pattern matches
+        """
+        if self.dir_only and not is_dir:
+            return False
+        if self.base:
+            if not rel_path.startswith(self.base + "/"):
+                return False
+            rel_path = rel_path[len(self.base) + 1 :]
+        return self.regex.fullmatch(rel_path) is not None
+
+
+def _translate_glob(pattern: str) -> str:
+    """Translate a gitignore glob (`*`, `?`, `[...]`, `**`) into a regular expression."""
+    parts: list[str] = []
+    i = 0
+    length = len(pattern)
+    while i < length:
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif char == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif char == "?":
+            parts.append("[^/]")
+            i += 1
+        elif char == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                parts.append(re.escape(char))
+                i += 1
+                continue
+            body = pattern[i + 1 : end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+            i = end + 1
+        elif char == "\\" and i + 1 < length:
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(char))
+            i += 1
+    return "".join(parts)
+
+
+@beartype
+@ensure(lambda result: isinstance(result, list), "Must return list")
+def parse_ignore_lines(lines: list[str], base: str = "") -> list[IgnorePattern]:
+    """
+    Parse `.gitignore`-style lines.
+
+    Supports comments, blank lines, `!` negation, trailing `/` (directories
+    only), leading or embedded `/` (anchored to the ignore file's directory)
+    and `*`, `?`, `[...]` and `**` wildcards.
+
+    Args:
+        lines: Lines of an ignore file
+        base: Directory containing the ignore file (POSIX, relative to the walk root)
+
+    Returns:
+        Compiled patterns in file order
+    """
+    patterns: list[IgnorePattern] = []
+    for raw_line in lines:
+        line = raw_line.rstrip("\n").rstrip("\r")
+        # Trailing spaces are ignored unless escaped
+        if not line.endswith("\\ "):
+            line = line.rstrip(" ")
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        # Drop the negation marker or the escape of a literal leading "#" / "!"
+        if negated or line.startswith("\\"):
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        anchored = "/" in line
+        line = line.lstrip("/")
+        regex = _translate_glob(line)
+        if not anchored:
+            regex = "(?:.*/)?" + regex
+        patterns.append(IgnorePattern(re.compile(regex, re.DOTALL), base, negated=negated, dir_only=dir_only))
+    return patterns
+
+
+class IgnoreRules:
+    """
+    Ordered set of ignore patterns (the last matching pattern wins, as in git).
+
+    Override patterns (from `.specfact/ignore`) take precedence over all
+    `.gitignore` patterns, including those of nested directories.
+    """
+
+    def __init__(
+        self, patterns: list[IgnorePattern] | None = None, overrides: list[IgnorePattern] | None = None
+    ) -> None:
+        """
+        Initialize rules.
+
+        Args:
+            patterns: Compiled patterns in precedence order (later patterns override earlier ones)
+            overrides: Patterns checked before all others
+        """
+        self.patterns: list[IgnorePattern] = list(patterns or [])
+        self.overrides: list[IgnorePattern] = list(overrides or [])
+
+    def extended(self, patterns: list[IgnorePattern]) -> IgnoreRules:
+        """Return new rules with additional, higher-precedence patterns (overrides are kept)."""
+        if not patterns:
+            return self
+        return IgnoreRules([*self.patterns, *patterns], self.overrides)
+
+    def is_ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """
+        Check whether a path is ignored.
+
+        Args:
+            rel_path: POSIX path relative to the walk root
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the last matching pattern ignores the path
+        """
+        for patterns in (self.overrides, self.patterns):
+            for pattern in reversed(patterns):
+                if pattern.matches(rel_path, is_dir):
+                    return not pattern.negated
+        return False
+
+
+def _read_ignore_file(path: Path, base: str) -> list[IgnorePattern]:
+    """Read an ignore file (missing or unreadable files yield no patterns)."""
+    try:
+        return parse_ignore_lines(path.read_text(encoding="utf-8", errors="replace").splitlines(), base)
+    except OSError:
+        return []
+
+
+@dataclass
+class WalkStats:
+    """Counters for a repository walk."""
+
+    dirs_visited: int = 0
+    dirs_pruned: int = 0
+    files_ignored: int = 0
+
+
+class RepoWalker:
+    """
+    Walks a repository with `os.scandir`, pruning excluded and ignored directories.
+
+    Symlinked directories are not followed (matching `Path.rglob`).
+    """
+
+    @beartype
+    @require(lambda root: isinstance(root, Path), "Root must be Path")
+    def __init__(
+        self,
+        root: Path,
+        excluded_dirs: frozenset[str] = DEFAULT_EXCLUDED_DIRS,
+        use_ignore_files: bool = True,
+    ) -> None:
+        """
+        Initialize walker.
+
+        Args:
+            root: Repository root (ignore patterns are resolved relative to it)
+            excluded_dirs: Directory names never descended into
+            use_ignore_files: Honour `.gitignore` files and `.specfact/ignore`
+        """
+        self.root = root
+        self.excluded_dirs = excluded_dirs
+        self.use_ignore_files = use_ignore_files
+        self.stats = WalkStats()
+
+    @beartype
+    @require(lambda suffixes: len(suffixes) > 0, "At least one suffix is required")
+    def iter_files(self, suffixes: tuple[str, ...] = (".py",), start: Path | None = None) -> Iterator[Path]:
+        """
+        Yield files with the given suffixes, depth-first in name order (a directory's
+        files before its subdirectories).
+
+        Args:
+            suffixes: File suffixes to include (e.g., (".py",))
+            start: Subdirectory of the root to walk instead of the whole repository
+                (ignore files of the root and all intermediate directories still apply)
+
+        Yields:
+            File paths prefixed with the walk root (like `root.rglob()`)
+        """
+        start_rel = ""
+        if start is not None:
+            start_abs = start if start.is_absolute() else self.root / start
+            start_rel = start_abs.resolve().relative_to(self.root.resolve()).as_posix()
+            if start_rel == ".":
+                start_rel = ""
+
+        rules = self._initial_rules(start_rel)
+        start_dir = self.root / start_rel if start_rel else self.root
+        stack: list[tuple[Path, str, IgnoreRules]] = [(start_dir, start_rel, rules)]
+        while stack:
+            directory, rel_dir, dir_rules = stack.pop()
+            try:
+                with os.scandir(directory) as iterator:
+                    entries = sorted(iterator, key=lambda entry: entry.name)
+            except OSError:
+                continue
+            self.stats.dirs_visited += 1
+
+            # Virtual environments are recognized by their marker file, whatever the directory is called
+            if rel_dir and any(entry.name == VENV_MARKER for entry in entries):
+                self.stats.dirs_pruned += 1
+                continue
+
+            if self.use_ignore_files and any(entry.name == GITIGNORE_FILE for entry in entries):
+                dir_rules = dir_rules.extended(_read_ignore_file(directory / GITIGNORE_FILE, rel_dir))
+
+            subdirs: list[tuple[Path, str, IgnoreRules]] = []
+            for entry in entries:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if self._is_excluded_dir(entry.name, rel_dir) or dir_rules.is_ignored(rel_path, True):
+                        self.stats.dirs_pruned += 1
+                        continue
+                    subdirs.append((directory / entry.name, rel_path, dir_rules))
+                elif entry.name.endswith(suffixes):
+                    if dir_rules.is_ignored(rel_path, False):
+                        self.stats.files_ignored += 1
+                        continue
+                    yield directory / entry.name
+            # Push in reverse so directories are visited in name order
+            stack.extend(reversed(subdirs))
+
+    @beartype
+    @ensure(lambda result: isinstance(result, list), "Must return list")
+    def list_files(self, suffixes: tuple[str, ...] = (".py",), start: Path | None = None) -> list[Path]:
+        """
+        List files with the given suffixes.
+
+        Args:
+            suffixes: File suffixes to include
+            start: Subdirectory to walk instead of the whole repository
+
+        Returns:
+            File paths in deterministic walk order
+        """
+        return list(self.iter_files(suffixes, start))
+
+    def _is_excluded_dir(self, name: str, rel_parent: str) -> bool:
+        """Check whether a directory is excluded by name."""
+        if name in self.excluded_dirs or name.endswith(".egg-info"):
+            return True
+        return not rel_parent and name in ROOT_EXCLUDED_DIRS
+
+    def _initial_rules(self, start_rel: str) -> IgnoreRules:
+        """Load `.specfact/ignore` and the ignore files of directories above the start directory."""
+        if not self.use_ignore_files:
+            return IgnoreRules()
+        rules = IgnoreRules(overrides=_read_ignore_file(self.root / SPECFACT_IGNORE_FILE, ""))
+        if start_rel:
+            parts = start_rel.split("/")
+            ancestors = ["", *("/".join(parts[:index]) for index in range(1, len(parts)))]
+            for ancestor in ancestors:
+                ancestor_dir = self.root / ancestor if ancestor else self.root
+                rules = rules.extended(_read_ignore_file(ancestor_dir / GITIGNORE_FILE, ancestor))
+        return rules
+
+
+class RepoFileIndex:
+    """
+    Per-run memo of discovered files, shared by all analysis phases.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        # Relative paths per (resolved root, suffixes), so callers get paths prefixed with their own root
+        self._files: dict[tuple[str, tuple[str, ...]], list[str]] = {}
+        self._lock = threading.Lock()
+        self.walks = 0
+
+    @beartype
+    @ensure(lambda result: isinstance(result, list), "Must return list")
+    def files(self, root: Path, suffixes: tuple[str, ...] = (".py",)) -> list[Path]:
+        """
+        Get all files with the given suffixes under a repository (walked on first use).
+
+        Args:
+            root: Repository root
+            suffixes: File suffixes to include
+
+        Returns:
+            File paths prefixed with root (a new list; callers may modify it)
+        """
+        key = (str(root.resolve()), suffixes)
+        with self._lock:
+            cached = self._files.get(key)
+            if cached is None:
+                cached = [str(file_path.relative_to(root)) for file_path in RepoWalker(root).iter_files(suffixes)]
+                self._files[key] = cached
+                self.walks += 1
+        return [root / rel_path for rel_path in cached]
+
+
+# Active per-run index, installed by repo_file_index_scope()
+_repo_file_index: RepoFileIndex | None = None
+_index_lock = threading.Lock()
+
+
+@beartype
+def get_repo_file_index() -> RepoFileIndex | None:
+    """Get the active file index (None outside `repo_file_index_scope()`)."""
+    with _index_lock:
+        return _repo_file_index
+
+
+@contextmanager
+def repo_file_index_scope(index: RepoFileIndex | None = None) -> Iterator[RepoFileIndex]:
+    """
+    Context manager that shares one file list per repository for the duration of a run.
+
+    Outside a scope every call to `list_python_files()` walks the repository again,
+    so long-lived processes never see stale file lists.
+
+    Args:
+        index: Index to install (e.g., one already used to count files); default: new index
+
+    Yields:
+        RepoFileIndex shared by all callers within the scope
+    """
+    global _repo_file_index
+    index = index if index is not None else RepoFileIndex()
+    with _index_lock:
+        previous = _repo_file_index
+        _repo_file_index = index
+    try:
+        yield index
+    finally:
+        with _index_lock:
+            _repo_file_index = previous
+
+
+@beartype
+@require(lambda repo_path: isinstance(repo_path, Path), "Repository path must be Path")
+@ensure(lambda result: isinstance(result, list), "Must return list")
+def list_python_files(repo_path: Path, subdir: Path | None = None) -> list[Path]:
+    """
+    List the repository's Python files, pruning excluded and ignored directories.
+
+    Uses the active `repo_file_index_scope()` (if any), so the repository is walked
+    once per run.
+
+    Args:
+        repo_path: Repository root
+        subdir: Restrict results to this subdirectory (absolute or relative to repo_path)
+
+    Returns:
+        Python file paths prefixed with repo_path
+    """
+    index = get_repo_file_index()
+    if index is None:
+        return RepoWalker(repo_path).list_files((".py",), start=subdir)
+
+    files = index.files(repo_path)
+    if subdir is None:
+        return files
+    subdir_abs = (subdir if subdir.is_absolute() else repo_path / subdir).resolve()
+    try:
+        prefix = subdir_abs.relative_to(repo_path.resolve()).parts
+    except ValueError:
+        # Outside the repository: walk the directory on its own
+        return RepoWalker(subdir_abs).list_files((".py",))
+    if not prefix:
+        return files
+    return [file_path for file_path in files if file_path.relative_to(repo_path).parts[: len(prefix)] == prefix]
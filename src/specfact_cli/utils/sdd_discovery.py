@@ -8,12 +8,14 @@ layouts.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 
 from beartype import beartype
 from icontract import ensure, require
 
 from specfact_cli.models.sdd import SDDManifest
+from specfact_cli.utils.bundle_registry import BundleRegistry
 from specfact_cli.utils.structure import SpecFactStructure
 from specfact_cli.utils.structured_io import StructuredFormat, load_structured_file
 
@@ -85,51 +87,34 @@ def find_sdd_for_bundle(bundle_name: str, base_path: Path, sdd_path: Path | None
 
 @beartype
 @require(lambda base_path: isinstance(base_path, Path), "Base path must be Path")
-@ensure(lambda result: isinstance(result, list), "Must return list")
-def list_all_sdds(base_path: Path) -> list[tuple[Path, SDDManifest]]:
+def iter_sdd_candidates(base_path: Path) -> Iterator[Path]:
     """
-    List all SDD manifests in the repository.
+    Iterate over the existing SDD manifest files of the repository (not parsed).
 
-    Searches bundle-specific locations first (.specfact/projects/<bundle>/sdd.{yaml,json}),
-    then legacy multi-SDD directory (.specfact/sdd/*.yaml),
-    and legacy single-SDD file (.specfact/sdd.yaml).
+    Yields bundle-specific locations first (.specfact/projects/<bundle>/sdd.{yaml,json}),
+    then the legacy multi-SDD directory (.specfact/sdd/*.yaml, *.json),
+    then the legacy single-SDD file (.specfact/sdd.{yaml,json}).
 
     Args:
         base_path: Base repository path
 
-    Returns:
-        List of (path, manifest) tuples for all found SDD manifests
+    Yields:
+        Paths of existing SDD files
     """
-    results: list[tuple[Path, SDDManifest]] = []
-
     # Bundle-specific (preferred)
     projects_dir = base_path / SpecFactStructure.PROJECTS
     if projects_dir.exists() and projects_dir.is_dir():
         for bundle_dir in projects_dir.iterdir():
             if not bundle_dir.is_dir():
                 continue
-            sdd_yaml = bundle_dir / "sdd.yaml"
-            sdd_json = bundle_dir / "sdd.json"
-            for candidate in (sdd_yaml, sdd_json):
-                if not candidate.exists():
-                    continue
-                try:
-                    sdd_data = load_structured_file(candidate)
-                    manifest = SDDManifest(**sdd_data)
-                    results.append((candidate.resolve(), manifest))
-                except Exception:
-                    continue
+            for candidate in (bundle_dir / "sdd.yaml", bundle_dir / "sdd.json"):
+                if candidate.exists():
+                    yield candidate
 
     # Legacy multi-SDD directory layout
     sdd_dir = base_path / SpecFactStructure.SDD
     if sdd_dir.exists() and sdd_dir.is_dir():
-        for sdd_file in list(sdd_dir.glob("*.yaml")) + list(sdd_dir.glob("*.json")):
-            try:
-                sdd_data = load_structured_file(sdd_file)
-                manifest = SDDManifest(**sdd_data)
-                results.append((sdd_file.resolve(), manifest))
-            except Exception:
-                continue
+        yield from list(sdd_dir.glob("*.yaml")) + list(sdd_dir.glob("*.json"))
 
     # Legacy single-SDD layout
     for legacy_file in (
@@ -137,13 +122,34 @@ def list_all_sdds(base_path: Path) -> list[tuple[Path, SDDManifest]]:
         base_path / SpecFactStructure.ROOT / "sdd.json",
     ):
         if legacy_file.exists():
-            try:
-                sdd_data = load_structured_file(legacy_file)
-                manifest = SDDManifest(**sdd_data)
-                results.append((legacy_file.resolve(), manifest))
-            except Exception:
-                continue
+            yield legacy_file
+
+
+@beartype
+@require(lambda base_path: isinstance(base_path, Path), "Base path must be Path")
+@ensure(lambda result: isinstance(result, list), "Must return list")
+def list_all_sdds(base_path: Path) -> list[tuple[Path, SDDManifest]]:
+    """
+    List all SDD manifests in the repository.
+
+    Searches bundle-specific locations first (.specfact/projects/<bundle>/sdd.{yaml,json}),
+    then legacy multi-SDD directory (.specfact/sdd/*.yaml),
+    and legacy single-SDD file (.specfact/sdd.yaml).
 
+    Args:
+        base_path: Base repository path
+
+    Returns:
+        List of (path, manifest) tuples for all found SDD manifests
+    """
+    results: list[tuple[Path, SDDManifest]] = []
+    for candidate in iter_sdd_candidates(base_path):
+        try:
+            sdd_data = load_structured_file(candidate, round_trip=False)
+            manifest = SDDManifest(**sdd_data)
+            results.append((candidate.resolve(), manifest))
+        except Exception:
+            continue
     return results
 
 
@@ -158,7 +164,8 @@ def get_sdd_by_hash(plan_hash: str, base_path: Path) -> Path | None:
     """
     Find SDD manifest by plan bundle hash (legacy support).
 
-    Searches all SDD manifests and returns the first one matching the hash.
+    Looks the hash up in the workspace bundle registry (`.specfact/registry/`), which
+    re-reads only SDD manifests changed since they were last indexed.
 
     Args:
         plan_hash: Plan bundle content hash
@@ -167,11 +174,10 @@ def get_sdd_by_hash(plan_hash: str, base_path: Path) -> Path | None:
     Returns:
         Path to SDD manifest if found, None otherwise
     """
-    all_sdds = list_all_sdds(base_path)
-    for sdd_path, manifest in all_sdds:
-        if manifest.plan_bundle_hash == plan_hash:
-            return sdd_path
-    return None
+    registry = BundleRegistry(base_path)
+    result = registry.find_sdd_by_hash(plan_hash)
+    registry.save()
+    return result
 
 
 @beartype
@@ -9,15 +9,99 @@ from __future__ import annotations
 
 import ast
 import os
+import threading
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 from beartype import beartype
 from icontract import ensure, require
 
 from specfact_cli.models.plan import Feature
 from specfact_cli.models.source_tracking import SourceTracking
+from specfact_cli.utils.ast_cache import get_parsed_module_cache
+from specfact_cli.utils.repo_walker import list_python_files
+
+
+# Top-level directories holding implementation code
+IMPLEMENTATION_ROOTS = ("src", "lib", "app")
+
+
+class FileNameIndex:
+    """
+    Inverted index from file-name trigrams to files.
+
+    Answers "which files have a stem containing this fragment?" with posting-list
+    intersections instead of comparing the fragment against every file name.
+    Results keep the order in which files were added.
+    """
+
+    NGRAM = 3
+
+    def __init__(self, files: list[Path]) -> None:
+        """
+        Build the index.
+
+        Args:
+            files: Files to index (stems are matched case-insensitively)
+        """
+        self._files = list(files)
+        self._stems: list[str] = [file_path.stem.lower() for file_path in self._files]
+        self._postings: dict[str, set[int]] = {}
+        for position, stem in enumerate(self._stems):
+            for start in range(len(stem) - self.NGRAM + 1):
+                self._postings.setdefault(stem[start : start + self.NGRAM], set()).add(position)
+
+    def __len__(self) -> int:
+        """Number of indexed files."""
+        return len(self._files)
+
+    @beartype
+    @ensure(lambda result: isinstance(result, set), "Must return set")
+    def positions(self, fragment: str) -> set[int]:
+        """
+        Find files whose lowercase stem contains a fragment.
+
+        Args:
+            fragment: Lowercase substring to search for
+
+        Returns:
+            Positions (in insertion order numbering) of matching files
+        """
+        if len(fragment) < self.NGRAM:
+            # Too short for trigram lookup - fall back to a scan
+            return {position for position, stem in enumerate(self._stems) if fragment in stem}
+
+        candidates: set[int] | None = None
+        grams = {fragment[start : start + self.NGRAM] for start in range(len(fragment) - self.NGRAM + 1)}
+        for gram in sorted(grams, key=lambda gram: len(self._postings.get(gram, ()))):
+            posting = self._postings.get(gram)
+            if not posting:
+                return set()
+            candidates = set(posting) if candidates is None else candidates & posting
+            if not candidates:
+                return set()
+        # Trigram hits are candidates only; confirm the full substring
+        return {position for position in candidates or set() if fragment in self._stems[position]}
+
+    @beartype
+    @ensure(lambda result: isinstance(result, list), "Must return list")
+    def search(self, fragments: list[str]) -> list[Path]:
+        """
+        Find files whose stem contains any of the fragments.
+
+        Args:
+            fragments: Lowercase substrings to search for
+
+        Returns:
+            Matching files in insertion order
+        """
+        matches: set[int] = set()
+        for fragment in fragments:
+            matches |= self.positions(fragment)
+        return [self._files[position] for position in sorted(matches)]
 
 
 @dataclass
@@ -41,6 +125,12 @@ class SourceArtifactScanner:
             repo_path: Path to repository root
         """
         self.repo_path = repo_path.resolve()
+        # Per-run memos shared by all features/stories (reset by link_to_specs)
+        self._memo_lock = threading.Lock()
+        self._file_hashes: dict[Path, str] = {}
+        self._function_names: dict[Path, list[str]] = {}
+        self._test_function_names: dict[Path, list[str]] = {}
+        self._file_locks: dict[Path, threading.Lock] = {}
 
     @beartype
     @require(lambda self: self.repo_path.exists(), "Repository path must exist")
@@ -55,24 +145,21 @@ class SourceArtifactScanner:
         """
         artifact_map = SourceArtifactMap()
 
-        # Discover implementation files (src/, lib/, app/, etc.)
-        for pattern in ["src/**/*.py", "lib/**/*.py", "app/**/*.py", "*.py"]:
-            for file_path in self.repo_path.glob(pattern):
-                if self._is_implementation_file(file_path):
-                    rel_path = str(file_path.relative_to(self.repo_path))
-                    artifact_map.implementation_files[rel_path] = []
-
-        # Discover test files (tests/, test/, spec/, etc.)
-        for pattern in ["tests/**/*.py", "test/**/*.py", "spec/**/*.py", "**/test_*.py", "**/*_test.py"]:
-            for file_path in self.repo_path.glob(pattern):
-                if self._is_test_file(file_path):
-                    rel_path = str(file_path.relative_to(self.repo_path))
-                    artifact_map.test_files[rel_path] = []
+        for file_path in list_python_files(self.repo_path):
+            rel_parts = file_path.relative_to(self.repo_path).parts
+            # Discover implementation files (src/, lib/, app/, top-level modules)
+            if (len(rel_parts) == 1 or rel_parts[0] in IMPLEMENTATION_ROOTS) and self._is_implementation_file(
+                file_path
+            ):
+                artifact_map.implementation_files[str(file_path.relative_to(self.repo_path))] = []
+            # Discover test files (tests/, test/, spec/, test_*.py, *_test.py)
+            if self._is_test_file(file_path):
+                artifact_map.test_files[str(file_path.relative_to(self.repo_path))] = []
 
         return artifact_map
 
     def _link_feature_to_specs(
-        self, feature: Feature, repo_path: Path, impl_files: list[Path], test_files: list[Path]
+        self, feature: Feature, repo_path: Path, impl_index: FileNameIndex, test_index: FileNameIndex
     ) -> None:
         """
         Link a single feature to matching files (thread-safe helper).
@@ -80,67 +167,77 @@ class SourceArtifactScanner:
         Args:
             feature: Feature to link
             repo_path: Repository path
-            impl_files: Pre-collected implementation files
-            test_files: Pre-collected test files
+            impl_index: File-name index of implementation files
+            test_index: File-name index of test files
         """
         if feature.source_tracking is None:
             feature.source_tracking = SourceTracking()
 
-        # Try to match feature key/title to files
-        feature_key_lower = feature.key.lower()
-        feature_title_lower = feature.title.lower()
+        # Simple matching: feature key or a title word (> 3 chars) appears in the filename
+        fragments = [feature.key.lower(), *(word for word in feature.title.lower().split() if len(word) > 3)]
 
         # Search for matching implementation files
-        for file_path in impl_files:
-            if self._is_implementation_file(file_path):
-                file_name_lower = file_path.stem.lower()
-                # Simple matching: check if feature key or title appears in filename
-                if feature_key_lower in file_name_lower or any(
-                    word in file_name_lower for word in feature_title_lower.split() if len(word) > 3
-                ):
-                    rel_path = str(file_path.relative_to(repo_path))
-                    if rel_path not in feature.source_tracking.implementation_files:
-                        feature.source_tracking.implementation_files.append(rel_path)
-                    # Compute and store hash
-                    feature.source_tracking.update_hash(file_path)
+        for file_path in impl_index.search(fragments):
+            rel_path = str(file_path.relative_to(repo_path))
+            if rel_path not in feature.source_tracking.implementation_files:
+                feature.source_tracking.implementation_files.append(rel_path)
+            # Store hash (computed once per file per run)
+            self._track_hash(feature.source_tracking, file_path)
 
         # Search for matching test files
-        for file_path in test_files:
-            if self._is_test_file(file_path):
-                file_name_lower = file_path.stem.lower()
-                # Match test files to features
-                if feature_key_lower in file_name_lower or any(
-                    word in file_name_lower for word in feature_title_lower.split() if len(word) > 3
-                ):
-                    rel_path = str(file_path.relative_to(repo_path))
-                    if rel_path not in feature.source_tracking.test_files:
-                        feature.source_tracking.test_files.append(rel_path)
-                    # Compute and store hash
-                    feature.source_tracking.update_hash(file_path)
-
-        # Extract function mappings for stories
-        for story in feature.stories:
-            for impl_file in feature.source_tracking.implementation_files:
-                file_path = repo_path / impl_file
-                if file_path.exists():
-                    functions = self.extract_function_mappings(file_path)
-                    for func_name in functions:
-                        func_mapping = f"{impl_file}::{func_name}"
-                        if func_mapping not in story.source_functions:
-                            story.source_functions.append(func_mapping)
-
-            for test_file in feature.source_tracking.test_files:
-                file_path = repo_path / test_file
-                if file_path.exists():
-                    test_functions = self.extract_test_mappings(file_path)
-                    for test_func_name in test_functions:
-                        test_mapping = f"{test_file}::{test_func_name}"
-                        if test_mapping not in story.test_functions:
-                            story.test_functions.append(test_mapping)
+        for file_path in test_index.search(fragments):
+            rel_path = str(file_path.relative_to(repo_path))
+            if rel_path not in feature.source_tracking.test_files:
+                feature.source_tracking.test_files.append(rel_path)
+            self._track_hash(feature.source_tracking, file_path)
+
+        # Extract function mappings for stories (function lists are extracted once per file)
+        if feature.stories:
+            source_functions = [
+                f"{impl_file}::{func_name}"
+                for impl_file in feature.source_tracking.implementation_files
+                for func_name in self._memoized(
+                    self._function_names, repo_path / impl_file, self.extract_function_mappings
+                )
+            ]
+            test_functions = [
+                f"{test_file}::{test_func_name}"
+                for test_file in feature.source_tracking.test_files
+                for test_func_name in self._memoized(
+                    self._test_function_names, repo_path / test_file, self.extract_test_mappings
+                )
+            ]
+            for story in feature.stories:
+                _extend_unique(story.source_functions, source_functions)
+                _extend_unique(story.test_functions, test_functions)
 
         # Update sync timestamp
         feature.source_tracking.update_sync_timestamp()
 
+    def _track_hash(self, source_tracking: SourceTracking, file_path: Path) -> None:
+        """Store a file's hash in source tracking, hashing each file at most once per run."""
+        if not file_path.exists():
+            source_tracking.update_hash(file_path, self.repo_path)
+            return
+        source_tracking.file_hashes[source_tracking.path_key(file_path, self.repo_path)] = self._memoized(
+            self._file_hashes, file_path, source_tracking.compute_hash
+        )
+
+    def _memoized(self, memo: dict[Path, Any], file_path: Path, compute: Callable[[Path], Any]) -> Any:
+        """Compute a per-file value once per run, even when several features need it concurrently."""
+        with self._memo_lock:
+            if file_path in memo:
+                return memo[file_path]
+            file_lock = self._file_locks.setdefault(file_path, threading.Lock())
+        with file_lock:
+            with self._memo_lock:
+                if file_path in memo:
+                    return memo[file_path]
+            value = compute(file_path)
+            with self._memo_lock:
+                memo[file_path] = value
+        return value
+
     @beartype
     @require(lambda self, features: isinstance(features, list), "Features must be list")
     @require(lambda self, features: all(isinstance(f, Feature) for f in features), "All items must be Feature")
@@ -159,18 +256,28 @@ class SourceArtifactScanner:
         if not features:
             return
 
-        # Pre-collect all files once (avoid repeated glob operations)
+        # Pre-collect all files once (shared, pruned repository walk)
         impl_files: list[Path] = []
-        for pattern in ["src/**/*.py", "lib/**/*.py", "app/**/*.py"]:
-            impl_files.extend(repo_path.glob(pattern))
-
         test_files: list[Path] = []
-        for pattern in ["tests/**/*.py", "test/**/*.py", "**/test_*.py", "**/*_test.py"]:
-            test_files.extend(repo_path.glob(pattern))
-
-        # Remove duplicates
-        impl_files = list(set(impl_files))
-        test_files = list(set(test_files))
+        for file_path in list_python_files(repo_path):
+            rel_parts = file_path.relative_to(repo_path).parts
+            if rel_parts[0] in IMPLEMENTATION_ROOTS:
+                impl_files.append(file_path)
+            if (
+                rel_parts[0] in ("tests", "test")
+                or file_path.name.startswith("test_")
+                or file_path.stem.endswith("_test")
+            ):
+                test_files.append(file_path)
+
+        # Index file names once; each feature then does lookups instead of scanning all files
+        impl_index = FileNameIndex([f for f in impl_files if self._is_implementation_file(f)])
+        test_index = FileNameIndex([f for f in test_files if self._is_test_file(f)])
+        with self._memo_lock:
+            self._file_hashes.clear()
+            self._function_names.clear()
+            self._test_function_names.clear()
+            self._file_locks.clear()
 
         # Process features in parallel
         # In test mode, use fewer workers to avoid resource contention
@@ -185,7 +292,7 @@ class SourceArtifactScanner:
         wait_on_shutdown = os.environ.get("TEST_MODE") != "true"
         try:
             future_to_feature = {
-                executor.submit(self._link_feature_to_specs, feature, repo_path, impl_files, test_files): feature
+                executor.submit(self._link_feature_to_specs, feature, repo_path, impl_index, test_index): feature
                 for feature in features
             }
             try:
@@ -235,8 +342,7 @@ class SourceArtifactScanner:
             return []
 
         try:
-            with file_path.open(encoding="utf-8") as f:
-                tree = ast.parse(f.read(), filename=str(file_path))
+            tree = get_parsed_module_cache().get_tree(file_path)
 
             functions: list[str] = []
             for node in ast.walk(tree):
@@ -265,8 +371,7 @@ class SourceArtifactScanner:
             return []
 
         try:
-            with test_file.open(encoding="utf-8") as f:
-                tree = ast.parse(f.read(), filename=str(test_file))
+            tree = get_parsed_module_cache().get_tree(test_file)
 
             test_functions: list[str] = []
             for node in ast.walk(tree):
@@ -313,3 +418,12 @@ class SourceArtifactScanner:
         # Check directory patterns
         test_dirs = {"tests", "test", "spec"}
         return any(part in test_dirs for part in file_path.parts)
+
+
+def _extend_unique(target: list[str], values: list[str]) -> None:
+    """Append values not already in target, preserving order."""
+    seen = set(target)
+    for value in values:
+        if value not in seen:
+            target.append(value)
+            seen.add(value)
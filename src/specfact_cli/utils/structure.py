@@ -37,8 +37,10 @@ class SpecFactStructure:
     REPORTS_COMPARISON = f"{ROOT}/reports/comparison"
     REPORTS_ENFORCEMENT = f"{ROOT}/reports/enforcement"
     REPORTS_ENRICHMENT = f"{ROOT}/reports/enrichment"
+    REPORTS_PROFILE = f"{ROOT}/reports/profile"
     GATES_RESULTS = f"{ROOT}/gates/results"
     CACHE = f"{ROOT}/cache"
+    REGISTRY = f"{ROOT}/registry"  # Workspace bundle registry (see utils/bundle_registry.py)
     SDD = f"{ROOT}/sdd"  # SDD manifests (one per project bundle)
     TASKS = f"{ROOT}/tasks"  # Task breakdowns (one per project bundle)
     CONFIG = f"{ROOT}/config"  # Global configuration (bridge.yaml, etc.)
@@ -135,8 +137,10 @@ class SpecFactStructure:
     @classmethod
     @beartype
     @require(
-        lambda report_type: isinstance(report_type, str) and report_type in ("brownfield", "comparison", "enforcement"),
-        "Report type must be brownfield/comparison/enforcement",
+        lambda report_type: (
+            isinstance(report_type, str) and report_type in ("brownfield", "comparison", "enforcement", "profile")
+        ),
+        "Report type must be brownfield/comparison/enforcement/profile",
     )
     @require(lambda base_path: base_path is None or isinstance(base_path, Path), "Base path must be None or Path")
     @require(lambda extension: isinstance(extension, str) and len(extension) > 0, "Extension must be non-empty string")
@@ -148,7 +152,7 @@ class SpecFactStructure:
         Get a timestamped report path.
 
         Args:
-            report_type: Type of report (brownfield, comparison, enforcement)
+            report_type: Type of report (brownfield, comparison, enforcement, profile)
             base_path: Base directory (default: current directory)
             extension: File extension (default: md)
 
@@ -167,6 +171,8 @@ class SpecFactStructure:
             directory = base_path / cls.REPORTS_COMPARISON
         elif report_type == "enforcement":
             directory = base_path / cls.REPORTS_ENFORCEMENT
+        elif report_type == "profile":
+            directory = base_path / cls.REPORTS_PROFILE
         else:
             raise ValueError(f"Unknown report type: {report_type}")
 
@@ -350,13 +356,20 @@ class SpecFactStructure:
         """
         List all available project bundles with metadata.
 
+        Metadata is read from the workspace bundle registry (`.specfact/registry/`);
+        only bundles whose manifest changed since they were last listed are read again.
+        The reported 'size' is refreshed with the manifest too: after editing feature files
+        by hand (without saving the bundle, which rewrites the manifest), it stays the size
+        of the last save until the manifest changes.
+
         Args:
             base_path: Base directory (default: current directory)
             max_files: Maximum number of bundles to process (for performance with many bundles).
                       If None, processes all bundles. If specified, processes most recent bundles first.
 
         Returns:
-            List of bundle dictionaries with 'name', 'path', 'features', 'stories', 'size', 'modified' keys
+            List of bundle dictionaries with 'name', 'path', 'features', 'stories', 'size', 'modified',
+            'active', 'content_hash', 'stage' and 'sdd_hash' keys
 
         Examples:
             >>> plans = SpecFactStructure.list_plans()
@@ -371,8 +384,6 @@ class SpecFactStructure:
         if not projects_dir.exists():
             return []
 
-        from datetime import datetime
-
         import yaml
 
         plans = []
@@ -389,84 +400,40 @@ class SpecFactStructure:
             except Exception:
                 pass
 
-        # Find all project bundle directories
-        bundle_dirs = [d for d in projects_dir.iterdir() if d.is_dir() and (d / "bundle.manifest.yaml").exists()]
-        bundle_dirs_sorted = sorted(
-            bundle_dirs, key=lambda d: (d / "bundle.manifest.yaml").stat().st_mtime, reverse=False
-        )
+        # Find all project bundle directories (one stat per manifest, oldest first)
+        manifest_mtimes = {
+            d: (d / "bundle.manifest.yaml").stat().st_mtime
+            for d in projects_dir.iterdir()
+            if d.is_dir() and (d / "bundle.manifest.yaml").exists()
+        }
+        bundle_dirs = list(manifest_mtimes)
+        bundle_dirs_sorted = sorted(bundle_dirs, key=lambda d: manifest_mtimes[d])
 
         # If max_files specified, only process the most recent N bundles (for performance)
         if max_files is not None and max_files > 0:
-            # Take most recent bundles (reverse sort, take last N, then reverse back)
-            bundle_dirs_sorted = sorted(
-                bundle_dirs, key=lambda d: (d / "bundle.manifest.yaml").stat().st_mtime, reverse=True
-            )[:max_files]
-            bundle_dirs_sorted = sorted(
-                bundle_dirs_sorted, key=lambda d: (d / "bundle.manifest.yaml").stat().st_mtime, reverse=False
-            )
-
-        for bundle_dir in bundle_dirs_sorted:
-            bundle_name = bundle_dir.name
-            manifest_path = bundle_dir / "bundle.manifest.yaml"
+            bundle_dirs_sorted = bundle_dirs_sorted[-max_files:]
 
-            # Declare plan_info once before try/except
-            plan_info: dict[str, str | int | None]
-
-            try:
-                # Read only the manifest file (much faster than loading full bundle)
-                from specfact_cli.models.project import BundleManifest
-                from specfact_cli.utils.structured_io import load_structured_file
-
-                manifest_data = load_structured_file(manifest_path)
-                manifest = BundleManifest.model_validate(manifest_data)
-
-                # Get modification time from manifest file
-                manifest_mtime = manifest_path.stat().st_mtime
-
-                # Calculate total size of bundle directory
-                total_size = sum(f.stat().st_size for f in bundle_dir.rglob("*") if f.is_file())
-
-                # Get features and stories count from manifest.features index
-                features_count = len(manifest.features) if manifest.features else 0
-                stories_count = sum(f.stories_count for f in manifest.features) if manifest.features else 0
-
-                # Get stage from manifest.bundle dict (if available) or default to "draft"
-                stage = manifest.bundle.get("stage", "draft") if manifest.bundle else "draft"
-
-                # Get content hash from manifest versions (use project version as hash identifier)
-                content_hash = manifest.versions.project if manifest.versions else None
-
-                plan_info = {
-                    "name": bundle_name,
-                    "path": str(bundle_dir.relative_to(base_path)),
-                    "features": features_count,
-                    "stories": stories_count,
-                    "size": total_size,
-                    "modified": datetime.fromtimestamp(manifest_mtime).isoformat(),
-                    "active": bundle_name == active_plan,
-                    "content_hash": content_hash,
-                    "stage": stage,
-                }
-            except Exception:
-                # Fallback: minimal info if manifest can't be loaded
-                manifest_mtime = manifest_path.stat().st_mtime if manifest_path.exists() else 0
-                total_size = sum(f.stat().st_size for f in bundle_dir.rglob("*") if f.is_file())
-
-                plan_info = {
-                    "name": bundle_name,
-                    "path": str(bundle_dir.relative_to(base_path)),
-                    "features": 0,
-                    "stories": 0,
-                    "size": total_size,
-                    "modified": datetime.fromtimestamp(manifest_mtime).isoformat()
-                    if manifest_mtime > 0
-                    else datetime.now().isoformat(),
-                    "active": bundle_name == active_plan,
-                    "content_hash": None,
-                    "stage": "unknown",
-                }
+        # Bundle metadata comes from the workspace registry; only changed manifests are read again
+        from specfact_cli.utils.bundle_registry import BundleRegistry
 
+        registry = BundleRegistry(base_path)
+        registry.retain_bundles({d.name for d in bundle_dirs})
+        for bundle_dir in bundle_dirs_sorted:
+            record = registry.bundle(bundle_dir)
+            plan_info: dict[str, str | int | None] = {
+                "name": record.name,
+                "path": str(bundle_dir.relative_to(base_path)),
+                "features": record.features,
+                "stories": record.stories,
+                "size": record.size,
+                "modified": record.modified,
+                "active": record.name == active_plan,
+                "content_hash": record.content_hash,
+                "stage": record.stage,
+                "sdd_hash": record.sdd_hash,
+            }
             plans.append(plan_info)
+        registry.save()
 
         return plans
 
@@ -898,6 +865,8 @@ class SpecFactStructure:
         gitignore_content = """# SpecFact ephemeral artifacts (not versioned)
 reports/
 cache/
+registry/
+projects/*/bundle.snapshot.bin
 
 # Keep these versioned
 !projects/
@@ -1067,7 +1036,7 @@ specfact import from-code --repo .
         if path.is_file() and path.suffix in [".yaml", ".yml", ".json"]:
             # Check if it's a monolithic bundle
             try:
-                data = load_structured_file(path)
+                data = load_structured_file(path, round_trip=False)
                 if isinstance(data, dict):
                     # Monolithic bundle has all aspects in one file
                     if "idea" in data and "product" in data and "features" in data:
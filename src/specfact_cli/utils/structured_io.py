@@ -2,6 +2,11 @@
 Structured data I/O utilities for SpecFact CLI.
 
 Provides helpers to load and dump JSON/YAML consistently with format detection.
+
+YAML is read and written with ruamel.yaml's round-trip mode by default, which
+preserves comments, key order and quoting. Callers that only read data (e.g. to
+validate it into models) or write generated output pass `round_trip=False` to use
+the much faster PyYAML path (libyaml C extension when available).
 """
 
 import json
@@ -13,7 +18,7 @@ from typing import Any, Optional
 from beartype import beartype
 from icontract import ensure, require
 
-from specfact_cli.utils.yaml_utils import YAMLUtils
+from specfact_cli.utils.yaml_utils import YAMLUtils, dump_yaml_fast, load_yaml_fast
 
 
 class StructuredFormat(str, Enum):
@@ -77,10 +82,6 @@ def _get_yaml_instance() -> YAMLUtils:
     return _thread_local.yaml
 
 
-# Module-level instance for backward compatibility (single-threaded use)
-_yaml = YAMLUtils()
-
-
 @beartype
 def structured_extension(format: StructuredFormat) -> str:
     """Return canonical file extension for structured format."""
@@ -90,13 +91,16 @@ def structured_extension(format: StructuredFormat) -> str:
 @beartype
 @require(lambda file_path: isinstance(file_path, (Path, str)), "File path must be Path or str")
 @ensure(lambda result: result is not None, "Must return parsed content")
-def load_structured_file(file_path: Path | str, format: StructuredFormat | None = None) -> Any:
+def load_structured_file(file_path: Path | str, format: StructuredFormat | None = None, round_trip: bool = True) -> Any:
     """
     Load structured data (JSON or YAML) from file.
 
     Args:
         file_path: Path to file
         format: Optional explicit format. Auto-detected from suffix when omitted.
+        round_trip: Load YAML with ruamel.yaml's round-trip loader (comments and formatting
+            kept for writing the data back). Pass False when the data is only read to use
+            the fast loader, which returns plain dicts and lists.
     """
     path = Path(file_path)
     # Check if path is a directory (should not happen, but handle gracefully)
@@ -107,6 +111,8 @@ def load_structured_file(file_path: Path | str, format: StructuredFormat | None
     if fmt == StructuredFormat.JSON:
         with path.open("r", encoding="utf-8") as handle:
             return json.load(handle)
+    if not round_trip:
+        return load_yaml_fast(path)
     # Use thread-local YAML instance for thread-safety (though loading is less critical)
     yaml_instance = _get_yaml_instance()
     return yaml_instance.load(path)
@@ -114,7 +120,9 @@ def load_structured_file(file_path: Path | str, format: StructuredFormat | None
 
 @beartype
 @require(lambda file_path: isinstance(file_path, (Path, str)), "File path must be Path or str")
-def dump_structured_file(data: Any, file_path: Path | str, format: StructuredFormat | None = None) -> None:
+def dump_structured_file(
+    data: Any, file_path: Path | str, format: StructuredFormat | None = None, round_trip: bool = True
+) -> None:
     """
     Dump structured data (JSON or YAML) to file.
 
@@ -124,6 +132,8 @@ def dump_structured_file(data: Any, file_path: Path | str, format: StructuredFor
         data: Serializable payload
         file_path: Destination path
         format: Optional explicit format (auto-detect by suffix when omitted)
+        round_trip: Dump YAML with ruamel.yaml (stable formatting for files that are edited
+            and diffed). Pass False for generated output to use the fast dumper.
     """
     path = Path(file_path)
     fmt = format or StructuredFormat.from_path(path)
@@ -131,6 +141,8 @@ def dump_structured_file(data: Any, file_path: Path | str, format: StructuredFor
 
     if fmt == StructuredFormat.JSON:
         path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    elif not round_trip:
+        path.write_text(dump_yaml_fast(data), encoding="utf-8")
     else:
         # Use thread-local YAML instance for thread-safety
         # ruamel.yaml.YAML() is not thread-safe when used from multiple threads
@@ -140,10 +152,12 @@ def dump_structured_file(data: Any, file_path: Path | str, format: StructuredFor
 
 @beartype
 @ensure(lambda result: isinstance(result, str), "Must return string output")
-def dumps_structured_data(data: Any, format: StructuredFormat) -> str:
-    """Serialize data to string for the requested structured format."""
+def dumps_structured_data(data: Any, format: StructuredFormat, round_trip: bool = True) -> str:
+    """Serialize data to string for the requested structured format (fast YAML dumper unless round_trip)."""
     if format == StructuredFormat.JSON:
         return json.dumps(data, indent=2)
+    if not round_trip:
+        return dump_yaml_fast(data)
     # Use thread-local YAML instance for thread-safety
     yaml_instance = _get_yaml_instance()
     return yaml_instance.dump_string(data)
@@ -152,10 +166,12 @@ def dumps_structured_data(data: Any, format: StructuredFormat) -> str:
 @beartype
 @require(lambda payload: isinstance(payload, str), "Payload must be string")
 @ensure(lambda result: result is not None, "Must return parsed content")
-def loads_structured_data(payload: str, format: StructuredFormat) -> Any:
-    """Deserialize structured payload string."""
+def loads_structured_data(payload: str, format: StructuredFormat, round_trip: bool = True) -> Any:
+    """Deserialize structured payload string (fast YAML loader unless round_trip)."""
     if format == StructuredFormat.JSON:
         return json.loads(payload)
+    if not round_trip:
+        return load_yaml_fast(payload)
     # Use thread-local YAML instance for thread-safety
     yaml_instance = _get_yaml_instance()
     return yaml_instance.load_string(payload)
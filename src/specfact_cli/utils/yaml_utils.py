@@ -2,19 +2,39 @@
 YAML utilities.
 
 This module provides helpers for YAML parsing and serialization.
+
+Two paths are available:
+
+- `YAMLUtils` (ruamel.yaml round-trip): preserves comments, key order and quoting,
+  for files that are edited and written back.
+- `load_yaml_fast` / `dump_yaml_fast` (PyYAML, libyaml C extension when available):
+  several times faster, returns plain Python objects and keeps no formatting, for
+  files that are only read (e.g. loading bundles into models).
 """
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import Any
 
+import yaml
 from beartype import beartype
 from icontract import ensure, require
 from ruamel.yaml import YAML
 from ruamel.yaml.scalarstring import DoubleQuotedScalarString
 
 
+try:
+    from yaml import CSafeDumper as _SafeDumperBase, CSafeLoader as _SafeLoaderBase
+
+    LIBYAML_AVAILABLE = True
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumperBase, SafeLoader as _SafeLoaderBase
+
+    LIBYAML_AVAILABLE = False
+
+
 class YAMLUtils:
     """Helper class for YAML operations."""
 
@@ -171,6 +191,91 @@ class YAMLUtils:
         return result
 
 
+class FastYAMLLoader(_SafeLoaderBase):  # type: ignore[misc,valid-type]
+    """
+    Safe loader (libyaml when available) that resolves plain scalars like the round-trip loader.
+
+    PyYAML implements YAML 1.1, where `yes`/`no`/`on`/`off` are booleans, `0123` is
+    octal and `12:30` is a base-60 integer; ruamel.yaml implements YAML 1.2, where
+    they are a string, 123 and a string. The YAML 1.1 int, float and bool
+    resolvers are replaced by the YAML 1.2 ones so both paths load the same values.
+    """
+
+    yaml_implicit_resolvers = {
+        first: [
+            (tag, regexp)
+            for tag, regexp in resolvers
+            if tag
+            not in (
+                "tag:yaml.org,2002:bool",
+                "tag:yaml.org,2002:int",
+                "tag:yaml.org,2002:float",
+                "tag:yaml.org,2002:value",
+            )
+        ]
+        for first, resolvers in _SafeLoaderBase.yaml_implicit_resolvers.items()
+    }
+
+    def construct_yaml_int(self, node: yaml.ScalarNode) -> int:
+        """Construct YAML 1.2 integers (decimal with optional leading zeros, 0b, 0o and 0x)."""
+        value = str(self.construct_scalar(node)).replace("_", "")
+        sign = -1 if value.startswith("-") else 1
+        value = value.lstrip("+-")
+        prefix = value[:2].lower()
+        if prefix == "0b":
+            return sign * int(value[2:], 2)
+        if prefix == "0o":
+            return sign * int(value[2:], 8)
+        if prefix == "0x":
+            return sign * int(value[2:], 16)
+        return sign * int(value)
+
+
+FastYAMLLoader.add_implicit_resolver(
+    "tag:yaml.org,2002:bool", re.compile(r"^(?:true|True|TRUE|false|False|FALSE)$"), list("tTfF")
+)
+FastYAMLLoader.add_implicit_resolver(
+    "tag:yaml.org,2002:int",
+    re.compile(r"^(?:[-+]?0b[0-1_]+|[-+]?0o?[0-7_]+|[-+]?[0-9_]+|[-+]?0x[0-9a-fA-F_]+)$"),
+    list("-+0123456789"),
+)
+FastYAMLLoader.add_implicit_resolver(
+    "tag:yaml.org,2002:float",
+    re.compile(
+        r"""^(?:[-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+        |[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)
+        |[-+]?\.[0-9_]+(?:[eE][-+]?[0-9]+)?
+        |[-+]?\.(?:inf|Inf|INF)
+        |\.(?:nan|NaN|NAN))$""",
+        re.X,
+    ),
+    list("-+0123456789."),
+)
+FastYAMLLoader.add_constructor("tag:yaml.org,2002:int", FastYAMLLoader.construct_yaml_int)
+
+
+class FastYAMLDumper(_SafeDumperBase):  # type: ignore[misc,valid-type]
+    """
+    Safe dumper (libyaml when available) with the round-trip dumper's block style.
+
+    Strings that would load as another type (including YAML 1.1 booleans such as
+    `yes`) are quoted, None is written as an empty value, and subclasses of the
+    basic types (e.g. str-based enums) are written as their base type.
+    """
+
+    def represent_none(self, data: None) -> yaml.ScalarNode:
+        """Write None as an empty value (`key:`) like ruamel.yaml."""
+        return self.represent_scalar("tag:yaml.org,2002:null", "")
+
+
+FastYAMLDumper.add_representer(type(None), FastYAMLDumper.represent_none)
+FastYAMLDumper.add_multi_representer(str, FastYAMLDumper.represent_str)
+FastYAMLDumper.add_multi_representer(int, FastYAMLDumper.represent_int)
+FastYAMLDumper.add_multi_representer(float, FastYAMLDumper.represent_float)
+FastYAMLDumper.add_multi_representer(dict, FastYAMLDumper.represent_dict)
+FastYAMLDumper.add_multi_representer(list, FastYAMLDumper.represent_list)
+
+
 # Convenience functions for quick operations
 
 
@@ -236,3 +341,49 @@ def string_to_yaml(yaml_string: str) -> Any:
     """
     utils = YAMLUtils()
     return utils.load_string(yaml_string)
+
+
+@beartype
+@require(lambda source: isinstance(source, (Path, str, bytes)), "Source must be Path, str or bytes")
+def load_yaml_fast(source: Path | str | bytes) -> Any:
+    """
+    Parse YAML without preserving formatting (PyYAML safe loader, libyaml when available).
+
+    Returns plain dicts, lists and scalars instead of ruamel.yaml's commented
+    containers, so use it only for data that is not written back.
+
+    Args:
+        source: Path to a YAML file, or YAML content as text or bytes
+
+    Returns:
+        Parsed YAML content (None for an empty document)
+
+    Raises:
+        FileNotFoundError: If source is a path that doesn't exist
+    """
+    if isinstance(source, Path):
+        if not source.exists():
+            raise FileNotFoundError(f"YAML file not found: {source}")
+        # libyaml decodes bytes itself (UTF-8/UTF-16 with BOM detection), which is faster than text mode
+        with source.open("rb") as handle:
+            return yaml.load(handle, Loader=FastYAMLLoader)
+    return yaml.load(source, Loader=FastYAMLLoader)
+
+
+@beartype
+@ensure(lambda result: isinstance(result, str), "Must return string")
+def dump_yaml_fast(data: Any) -> str:
+    """
+    Serialize plain data to YAML without round-trip support (PyYAML safe dumper, libyaml when available).
+
+    Keys keep insertion order and the block style matches `YAMLUtils`, but long
+    scalars may wrap differently, so use it for generated output that is not
+    diffed against a round-trip dump.
+
+    Args:
+        data: Data to serialize (dicts, lists, scalars)
+
+    Returns:
+        YAML string
+    """
+    return yaml.dump(data, Dumper=FastYAMLDumper, sort_keys=False, default_flow_style=False, allow_unicode=True)
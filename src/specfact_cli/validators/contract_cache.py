@@ -0,0 +1,282 @@
+"""
+Content-addressed result cache for contract validation.
+
+`specfact spec validate` (Specmatic) and `specfact contract validate` (built-in
+OpenAPI schema checks) validate every contract of a bundle, although most
+contract files do not change between runs. A validation result is
+replayed from the cache when nothing it depends on changed:
+
+- the contract's content hash (SHA-256), including the files it references
+  with relative `$ref`s (transitively) and its Specmatic examples directory
+  (`<name>_examples/` next to the contract)
+- the same for the previous version (backward compatibility checks)
+- the validator and its version (`specmatic --version`, or the SpecFact version
+  and rules version for the built-in OpenAPI checks)
+
+Entries live under `.specfact/cache/contracts/` and are evicted least recently
+used first once the directory exceeds its size limit. Results of runs that did
+not complete (timeouts, Specmatic errors) are not cached. `--force` bypasses the
+cache.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote
+
+from beartype import beartype
+from icontract import require
+
+from specfact_cli import __version__
+from specfact_cli.utils.analysis_cache import AnalysisCacheStats, PruneResult, prune_cache_dir
+from specfact_cli.validators.openapi_validator import OPENAPI_VALIDATOR_RULES_VERSION
+
+
+# Bump when the entry layout or the key material changes
+CONTRACT_CACHE_FORMAT_VERSION = "2"
+
+# Size limit of the result cache (bytes); least recently used entries are evicted first
+DEFAULT_MAX_CONTRACT_CACHE_BYTES = 32 * 1024 * 1024
+
+# Validator names (part of the cache key)
+SPECMATIC_VALIDATOR = "specmatic"
+OPENAPI_SCHEMA_VALIDATOR = "openapi-schema"
+
+# Version of the built-in OpenAPI schema checks
+OPENAPI_SCHEMA_VALIDATOR_VERSION = f"{__version__}+rules{OPENAPI_VALIDATOR_RULES_VERSION}"
+
+# `$ref` values of a JSON or YAML document (found without parsing it; captures the file part)
+_REF_PATTERN = re.compile(rb"""\$ref["']?\s*:\s*["']?([^"'\s#,}]*)""")
+
+
+@dataclass
+class CachedContractResult:
+    """A validation result replayed from the cache."""
+
+    result: dict[str, Any]
+    cached_at: str
+
+
+class ContractValidationCache:
+    """
+    Result cache for contract validation, keyed by contract content, previous version and validator.
+
+    Entries are content-addressed: a renamed or copied contract with the same
+    content (and the same referenced files and examples) reuses the result.
+    """
+
+    SUBDIR = "contracts"
+
+    @beartype
+    @require(lambda repo_path: isinstance(repo_path, Path), "Repo path must be Path")
+    @require(lambda max_bytes: max_bytes >= 0, "Max bytes must be non-negative")
+    def __init__(
+        self,
+        repo_path: Path,
+        cache_dir: Path | None = None,
+        max_bytes: int = DEFAULT_MAX_CONTRACT_CACHE_BYTES,
+    ) -> None:
+        """
+        Initialize result cache.
+
+        Args:
+            repo_path: Repository root
+            cache_dir: Override cache directory (default: .specfact/cache/contracts)
+            max_bytes: Size limit applied by `prune()`
+        """
+        from specfact_cli.utils.structure import SpecFactStructure
+
+        self.repo_path = repo_path.resolve()
+        self.cache_dir = cache_dir or (self.repo_path / SpecFactStructure.CACHE / self.SUBDIR)
+        self.max_bytes = max_bytes
+        self._stats = AnalysisCacheStats()
+
+    @beartype
+    @require(lambda validator: len(validator) > 0, "Validator must be non-empty")
+    def get(
+        self,
+        validator: str,
+        validator_version: str,
+        contract_path: Path,
+        previous_path: Path | None = None,
+    ) -> CachedContractResult | None:
+        """
+        Look up a cached validation result.
+
+        Args:
+            validator: Validator name (e.g., SPECMATIC_VALIDATOR)
+            validator_version: Validator version
+            contract_path: Contract file
+            previous_path: Previous contract version (backward compatibility checks)
+
+        Returns:
+            CachedContractResult, or None on miss
+        """
+        entry_path = self._entry_path(validator, validator_version, contract_path, previous_path)
+        entry = self._read_entry(entry_path) if entry_path is not None else None
+        if entry is None:
+            self._stats.misses += 1
+            return None
+        self._stats.hits += 1
+        return CachedContractResult(result=entry["result"], cached_at=str(entry.get("cached_at", "unknown")))
+
+    @beartype
+    @require(lambda validator: len(validator) > 0, "Validator must be non-empty")
+    def put(
+        self,
+        validator: str,
+        validator_version: str,
+        contract_path: Path,
+        result: dict[str, Any],
+        previous_path: Path | None = None,
+    ) -> None:
+        """
+        Cache a validation result (atomically; failures are ignored).
+
+        Args:
+            validator: Validator name
+            validator_version: Validator version
+            contract_path: Contract file the result was computed from
+            result: JSON-serializable result
+            previous_path: Previous contract version (backward compatibility checks)
+        """
+        entry_path = self._entry_path(validator, validator_version, contract_path, previous_path)
+        if entry_path is None:
+            return
+        entry = {
+            "validator": validator,
+            "validator_version": validator_version,
+            "contract": self._display_path(contract_path),
+            "cached_at": datetime.now(UTC).isoformat(),
+            "result": result,
+        }
+        tmp_name: str | None = None
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(entry, handle, separators=(",", ":"))
+            os.replace(tmp_name, entry_path)
+            self._stats.writes += 1
+        except (OSError, TypeError, ValueError):
+            if tmp_name is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_name)
+
+    @beartype
+    def get_stats(self) -> AnalysisCacheStats:
+        """Get hit/miss counters for this run."""
+        return AnalysisCacheStats(hits=self._stats.hits, misses=self._stats.misses, writes=self._stats.writes)
+
+    @beartype
+    def prune(self) -> PruneResult:
+        """Evict least recently used entries until the cache fits in its size limit."""
+        return prune_cache_dir(self.cache_dir, self.max_bytes)
+
+    def _entry_path(
+        self, validator: str, validator_version: str, contract_path: Path, previous_path: Path | None
+    ) -> Path | None:
+        """Compute the entry path, or None if a contract file cannot be read."""
+        contract_digest = _contract_digest(contract_path)
+        previous_digest = _contract_digest(previous_path) if previous_path is not None else None
+        if contract_digest is None or (previous_path is not None and previous_digest is None):
+            return None
+        key_material = json.dumps(
+            [CONTRACT_CACHE_FORMAT_VERSION, validator, validator_version, contract_digest, previous_digest]
+        )
+        key = hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read_entry(self, entry_path: Path) -> dict[str, Any] | None:
+        """Read a cache entry and refresh its access time (None if missing or unreadable)."""
+        try:
+            entry = json.loads(entry_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or not isinstance(entry.get("result"), dict):
+            return None
+        # Refresh access time for LRU pruning
+        with contextlib.suppress(OSError):
+            os.utime(entry_path)
+        return entry
+
+    def _display_path(self, contract_path: Path) -> str:
+        """Repository-relative path of a contract (informational only, not part of the key)."""
+        try:
+            return contract_path.resolve().relative_to(self.repo_path).as_posix()
+        except ValueError:
+            return contract_path.as_posix()
+
+
+def _file_digest(file_path: Path) -> str | None:
+    """SHA-256 of a file's content, or None if it cannot be read."""
+    try:
+        return hashlib.sha256(file_path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _contract_digest(contract_path: Path) -> str | None:
+    """
+    SHA-256 over a contract and the files its validation depends on.
+
+    Covers relative files referenced by `$ref` (followed transitively; missing files are
+    recorded as missing) and the Specmatic examples directory next to the contract.
+    Remote (URL) references are not followed.
+
+    Args:
+        contract_path: Contract file
+
+    Returns:
+        Hex digest, or None if the contract cannot be read
+    """
+    root = contract_path.resolve()
+    try:
+        content = root.read_bytes()
+    except OSError:
+        return None
+    dependencies: dict[str, str | None] = {}
+    pending = [(root, content)]
+    seen = {root}
+    while pending:
+        current, current_content = pending.pop()
+        for match in _REF_PATTERN.finditer(current_content):
+            file_part = unquote(match.group(1).decode("utf-8", "replace"))
+            if not file_part or ":" in file_part:
+                continue  # Local JSON pointer or remote reference
+            ref_path = (current.parent / file_part).resolve()
+            if ref_path in seen:
+                continue
+            seen.add(ref_path)
+            try:
+                ref_content = ref_path.read_bytes()
+            except OSError:
+                dependencies[_relative_name(ref_path, root.parent)] = None
+                continue
+            dependencies[_relative_name(ref_path, root.parent)] = hashlib.sha256(ref_content).hexdigest()
+            pending.append((ref_path, ref_content))
+
+    examples_dir = root.parent / f"{root.stem}_examples"
+    if examples_dir.is_dir():
+        for example in examples_dir.rglob("*"):
+            if example.is_file():
+                dependencies[f"examples:{example.relative_to(examples_dir).as_posix()}"] = _file_digest(example)
+
+    hasher = hashlib.sha256(content)
+    for name in sorted(dependencies):
+        hasher.update(f"\0{name}\0{dependencies[name] or 'missing'}".encode())
+    return hasher.hexdigest()
+
+
+def _relative_name(path: Path, base_dir: Path) -> str:
+    """Path of a referenced file relative to the contract's directory (part of the key)."""
+    return Path(os.path.relpath(path, base_dir)).as_posix()
@@ -0,0 +1,293 @@
+"""
+Sharded CrossHair contract exploration with per-module result caching.
+
+`specfact repro` runs CrossHair once per module (a shard) instead of once over
+all targets, so a slow module only costs its own per-shard timeout. Shards run
+in parallel, each in its own CrossHair process, and their results are merged
+into a single check result.
+
+Pass/fail results are cached per module content hash and CrossHair
+configuration under `.specfact/cache/repro/crosshair/`, so runs after a small
+change only explore the touched modules. Cache entries depend on the module's
+own source only; run `specfact cache prune --all` to force a full exploration
+after changing code the modules import.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import time
+import tomllib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from beartype import beartype
+from icontract import ensure, require
+
+from specfact_cli.utils.analysis_cache import AnalysisCache
+from specfact_cli.utils.executors import ExecutorConfig, ExecutorKind, run_ordered
+from specfact_cli.validators.repro_checker import CheckResult, CheckStatus, _is_crosshair_signature_issue
+
+
+# Timeout per module (seconds); shards are also bounded by the check's overall timeout
+DEFAULT_SHARD_TIMEOUT = 60.0
+
+# Shard outcomes that are deterministic for a given module and configuration (timeouts are not cached)
+CACHEABLE_STATUSES = frozenset({CheckStatus.PASSED, CheckStatus.FAILED, CheckStatus.SKIPPED})
+
+
+@dataclass(frozen=True)
+class CrossHairShard:
+    """A single module explored by its own CrossHair process."""
+
+    module: str
+    file_path: Path
+
+
+@dataclass
+class ShardResult:
+    """Outcome of exploring one module."""
+
+    module: str
+    status: CheckStatus
+    output: str = ""
+    error: str = ""
+    duration: float = 0.0
+    cached: bool = False
+
+
+@beartype
+@require(lambda repo_path: isinstance(repo_path, Path), "Repository path must be Path")
+@ensure(lambda result: isinstance(result, dict), "Must return dict")
+def load_crosshair_config(repo_path: Path) -> dict[str, Any]:
+    """
+    Load the `[tool.crosshair]` section of the repository's pyproject.toml.
+
+    Args:
+        repo_path: Repository root
+
+    Returns:
+        CrossHair settings (empty if not configured or unreadable)
+    """
+    try:
+        with (repo_path / "pyproject.toml").open("rb") as handle:
+            data = tomllib.load(handle)
+    except (OSError, tomllib.TOMLDecodeError):
+        return {}
+    config = data.get("tool", {}).get("crosshair", {})
+    return config if isinstance(config, dict) else {}
+
+
+class CrossHairShardRunner:
+    """
+    Runs CrossHair per module in parallel and merges the results.
+    """
+
+    CACHE_KIND = "crosshair"
+
+    @beartype
+    @require(lambda base_command: len(base_command) > 0, "Base command must be non-empty")
+    @require(lambda shard_timeout: shard_timeout > 0, "Shard timeout must be positive")
+    @require(lambda workers: workers >= 1, "Workers must be >= 1")
+    def __init__(
+        self,
+        repo_path: Path,
+        base_command: list[str],
+        env: dict[str, str] | None = None,
+        shard_timeout: float = DEFAULT_SHARD_TIMEOUT,
+        workers: int = 1,
+        cache: AnalysisCache | None = None,
+    ) -> None:
+        """
+        Initialize shard runner.
+
+        Args:
+            repo_path: Repository root (working directory for CrossHair)
+            base_command: CrossHair command without targets (module names are appended)
+            env: Environment for the CrossHair processes (e.g., PYTHONPATH roots)
+            shard_timeout: Timeout per module in seconds
+            workers: Maximum CrossHair processes run at the same time
+            cache: Cache for per-module results (None disables caching)
+        """
+        self.repo_path = repo_path
+        self.base_command = base_command
+        self.env = env
+        self.shard_timeout = shard_timeout
+        self.workers = workers
+        self.cache = cache
+        self._cache_settings = {"command": base_command, "config": load_crosshair_config(repo_path)}
+        self._deadline: float | None = None
+
+    @classmethod
+    @beartype
+    def cache_for(cls, repo_path: Path) -> AnalysisCache:
+        """Create the per-module result cache for a repository (.specfact/cache/repro/crosshair)."""
+        from specfact_cli.utils.structure import SpecFactStructure
+
+        return AnalysisCache(repo_path, cache_dir=repo_path.resolve() / SpecFactStructure.CACHE / "repro" / "crosshair")
+
+    @beartype
+    @ensure(lambda result: isinstance(result, list), "Must return list")
+    def run(self, shards: list[CrossHairShard], timeout: float | None = None) -> list[ShardResult]:
+        """
+        Explore modules, serving unchanged modules from the cache.
+
+        Args:
+            shards: Modules to explore
+            timeout: Overall time limit in seconds (shards not finished by then time out)
+
+        Returns:
+            One result per shard, in input order
+        """
+        results: dict[str, ShardResult] = {}
+        pending: list[CrossHairShard] = []
+        for shard in shards:
+            cached = self.cache.get(self.CACHE_KIND, shard.file_path, self._cache_settings) if self.cache else None
+            try:
+                status = CheckStatus(cached["status"]) if cached is not None else None
+            except (KeyError, ValueError):
+                status = None
+            if cached is not None and status in CACHEABLE_STATUSES:
+                results[shard.module] = ShardResult(
+                    module=shard.module,
+                    status=status,
+                    output=str(cached.get("output", "")),
+                    error=str(cached.get("error", "")),
+                    cached=True,
+                )
+            else:
+                pending.append(shard)
+
+        self._deadline = time.monotonic() + timeout if timeout is not None else None
+        kind = ExecutorKind.SERIAL if self.workers == 1 else ExecutorKind.THREAD
+        for shard, shard_result, error in run_ordered(
+            self._run_shard, pending, ExecutorConfig(kind=kind, workers=self.workers)
+        ):
+            if error is not None or shard_result is None:
+                shard_result = ShardResult(
+                    module=shard.module, status=CheckStatus.FAILED, error=f"Shard failed with exception: {error!s}"
+                )
+            elif self.cache is not None and shard_result.status in CACHEABLE_STATUSES:
+                self.cache.put(
+                    self.CACHE_KIND,
+                    shard.file_path,
+                    {"status": shard_result.status.value, "output": shard_result.output, "error": shard_result.error},
+                    self._cache_settings,
+                )
+            results[shard.module] = shard_result
+
+        return [results[shard.module] for shard in shards]
+
+    @beartype
+    @require(lambda name: len(name) > 0, "Name must be non-empty")
+    @ensure(lambda result: isinstance(result, CheckResult), "Must return CheckResult")
+    def run_check(self, name: str, shards: list[CrossHairShard], timeout: float | None = None) -> CheckResult:
+        """
+        Explore modules and merge the shard results into one check result.
+
+        Args:
+            name: Check name
+            shards: Modules to explore
+            timeout: Overall time limit in seconds
+
+        Returns:
+            Merged CheckResult (output of all shards, for `_extract_crosshair_findings`)
+        """
+        return merge_shard_results(name, self.run(shards, timeout))
+
+    def _run_shard(self, shard: CrossHairShard) -> ShardResult:
+        """Explore one module in its own CrossHair process."""
+        shard_timeout = self.shard_timeout
+        if self._deadline is not None:
+            shard_timeout = min(shard_timeout, self._deadline - time.monotonic())
+            if shard_timeout <= 0:
+                return ShardResult(
+                    module=shard.module, status=CheckStatus.TIMEOUT, error="Not explored: check timeout reached"
+                )
+
+        start = time.time()
+        try:
+            proc = subprocess.run(
+                [*self.base_command, shard.module],
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+                timeout=shard_timeout,
+                check=False,
+                env=self.env,
+            )
+        except subprocess.TimeoutExpired:
+            return ShardResult(
+                module=shard.module,
+                status=CheckStatus.TIMEOUT,
+                error=f"Timed out after {shard_timeout:.1f}s",
+                duration=time.time() - start,
+            )
+
+        error = proc.stderr
+        if proc.returncode == 0:
+            status = CheckStatus.PASSED
+        elif _is_crosshair_signature_issue(proc.stdout, proc.stderr):
+            # Signature analysis limitation - treat as skipped, not failed
+            status = CheckStatus.SKIPPED
+            error = (
+                "CrossHair signature analysis limitation (non-blocking, runtime contracts valid): "
+                f"{proc.stderr[:200] if proc.stderr else 'signature analysis limitation'}"
+            )
+        else:
+            status = CheckStatus.FAILED
+        return ShardResult(
+            module=shard.module,
+            status=status,
+            output=proc.stdout,
+            error=error,
+            duration=time.time() - start,
+        )
+
+
+@beartype
+@require(lambda name: len(name) > 0, "Name must be non-empty")
+@ensure(lambda result: isinstance(result, CheckResult), "Must return CheckResult")
+def merge_shard_results(name: str, results: list[ShardResult]) -> CheckResult:
+    """
+    Merge per-module results into one CrossHair check result.
+
+    The check fails if any module failed, times out if any module timed out, and
+    passes if any module passed (modules skipped for signature limitations do not
+    count either way). Outputs are concatenated in module order, so counterexamples
+    from all shards appear in the check's findings.
+
+    Args:
+        name: Check name
+        results: Shard results
+
+    Returns:
+        Merged CheckResult
+    """
+    statuses = {result.status for result in results}
+    if CheckStatus.FAILED in statuses:
+        status = CheckStatus.FAILED
+    elif CheckStatus.TIMEOUT in statuses:
+        status = CheckStatus.TIMEOUT
+    elif CheckStatus.PASSED in statuses:
+        status = CheckStatus.PASSED
+    else:
+        status = CheckStatus.SKIPPED
+
+    output = "".join(
+        result.output if result.output.endswith("\n") else result.output + "\n" for result in results if result.output
+    )
+    cached_count = sum(1 for result in results if result.cached)
+    summary = f"CrossHair: {len(results)} modules ({cached_count} cached, {len(results) - cached_count} explored)"
+    error_lines = [summary]
+    for result in results:
+        if result.status in (CheckStatus.FAILED, CheckStatus.TIMEOUT, CheckStatus.SKIPPED) and result.error:
+            error_lines.append(f"{result.module} [{result.status.value}]: {result.error.strip()}")
+
+    merged = CheckResult(name=name, tool="crosshair", status=status, output=output, error="\n".join(error_lines))
+    if status == CheckStatus.TIMEOUT:
+        merged.timeout = True
+    elif status in (CheckStatus.PASSED, CheckStatus.FAILED):
+        merged.exit_code = 0 if status == CheckStatus.PASSED else 1
+    return merged
@@ -48,7 +48,7 @@ class FSMValidator:
 
         if protocol is None:
             # Load protocol from file
-            data = load_structured_file(protocol_path)  # type: ignore[arg-type]
+            data = load_structured_file(protocol_path, round_trip=False)  # type: ignore[arg-type]
             self.protocol = Protocol(**data)
         else:
             self.protocol = protocol
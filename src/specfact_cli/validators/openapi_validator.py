@@ -0,0 +1,537 @@
+"""
+In-process structural validation of OpenAPI 3.0/3.1 documents.
+
+`validate_openapi_schema` (models.contract) only checks the top-level fields, so
+structural mistakes used to surface late, from a Specmatic (JVM) run. This engine
+checks the structure defined by the OpenAPI 3.0 and 3.1 specifications in pure
+Python:
+
+- required fields and field types of the document, Info, Paths, Path Item,
+  Operation, Parameter, Request Body, Response and Components objects
+- `$ref`s resolve (local JSON pointers and relative files; resolution is memoised)
+- `operationId`s are unique and no two path templates are equivalent
+- parameter locations are valid, path parameters are required and match the path template
+- operations declare responses (required in 3.0) with valid status codes
+
+Issues carry the JSON pointer of the offending node. Schema Objects (JSON Schema)
+are checked for resolvable `$ref`s only; Specmatic covers the rest. `spec validate`,
+`contract validate` and bundle import run this as a pre-pass and call Specmatic only
+for contracts that pass.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote
+
+from beartype import beartype
+from icontract import ensure, require
+
+
+# Bump when the rules change (part of the contract validation cache key)
+OPENAPI_VALIDATOR_RULES_VERSION = "1"
+
+# Issues reported per document before validation stops
+DEFAULT_MAX_ISSUES = 100
+
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+PARAMETER_LOCATIONS = ("query", "header", "path", "cookie")
+COMPONENT_TYPES = (
+    "schemas",
+    "responses",
+    "parameters",
+    "examples",
+    "requestBodies",
+    "headers",
+    "securitySchemes",
+    "links",
+    "callbacks",
+    "pathItems",
+)
+
+_SUPPORTED_VERSION = re.compile(r"^3\.[01](\.\d+)?(-[\w.]+)?$")
+_STATUS_CODE = re.compile(r"^(default|[1-5](\d\d|XX))$")
+_COMPONENT_NAME = re.compile(r"^[a-zA-Z0-9._-]+$")
+_PATH_TEMPLATE = re.compile(r"\{([^{}/]+)\}")
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class OpenAPIIssue:
+    """A structural problem at a JSON pointer of the document."""
+
+    pointer: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.pointer or '/'}: {self.message}"
+
+
+@dataclass
+class OpenAPIValidationResult:
+    """Outcome of structural validation of one document."""
+
+    issues: list[OpenAPIIssue] = field(default_factory=list)
+    openapi_version: str | None = None
+    endpoints: int = 0
+    # More than max_issues issues were found (the rest are not listed)
+    truncated: bool = False
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the document has no structural issues."""
+        return not self.issues
+
+    @property
+    def errors(self) -> list[str]:
+        """Issues formatted as `<pointer>: <message>`."""
+        return [str(issue) for issue in self.issues]
+
+
+class RefResolutionError(ValueError):
+    """A `$ref` does not resolve."""
+
+
+class OpenAPIRefResolver:
+    """
+    Memoised `$ref` resolver for local JSON pointers and relative files.
+
+    Resolved targets (including failures) and loaded files are cached, so a `$ref`
+    shared by many operations is resolved once. Chains of `$ref`s are followed and
+    cycles reported. Remote (URL) references and named anchors cannot be checked
+    offline; `can_resolve()` tells them apart.
+    """
+
+    @beartype
+    def __init__(self, document: Any, base_path: Path | None = None) -> None:
+        """
+        Initialize resolver.
+
+        Args:
+            document: Parsed OpenAPI document
+            base_path: File the document was loaded from (needed for relative file references)
+        """
+        self.document = document
+        self.base_path = base_path.resolve() if base_path is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._documents: dict[Path, Any] = {}
+        self._resolved: dict[tuple[Path | None, str], tuple[Path | None, Any] | RefResolutionError] = {}
+
+    @beartype
+    def can_resolve(self, ref: str) -> bool:
+        """Whether a `$ref` can be checked offline (JSON pointers, relative files with a known base)."""
+        file_part, _, fragment = ref.partition("#")
+        if fragment and not fragment.startswith("/"):
+            return False  # Named anchor (3.1)
+        if not file_part:
+            return True
+        return self.base_path is not None and ":" not in file_part
+
+    @beartype
+    def resolve(self, ref: str, base: Path | None = None) -> tuple[Path | None, Any]:
+        """
+        Resolve a `$ref`, following chains of references.
+
+        Args:
+            ref: Reference (e.g., `#/components/schemas/User` or `common.yaml#/Error`)
+            base: File containing the reference (default: the document itself)
+
+        Returns:
+            Tuple of (file containing the target, or None for the document itself; target)
+
+        Raises:
+            RefResolutionError: If the reference (or a reference it points to) does not resolve
+        """
+        key = (base, ref)
+        cached = self._resolved.get(key)
+        if cached is not None:
+            self.hits += 1
+            if isinstance(cached, RefResolutionError):
+                raise cached
+            return cached
+        self.misses += 1
+        try:
+            resolved = self._resolve_chain(ref, base)
+        except RefResolutionError as e:
+            self._resolved[key] = e
+            raise
+        self._resolved[key] = resolved
+        return resolved
+
+    def _resolve_chain(self, ref: str, base: Path | None) -> tuple[Path | None, Any]:
+        seen: set[tuple[Path | None, str]] = set()
+        while True:
+            if (base, ref) in seen:
+                raise RefResolutionError(f"circular $ref chain through '{ref}'")
+            seen.add((base, ref))
+            base, target = self._resolve_once(ref, base)
+            next_ref = target.get("$ref") if isinstance(target, dict) else None
+            if not isinstance(next_ref, str) or not self.can_resolve(next_ref):
+                return base, target
+            ref = next_ref
+
+    def _resolve_once(self, ref: str, base: Path | None) -> tuple[Path | None, Any]:
+        file_part, _, fragment = ref.partition("#")
+        if file_part:
+            base = self._file_path(file_part, base)
+        document = self.document if base is None else self._load(base)
+        if fragment in ("", "/"):
+            return base, document
+        node = document
+        for raw_token in fragment.split("/")[1:]:
+            token = unquote(raw_token).replace("~1", "/").replace("~0", "~")
+            node = _child_node(node, token)
+            if node is _MISSING:
+                raise RefResolutionError(f"'{ref}' does not resolve ('{token}' not found)")
+        return base, node
+
+    def _file_path(self, file_part: str, base: Path | None) -> Path | None:
+        containing = base or self.base_path
+        if containing is None or ":" in file_part:
+            raise RefResolutionError(f"cannot resolve file reference '{file_part}' without the document's path")
+        path = (containing.parent / unquote(file_part)).resolve()
+        return None if path == self.base_path else path
+
+    def _load(self, path: Path) -> Any:
+        if path not in self._documents:
+            from specfact_cli.utils.structured_io import load_structured_file
+
+            try:
+                self._documents[path] = load_structured_file(path, round_trip=False)
+            except Exception as e:
+                raise RefResolutionError(f"cannot load referenced file '{path.name}': {e}") from e
+        return self._documents[path]
+
+
+class _DocumentValidator:
+    """Walks one document and collects structural issues."""
+
+    def __init__(self, resolver: OpenAPIRefResolver, max_issues: int) -> None:
+        self.resolver = resolver
+        self.max_issues = max_issues
+        self.result = OpenAPIValidationResult()
+        self.is_31 = False
+        self._operation_ids: dict[str, str] = {}
+
+    def add(self, pointer: str, message: str) -> None:
+        if len(self.result.issues) < self.max_issues:
+            self.result.issues.append(OpenAPIIssue(pointer, message))
+        else:
+            self.result.truncated = True
+
+    def deref(self, node: Any) -> Any:
+        """Resolve a Reference Object; None if it cannot be resolved (reported by `check_refs`)."""
+        if not isinstance(node, dict) or "$ref" not in node:
+            return node
+        ref = node["$ref"]
+        if not isinstance(ref, str) or not self.resolver.can_resolve(ref):
+            return None
+        try:
+            return self.resolver.resolve(ref)[1]
+        except RefResolutionError:
+            return None
+
+    def check_document(self, document: Any) -> None:
+        if not isinstance(document, dict):
+            self.add("", "document must be a mapping")
+            return
+        self.check_version(document)
+        self.check_info(document.get("info", _MISSING))
+        if "paths" in document:
+            self.check_paths(document["paths"])
+        elif not self.is_31:
+            self.add("", "missing required field 'paths'")
+        elif "components" not in document and "webhooks" not in document:
+            self.add("", "must contain 'paths', 'components' or 'webhooks'")
+        if "webhooks" in document:
+            self.check_webhooks(document["webhooks"])
+        if "components" in document:
+            self.check_components(document["components"])
+        self.check_refs(document)
+
+    def check_version(self, document: dict[str, Any]) -> None:
+        version = document.get("openapi", _MISSING)
+        if version is _MISSING:
+            if "swagger" in document:
+                self.add("/swagger", "Swagger 2.0 documents are not supported (OpenAPI 3.0.x or 3.1.x)")
+            else:
+                self.add("", "missing required field 'openapi'")
+        elif not isinstance(version, str):
+            self.add("/openapi", "must be a version string (quote it in YAML)")
+        elif not _SUPPORTED_VERSION.match(version):
+            self.add("/openapi", f"unsupported OpenAPI version '{version}' (3.0.x or 3.1.x)")
+        else:
+            self.result.openapi_version = version
+            self.is_31 = version.startswith("3.1")
+
+    def check_info(self, info: Any) -> None:
+        if info is _MISSING:
+            self.add("", "missing required field 'info'")
+            return
+        if not isinstance(info, dict):
+            self.add("/info", "must be a mapping")
+            return
+        for name in ("title", "version"):
+            if name not in info:
+                self.add("/info", f"missing required field '{name}'")
+        if "title" in info and not isinstance(info["title"], str):
+            self.add("/info/title", "must be a string")
+        # Unquoted YAML versions (1.0) load as numbers; tools accept them
+        if "version" in info and not isinstance(info["version"], (str, int, float)):
+            self.add("/info/version", "must be a string")
+
+    def check_paths(self, paths: Any) -> None:
+        if not isinstance(paths, dict):
+            self.add("/paths", "must be a mapping")
+            return
+        normalized: dict[str, str] = {}
+        for raw_template, item in paths.items():
+            template = str(raw_template)
+            if template.startswith("x-"):
+                continue
+            pointer = _pointer("/paths", template)
+            if not template.startswith("/"):
+                self.add(pointer, "path must start with '/'")
+            shape = _PATH_TEMPLATE.sub("{}", template)
+            if shape in normalized:
+                self.add(pointer, f"path is equivalent to '{normalized[shape]}'")
+            normalized.setdefault(shape, template)
+            self.check_path_item(item, pointer, template)
+
+    def check_webhooks(self, webhooks: Any) -> None:
+        if not isinstance(webhooks, dict):
+            self.add("/webhooks", "must be a mapping")
+            return
+        for name, item in webhooks.items():
+            self.check_path_item(item, _pointer("/webhooks", name), None)
+
+    def check_path_item(self, item: Any, pointer: str, template: str | None) -> None:
+        resolved = self.deref(item)
+        if resolved is None:
+            if item is None:
+                self.add(pointer, "path item must be a mapping")
+            return
+        if not isinstance(resolved, dict):
+            self.add(pointer, "path item must be a mapping")
+            return
+        shared = self.collect_parameters(resolved.get("parameters"), _pointer(pointer, "parameters"))
+        for method in HTTP_METHODS:
+            if method in resolved:
+                self.check_operation(resolved[method], _pointer(pointer, method), template, shared)
+
+    def collect_parameters(self, parameters: Any, pointer: str) -> dict[tuple[str, str], dict[str, Any]]:
+        """Check a parameter list; returns the parameters by (name, location)."""
+        if parameters is None:
+            return {}
+        if not isinstance(parameters, list):
+            self.add(pointer, "must be a list")
+            return {}
+        collected: dict[tuple[str, str], dict[str, Any]] = {}
+        for index, parameter in enumerate(parameters):
+            item_pointer = f"{pointer}/{index}"
+            resolved = self.deref(parameter)
+            if resolved is None:
+                continue
+            if not isinstance(resolved, dict):
+                self.add(item_pointer, "parameter must be a mapping")
+                continue
+            name = resolved.get("name")
+            location = resolved.get("in")
+            if not isinstance(name, str) or not name:
+                self.add(item_pointer, "missing required field 'name'")
+                continue
+            if location not in PARAMETER_LOCATIONS:
+                message = (
+                    f"parameter '{name}' has invalid location '{location}' (query, header, path or cookie)"
+                    if location is not None
+                    else f"parameter '{name}' is missing required field 'in'"
+                )
+                self.add(item_pointer, message)
+                continue
+            if location == "path" and resolved.get("required") is not True:
+                self.add(item_pointer, f"path parameter '{name}' must have 'required: true'")
+            if ("schema" in resolved) == ("content" in resolved):
+                self.add(item_pointer, f"parameter '{name}' must have either 'schema' or 'content'")
+            # Header names are case-insensitive
+            key = (name.lower() if location == "header" else name, location)
+            if key in collected:
+                self.add(item_pointer, f"duplicate parameter '{name}' in {location}")
+            collected[key] = resolved
+        return collected
+
+    def check_operation(
+        self,
+        operation: Any,
+        pointer: str,
+        template: str | None,
+        shared: dict[tuple[str, str], dict[str, Any]],
+    ) -> None:
+        self.result.endpoints += 1
+        if not isinstance(operation, dict):
+            self.add(pointer, "operation must be a mapping")
+            return
+        operation_id = operation.get("operationId")
+        if operation_id is not None:
+            if not isinstance(operation_id, str):
+                self.add(_pointer(pointer, "operationId"), "must be a string")
+            elif operation_id in self._operation_ids:
+                self.add(
+                    _pointer(pointer, "operationId"),
+                    f"duplicate operationId '{operation_id}' (also used by {self._operation_ids[operation_id]})",
+                )
+            else:
+                self._operation_ids[operation_id] = pointer
+
+        # Operation parameters override path-level parameters with the same name and location
+        parameters = {**shared, **self.collect_parameters(operation.get("parameters"), _pointer(pointer, "parameters"))}
+        if template is not None:
+            declared = {name for name, location in parameters if location == "path"}
+            expected = set(_PATH_TEMPLATE.findall(template))
+            for name in sorted(expected - declared):
+                self.add(pointer, f"path parameter '{name}' of '{template}' is not declared")
+            for name in sorted(declared - expected):
+                self.add(pointer, f"path parameter '{name}' does not appear in '{template}'")
+
+        if "requestBody" in operation:
+            request_body = self.deref(operation["requestBody"])
+            if request_body is not None and (
+                not isinstance(request_body, dict) or not isinstance(request_body.get("content"), dict)
+            ):
+                self.add(_pointer(pointer, "requestBody"), "missing required field 'content'")
+
+        if "responses" in operation:
+            self.check_responses(operation["responses"], _pointer(pointer, "responses"))
+        elif not self.is_31:
+            self.add(pointer, "missing required field 'responses'")
+
+    def check_responses(self, responses: Any, pointer: str) -> None:
+        if not isinstance(responses, dict):
+            self.add(pointer, "must be a mapping")
+            return
+        codes = [code for code in responses if not str(code).startswith("x-")]
+        if not codes:
+            self.add(pointer, "must declare at least one response")
+        for code in codes:
+            code_pointer = _pointer(pointer, code)
+            if not _STATUS_CODE.match(str(code)):
+                self.add(code_pointer, f"invalid response status code '{code}'")
+            response = self.deref(responses[code])
+            if response is None:
+                continue
+            if not isinstance(response, dict):
+                self.add(code_pointer, "response must be a mapping")
+            elif "description" not in response:
+                self.add(code_pointer, "missing required field 'description'")
+
+    def check_components(self, components: Any) -> None:
+        if not isinstance(components, dict):
+            self.add("/components", "must be a mapping")
+            return
+        for kind, entries in components.items():
+            if str(kind).startswith("x-"):
+                continue
+            pointer = _pointer("/components", kind)
+            if kind not in COMPONENT_TYPES:
+                self.add(pointer, f"unknown component type '{kind}'")
+            elif not isinstance(entries, dict):
+                self.add(pointer, "must be a mapping")
+            else:
+                for name in entries:
+                    if not _COMPONENT_NAME.match(str(name)):
+                        self.add(_pointer(pointer, name), f"invalid component name '{name}'")
+
+    def check_refs(self, document: dict[str, Any]) -> None:
+        """Report every `$ref` of the document that does not resolve."""
+        stack: list[tuple[Any, str]] = [(document, "")]
+        while stack:
+            node, pointer = stack.pop()
+            if isinstance(node, dict):
+                if "$ref" in node:
+                    self.check_ref(node["$ref"], pointer)
+                children = [
+                    (value, _pointer(pointer, key))
+                    for key, value in node.items()
+                    # Examples and extensions hold free-form data
+                    if key not in ("$ref", "example") and not str(key).startswith("x-")
+                ]
+            elif isinstance(node, list):
+                children = [(value, f"{pointer}/{index}") for index, value in enumerate(node)]
+            else:
+                continue
+            stack.extend(reversed(children))
+
+    def check_ref(self, ref: Any, pointer: str) -> None:
+        if not isinstance(ref, str):
+            self.add(_pointer(pointer, "$ref"), "must be a string")
+            return
+        if not self.resolver.can_resolve(ref):
+            return
+        try:
+            self.resolver.resolve(ref)
+        except RefResolutionError as e:
+            self.add(pointer, f"unresolved $ref: {e}")
+
+
+def _pointer(parent: str, key: Any) -> str:
+    """Append a key to a JSON pointer (RFC 6901 escaping)."""
+    return f"{parent}/{str(key).replace('~', '~0').replace('/', '~1')}"
+
+
+def _child_node(node: Any, token: str) -> Any:
+    if isinstance(node, dict):
+        if token in node:
+            return node[token]
+        # YAML loads keys such as response codes (200) as numbers
+        return next((value for key, value in node.items() if str(key) == token), _MISSING)
+    if isinstance(node, list) and token.isdigit() and int(token) < len(node):
+        return node[int(token)]
+    return _MISSING
+
+
+@beartype
+@require(lambda max_issues: max_issues > 0, "Max issues must be positive")
+@ensure(lambda result: isinstance(result, OpenAPIValidationResult), "Must return OpenAPIValidationResult")
+def validate_openapi_document(
+    document: Any, base_path: Path | None = None, max_issues: int = DEFAULT_MAX_ISSUES
+) -> OpenAPIValidationResult:
+    """
+    Validate the structure of a parsed OpenAPI 3.0/3.1 document.
+
+    Args:
+        document: Parsed document
+        base_path: File the document was loaded from (resolves relative file `$ref`s)
+        max_issues: Issues reported before validation stops listing them
+
+    Returns:
+        OpenAPIValidationResult with the issues found and the number of operations
+    """
+    validator = _DocumentValidator(OpenAPIRefResolver(document, base_path), max_issues)
+    validator.check_document(document)
+    return validator.result
+
+
+@beartype
+@require(lambda contract_path: isinstance(contract_path, Path), "Contract path must be Path")
+@ensure(lambda result: isinstance(result, OpenAPIValidationResult), "Must return OpenAPIValidationResult")
+def validate_openapi_file(contract_path: Path, max_issues: int = DEFAULT_MAX_ISSUES) -> OpenAPIValidationResult:
+    """
+    Load and validate the structure of an OpenAPI 3.0/3.1 file (YAML or JSON).
+
+    Args:
+        contract_path: Contract file
+        max_issues: Issues reported before validation stops listing them
+
+    Returns:
+        OpenAPIValidationResult (a file that cannot be read or parsed yields a single issue)
+    """
+    from specfact_cli.utils.structured_io import load_structured_file
+
+    try:
+        document = load_structured_file(contract_path, round_trip=False)
+    except Exception as e:
+        return OpenAPIValidationResult(issues=[OpenAPIIssue("", f"cannot parse {contract_path.name}: {e}")])
+    return validate_openapi_document(document, base_path=contract_path, max_issues=max_issues)
@@ -0,0 +1,383 @@
+"""
+Content-addressed result cache for `specfact repro` checks.
+
+Most pushes touch a handful of files (or only docs), yet ruff, Semgrep and
+basedpyright used to re-check the whole tree on every run. A check result is
+replayed from the cache when nothing it depends on changed:
+
+- the check's command and the tool version (`<tool> --version`)
+- its configuration files (pyproject.toml, Semgrep rules, pyrightconfig.json, ...)
+- the content hashes (SHA-256) of its input files (via the shared stat index of
+  `utils.file_hashes`, so unchanged files cost one `stat()` instead of a read)
+
+Per-file tools (ruff) also support partial re-runs: when only some inputs
+changed, just those files are checked again and their findings are merged
+with the cached findings of the unchanged files.
+
+Entries live under `.specfact/cache/repro/results/` (one entry per check and
+tool/config combination) and are evicted least recently used first once the
+directory exceeds its size limit (checked once per run, in `save()`). Only passed and failed results are cached;
+timeouts and skipped checks always run again. `specfact repro --no-cache`
+bypasses the cache.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from beartype import beartype
+from icontract import ensure, require
+
+from specfact_cli import __version__
+from specfact_cli.utils.analysis_cache import hash_config_files, prune_cache_dir
+from specfact_cli.utils.file_hashes import FileHashIndex
+from specfact_cli.utils.repo_walker import RepoWalker
+from specfact_cli.validators.repro_checker import (
+    MAX_FINDING_RECORDS,
+    CheckCacheSpec,
+    CheckResult,
+    CheckStatus,
+)
+
+
+# Bump when the entry layout or the key material changes
+REPRO_CACHE_FORMAT_VERSION = "1"
+
+# Size limit of the result cache (bytes); least recently used entries are evicted first
+DEFAULT_MAX_REPRO_CACHE_BYTES = 64 * 1024 * 1024
+
+# Results that are deterministic for the same tool, configuration and inputs
+CACHEABLE_STATUSES = frozenset({CheckStatus.PASSED, CheckStatus.FAILED})
+
+# A partial re-run is only worth it while at most this share of the inputs changed
+PARTIAL_RUN_MAX_FRACTION = 0.5
+
+# Seconds allowed for `<tool> --version`
+VERSION_COMMAND_TIMEOUT = 30.0
+
+# Findings category of per-file tools (ruff-style records with a "file" key)
+_PER_FILE_CATEGORY = "violations"
+
+
+@dataclass
+class CacheLookup:
+    """What the cache knows about a check about to run."""
+
+    name: str
+    tool: str
+    entry_path: Path
+    # Content hash per input file (repository-relative POSIX path)
+    inputs: dict[str, str]
+    # Cached result, if all inputs are unchanged
+    result: CheckResult | None = None
+    # Inputs to check again in a partial re-run (None: run the full check)
+    changed_files: list[str] | None = None
+    # Cached findings per unchanged input file (partial re-runs)
+    file_findings: dict[str, list[dict[str, Any]]] | None = None
+    # Whether the result's findings can be stored per file (per-file tools)
+    per_file: bool = False
+
+
+class ReproResultCache:
+    """
+    Result cache for repro checks, keyed by tool version, configuration and input content.
+
+    Thread-safe: checks running in parallel look up and store entries concurrently.
+    Call `save()` once the run's checks finished.
+    """
+
+    SUBDIR = "results"
+
+    @beartype
+    @require(lambda repo_path: isinstance(repo_path, Path), "Repo path must be Path")
+    @require(lambda max_bytes: max_bytes >= 0, "Max bytes must be non-negative")
+    def __init__(
+        self,
+        repo_path: Path,
+        cache_dir: Path | None = None,
+        max_bytes: int = DEFAULT_MAX_REPRO_CACHE_BYTES,
+        hash_index: FileHashIndex | None = None,
+    ) -> None:
+        """
+        Initialize result cache.
+
+        Args:
+            repo_path: Repository root (inputs and configuration files are relative to it)
+            cache_dir: Override cache directory (default: .specfact/cache/repro/results)
+            max_bytes: Size limit; older entries are evicted by `save()`
+            hash_index: Shared file hash index (default: the repository's persisted stat index)
+        """
+        from specfact_cli.utils.structure import SpecFactStructure
+
+        self.repo_path = repo_path.resolve()
+        self.cache_dir = cache_dir or (self.repo_path / SpecFactStructure.CACHE / "repro" / self.SUBDIR)
+        self.max_bytes = max_bytes
+        # Inputs of several checks overlap (semgrep scans the whole tree): each file is hashed once per run
+        self.hash_index = hash_index or FileHashIndex(self.repo_path)
+        self._lock = threading.Lock()
+        self._versions: dict[tuple[str, ...], str | None] = {}
+        self._written = False
+
+    @beartype
+    @require(lambda command: len(command) > 0, "Command must be non-empty")
+    def lookup(self, name: str, tool: str, command: list[str], spec: CheckCacheSpec) -> CacheLookup | None:
+        """
+        Look up the cached result of a check.
+
+        Args:
+            name: Check name
+            tool: Tool name
+            command: Full command of the check
+            spec: What the check's result depends on
+
+        Returns:
+            CacheLookup (with `result` on a hit, `changed_files` for a partial re-run),
+            or None if the check cannot be cached (tool version unknown)
+        """
+        version = self._tool_version(spec.version_command)
+        if version is None:
+            return None
+        key_material = json.dumps(
+            [
+                REPRO_CACHE_FORMAT_VERSION,
+                __version__,
+                name,
+                tool,
+                command,
+                version,
+                hash_config_files(self.repo_path / config_file for config_file in spec.config_files),
+            ],
+            sort_keys=True,
+        )
+        key = hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+        lookup = CacheLookup(
+            name=name,
+            tool=tool,
+            entry_path=self.cache_dir / key[:2] / f"{key}.json",
+            inputs=self._hash_inputs(spec),
+            per_file=spec.partial_command is not None,
+        )
+
+        entry = self._read_entry(lookup.entry_path)
+        if entry is None:
+            return lookup
+        if entry["inputs"] == lookup.inputs:
+            with contextlib.suppress(KeyError, TypeError, ValueError):
+                lookup.result = CheckResult.from_record(entry["result"])
+            return lookup
+
+        file_findings = entry.get("files")
+        if lookup.per_file and isinstance(file_findings, dict):
+            changed = [path for path, digest in lookup.inputs.items() if entry["inputs"].get(path) != digest]
+            if len(changed) <= len(lookup.inputs) * PARTIAL_RUN_MAX_FRACTION:
+                lookup.changed_files = changed
+                lookup.file_findings = {
+                    path: findings
+                    for path, findings in file_findings.items()
+                    if path in lookup.inputs and path not in changed
+                }
+        return lookup
+
+    @beartype
+    @ensure(lambda result: isinstance(result, CheckResult), "Must return CheckResult")
+    def store(self, lookup: CacheLookup, run_result: CheckResult | None, started_at: float) -> CheckResult:
+        """
+        Cache a check's result (merging a partial re-run with the cached findings first).
+
+        Args:
+            lookup: Lookup made before the check ran
+            run_result: Result of the (full or partial) run; None if a partial re-run had no
+                files to check (only removed inputs)
+            started_at: When the check started (seconds since the epoch)
+
+        Returns:
+            The result to report: the merged result for partial re-runs, else `run_result`
+        """
+        result = run_result
+        if lookup.changed_files is not None and lookup.file_findings is not None:
+            merged = self._merge_partial(lookup, lookup.file_findings, result, started_at)
+            if merged is None:
+                # The partial run did not produce per-file findings (e.g., a configuration error)
+                return result or CheckResult(name=lookup.name, tool=lookup.tool, status=CheckStatus.SKIPPED)
+            result = merged
+        if result is None or result.status not in CACHEABLE_STATUSES or result.exit_code is None:
+            return result or CheckResult(name=lookup.name, tool=lookup.tool, status=CheckStatus.SKIPPED)
+
+        files = self._findings_by_file(result, lookup.inputs) if lookup.per_file else None
+        record = result.to_record()
+        record["cache"] = None
+        self._write_entry(lookup.entry_path, {"inputs": lookup.inputs, "result": record, "files": files})
+        return result
+
+    @beartype
+    def prune(self) -> None:
+        """Evict least recently used entries until the cache fits in its size limit."""
+        prune_cache_dir(self.cache_dir, self.max_bytes)
+
+    @beartype
+    def save(self) -> None:
+        """Persist the file stat index and, if entries were written this run, evict old entries."""
+        self.hash_index.save()
+        with self._lock:
+            written, self._written = self._written, False
+        if written:
+            self.prune()
+
+    def _tool_version(self, version_command: list[str]) -> str | None:
+        """Output of the tool's version command (run once per command), or None if it fails."""
+        key = tuple(version_command)
+        with self._lock:
+            if key in self._versions:
+                return self._versions[key]
+        try:
+            proc = subprocess.run(
+                version_command,
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+                timeout=VERSION_COMMAND_TIMEOUT,
+                check=False,
+            )
+            version = proc.stdout.strip() if proc.returncode == 0 and proc.stdout.strip() else None
+        except (OSError, subprocess.SubprocessError):
+            version = None
+        with self._lock:
+            self._versions[key] = version
+        return version
+
+    def _hash_inputs(self, spec: CheckCacheSpec) -> dict[str, str]:
+        """Content hash of every input file, by repository-relative POSIX path."""
+        files: set[Path] = set()
+        for target in spec.inputs:
+            target_path = self.repo_path / target
+            if target_path.is_file():
+                files.add(target_path)
+            elif target_path.is_dir():
+                files.update(RepoWalker(self.repo_path).list_files(spec.suffixes, start=target_path))
+        inputs: dict[str, str] = {}
+        for file_path in sorted(files):
+            digest = self.hash_index.hash_file(file_path)
+            if digest is not None:
+                inputs[file_path.resolve().relative_to(self.repo_path).as_posix()] = digest
+        return inputs
+
+    def _merge_partial(
+        self,
+        lookup: CacheLookup,
+        file_findings: dict[str, list[dict[str, Any]]],
+        result: CheckResult | None,
+        started_at: float,
+    ) -> CheckResult | None:
+        """Combine the findings of a partial re-run with the cached findings of the unchanged files."""
+        new_findings: dict[str, list[dict[str, Any]]] | None = {}
+        if result is not None:
+            new_findings = self._findings_by_file(result, lookup.inputs)
+        if new_findings is None:
+            return None
+        by_file = {**file_findings, **new_findings}
+        records = [finding for path in sorted(by_file) for finding in by_file[path]]
+
+        cached_lines = [
+            f"{finding['file']}:{finding['line']}:{finding['column']}: {finding['code']} {finding['message']}"
+            for path in sorted(file_findings)
+            for finding in file_findings[path]
+        ]
+        checked = len(lookup.changed_files or [])
+        summary = (
+            f"{checked} changed file(s) checked, cached findings for {len(lookup.inputs) - checked} unchanged file(s)"
+        )
+        output = result.output if result is not None else ""
+        if cached_lines:
+            output = f"{output.rstrip()}\n" if output.strip() else ""
+            output += "\n".join(cached_lines) + "\n"
+
+        findings: dict[str, Any] = dict(result.findings or {}) if result is not None else {}
+        findings[_PER_FILE_CATEGORY] = records[:MAX_FINDING_RECORDS]
+        findings["total_violations"] = len(records)
+        findings.pop("findings_truncated", None)
+        if len(records) > MAX_FINDING_RECORDS:
+            findings["findings_truncated"] = True
+
+        finished_at = time.time()
+        return CheckResult(
+            name=lookup.name,
+            tool=lookup.tool,
+            status=CheckStatus.FAILED if records else CheckStatus.PASSED,
+            duration=finished_at - started_at,
+            exit_code=1 if records else 0,
+            output=output,
+            error=summary,
+            started_at=started_at,
+            finished_at=finished_at,
+            findings=findings,
+            cache="partial",
+        )
+
+    def _read_entry(self, entry_path: Path) -> dict[str, Any] | None:
+        """Read a cache entry and refresh its access time (None if missing or unreadable)."""
+        try:
+            entry = json.loads(entry_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or not isinstance(entry.get("inputs"), dict):
+            return None
+        # Refresh access time for LRU pruning
+        with contextlib.suppress(OSError):
+            os.utime(entry_path)
+        return entry
+
+    def _write_entry(self, entry_path: Path, entry: dict[str, Any]) -> None:
+        """Write a cache entry atomically (failures are ignored)."""
+        tmp_name: str | None = None
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(entry, handle, separators=(",", ":"))
+            os.replace(tmp_name, entry_path)
+        except (OSError, TypeError, ValueError):
+            if tmp_name is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_name)
+            return
+        with self._lock:
+            self._written = True
+
+    def _findings_by_file(self, result: CheckResult, inputs: dict[str, str]) -> dict[str, list[dict[str, Any]]] | None:
+        """
+        Group a per-file tool's findings by input file.
+
+        Returns:
+            Findings per repository-relative path, or None if they cannot be attributed to
+            input files (incomplete findings, failures without findings such as syntax or
+            configuration errors, or findings in files that are not inputs)
+        """
+        findings = result.findings
+        if findings is None or findings.get("findings_truncated") or result.exit_code not in (0, 1):
+            return None
+        records = findings.get(_PER_FILE_CATEGORY)
+        if not isinstance(records, list) or (result.exit_code == 1) != bool(records):
+            return None
+        by_file: dict[str, list[dict[str, Any]]] = {}
+        for record in records:
+            file_path = Path(str(record.get("file", "")))
+            if file_path.is_absolute():
+                try:
+                    file_path = file_path.resolve().relative_to(self.repo_path)
+                except ValueError:
+                    return None
+            path = file_path.as_posix()
+            if path not in inputs:
+                return None
+            by_file.setdefault(path, []).append(record)
+        return by_file
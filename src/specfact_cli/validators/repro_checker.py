@@ -7,24 +7,59 @@ exploration, and test suites with time budgets and result aggregation.
 
 from __future__ import annotations
 
+import functools
+import json
 import os
 import re
 import shutil
 import subprocess
+import threading
 import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from beartype import beartype
 from icontract import ensure, require
 from rich.console import Console
 
 
+if TYPE_CHECKING:
+    from specfact_cli.validators.repro_cache import ReproResultCache
+
 console = Console()
 
+# Maximum checks run at the same time by default (each check is a separate tool process)
+DEFAULT_MAX_PARALLEL_CHECKS = 4
+
+# Expected duration (seconds) for checks without history or an explicit timeout
+DEFAULT_CHECK_ESTIMATE = 60.0
+
+# Budget allocated per check relative to its expected duration
+CHECK_TIMEOUT_HEADROOM = 2.0
+
+# Weight of the latest run in the per-check duration history (exponential moving average)
+DURATION_HISTORY_WEIGHT = 0.5
+
+# Raw output kept per stream and check (characters); the middle of longer output is dropped
+MAX_CAPTURED_OUTPUT = 50_000
+
+# Longest chunk read as one line from tool output (longer lines are split)
+MAX_OUTPUT_LINE = 64 * 1024
+
+# Findings kept per category in a check result; totals still count every finding
+MAX_FINDING_RECORDS = 1_000
+
+# Seconds to wait for output readers after a tool exits (grandchildren may keep its pipes open)
+OUTPUT_READER_JOIN_TIMEOUT = 5.0
+
+_ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
 
 class CheckStatus(Enum):
     """Status of a validation check."""
@@ -42,8 +77,7 @@ class CheckStatus(Enum):
 @ensure(lambda result: isinstance(result, str), "Must return string")
 def _strip_ansi_codes(text: str) -> str:
     """Remove ANSI escape codes from text."""
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    return ansi_escape.sub("", text)
+    return _ANSI_ESCAPE.sub("", text)
 
 
 @beartype
@@ -58,7 +92,22 @@ def _expand_crosshair_targets(repo_path: Path, targets: list[str]) -> tuple[list
     """
     Expand directory targets into module names and PYTHONPATH roots, excluding __main__.py.
     """
-    expanded: list[str] = []
+    module_files, excluded_main, pythonpath_roots = _crosshair_target_modules(repo_path, targets)
+    return sorted(module_files), excluded_main, pythonpath_roots
+
+
+@beartype
+@require(lambda repo_path: isinstance(repo_path, Path), "repo_path must be Path")
+@require(lambda targets: isinstance(targets, list), "targets must be list")
+@ensure(lambda result: isinstance(result, tuple) and len(result) == 3, "Must return (dict, bool, list)")
+def _crosshair_target_modules(repo_path: Path, targets: list[str]) -> tuple[dict[str, Path], bool, list[str]]:
+    """
+    Map CrossHair targets to module names and their source files (one shard per module).
+
+    Returns:
+        Tuple of (source file per module name, whether a __main__.py was excluded, PYTHONPATH roots)
+    """
+    expanded: dict[str, Path] = {}
     excluded_main = False
     pythonpath_roots: list[str] = []
     src_root = (repo_path / "src").resolve()
@@ -85,7 +134,7 @@ def _expand_crosshair_targets(repo_path: Path, targets: list[str]) -> tuple[list
                     continue
                 module_name = _module_name_from_path(module_root, py_file)
                 if module_name:
-                    expanded.append(module_name)
+                    expanded.setdefault(module_name, py_file)
         else:
             if target_path.name == "__main__.py":
                 excluded_main = True
@@ -106,9 +155,8 @@ def _expand_crosshair_targets(repo_path: Path, targets: list[str]) -> tuple[list
                     pythonpath_roots.append(pythonpath_root_str)
                 module_name = _module_name_from_path(module_root, file_path)
                 if module_name:
-                    expanded.append(module_name)
+                    expanded.setdefault(module_name, file_path)
 
-    expanded = sorted(set(expanded))
     return expanded, excluded_main, pythonpath_roots
 
 
@@ -149,90 +197,285 @@ def _build_crosshair_env(pythonpath_roots: list[str]) -> dict[str, str] | None:
 
 
 @beartype
-@require(lambda output: isinstance(output, str), "Output must be string")
-@ensure(lambda result: isinstance(result, dict), "Must return dictionary")
-@ensure(
-    lambda result: "violations" in result and "total_violations" in result,
-    "Must include violations and total_violations",
-)
-def _extract_ruff_findings(output: str) -> dict[str, Any]:
-    """Extract structured findings from ruff output."""
-    findings: dict[str, Any] = {
-        "violations": [],
-        "total_violations": 0,
-        "files_checked": 0,
-    }
-
-    # Strip ANSI codes
-    clean_output = _strip_ansi_codes(output)
-
-    # Parse ruff output format:
-    # Format 1: "W293 [*] Blank line contains whitespace\n--> src/file.py:240:1"
-    # Format 2: "src/file.py:240:1: W293 Blank line contains whitespace"
-    lines = clean_output.split("\n")
-    i = 0
-    while i < len(lines):
-        line_stripped = lines[i].strip()
-        if not line_stripped:
-            i += 1
-            continue
+@ensure(lambda result: isinstance(result, bool), "Must return bool")
+def _is_crosshair_signature_issue(stdout: str, stderr: str) -> bool:
+    """Check whether a failed CrossHair run hit a signature analysis limitation (not a real failure)."""
+    combined_output = f"{stderr} {stdout}".lower()
+    return (
+        "wrong parameter order" in combined_output
+        or "keyword-only parameter" in combined_output
+        or "valueerror: wrong parameter" in combined_output
+        or ("signature" in combined_output and ("error" in combined_output or "failure" in combined_output))
+    )
 
-        # Skip help lines and code block markers
-        if line_stripped.startswith(("help:", "|", "    |")):
-            i += 1
-            continue
 
-        # Try format 1: "W293 [*] message" followed by "--> file:line:col"
-        code_match = re.match(r"^([A-Z]\d+)\s+\[[^\]]+\]\s+(.+)$", line_stripped)
+class FindingsParser:
+    """
+    Incremental parser for the structured findings in a tool's output.
+
+    Output is fed line by line while the tool runs (`feed`), so findings are
+    available before it exits and its output never has to be buffered whole.
+    Every finding is passed to `on_finding`; at most `max_records` findings per
+    category are kept in `result()` (totals still count all of them).
+    """
+
+    # Output streams the tool reports findings on
+    streams: tuple[str, ...] = ("stdout",)
+
+    def __init__(
+        self,
+        on_finding: Callable[[str, dict[str, Any]], None] | None = None,
+        max_records: int = MAX_FINDING_RECORDS,
+    ) -> None:
+        self.on_finding = on_finding
+        self.max_records = max_records
+        self.findings: dict[str, Any] = self._empty_findings()
+
+    def _empty_findings(self) -> dict[str, Any]:
+        return {}
+
+    def feed(self, line: str, stream: str = "stdout") -> None:
+        """Parse one line of output (ANSI codes and surrounding whitespace are ignored)."""
+        if stream in self.streams:
+            self._parse_line(_ANSI_ESCAPE.sub("", line).strip())
+
+    def _parse_line(self, line: str) -> None:
+        raise NotImplementedError
+
+    def _add(self, category: str, finding: dict[str, Any]) -> None:
+        """Record a finding (kept in the result up to max_records per category)."""
+        records: list[dict[str, Any]] = self.findings[category]
+        if len(records) < self.max_records:
+            records.append(finding)
+        else:
+            self.findings["findings_truncated"] = True
+        if self.on_finding is not None:
+            self.on_finding(category, finding)
+
+    def result(self) -> dict[str, Any]:
+        """Findings parsed so far."""
+        return self.findings
+
+
+class RuffFindingsParser(FindingsParser):
+    """
+    Parser for `ruff check` output.
+
+    Supports both output formats:
+    - Full: "W293 [*] Blank line contains whitespace" followed by "--> src/file.py:240:1"
+    - Concise: "src/file.py:240:1: W293 Blank line contains whitespace"
+    """
+
+    _CODE = re.compile(r"^([A-Z]\d+)\s+\[[^\]]+\]\s+(.+)$")
+    _LOCATION = re.compile(r"-->\s+([^:]+):(\d+):(\d+)")
+    _CONCISE = re.compile(r"^([^:]+):(\d+):(\d+):\s+([A-Z]\d+)\s+(.+)$")
+    _FILES_CHECKED = re.compile(r"(\d+)\s+files?\s+checked", re.IGNORECASE)
+
+    def __init__(
+        self,
+        on_finding: Callable[[str, dict[str, Any]], None] | None = None,
+        max_records: int = MAX_FINDING_RECORDS,
+    ) -> None:
+        super().__init__(on_finding, max_records)
+        # Code and message of a full-format violation waiting for its location line
+        self._pending: tuple[str, str] | None = None
+        self._files_checked_seen = False
+
+    def _empty_findings(self) -> dict[str, Any]:
+        return {"violations": [], "total_violations": 0, "files_checked": 0}
+
+    def _parse_line(self, line: str) -> None:
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            location = self._LOCATION.match(line)
+            if location:
+                self._add_violation(location.group(1), location.group(2), location.group(3), *pending)
+                return
+
+        if not self._files_checked_seen:
+            files_match = self._FILES_CHECKED.search(line)
+            if files_match:
+                self.findings["files_checked"] = int(files_match.group(1))
+                self._files_checked_seen = True
+
+        # Skip empty lines, help lines and code block markers
+        if not line or line.startswith(("help:", "|")):
+            return
+
+        code_match = self._CODE.match(line)
         if code_match:
-            code = code_match.group(1)
-            message = code_match.group(2)
-            # Look for location line: "--> file:line:col"
-            if i + 1 < len(lines):
-                location_line = lines[i + 1].strip()
-                location_match = re.match(r"-->\s+([^:]+):(\d+):(\d+)", location_line)
-                if location_match:
-                    file_path = location_match.group(1)
-                    line_num = int(location_match.group(2))
-                    col_num = int(location_match.group(3))
-                    findings["violations"].append(
-                        {
-                            "file": file_path,
-                            "line": line_num,
-                            "column": col_num,
-                            "code": code,
-                            "message": message,
-                        }
-                    )
-                    i += 2  # Skip both lines
-                    continue
+            self._pending = (code_match.group(1), code_match.group(2))
+            return
+
+        concise_match = self._CONCISE.match(line)
+        if concise_match:
+            file_path, line_num, col_num, code, message = concise_match.groups()
+            self._add_violation(file_path, line_num, col_num, code, message)
+
+    def _add_violation(self, file_path: str, line_num: str, col_num: str, code: str, message: str) -> None:
+        self.findings["total_violations"] += 1
+        self._add(
+            "violations",
+            {"file": file_path, "line": int(line_num), "column": int(col_num), "code": code, "message": message},
+        )
+
+
+class SemgrepFindingsParser(FindingsParser):
+    """Parser for Semgrep's scan summary (reported on stdout or stderr, depending on the version)."""
+
+    streams = ("stdout", "stderr")
+    _COUNTERS = (
+        ("total_findings", re.compile(r"Findings:\s*(\d+)", re.IGNORECASE)),
+        ("rules_run", re.compile(r"Rules\s+run:\s*(\d+)", re.IGNORECASE)),
+        ("targets_scanned", re.compile(r"Targets\s+scanned:\s*(\d+)", re.IGNORECASE)),
+    )
+
+    def __init__(
+        self,
+        on_finding: Callable[[str, dict[str, Any]], None] | None = None,
+        max_records: int = MAX_FINDING_RECORDS,
+    ) -> None:
+        super().__init__(on_finding, max_records)
+        self._seen: set[str] = set()
+
+    def _empty_findings(self) -> dict[str, Any]:
+        return {"findings": [], "total_findings": 0, "rules_run": 0, "targets_scanned": 0}
 
-        # Try format 2: "file:line:col: code message"
-        pattern = r"^([^:]+):(\d+):(\d+):\s+([A-Z]\d+)\s+(.+)$"
-        match = re.match(pattern, line_stripped)
-        if match:
-            file_path, line_num, col_num, code, message = match.groups()
-            findings["violations"].append(
-                {
-                    "file": file_path,
-                    "line": int(line_num),
-                    "column": int(col_num),
-                    "code": code,
-                    "message": message,
-                }
+    def _parse_line(self, line: str) -> None:
+        for key, pattern in self._COUNTERS:
+            if key in self._seen:
+                continue
+            match = pattern.search(line)
+            if match:
+                self.findings[key] = int(match.group(1))
+                self._seen.add(key)
+
+
+class BasedpyrightFindingsParser(FindingsParser):
+    """Parser for basedpyright diagnostics ("path:line:col: error|warning: message")."""
+
+    _DIAGNOSTIC = re.compile(r"^([^:]+):(\d+):(\d+):\s+(error|warning):\s+(.+)$")
+
+    def _empty_findings(self) -> dict[str, Any]:
+        return {"errors": [], "warnings": [], "total_errors": 0, "total_warnings": 0}
+
+    def _parse_line(self, line: str) -> None:
+        match = self._DIAGNOSTIC.match(line)
+        if not match:
+            return
+        file_path, line_num, col_num, level, message = match.groups()
+        finding = {"file": file_path, "line": int(line_num), "column": int(col_num), "message": message}
+        if level == "error":
+            self.findings["total_errors"] += 1
+            self._add("errors", finding)
+        else:
+            self.findings["total_warnings"] += 1
+            self._add("warnings", finding)
+
+
+class CrossHairFindingsParser(FindingsParser):
+    """Parser for CrossHair counterexamples and failures ("path:line: ... counterexample|failed")."""
+
+    _COUNTEREXAMPLE = re.compile(r"([^:]+):(\d+):.*?(counterexample|failed)", re.IGNORECASE)
+
+    def _empty_findings(self) -> dict[str, Any]:
+        return {"counterexamples": [], "total_counterexamples": 0}
+
+    def _parse_line(self, line: str) -> None:
+        lowered = line.lower()
+        if "counterexample" not in lowered and "failed" not in lowered:
+            return
+        for match in self._COUNTEREXAMPLE.finditer(line):
+            self.findings["total_counterexamples"] += 1
+            self._add(
+                "counterexamples",
+                {"file": match.group(1), "line": int(match.group(2)), "type": match.group(3).lower()},
             )
 
-        i += 1
 
-    # Set total_violations from list length
-    findings["total_violations"] = len(findings["violations"])
+class PytestFindingsParser(FindingsParser):
+    """Parser for the pytest session summary ("N passed, N failed, N skipped")."""
+
+    _COUNTERS = (
+        ("tests_passed", re.compile(r"(\d+)\s+passed", re.IGNORECASE)),
+        ("tests_failed", re.compile(r"(\d+)\s+failed", re.IGNORECASE)),
+        ("tests_skipped", re.compile(r"(\d+)\s+skipped", re.IGNORECASE)),
+    )
+
+    def __init__(
+        self,
+        on_finding: Callable[[str, dict[str, Any]], None] | None = None,
+        max_records: int = MAX_FINDING_RECORDS,
+    ) -> None:
+        super().__init__(on_finding, max_records)
+        self._seen: set[str] = set()
+
+    def _empty_findings(self) -> dict[str, Any]:
+        return {"tests_run": 0, "tests_passed": 0, "tests_failed": 0, "tests_skipped": 0, "failures": []}
+
+    def _parse_line(self, line: str) -> None:
+        for key, pattern in self._COUNTERS:
+            if key in self._seen:
+                continue
+            match = pattern.search(line)
+            if match:
+                self.findings[key] = int(match.group(1))
+                self._seen.add(key)
+
+    def result(self) -> dict[str, Any]:
+        self.findings["tests_run"] = (
+            self.findings["tests_passed"] + self.findings["tests_failed"] + self.findings["tests_skipped"]
+        )
+        return self.findings
+
+
+_FINDINGS_PARSERS: dict[str, type[FindingsParser]] = {
+    "ruff": RuffFindingsParser,
+    "semgrep": SemgrepFindingsParser,
+    "basedpyright": BasedpyrightFindingsParser,
+    "crosshair": CrossHairFindingsParser,
+    "pytest": PytestFindingsParser,
+}
+
+
+@beartype
+@require(lambda tool: isinstance(tool, str), "Tool must be string")
+def findings_parser_for(
+    tool: str, on_finding: Callable[[str, dict[str, Any]], None] | None = None
+) -> FindingsParser | None:
+    """
+    Create the incremental findings parser for a tool.
+
+    Args:
+        tool: Tool name (ruff, semgrep, basedpyright, crosshair, pytest)
+        on_finding: Called with the category and record of each finding as it is parsed
+
+    Returns:
+        Parser for the tool, or None for tools without structured findings
+    """
+    parser_class = _FINDINGS_PARSERS.get(tool.lower())
+    return parser_class(on_finding) if parser_class is not None else None
+
+
+def _parse_output(parser: FindingsParser, output: str, error: str = "") -> dict[str, Any]:
+    """Feed complete stdout/stderr text to a findings parser and return its findings."""
+    for line in output.split("\n"):
+        parser.feed(line, "stdout")
+    for line in error.split("\n"):
+        parser.feed(line, "stderr")
+    return parser.result()
 
-    # Extract files checked count
-    files_match = re.search(r"(\d+)\s+files?\s+checked", clean_output, re.IGNORECASE)
-    if files_match:
-        findings["files_checked"] = int(files_match.group(1))
 
-    return findings
+@beartype
+@require(lambda output: isinstance(output, str), "Output must be string")
+@ensure(lambda result: isinstance(result, dict), "Must return dictionary")
+@ensure(
+    lambda result: "violations" in result and "total_violations" in result,
+    "Must include violations and total_violations",
+)
+def _extract_ruff_findings(output: str) -> dict[str, Any]:
+    """Extract structured findings from ruff output."""
+    return _parse_output(RuffFindingsParser(), output)
 
 
 @beartype
@@ -242,32 +485,7 @@ def _extract_ruff_findings(output: str) -> dict[str, Any]:
 @ensure(lambda result: "total_findings" in result, "Must include total_findings")
 def _extract_semgrep_findings(output: str, error: str) -> dict[str, Any]:
     """Extract structured findings from semgrep output."""
-    findings: dict[str, Any] = {
-        "findings": [],
-        "total_findings": 0,
-        "rules_run": 0,
-        "targets_scanned": 0,
-    }
-
-    # Combine output and error (semgrep uses stderr for status)
-    combined = _strip_ansi_codes((output + "\n" + error).strip())
-
-    # Extract findings count
-    findings_match = re.search(r"Findings:\s*(\d+)", combined, re.IGNORECASE)
-    if findings_match:
-        findings["total_findings"] = int(findings_match.group(1))
-
-    # Extract rules run
-    rules_match = re.search(r"Rules\s+run:\s*(\d+)", combined, re.IGNORECASE)
-    if rules_match:
-        findings["rules_run"] = int(rules_match.group(1))
-
-    # Extract targets scanned
-    targets_match = re.search(r"Targets\s+scanned:\s*(\d+)", combined, re.IGNORECASE)
-    if targets_match:
-        findings["targets_scanned"] = int(targets_match.group(1))
-
-    return findings
+    return _parse_output(SemgrepFindingsParser(), output, error)
 
 
 @beartype
@@ -276,39 +494,7 @@ def _extract_semgrep_findings(output: str, error: str) -> dict[str, Any]:
 @ensure(lambda result: "errors" in result and "warnings" in result, "Must include errors and warnings")
 def _extract_basedpyright_findings(output: str) -> dict[str, Any]:
     """Extract structured findings from basedpyright output."""
-    findings: dict[str, Any] = {
-        "errors": [],
-        "warnings": [],
-        "total_errors": 0,
-        "total_warnings": 0,
-    }
-
-    # Strip ANSI codes
-    clean_output = _strip_ansi_codes(output)
-
-    # Parse basedpyright output: "path:line:col: error|warning: message"
-    pattern = r"^([^:]+):(\d+):(\d+):\s+(error|warning):\s+(.+)$"
-    for line in clean_output.split("\n"):
-        line_stripped = line.strip()
-        if not line_stripped:
-            continue
-        match = re.match(pattern, line_stripped)
-        if match:
-            file_path, line_num, col_num, level, message = match.groups()
-            finding = {
-                "file": file_path,
-                "line": int(line_num),
-                "column": int(col_num),
-                "message": message,
-            }
-            if level == "error":
-                findings["errors"].append(finding)
-                findings["total_errors"] += 1
-            else:
-                findings["warnings"].append(finding)
-                findings["total_warnings"] += 1
-
-    return findings
+    return _parse_output(BasedpyrightFindingsParser(), output)
 
 
 @beartype
@@ -317,31 +503,7 @@ def _extract_basedpyright_findings(output: str) -> dict[str, Any]:
 @ensure(lambda result: "counterexamples" in result, "Must include counterexamples")
 def _extract_crosshair_findings(output: str) -> dict[str, Any]:
     """Extract structured findings from CrossHair output."""
-    findings: dict[str, Any] = {
-        "counterexamples": [],
-        "total_counterexamples": 0,
-    }
-
-    # Strip ANSI codes
-    clean_output = _strip_ansi_codes(output)
-
-    # CrossHair typically outputs counterexamples
-    # Format varies, but we can extract basic info
-    if "counterexample" in clean_output.lower() or "failed" in clean_output.lower():
-        # Try to extract file and line info
-        pattern = r"([^:]+):(\d+):.*?(counterexample|failed)"
-        matches = re.finditer(pattern, clean_output, re.IGNORECASE)
-        for match in matches:
-            findings["counterexamples"].append(
-                {
-                    "file": match.group(1),
-                    "line": int(match.group(2)),
-                    "type": match.group(3).lower(),
-                }
-            )
-            findings["total_counterexamples"] += 1
-
-    return findings
+    return _parse_output(CrossHairFindingsParser(), output)
 
 
 @beartype
@@ -351,33 +513,7 @@ def _extract_crosshair_findings(output: str) -> dict[str, Any]:
 @ensure(lambda result: result["tests_run"] >= 0, "tests_run must be non-negative")
 def _extract_pytest_findings(output: str) -> dict[str, Any]:
     """Extract structured findings from pytest output."""
-    findings: dict[str, Any] = {
-        "tests_run": 0,
-        "tests_passed": 0,
-        "tests_failed": 0,
-        "tests_skipped": 0,
-        "failures": [],
-    }
-
-    # Strip ANSI codes
-    clean_output = _strip_ansi_codes(output)
-
-    # Extract test summary
-    summary_match = re.search(r"(\d+)\s+passed", clean_output, re.IGNORECASE)
-    if summary_match:
-        findings["tests_passed"] = int(summary_match.group(1))
-
-    failed_match = re.search(r"(\d+)\s+failed", clean_output, re.IGNORECASE)
-    if failed_match:
-        findings["tests_failed"] = int(failed_match.group(1))
-
-    skipped_match = re.search(r"(\d+)\s+skipped", clean_output, re.IGNORECASE)
-    if skipped_match:
-        findings["tests_skipped"] = int(skipped_match.group(1))
-
-    findings["tests_run"] = findings["tests_passed"] + findings["tests_failed"] + findings["tests_skipped"]
-
-    return findings
+    return _parse_output(PytestFindingsParser(), output)
 
 
 @beartype
@@ -412,6 +548,62 @@ def _extract_findings(tool: str, output: str, error: str) -> dict[str, Any]:
     return {}
 
 
+class BoundedOutput:
+    """
+    Captured output of one stream that keeps only its head and tail in memory.
+
+    Tools can print hundreds of megabytes (e.g., pytest -v or basedpyright on a
+    large tree); the middle of longer output is dropped and only counted.
+    """
+
+    def __init__(self, limit: int = MAX_CAPTURED_OUTPUT) -> None:
+        self._head_limit = limit // 2
+        self._tail_limit = limit - self._head_limit
+        self._head: list[str] = []
+        self._head_size = 0
+        self._tail: deque[str] = deque()
+        self._tail_size = 0
+        self.total = 0
+
+    def append(self, text: str) -> None:
+        """Add output (head first; once the head is full, the tail keeps the latest output)."""
+        self.total += len(text)
+        if self._head_size < self._head_limit:
+            kept = text[: self._head_limit - self._head_size]
+            self._head.append(kept)
+            self._head_size += len(kept)
+            text = text[len(kept) :]
+            if not text:
+                return
+        self._tail.append(text)
+        self._tail_size += len(text)
+        while self._tail and self._tail_size - len(self._tail[0]) >= self._tail_limit:
+            self._tail_size -= len(self._tail.popleft())
+
+    @property
+    def omitted(self) -> int:
+        """Number of characters dropped from the middle of the output."""
+        return self.total - self._head_size - min(self._tail_size, self._tail_limit)
+
+    def text(self) -> str:
+        """Kept output, with a marker where characters were dropped."""
+        head = "".join(self._head)
+        tail = "".join(self._tail)[-self._tail_limit :] if self._tail else ""
+        if not self.omitted:
+            return head + tail
+        return f"{head}{_omission_marker(self.omitted)}{tail}"
+
+
+def _omission_marker(omitted: int) -> str:
+    """Marker inserted where BoundedOutput dropped characters."""
+    return f"\n... [{omitted} characters omitted] ...\n"
+
+
+def _original_length(text: str, omitted: int) -> int:
+    """Length of the output before BoundedOutput dropped its middle."""
+    return len(text) - len(_omission_marker(omitted)) + omitted if omitted else len(text)
+
+
 @dataclass
 class CheckResult:
     """Result of a single validation check."""
@@ -424,6 +616,17 @@ class CheckResult:
     output: str = ""
     error: str = ""
     timeout: bool = False
+    # Wall-clock timestamps (seconds since the epoch) for scheduling analysis
+    queued_at: float | None = None
+    started_at: float | None = None
+    finished_at: float | None = None
+    # Findings parsed while the tool ran (None: extracted from output/error when needed)
+    findings: dict[str, Any] | None = None
+    # Characters dropped from the middle of output/error (see BoundedOutput)
+    output_omitted: int = 0
+    error_omitted: int = 0
+    # Result cache use: "hit" (replayed without running) or "partial" (only changed files re-checked)
+    cache: str | None = None
 
     def __post_init__(self) -> None:
         """Validate that tool is non-empty if findings extraction is needed."""
@@ -455,14 +658,27 @@ class CheckResult:
             "duration": self.duration,
             "exit_code": self.exit_code,
             "timeout": self.timeout,
-            "output_length": len(self.output),
-            "error_length": len(self.error),
+            "output_length": _original_length(self.output, self.output_omitted),
+            "error_length": _original_length(self.error, self.error_omitted),
         }
+        for key, value in (
+            ("queued_at", self.queued_at),
+            ("started_at", self.started_at),
+            ("finished_at", self.finished_at),
+        ):
+            if value is not None:
+                result[key] = datetime.fromtimestamp(value).isoformat()
+        if self.cache is not None:
+            result["cache"] = self.cache
 
         # Extract structured findings based on tool type
         if include_findings and self.tool:
             try:
-                findings = _extract_findings(self.tool, self.output, self.error)
+                findings = (
+                    self.findings
+                    if self.findings is not None
+                    else _extract_findings(self.tool, self.output, self.error)
+                )
                 if findings:
                     result["findings"] = findings
             except Exception:
@@ -487,6 +703,67 @@ class CheckResult:
 
         return result
 
+    @beartype
+    @ensure(lambda result: isinstance(result, dict), "Must return dictionary")
+    def to_record(self) -> dict[str, Any]:
+        """
+        Convert result to a JSON-serializable record that `from_record` restores losslessly.
+
+        Used for streamed reports (one record per finished check), so an interrupted run
+        can be resumed without running finished checks again.
+
+        Returns:
+            Dictionary with all fields (timestamps as seconds since the epoch)
+        """
+        return {
+            "name": self.name,
+            "tool": self.tool,
+            "status": self.status.value,
+            "duration": self.duration,
+            "exit_code": self.exit_code,
+            "timeout": self.timeout,
+            "queued_at": self.queued_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "findings": self.findings,
+            "output": self.output,
+            "error": self.error,
+            "output_omitted": self.output_omitted,
+            "error_omitted": self.error_omitted,
+            "cache": self.cache,
+        }
+
+    @classmethod
+    @beartype
+    @require(lambda record: "name" in record and "status" in record, "Record must include name and status")
+    def from_record(cls, record: dict[str, Any]) -> CheckResult:
+        """
+        Restore a result from a record written by `to_record`.
+
+        Args:
+            record: Record of a finished check
+
+        Returns:
+            CheckResult equal to the one the record was made from
+        """
+        return cls(
+            name=record["name"],
+            tool=record.get("tool") or "unknown",
+            status=CheckStatus(record["status"]),
+            duration=record.get("duration"),
+            exit_code=record.get("exit_code"),
+            output=record.get("output") or "",
+            error=record.get("error") or "",
+            timeout=bool(record.get("timeout")),
+            queued_at=record.get("queued_at"),
+            started_at=record.get("started_at"),
+            finished_at=record.get("finished_at"),
+            findings=record.get("findings"),
+            output_omitted=int(record.get("output_omitted") or 0),
+            error_omitted=int(record.get("error_omitted") or 0),
+            cache=record.get("cache"),
+        )
+
 
 @dataclass
 class ReproReport:
@@ -509,6 +786,7 @@ class ReproReport:
     enforcement_preset: str | None = None
     fix_enabled: bool = False
     fail_fast: bool = False
+    max_parallel: int | None = None
 
     @beartype
     @require(lambda result: isinstance(result, CheckResult), "Must be CheckResult instance")
@@ -595,6 +873,8 @@ class ReproReport:
             metadata["fix_enabled"] = self.fix_enabled
         if self.fail_fast:
             metadata["fail_fast"] = self.fail_fast
+        if self.max_parallel is not None:
+            metadata["max_parallel"] = self.max_parallel
 
         if metadata:
             result["metadata"] = metadata
@@ -602,6 +882,110 @@ class ReproReport:
         return result
 
 
+@dataclass
+class CheckSpec:
+    """A validation check to schedule."""
+
+    name: str
+    tool: str
+    command: list[str]  # Empty if the tool is not available (reported as skipped)
+    estimate: float | None = None  # Expected duration (seconds) until the check has run before
+    skip_if_missing: bool = True
+    env: dict[str, str] | None = None
+    # Checks that must finish first (ordering only; their outcome does not matter)
+    depends_on: tuple[str, ...] = ()
+    # Runs the check in-process instead of `command` (called with the check's timeout)
+    runner: Callable[[float], CheckResult] | None = None
+    # What the result depends on; None disables the result cache for this check
+    cache: CheckCacheSpec | None = None
+
+
+@dataclass
+class CheckCacheSpec:
+    """Inputs of a check's result, for replaying it from the result cache (see `repro_cache`)."""
+
+    # Prints the tool version (part of the cache key)
+    version_command: list[str]
+    # Files and directories (relative to the repository) whose files the tool reads
+    inputs: tuple[str, ...]
+    # Configuration files (relative to the repository; missing files count too)
+    config_files: tuple[str, ...] = ()
+    suffixes: tuple[str, ...] = (".py", ".pyi")
+    # Builds the command that checks only the given files (per-file tools such as ruff);
+    # their findings are merged into the cached findings of the unchanged files
+    partial_command: Callable[[list[str]], list[str]] | None = None
+
+
+@beartype
+@require(lambda budget: budget > 0, "Budget must be positive")
+@require(lambda concurrency: concurrency >= 1, "Concurrency must be >= 1")
+@ensure(lambda result: all(value > 0 for value in result.values()), "Allocations must be positive")
+def allocate_check_budget(estimates: dict[str, float], budget: float, concurrency: int) -> dict[str, float]:
+    """
+    Split a time budget between checks based on their expected durations.
+
+    Each check asks for its expected duration plus headroom (capped at the budget).
+    If all requests fit into the available capacity (budget x parallel slots), they
+    are scaled up to use it; otherwise the largest requests are cut first (water-filling),
+    so one slow check cannot starve the quick ones.
+
+    Args:
+        estimates: Expected duration in seconds per check name
+        budget: Total wall-clock budget in seconds
+        concurrency: Number of checks run at the same time
+
+    Returns:
+        Timeout in seconds per check name
+    """
+    if not estimates:
+        return {}
+    wants = {name: min(budget, max(estimate, 1.0) * CHECK_TIMEOUT_HEADROOM) for name, estimate in estimates.items()}
+    capacity = budget * min(concurrency, len(wants))
+    total_want = sum(wants.values())
+    if total_want <= capacity:
+        scale = capacity / total_want
+        return {name: min(budget, want * scale) for name, want in wants.items()}
+
+    allocations: dict[str, float] = {}
+    remaining = capacity
+    ordered = sorted(wants.items(), key=lambda item: item[1])
+    for index, (name, want) in enumerate(ordered):
+        level = remaining / (len(ordered) - index)
+        allocations[name] = min(want, level)
+        remaining -= allocations[name]
+    return allocations
+
+
+def _duration_history_path(repo_path: Path) -> Path:
+    """Path of the per-check duration history."""
+    from specfact_cli.utils.structure import SpecFactStructure
+
+    return repo_path / SpecFactStructure.CACHE / "repro" / "durations.json"
+
+
+def _load_duration_history(repo_path: Path) -> dict[str, float]:
+    """Load expected durations per check name (empty if missing or unreadable)."""
+    try:
+        data = json.loads(_duration_history_path(repo_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {str(name): float(value) for name, value in data.items() if isinstance(value, (int, float)) and value > 0}
+
+
+def _save_duration_history(repo_path: Path, history: dict[str, float]) -> None:
+    """Persist expected durations per check name (best effort)."""
+    path = _duration_history_path(repo_path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(history, indent=2, sort_keys=True), encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError:
+        pass
+
+
 class ReproChecker:
     """
     Runs validation checks with time budgets and result aggregation.
@@ -612,9 +996,18 @@ class ReproChecker:
 
     @beartype
     @require(lambda budget: budget > 0, "Budget must be positive")
+    @require(lambda max_parallel: max_parallel is None or max_parallel >= 1, "max_parallel must be >= 1")
     @ensure(lambda self: self.budget > 0, "Budget must be positive after init")
     def __init__(
-        self, repo_path: Path | None = None, budget: int = 120, fail_fast: bool = False, fix: bool = False
+        self,
+        repo_path: Path | None = None,
+        budget: int = 120,
+        fail_fast: bool = False,
+        fix: bool = False,
+        max_parallel: int | None = None,
+        on_event: Callable[[dict[str, Any]], None] | None = None,
+        completed: list[CheckResult] | None = None,
+        use_cache: bool = True,
     ) -> None:
         """
         Initialize reproducibility checker.
@@ -624,11 +1017,35 @@ class ReproChecker:
             budget: Total time budget in seconds (must be > 0)
             fail_fast: Stop on first failure
             fix: Apply auto-fixes where available (Semgrep auto-fixes)
+            max_parallel: Maximum checks run at the same time (default: up to 4, by CPU count;
+                1 in TEST_MODE)
+            on_event: Called (from worker threads) with a JSON-serializable record when a
+                check starts (`check_started`), for each finding parsed from its output while
+                it runs (`finding`) and when it finishes (`check_result`)
+            completed: Results of checks that already finished in an interrupted run; these
+                checks are reported again instead of being run
+            use_cache: Replay results of checks whose tool version, configuration and inputs
+                are unchanged from the result cache (.specfact/cache/repro/results)
         """
         self.repo_path = Path(repo_path) if repo_path else Path(".")
         self.budget = budget
         self.fail_fast = fail_fast
         self.fix = fix
+        if max_parallel is None:
+            from specfact_cli.utils.executors import available_cpu_count
+
+            if os.environ.get("TEST_MODE") == "true":
+                max_parallel = 1
+            else:
+                max_parallel = min(DEFAULT_MAX_PARALLEL_CHECKS, available_cpu_count())
+        self.max_parallel = max_parallel
+        self.on_event = on_event
+        self.completed = list(completed or [])
+        self.result_cache: ReproResultCache | None = None
+        if use_cache:
+            from specfact_cli.validators.repro_cache import ReproResultCache
+
+            self.result_cache = ReproResultCache(self.repo_path)
         self.report = ReproReport()
         self.start_time = time.time()
 
@@ -637,6 +1054,7 @@ class ReproChecker:
         self.report.budget = budget
         self.report.fix_enabled = fix
         self.report.fail_fast = fail_fast
+        self.report.max_parallel = max_parallel
 
     @beartype
     @require(lambda name: isinstance(name, str) and len(name) > 0, "Name must be non-empty string")
@@ -651,9 +1069,11 @@ class ReproChecker:
         name: str,
         tool: str,
         command: list[str],
-        timeout: int | None = None,
+        timeout: int | float | None = None,
         skip_if_missing: bool = True,
         env: dict[str, str] | None = None,
+        runner: Callable[[float], CheckResult] | None = None,
+        cache_spec: CheckCacheSpec | None = None,
     ) -> CheckResult:
         """
         Run a single validation check.
@@ -665,6 +1085,10 @@ class ReproChecker:
             timeout: Per-check timeout (default: budget / number of checks, must be > 0 if provided)
             skip_if_missing: Skip check if tool not found
             env: Optional environment variables to pass to the subprocess
+            runner: Runs the check instead of `command` (e.g., sharded CrossHair); called with the
+                check timeout and returns the check's status and output
+            cache_spec: Inputs of the check's result; if they are unchanged, the cached result
+                is replayed (with `partial_command`, only changed files are checked again)
 
         Returns:
             CheckResult with status and output
@@ -695,70 +1119,327 @@ class ReproChecker:
         # Run command
         result.status = CheckStatus.RUNNING
         start = time.time()
+        result.started_at = start
+        lookup = None
+        if self.result_cache is not None and cache_spec is not None and runner is None:
+            lookup = self.result_cache.lookup(name, tool, command, cache_spec)
+            if lookup is not None and lookup.result is not None:
+                # Tool version, configuration and inputs unchanged: replay the cached result
+                cached = lookup.result
+                cached.cache = "hit"
+                cached.started_at = start
+                cached.finished_at = time.time()
+                cached.duration = cached.finished_at - start
+                return cached
+            if lookup is not None and lookup.changed_files is not None and cache_spec.partial_command is not None:
+                if not lookup.changed_files:
+                    # Only removed files: the cached findings of the remaining files are the result
+                    return self.result_cache.store(lookup, None, start)
+                command = cache_spec.partial_command(lookup.changed_files)
+        self._emit(
+            {
+                "type": "check_started",
+                "check": name,
+                "tool": tool,
+                "started_at": datetime.fromtimestamp(start).isoformat(),
+            }
+        )
+        parser = findings_parser_for(
+            tool,
+            on_finding=lambda category, finding: self._emit(
+                {"type": "finding", "check": name, "tool": tool, "category": category, "finding": finding}
+            ),
+        )
 
         try:
-            proc = subprocess.run(
-                command,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=check_timeout,
-                check=False,
-                env=env,
-            )
+            if runner is not None:
+                outcome = runner(check_timeout)
+                result.duration = time.time() - start
+                result.status = outcome.status
+                result.exit_code = outcome.exit_code
+                result.timeout = outcome.timeout
+                stdout, stderr = BoundedOutput(), BoundedOutput()
+                stdout.append(outcome.output)
+                stderr.append(outcome.error)
+                self._capture_output(result, stdout, stderr)
+                if parser is not None:
+                    result.findings = _parse_output(parser, outcome.output, outcome.error)
+                result.finished_at = time.time()
+                return result
+
+            returncode, stdout, stderr = self._run_streaming(command, check_timeout, env, parser)
 
             result.duration = time.time() - start
-            result.exit_code = proc.returncode
-            result.output = proc.stdout
-            result.error = proc.stderr
+            result.exit_code = returncode
+            self._capture_output(result, stdout, stderr)
+            if parser is not None:
+                result.findings = parser.result()
 
             # Check if this is a CrossHair signature analysis limitation (not a real failure)
-            is_signature_issue = False
-            if tool.lower() == "crosshair" and proc.returncode != 0:
-                combined_output = f"{proc.stderr} {proc.stdout}".lower()
-                is_signature_issue = (
-                    "wrong parameter order" in combined_output
-                    or "keyword-only parameter" in combined_output
-                    or "valueerror: wrong parameter" in combined_output
-                    or ("signature" in combined_output and ("error" in combined_output or "failure" in combined_output))
-                )
+            is_signature_issue = (
+                tool.lower() == "crosshair"
+                and returncode not in (0, None)
+                and _is_crosshair_signature_issue(result.output, result.error)
+            )
 
-            if proc.returncode == 0:
+            if returncode is None:
+                result.status = CheckStatus.TIMEOUT
+                result.timeout = True
+                result.error = f"Check timed out after {check_timeout}s"
+            elif returncode == 0:
                 result.status = CheckStatus.PASSED
             elif is_signature_issue:
                 # CrossHair signature analysis limitation - treat as skipped, not failed
                 result.status = CheckStatus.SKIPPED
-                result.error = f"CrossHair signature analysis limitation (non-blocking, runtime contracts valid): {proc.stderr[:200] if proc.stderr else 'signature analysis limitation'}"
+                result.error = f"CrossHair signature analysis limitation (non-blocking, runtime contracts valid): {result.error[:200] if result.error else 'signature analysis limitation'}"
             else:
                 result.status = CheckStatus.FAILED
 
-        except subprocess.TimeoutExpired:
-            result.duration = time.time() - start
-            result.status = CheckStatus.TIMEOUT
-            result.timeout = True
-            result.error = f"Check timed out after {check_timeout}s"
-
         except Exception as e:
             result.duration = time.time() - start
             result.status = CheckStatus.FAILED
             result.error = f"Check failed with exception: {e!s}"
 
+        result.finished_at = time.time()
+        if lookup is not None and self.result_cache is not None:
+            # Cache the result (a partial run is merged with the cached findings of unchanged files)
+            return self.result_cache.store(lookup, result, start)
         return result
 
+    def _run_streaming(
+        self,
+        command: list[str],
+        timeout: float,
+        env: dict[str, str] | None,
+        parser: FindingsParser | None,
+    ) -> tuple[int | None, BoundedOutput, BoundedOutput]:
+        """
+        Run a command, feeding its output to the findings parser line by line as it is printed.
+
+        Returns:
+            Exit code (None if the command timed out and was killed) and the captured
+            head and tail of stdout and stderr
+        """
+        outputs = {"stdout": BoundedOutput(), "stderr": BoundedOutput()}
+        lock = threading.Lock()
+        process = subprocess.Popen(
+            command,
+            cwd=self.repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+            env=env,
+        )
+
+        def pump(stream_name: str, stream: Any) -> None:
+            for line in iter(functools.partial(stream.readline, MAX_OUTPUT_LINE), ""):
+                with lock:
+                    outputs[stream_name].append(line)
+                    if parser is not None:
+                        parser.feed(line, stream_name)
+
+        readers = [
+            threading.Thread(target=pump, args=(stream_name, stream), daemon=True)
+            for stream_name, stream in (("stdout", process.stdout), ("stderr", process.stderr))
+        ]
+        for reader in readers:
+            reader.start()
+        returncode: int | None = None
+        try:
+            returncode = process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        finally:
+            for reader in readers:
+                reader.join(OUTPUT_READER_JOIN_TIMEOUT)
+        return returncode, outputs["stdout"], outputs["stderr"]
+
+    @staticmethod
+    def _capture_output(result: CheckResult, stdout: BoundedOutput, stderr: BoundedOutput) -> None:
+        """Store the captured output of a check in its result."""
+        result.output = stdout.text()
+        result.error = stderr.text()
+        result.output_omitted = stdout.omitted
+        result.error_omitted = stderr.omitted
+
+    def _emit(self, record: dict[str, Any]) -> None:
+        """Pass a progress record to the on_event callback, if any."""
+        if self.on_event is not None:
+            self.on_event(record)
+
+    @beartype
+    @require(lambda checks: len({spec.name for spec in checks}) == len(checks), "Check names must be unique")
+    def run_scheduled_checks(
+        self,
+        checks: list[CheckSpec],
+        on_result: Callable[[CheckResult], None] | None = None,
+        unavailable: Callable[[CheckSpec], CheckResult] | None = None,
+    ) -> None:
+        """
+        Run checks in parallel, respecting dependencies, and add results to the report.
+
+        Up to `max_parallel` checks run at the same time; a check starts once all checks
+        it depends on have finished. The budget is split between checks by their past
+        durations (`allocate_check_budget`), so a slow check cannot use up the time of
+        the others. Results are added to the report (and passed to `on_result`) in
+        completion order. With fail_fast, no new checks start after the first failure.
+        Checks with a result in `completed` (from an interrupted run) are not run again;
+        their stored result is reported first.
+
+        Args:
+            checks: Checks to run (in priority order)
+            on_result: Called with each result as soon as its check finishes
+            unavailable: Builds the result for checks without a command (default: skipped)
+        """
+        history = _load_duration_history(self.repo_path)
+        runnable = [spec for spec in checks if spec.command]
+        remaining_budget = max(self.budget - (time.time() - self.start_time), 1.0)
+        allocations = allocate_check_budget(
+            {spec.name: history.get(spec.name, spec.estimate or DEFAULT_CHECK_ESTIMATE) for spec in runnable},
+            remaining_budget,
+            self.max_parallel,
+        )
+
+        names = {spec.name for spec in checks}
+        queued_at = time.time()
+        pending = list(checks)
+        finished: set[str] = set()
+        running: dict[Future[CheckResult], CheckSpec] = {}
+        stop = False
+
+        def record(result: CheckResult, resumed: bool = False) -> None:
+            nonlocal stop
+            if not resumed:
+                result.queued_at = queued_at
+                self._emit({"type": "check_result", "check": result.name, "result": result.to_record()})
+            self.report.add_check(result)
+            if (
+                not resumed
+                and result.cache is None
+                and result.duration is not None
+                and result.status != CheckStatus.SKIPPED
+            ):
+                previous = history.get(result.name)
+                if result.status == CheckStatus.TIMEOUT:
+                    # A timed-out run only shows a lower bound of the real duration
+                    history[result.name] = max(previous or 0.0, result.duration)
+                elif previous is None:
+                    history[result.name] = result.duration
+                else:
+                    history[result.name] = (
+                        DURATION_HISTORY_WEIGHT * result.duration + (1 - DURATION_HISTORY_WEIGHT) * previous
+                    )
+            if on_result is not None:
+                on_result(result)
+            if self.fail_fast and result.status == CheckStatus.FAILED:
+                stop = True
+
+        def start_ready_checks() -> bool:
+            """Start ready checks while parallel slots are free; return whether any check was started or resolved."""
+            nonlocal stop
+            progressed = False
+            for spec in list(pending):
+                if stop:
+                    break
+                if any(dep in names and dep not in finished for dep in spec.depends_on):
+                    continue
+                if not spec.command:
+                    pending.remove(spec)
+                    result = (
+                        unavailable(spec)
+                        if unavailable is not None
+                        else CheckResult(
+                            name=spec.name,
+                            tool=spec.tool,
+                            status=CheckStatus.SKIPPED,
+                            error=f"Tool '{spec.tool}' not available",
+                        )
+                    )
+                    result.started_at = result.finished_at = time.time()
+                    finished.add(spec.name)
+                    record(result)
+                    progressed = True
+                    continue
+                if len(running) >= self.max_parallel:
+                    continue
+                if time.time() - self.start_time >= self.budget:
+                    self.report.budget_exceeded = True
+                    stop = True
+                    break
+                pending.remove(spec)
+                future = executor.submit(
+                    self.run_check,
+                    spec.name,
+                    spec.tool,
+                    spec.command,
+                    allocations.get(spec.name),
+                    spec.skip_if_missing,
+                    spec.env,
+                    spec.runner,
+                    spec.cache,
+                )
+                running[future] = spec
+                progressed = True
+            if stop:
+                # Checks not started yet are dropped (running ones still report)
+                pending.clear()
+            return progressed
+
+        # Checks that finished in an interrupted run are reported again, not run
+        completed = {result.name: result for result in self.completed}
+        for spec in list(pending):
+            if spec.name in completed:
+                pending.remove(spec)
+                finished.add(spec.name)
+                record(completed[spec.name], resumed=True)
+        if stop:
+            pending.clear()
+
+        executor = ThreadPoolExecutor(max_workers=self.max_parallel)
+        interrupted = False
+        try:
+            while pending or running:
+                while start_ready_checks():
+                    pass
+                if not running:
+                    # Anything still pending waits on checks that will never run
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: checks.index(running[f])):
+                    spec = running.pop(future)
+                    finished.add(spec.name)
+                    record(future.result())
+        except KeyboardInterrupt:
+            interrupted = True
+            raise
+        finally:
+            executor.shutdown(wait=not interrupted, cancel_futures=True)
+            _save_duration_history(self.repo_path, history)
+            if self.result_cache is not None:
+                self.result_cache.save()
+
     @beartype
     @ensure(lambda result: isinstance(result, ReproReport), "Must return ReproReport")
     @ensure(lambda result: result.total_checks >= 0, "Total checks must be non-negative")
     @ensure(
-        lambda result: result.total_checks
-        == result.passed_checks + result.failed_checks + result.timeout_checks + result.skipped_checks,
+        lambda result: (
+            result.total_checks
+            == result.passed_checks + result.failed_checks + result.timeout_checks + result.skipped_checks
+        ),
         "Total checks must equal sum of all status types",
     )
-    def run_all_checks(self) -> ReproReport:
+    def run_all_checks(self, on_result: Callable[[CheckResult], None] | None = None) -> ReproReport:
         """
         Run all validation checks.
 
         Detects the target repository's environment manager and builds appropriate
         commands. Makes all tools optional with clear messaging when unavailable.
+        Independent checks run in parallel (see `run_scheduled_checks`).
+
+        Args:
+            on_result: Called with each check result as soon as the check finishes
 
         Returns:
             ReproReport with aggregated results
@@ -797,21 +1478,30 @@ class ReproChecker:
         smoke_tests = self.repo_path / "tests" / "smoke"
         tests_dir = self.repo_path / "tests"
 
-        checks: list[tuple[str, str, list[str], int | None, bool, dict[str, str] | None]] = []
+        checks: list[CheckSpec] = []
 
         # Linting (ruff) - optional
         ruff_available, _ = check_tool_in_env(self.repo_path, "ruff", env_info)
         if ruff_available:
-            ruff_command = ["ruff", "check", "--output-format=full", *source_dirs]
+            ruff_targets = list(source_dirs)
             if tests_dir.exists():
-                ruff_command.append("tests/")
+                ruff_targets.append("tests/")
             if (self.repo_path / "tools").exists():
-                ruff_command.append("tools/")
-            ruff_command = build_tool_command(env_info, ruff_command)
-            checks.append(("Linting (ruff)", "ruff", ruff_command, None, True, None))
+                ruff_targets.append("tools/")
+            ruff_command = build_tool_command(env_info, ["ruff", "check", "--output-format=full", *ruff_targets])
+            ruff_cache = CheckCacheSpec(
+                version_command=build_tool_command(env_info, ["ruff", "--version"]),
+                inputs=tuple(ruff_targets),
+                config_files=("pyproject.toml", "ruff.toml", ".ruff.toml"),
+                # Files passed explicitly are still subject to ruff's exclude settings
+                partial_command=lambda files: build_tool_command(
+                    env_info, ["ruff", "check", "--output-format=full", "--force-exclude", *files]
+                ),
+            )
+            checks.append(CheckSpec("Linting (ruff)", "ruff", ruff_command, cache=ruff_cache))
         else:
             # Add as skipped check with message
-            checks.append(("Linting (ruff)", "ruff", [], None, True, None))
+            checks.append(CheckSpec("Linting (ruff)", "ruff", []))
 
         # Semgrep - optional, only if config exists
         if semgrep_enabled:
@@ -821,9 +1511,21 @@ class ReproChecker:
                 if self.fix:
                     semgrep_command.append("--autofix")
                 semgrep_command = build_tool_command(env_info, semgrep_command)
-                checks.append(("Async patterns (semgrep)", "semgrep", semgrep_command, 30, True, None))
+                # Auto-fixes change the sources, so a fixing run is never replayed from the cache
+                semgrep_cache = (
+                    None
+                    if self.fix
+                    else CheckCacheSpec(
+                        version_command=build_tool_command(env_info, ["semgrep", "--version"]),
+                        inputs=(".",),
+                        config_files=(str(semgrep_config.relative_to(self.repo_path)), ".semgrepignore"),
+                    )
+                )
+                checks.append(
+                    CheckSpec("Async patterns (semgrep)", "semgrep", semgrep_command, estimate=30, cache=semgrep_cache)
+                )
             else:
-                checks.append(("Async patterns (semgrep)", "semgrep", [], 30, True, None))
+                checks.append(CheckSpec("Async patterns (semgrep)", "semgrep", [], estimate=30))
 
         # Type checking (basedpyright) - optional
         basedpyright_available, _ = check_tool_in_env(self.repo_path, "basedpyright", env_info)
@@ -831,10 +1533,20 @@ class ReproChecker:
             basedpyright_command = ["basedpyright", *source_dirs]
             if (self.repo_path / "tools").exists():
                 basedpyright_command.append("tools/")
+            basedpyright_cache = CheckCacheSpec(
+                version_command=build_tool_command(env_info, ["basedpyright", "--version"]),
+                inputs=tuple(basedpyright_command[1:]),
+                # Lock files stand in for the installed packages the type checker resolves imports against
+                config_files=("pyproject.toml", "pyrightconfig.json", "uv.lock", "poetry.lock", "requirements.txt"),
+            )
             basedpyright_command = build_tool_command(env_info, basedpyright_command)
-            checks.append(("Type checking (basedpyright)", "basedpyright", basedpyright_command, None, True, None))
+            checks.append(
+                CheckSpec(
+                    "Type checking (basedpyright)", "basedpyright", basedpyright_command, cache=basedpyright_cache
+                )
+            )
         else:
-            checks.append(("Type checking (basedpyright)", "basedpyright", [], None, True, None))
+            checks.append(CheckSpec("Type checking (basedpyright)", "basedpyright", []))
 
         # CrossHair - optional, only if source directories exist
         if source_dirs:
@@ -846,27 +1558,39 @@ class ReproChecker:
                 if (self.repo_path / "tools").exists():
                     crosshair_targets.append("tools/")
 
-                expanded_targets, _excluded_main, pythonpath_roots = _expand_crosshair_targets(
+                module_files, _excluded_main, pythonpath_roots = _crosshair_target_modules(
                     self.repo_path, crosshair_targets
                 )
-                if expanded_targets:
-                    crosshair_base = ["python", "-m", "crosshair", "check", *expanded_targets]
-                    crosshair_command = build_tool_command(env_info, crosshair_base)
+                if module_files:
+                    from specfact_cli.validators.crosshair_shards import CrossHairShard, CrossHairShardRunner
+
+                    # One CrossHair process per module (shard); unchanged modules are served from the cache
+                    crosshair_command = build_tool_command(env_info, ["python", "-m", "crosshair", "check"])
                     crosshair_env = _build_crosshair_env(pythonpath_roots)
+                    shard_runner = CrossHairShardRunner(
+                        self.repo_path,
+                        crosshair_command,
+                        env=crosshair_env,
+                        workers=self.max_parallel,
+                        cache=CrossHairShardRunner.cache_for(self.repo_path),
+                    )
+                    shards = [CrossHairShard(module, file_path) for module, file_path in sorted(module_files.items())]
                     checks.append(
-                        (
+                        CheckSpec(
                             "Contract exploration (CrossHair)",
                             "crosshair",
                             crosshair_command,
-                            60,
-                            True,
-                            crosshair_env,
+                            estimate=60,
+                            env=crosshair_env,
+                            runner=functools.partial(
+                                shard_runner.run_check, "Contract exploration (CrossHair)", shards
+                            ),
                         )
                     )
                 else:
-                    checks.append(("Contract exploration (CrossHair)", "crosshair", [], 60, True, None))
+                    checks.append(CheckSpec("Contract exploration (CrossHair)", "crosshair", [], estimate=60))
             else:
-                checks.append(("Contract exploration (CrossHair)", "crosshair", [], 60, True, None))
+                checks.append(CheckSpec("Contract exploration (CrossHair)", "crosshair", [], estimate=60))
 
         # Property tests - optional, only if directory exists
         if contracts_tests.exists():
@@ -874,9 +1598,9 @@ class ReproChecker:
             if pytest_available:
                 pytest_command = ["pytest", "tests/contracts/", "-v"]
                 pytest_command = build_tool_command(env_info, pytest_command)
-                checks.append(("Property tests (pytest contracts)", "pytest", pytest_command, 30, True, None))
+                checks.append(CheckSpec("Property tests (pytest contracts)", "pytest", pytest_command, estimate=30))
             else:
-                checks.append(("Property tests (pytest contracts)", "pytest", [], 30, True, None))
+                checks.append(CheckSpec("Property tests (pytest contracts)", "pytest", [], estimate=30))
 
         # Smoke tests - optional, only if directory exists
         if smoke_tests.exists():
@@ -884,38 +1608,28 @@ class ReproChecker:
             if pytest_available:
                 pytest_command = ["pytest", "tests/smoke/", "-v"]
                 pytest_command = build_tool_command(env_info, pytest_command)
-                checks.append(("Smoke tests (pytest smoke)", "pytest", pytest_command, 30, True, None))
+                checks.append(CheckSpec("Smoke tests (pytest smoke)", "pytest", pytest_command, estimate=30))
             else:
-                checks.append(("Smoke tests (pytest smoke)", "pytest", [], 30, True, None))
-
-        for check_args in checks:
-            # Check budget before starting
-            elapsed = time.time() - self.start_time
-            if elapsed >= self.budget:
-                self.report.budget_exceeded = True
-                break
-
-            # Skip checks with empty commands (tool not available)
-            name, tool, command, _timeout, _skip_if_missing, _env = check_args
-            if not command:
-                # Tool not available - create skipped result with helpful message
-                _tool_available, tool_message = check_tool_in_env(self.repo_path, tool, env_info)
-                result = CheckResult(
-                    name=name,
-                    tool=tool,
-                    status=CheckStatus.SKIPPED,
-                    error=tool_message or f"Tool '{tool}' not available",
-                )
-                self.report.add_check(result)
-                continue
-
-            # Run check
-            result = self.run_check(*check_args)
-            self.report.add_check(result)
+                checks.append(CheckSpec("Smoke tests (pytest smoke)", "pytest", [], estimate=30))
+
+        # Semgrep auto-fixes rewrite source files - run every other check on the fixed sources
+        semgrep_names = [spec.name for spec in checks if spec.tool == "semgrep" and spec.command]
+        if self.fix and semgrep_names:
+            for spec in checks:
+                if spec.tool != "semgrep":
+                    spec.depends_on = (*spec.depends_on, *semgrep_names)
+
+        def report_unavailable(spec: CheckSpec) -> CheckResult:
+            # Tool not available - create skipped result with helpful message
+            _tool_available, tool_message = check_tool_in_env(self.repo_path, spec.tool, env_info)
+            return CheckResult(
+                name=spec.name,
+                tool=spec.tool,
+                status=CheckStatus.SKIPPED,
+                error=tool_message or f"Tool '{spec.tool}' not available",
+            )
 
-            # Fail fast if requested
-            if self.fail_fast and result.status == CheckStatus.FAILED:
-                break
+        self.run_scheduled_checks(checks, on_result=on_result, unavailable=report_unavailable)
 
         self.report.total_duration = time.time() - self.start_time
 
@@ -0,0 +1,205 @@
+"""
+Streaming repro reports - JSON Lines records written while validation runs.
+
+A full `specfact repro` run can take many minutes. Next to the YAML report
+(written once at the end), the run appends one JSON record per line to a
+stream file as soon as something happens:
+
+- `run_started` / `run_resumed`: run settings and the YAML report path
+- `check_started`: a check's tool process was launched
+- `finding`: a finding parsed from a tool's output while the tool still runs
+- `check_result`: a check finished (complete `CheckResult` record)
+- `run_finished`: exit code and total duration
+
+Each record is flushed when written, so the stream can be followed with
+`tail -f` and survives a crash or Ctrl-C. A stream without `run_finished`
+belongs to an interrupted run, which `specfact repro --resume` continues:
+checks with a `check_result` record are reported from the stream and only
+the remaining checks run again.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from beartype import beartype
+from icontract import ensure, require
+
+from specfact_cli.validators.repro_checker import CheckResult
+
+
+# Bump when the record layout changes incompatibly
+STREAM_FORMAT_VERSION = 1
+
+
+class ReproStreamWriter:
+    """Thread-safe writer appending one JSON record per line to a repro stream file."""
+
+    @beartype
+    @require(lambda path: isinstance(path, Path), "Path must be Path")
+    def __init__(self, path: Path, append: bool = False) -> None:
+        """
+        Open a stream file for writing.
+
+        Args:
+            path: Stream file (`.jsonl`); parent directories are created
+            append: Continue an existing stream (resume) instead of replacing it
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        needs_newline = append and path.exists() and path.stat().st_size > 0 and not _ends_with_newline(path)
+        self._handle = path.open("a" if append else "w", encoding="utf-8")
+        if needs_newline:
+            # An interrupted run may have stopped in the middle of a record
+            self._handle.write("\n")
+
+    @beartype
+    def write(self, record: dict[str, Any]) -> None:
+        """Write one record and flush it to disk."""
+        line = json.dumps(record, default=str, ensure_ascii=False)
+        with self._lock:
+            if self._handle.closed:
+                return
+            self._handle.write(line + "\n")
+            self._handle.flush()
+
+    def close(self) -> None:
+        """Close the stream file."""
+        with self._lock:
+            self._handle.close()
+
+    def __enter__(self) -> ReproStreamWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+@dataclass
+class ReproStreamState:
+    """State of a run, rebuilt from its stream file."""
+
+    path: Path
+    run: dict[str, Any] = field(default_factory=dict)
+    results: list[CheckResult] = field(default_factory=list)
+    finished: bool = False
+
+
+@beartype
+def run_started_record(
+    repo_path: Path, report_path: Path, budget: int, fix: bool, fail_fast: bool, max_parallel: int
+) -> dict[str, Any]:
+    """Build the first record of a new run's stream."""
+    return {
+        "type": "run_started",
+        "format": STREAM_FORMAT_VERSION,
+        "timestamp": datetime.now().isoformat(),
+        "repo_path": str(repo_path.resolve()),
+        "report_path": str(report_path),
+        "budget": budget,
+        "fix": fix,
+        "fail_fast": fail_fast,
+        "max_parallel": max_parallel,
+    }
+
+
+@beartype
+def run_resumed_record(completed: int) -> dict[str, Any]:
+    """Build the record marking where a resumed run continues a stream."""
+    return {"type": "run_resumed", "timestamp": datetime.now().isoformat(), "completed_checks": completed}
+
+
+@beartype
+def run_finished_record(exit_code: int, total_duration: float) -> dict[str, Any]:
+    """Build the last record of a completed run's stream."""
+    return {
+        "type": "run_finished",
+        "timestamp": datetime.now().isoformat(),
+        "exit_code": exit_code,
+        "total_duration": total_duration,
+    }
+
+
+@beartype
+@require(lambda path: isinstance(path, Path), "Path must be Path")
+@ensure(lambda result: isinstance(result, ReproStreamState), "Must return ReproStreamState")
+def read_repro_stream(path: Path) -> ReproStreamState:
+    """
+    Rebuild a run's state from its stream file.
+
+    Lines that are not valid records (e.g. cut off by an interrupted run) are skipped.
+
+    Args:
+        path: Stream file
+
+    Returns:
+        Run settings, finished check results (latest per check) and whether the run finished
+    """
+    state = ReproStreamState(path=path)
+    results: dict[str, CheckResult] = {}
+    with path.open(encoding="utf-8", errors="replace") as handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(record, dict):
+                continue
+            record_type = record.get("type")
+            if record_type == "run_started":
+                state.run = record
+            elif record_type == "check_result" and isinstance(record.get("result"), dict):
+                try:
+                    result = CheckResult.from_record(record["result"])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                results[result.name] = result
+            elif record_type == "run_finished":
+                state.finished = True
+    state.results = list(results.values())
+    return state
+
+
+@beartype
+@require(lambda directory: isinstance(directory, Path), "Directory must be Path")
+def find_resumable_stream(directory: Path, repo_path: Path) -> ReproStreamState | None:
+    """
+    Find the most recent interrupted run of a repository in a report directory.
+
+    Args:
+        directory: Directory holding repro reports and their streams
+        repo_path: Repository the run must have validated
+
+    Returns:
+        State of the newest unfinished stream for repo_path, or None
+    """
+    if not directory.is_dir():
+        return None
+    repo = str(repo_path.resolve())
+    streams = sorted(directory.glob("*.jsonl"), key=lambda path: path.stat().st_mtime, reverse=True)
+    for path in streams:
+        state = read_repro_stream(path)
+        if state.finished or state.run.get("repo_path") != repo:
+            continue
+        if state.run.get("format") != STREAM_FORMAT_VERSION:
+            continue
+        return state
+    return None
+
+
+def _ends_with_newline(path: Path) -> bool:
+    with path.open("rb") as handle:
+        handle.seek(-1, 2)
+        return handle.read(1) == b"\n"
@@ -159,7 +159,7 @@ def validate_plan_bundle(
         )
     fmt = StructuredFormat.from_path(path)
     try:
-        data = load_structured_file(path, fmt)
+        data = load_structured_file(path, fmt, round_trip=False)
         bundle = PlanBundle(**data)
         return True, None, bundle
 
@@ -196,7 +196,7 @@ def validate_protocol(protocol_or_path: Protocol | Path) -> ValidationReport | t
     path = protocol_or_path
     fmt = StructuredFormat.from_path(path)
     try:
-        data = load_structured_file(path, fmt)
+        data = load_structured_file(path, fmt, round_trip=False)
         protocol = Protocol(**data)
         return True, None, protocol
 
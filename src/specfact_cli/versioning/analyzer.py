@@ -189,9 +189,11 @@ class ChangeAnalyzer:
         content_hash: str | None = None
         try:
             bundle_obj = bundle or load_project_bundle(bundle_dir, validate_hashes=False, progress_callback=None)
-            summary = bundle_obj.compute_summary(include_hash=True)
-            content_hash = summary.content_hash
             baseline_hash = bundle_obj.manifest.bundle.get("content_hash")
+            # A baseline recorded as pre-Merkle hash is returned as-is while the content is unchanged
+            content_hash = bundle_obj.compute_content_hash(
+                expected=baseline_hash if isinstance(baseline_hash, str) and baseline_hash else None
+            )
 
             if change_type == ChangeType.NONE:
                 if baseline_hash and content_hash and baseline_hash != content_hash:
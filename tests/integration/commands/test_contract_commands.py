@@ -199,6 +199,47 @@ class TestContractValidate:
         # Should fail or report error
         assert result.exit_code != 0 or "error" in result.stdout.lower() or "invalid" in result.stdout.lower()
 
+    def test_validate_reports_structural_issues(self, sample_bundle_with_contract: tuple[Path, str]) -> None:
+        """Test that structural issues (duplicate operationIds, missing responses) are listed."""
+        repo_path, bundle_name = sample_bundle_with_contract
+        os.environ["TEST_MODE"] = "true"
+
+        contracts_dir = repo_path / ".specfact" / "projects" / bundle_name / "contracts"
+        contracts_dir.mkdir(exist_ok=True)
+
+        import yaml
+
+        contract_data = {
+            "openapi": "3.0.3",
+            "info": {"title": "Test API", "version": "1.0.0"},
+            "paths": {
+                "/users": {
+                    "get": {"operationId": "users", "responses": {"200": {"description": "Success"}}},
+                    "post": {"operationId": "users"},
+                }
+            },
+        }
+        (contracts_dir / "FEATURE-001.openapi.yaml").write_text(yaml.dump(contract_data))
+
+        result = runner.invoke(
+            app,
+            [
+                "contract",
+                "validate",
+                "--repo",
+                str(repo_path),
+                "--bundle",
+                bundle_name,
+                "--feature",
+                "FEATURE-001",
+                "--no-interactive",
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "duplicate operationId 'users'" in result.stdout
+        assert "missing required field 'responses'" in result.stdout
+
 
 class TestContractCoverage:
     """Test suite for contract coverage command."""
@@ -353,3 +353,43 @@ packages = ["src/test_package"]
                         pyproject_path.chmod(0o644)
                 except Exception:
                     pass
+
+
+class TestReproResume:
+    """Test suite for streamed and resumed repro runs."""
+
+    def test_resume_runs_only_unfinished_checks(self, tmp_path: Path, monkeypatch):
+        """An interrupted run is resumed into the same report; finished checks are not run again."""
+        import sys
+
+        from specfact_cli.validators.repro_checker import CheckSpec, ReproChecker
+        from specfact_cli.validators.repro_stream import read_repro_stream
+
+        monkeypatch.chdir(tmp_path)
+        ran: list[str] = []
+
+        def run_all_checks(self, on_result=None):
+            specs = [CheckSpec(name, "python", [sys.executable, "-c", ""], False) for name in ("Lint", "Tests")]
+            self.run_scheduled_checks(specs, on_result=on_result)
+            ran.extend(check.name for check in self.report.checks if check not in self.completed)
+            return self.report
+
+        with patch.object(ReproChecker, "run_all_checks", run_all_checks):
+            # Interrupted after "Lint" finished
+            first = runner.invoke(app, ["repro", "--repo", str(tmp_path)])
+            assert first.exit_code == 0
+            stream_path = next((tmp_path / ".specfact" / "reports" / "enforcement").glob("*.jsonl"))
+            lines = stream_path.read_text(encoding="utf-8").splitlines()
+            kept = [line for line in lines if '"Tests"' not in line and '"run_finished"' not in line]
+            stream_path.write_text("\n".join(kept) + "\n", encoding="utf-8")
+            ran.clear()
+
+            result = runner.invoke(app, ["repro", "--repo", str(tmp_path), "--resume"])
+
+        assert result.exit_code == 0
+        assert "Resuming interrupted run" in result.stdout
+        assert ran == ["Tests"]
+        state = read_repro_stream(stream_path)
+        assert state.finished is True
+        assert {check.name for check in state.results} == {"Lint", "Tests"}
+        assert stream_path.with_suffix(".yaml").exists()
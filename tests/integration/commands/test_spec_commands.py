@@ -14,9 +14,10 @@ runner = CliRunner()
 class TestSpecValidateCommand:
     """Test suite for spec validate command."""
 
+    @patch("specfact_cli.commands.spec.get_specmatic_version", return_value=None)
     @patch("specfact_cli.commands.spec.check_specmatic_available")
-    @patch("specfact_cli.commands.spec.validate_spec_with_specmatic")
-    def test_validate_command_success(self, mock_validate, mock_check, tmp_path):
+    @patch("specfact_cli.integrations.specmatic.validate_spec_with_specmatic")
+    def test_validate_command_success(self, mock_validate, mock_check, _mock_version, tmp_path):
         """Test successful validation command."""
         mock_check.return_value = (True, None)
         from specfact_cli.integrations.specmatic import SpecValidationResult
@@ -38,7 +39,7 @@ class TestSpecValidateCommand:
         mock_validate.side_effect = mock_validate_coro
 
         spec_path = tmp_path / "openapi.yaml"
-        spec_path.write_text("openapi: 3.0.0\ninfo:\n  title: Test API\n  version: 1.0.0\n")
+        spec_path.write_text("openapi: 3.0.0\ninfo:\n  title: Test API\n  version: 1.0.0\npaths: {}\n")
 
         old_cwd = os.getcwd()
         try:
@@ -69,9 +70,10 @@ class TestSpecValidateCommand:
         assert result.exit_code == 1
         assert "Specmatic not available" in result.stdout
 
+    @patch("specfact_cli.commands.spec.get_specmatic_version", return_value=None)
     @patch("specfact_cli.commands.spec.check_specmatic_available")
-    @patch("specfact_cli.commands.spec.validate_spec_with_specmatic")
-    def test_validate_command_failure(self, mock_validate, mock_check, tmp_path):
+    @patch("specfact_cli.integrations.specmatic.validate_spec_with_specmatic")
+    def test_validate_command_failure(self, mock_validate, mock_check, _mock_version, tmp_path):
         """Test validation command with validation failures."""
         mock_check.return_value = (True, None)
         from specfact_cli.integrations.specmatic import SpecValidationResult
@@ -89,7 +91,7 @@ class TestSpecValidateCommand:
         mock_validate.side_effect = mock_validate_async
 
         spec_path = tmp_path / "openapi.yaml"
-        spec_path.write_text("openapi: 3.0.0\n")
+        spec_path.write_text("openapi: 3.0.0\ninfo:\n  title: Test API\n  version: 1.0.0\npaths: {}\n")
 
         old_cwd = os.getcwd()
         try:
@@ -102,6 +104,63 @@ class TestSpecValidateCommand:
         assert "✗ Specification validation failed" in result.stdout
         assert "Schema validation failed" in result.stdout
 
+    @patch("specfact_cli.commands.spec.get_specmatic_version", return_value=None)
+    @patch("specfact_cli.commands.spec.check_specmatic_available")
+    @patch("specfact_cli.integrations.specmatic.validate_spec_with_specmatic")
+    def test_validate_command_structural_prepass(self, mock_validate, mock_check, _mock_version, tmp_path):
+        """Test that contracts with structural errors fail without running Specmatic."""
+        mock_check.return_value = (True, None)
+
+        spec_path = tmp_path / "openapi.yaml"
+        spec_path.write_text(
+            "openapi: 3.0.3\ninfo:\n  title: Test API\n  version: 1.0.0\npaths:\n"
+            "  /users/{id}:\n    get:\n      responses:\n        '200':\n"
+            "          $ref: '#/components/responses/Missing'\n"
+        )
+
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(tmp_path)
+            result = runner.invoke(app, ["spec", "validate", str(spec_path)])
+        finally:
+            os.chdir(old_cwd)
+
+        assert result.exit_code == 1
+        mock_validate.assert_not_called()
+        assert "path parameter 'id'" in result.stdout
+        assert "#/components/responses/Missing" in result.stdout
+
+    @patch("specfact_cli.commands.spec.get_specmatic_version", return_value="2.0.0")
+    @patch("specfact_cli.commands.spec.check_specmatic_available")
+    @patch("specfact_cli.integrations.specmatic.validate_spec_with_specmatic")
+    def test_validate_command_replays_cached_results(self, mock_validate, mock_check, _mock_version, tmp_path):
+        """Test that unchanged contracts are replayed from the result cache unless --force is given."""
+        mock_check.return_value = (True, None)
+        from specfact_cli.integrations.specmatic import SpecValidationResult
+
+        async def mock_validate_async(*args, **kwargs):
+            return SpecValidationResult(is_valid=True, schema_valid=True, examples_valid=True)
+
+        mock_validate.side_effect = mock_validate_async
+
+        spec_path = tmp_path / "openapi.yaml"
+        spec_path.write_text("openapi: 3.0.0\ninfo:\n  title: Test API\n  version: 1.0.0\npaths: {}\n")
+
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(tmp_path)
+            first = runner.invoke(app, ["spec", "validate", str(spec_path)])
+            second = runner.invoke(app, ["spec", "validate", str(spec_path)])
+            assert mock_validate.call_count == 1
+            forced = runner.invoke(app, ["spec", "validate", str(spec_path), "--force"])
+        finally:
+            os.chdir(old_cwd)
+
+        assert first.exit_code == second.exit_code == forced.exit_code == 0
+        assert "Skipping (cache hit" in second.stdout
+        assert mock_validate.call_count == 2
+        assert list((tmp_path / ".specfact" / "cache" / "contracts").rglob("*.json"))
+
 
 class TestSpecBackwardCompatCommand:
     """Test suite for spec backward-compat command."""
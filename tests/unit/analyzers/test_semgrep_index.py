@@ -0,0 +1,136 @@
+"""
+Unit tests for batched Semgrep execution.
+
+Tests sharding, the per-file findings index and per-file-hash caching of findings.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from specfact_cli.analyzers.code_analyzer import CodeAnalyzer
+from specfact_cli.analyzers.semgrep_index import SemgrepBatchRunner, SemgrepFindingIndex
+from specfact_cli.utils.analysis_cache import AnalysisCache
+
+
+def _fake_semgrep(calls: list[list[str]]) -> Any:
+    """Create a fake subprocess.run reporting one finding per scanned file."""
+
+    def run(cmd: list[str], **_kwargs: Any) -> subprocess.CompletedProcess[str]:
+        calls.append(cmd)
+        targets = cmd[cmd.index("--json") + 1 :]
+        results = [
+            {
+                "check_id": "crud-detection",
+                "path": target,
+                "start": {"line": 5},
+                "message": "CRUD operation",
+                "extra": {"metadata": {"operation": "create"}},
+            }
+            for target in targets
+        ]
+        return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps({"results": results, "errors": []}), stderr="")
+
+    return run
+
+
+def _make_files(tmp_path: Path, count: int) -> list[Path]:
+    files = []
+    for i in range(count):
+        file_path = tmp_path / f"module_{i}.py"
+        file_path.write_text(f"value_{i} = {i}\n")
+        files.append(file_path)
+    return files
+
+
+class TestSemgrepFindingIndex:
+    """Tests for SemgrepFindingIndex."""
+
+    def test_findings_sorted_by_line(self, tmp_path: Path) -> None:
+        """Findings are indexed by file and sorted by start line."""
+        file_path = tmp_path / "module.py"
+        index = SemgrepFindingIndex()
+        index.add(file_path, [{"start": {"line": 9}}, {"start": {"line": 2}}])
+
+        assert file_path in index
+        assert [f["start"]["line"] for f in index.findings_for(file_path)] == [2, 9]
+        assert index.findings_for(tmp_path / "other.py") == []
+
+
+class TestSemgrepBatchRunner:
+    """Tests for SemgrepBatchRunner."""
+
+    def test_scans_in_shards(self, tmp_path: Path) -> None:
+        """Semgrep runs once per shard instead of once per file."""
+        files = _make_files(tmp_path, 5)
+        calls: list[list[str]] = []
+        runner = SemgrepBatchRunner([tmp_path / "rules.yml", tmp_path / "quality.yml"], shard_size=2)
+
+        with patch("specfact_cli.analyzers.semgrep_index.subprocess.run", side_effect=_fake_semgrep(calls)):
+            index = runner.scan(files)
+
+        assert len(calls) == 3
+        assert calls[0].count("--config") == 2
+        assert len(index) == 5
+        assert all(len(index.findings_for(f)) == 1 for f in files)
+
+    def test_findings_cached_per_file_hash(self, tmp_path: Path) -> None:
+        """Re-scans only run Semgrep for files whose content changed."""
+        files = _make_files(tmp_path, 3)
+        cache = AnalysisCache(tmp_path)
+        calls: list[list[str]] = []
+
+        with patch("specfact_cli.analyzers.semgrep_index.subprocess.run", side_effect=_fake_semgrep(calls)):
+            SemgrepBatchRunner([tmp_path / "rules.yml"], analysis_cache=cache, rules_hash="a").scan(files)
+            files[1].write_text("changed = True\n")
+            runner = SemgrepBatchRunner([tmp_path / "rules.yml"], analysis_cache=cache, rules_hash="a")
+            index = runner.scan(files)
+
+        assert runner.cached_file_count == 2
+        assert calls[-1][calls[-1].index("--json") + 1 :] == [str(files[1])]
+        assert len(index.findings_for(files[0])) == 1
+
+    def test_failed_shard_not_cached(self, tmp_path: Path) -> None:
+        """Failed shards yield no findings for this run and are rescanned next run."""
+        files = _make_files(tmp_path, 2)
+        cache = AnalysisCache(tmp_path)
+        runner = SemgrepBatchRunner([tmp_path / "rules.yml"], analysis_cache=cache)
+
+        with patch(
+            "specfact_cli.analyzers.semgrep_index.subprocess.run",
+            side_effect=subprocess.TimeoutExpired("semgrep", 1),
+        ):
+            index = runner.scan(files)
+
+        assert files[0] in index
+        assert index.findings_for(files[0]) == []
+        assert cache.get_stats().writes == 0
+
+
+class TestCodeAnalyzerSemgrepIndex:
+    """Tests for CodeAnalyzer looking up findings from the batch index."""
+
+    def test_run_semgrep_patterns_uses_index(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Indexed files are not rescanned; unindexed files are scanned on demand."""
+        monkeypatch.delenv("TEST_MODE", raising=False)
+        files = _make_files(tmp_path, 2)
+        with patch.object(CodeAnalyzer, "_check_semgrep_available", return_value=False):
+            analyzer = CodeAnalyzer(tmp_path)
+        analyzer.semgrep_enabled = True
+        analyzer.semgrep_runner = SemgrepBatchRunner([tmp_path / "rules.yml"])
+        calls: list[list[str]] = []
+
+        with patch("specfact_cli.analyzers.semgrep_index.subprocess.run", side_effect=_fake_semgrep(calls)):
+            analyzer.semgrep_runner.scan([files[0]], analyzer.semgrep_index)
+            first = analyzer._run_semgrep_patterns(files[0])
+            second = analyzer._run_semgrep_patterns(files[1])
+
+        assert len(first) == 1
+        assert len(second) == 1
+        assert len(calls) == 2
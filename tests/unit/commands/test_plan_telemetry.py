@@ -157,8 +157,11 @@ class TestPlanCommandTelemetry:
         mock_record.assert_called()
 
     @patch("specfact_cli.commands.plan.telemetry")
-    def test_plan_compare_tracks_telemetry(self, mock_telemetry: MagicMock, tmp_path):
+    def test_plan_compare_tracks_telemetry(self, mock_telemetry: MagicMock, tmp_path, monkeypatch):
         """Test that plan compare command tracks telemetry."""
+        # The comparison report is written below the working directory
+        monkeypatch.chdir(tmp_path)
+
         from specfact_cli.generators.plan_generator import PlanGenerator
         from specfact_cli.models.plan import Feature, PlanBundle, Product
 
@@ -1,5 +1,8 @@
 """Unit tests for Specmatic integration."""
 
+import shlex
+import sys
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -9,8 +12,10 @@ from specfact_cli.integrations.specmatic import (
     check_backward_compatibility,
     check_specmatic_available,
     create_mock_server,
+    generate_specmatic_examples_for_specs,
     generate_specmatic_tests,
     validate_spec_with_specmatic,
+    validate_specs_with_specmatic,
 )
 
 
@@ -143,15 +148,15 @@ class TestValidateSpecWithSpecmatic:
 
     @pytest.mark.asyncio
     @patch("specfact_cli.integrations.specmatic._get_specmatic_command")
-    @patch("specfact_cli.integrations.specmatic.asyncio.to_thread")
-    async def test_validate_success(self, mock_to_thread, mock_get_cmd, tmp_path):
+    @patch("specfact_cli.integrations.specmatic._run_specmatic")
+    async def test_validate_success(self, mock_run_specmatic, mock_get_cmd, tmp_path):
         """Test successful validation."""
         # Mock specmatic command
         mock_get_cmd.return_value = ["specmatic"]
         # Mock successful subprocess runs
         mock_schema_result = MagicMock(returncode=0, stderr="")
         mock_examples_result = MagicMock(returncode=0, stderr="")
-        mock_to_thread.side_effect = [mock_schema_result, mock_examples_result]
+        mock_run_specmatic.side_effect = [mock_schema_result, mock_examples_result]
 
         spec_path = tmp_path / "openapi.yaml"
         spec_path.write_text("openapi: 3.0.0\n")
@@ -161,7 +166,7 @@ class TestValidateSpecWithSpecmatic:
         assert result.is_valid is True
         assert result.schema_valid is True
         assert result.examples_valid is True
-        assert mock_to_thread.call_count == 2  # Schema validation + examples
+        assert mock_run_specmatic.call_count == 2  # Schema validation + examples
 
     @pytest.mark.asyncio
     @patch("specfact_cli.integrations.specmatic._get_specmatic_command")
@@ -181,15 +186,15 @@ class TestValidateSpecWithSpecmatic:
 
     @pytest.mark.asyncio
     @patch("specfact_cli.integrations.specmatic._get_specmatic_command")
-    @patch("specfact_cli.integrations.specmatic.asyncio.to_thread")
-    async def test_validate_with_previous_version(self, mock_to_thread, mock_get_cmd, tmp_path):
+    @patch("specfact_cli.integrations.specmatic._run_specmatic")
+    async def test_validate_with_previous_version(self, mock_run_specmatic, mock_get_cmd, tmp_path):
         """Test validation with previous version for backward compatibility."""
         mock_get_cmd.return_value = ["specmatic"]
         # Mock successful subprocess runs
         mock_schema_result = MagicMock(returncode=0, stderr="")
         mock_examples_result = MagicMock(returncode=0, stderr="")
         mock_compat_result = MagicMock(returncode=0, stdout="", stderr="")
-        mock_to_thread.side_effect = [mock_schema_result, mock_examples_result, mock_compat_result]
+        mock_run_specmatic.side_effect = [mock_schema_result, mock_examples_result, mock_compat_result]
 
         spec_path = tmp_path / "openapi.yaml"
         spec_path.write_text("openapi: 3.0.0\n")
@@ -200,7 +205,7 @@ class TestValidateSpecWithSpecmatic:
 
         assert result.is_valid is True
         assert result.backward_compatible is True
-        assert mock_to_thread.call_count == 3  # Schema validation + examples + backward compat check
+        assert mock_run_specmatic.call_count == 3  # Schema validation + examples + backward compat check
 
 
 class TestCheckBackwardCompatibility:
@@ -208,13 +213,13 @@ class TestCheckBackwardCompatibility:
 
     @pytest.mark.asyncio
     @patch("specfact_cli.integrations.specmatic._get_specmatic_command")
-    @patch("specfact_cli.integrations.specmatic.asyncio.to_thread")
-    async def test_backward_compatible(self, mock_to_thread, mock_get_cmd, tmp_path):
+    @patch("specfact_cli.integrations.specmatic._run_specmatic")
+    async def test_backward_compatible(self, mock_run_specmatic, mock_get_cmd, tmp_path):
         """Test when specs are backward compatible."""
         mock_get_cmd.return_value = ["specmatic"]
         # Mock successful backward compatibility check
         mock_compat_result = MagicMock(returncode=0, stdout="", stderr="")
-        mock_to_thread.return_value = mock_compat_result
+        mock_run_specmatic.return_value = mock_compat_result
 
         old_spec = tmp_path / "old.yaml"
         old_spec.write_text("openapi: 3.0.0\n")
@@ -228,8 +233,8 @@ class TestCheckBackwardCompatibility:
 
     @pytest.mark.asyncio
     @patch("specfact_cli.integrations.specmatic._get_specmatic_command")
-    @patch("specfact_cli.integrations.specmatic.asyncio.to_thread")
-    async def test_backward_incompatible(self, mock_to_thread, mock_get_cmd, tmp_path):
+    @patch("specfact_cli.integrations.specmatic._run_specmatic")
+    async def test_backward_incompatible(self, mock_run_specmatic, mock_get_cmd, tmp_path):
         """Test when specs are not backward compatible."""
         mock_get_cmd.return_value = ["specmatic"]
         # Mock failed backward compatibility check with breaking changes in output
@@ -238,7 +243,7 @@ class TestCheckBackwardCompatibility:
             stdout="Breaking change: Removed endpoint /api/v1/users",
             stderr="incompatible changes detected",
         )
-        mock_to_thread.return_value = mock_compat_result
+        mock_run_specmatic.return_value = mock_compat_result
 
         old_spec = tmp_path / "old.yaml"
         old_spec.write_text("openapi: 3.0.0\n")
@@ -252,6 +257,78 @@ class TestCheckBackwardCompatibility:
         assert any("Removed endpoint" in change or "incompatible" in change.lower() for change in breaking_changes)
 
 
+# Stand-in for the Specmatic CLI: records how many instances run at once and
+# fails `validate` for specs containing "broken"
+FAKE_SPECMATIC = """
+import os, sys, time
+from pathlib import Path
+
+state = Path(os.environ["FAKE_SPECMATIC_STATE"])
+marker = state / f"running-{os.getpid()}"
+marker.touch()
+with (state / "concurrency.log").open("a") as log:
+    log.write(f"{len(list(state.glob('running-*')))}\\n")
+time.sleep(0.2)
+marker.unlink()
+if sys.argv[1] == "validate" and "broken" in Path(sys.argv[2]).read_text():
+    sys.stderr.write("missing info")
+    sys.exit(1)
+if sys.argv[1:3] == ["examples", "generate"]:
+    (Path.cwd() / f"{Path(sys.argv[3]).stem}_examples" / "example.json").write_text("{}")
+"""
+
+
+@pytest.fixture
+def fake_specmatic(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Use a fake Specmatic script; returns its state directory."""
+    script = tmp_path / "fake_specmatic.py"
+    script.write_text(FAKE_SPECMATIC)
+    state = tmp_path / "state"
+    state.mkdir()
+    monkeypatch.setenv("SPECFACT_SPECMATIC_CMD", f"{shlex.quote(sys.executable)} {shlex.quote(str(script))}")
+    monkeypatch.setenv("FAKE_SPECMATIC_STATE", str(state))
+    return state
+
+
+class TestSpecmaticBatches:
+    """Test suite for concurrent validation and example generation of several specs."""
+
+    @pytest.mark.asyncio
+    async def test_validate_specs_runs_concurrently_and_streams_results(self, fake_specmatic, tmp_path):
+        """Specs are validated concurrently (bounded), reported as they finish and returned in input order."""
+        spec_paths = []
+        for index in range(6):
+            spec_path = tmp_path / f"api-{index}.yaml"
+            spec_path.write_text("openapi: 3.0.0\n" + ("broken\n" if index == 2 else ""))
+            spec_paths.append(spec_path)
+        reported: list[Path] = []
+
+        results = await validate_specs_with_specmatic(
+            spec_paths, max_concurrency=4, on_result=lambda spec_path, _result: reported.append(spec_path)
+        )
+
+        assert sorted(reported) == sorted(spec_paths)
+        assert [result.is_valid for result in results] == [True, True, False, True, True, True]
+        assert results[2].errors == ["Schema validation failed: missing info"]
+        assert set(results[0].step_durations) == {"schema", "examples"}
+        assert results[0].duration >= 0.4
+        concurrency = [int(line) for line in (fake_specmatic / "concurrency.log").read_text().split()]
+        assert len(concurrency) == 12
+        assert 1 < max(concurrency) <= 4
+
+    @pytest.mark.asyncio
+    async def test_generate_examples_for_specs(self, fake_specmatic, tmp_path):
+        """Examples are generated next to each spec; directories are returned in input order."""
+        spec_paths = [tmp_path / "orders.yaml", tmp_path / "users.yaml"]
+        for spec_path in spec_paths:
+            spec_path.write_text("openapi: 3.0.0\n")
+
+        outcomes = await generate_specmatic_examples_for_specs(spec_paths)
+
+        assert outcomes == [tmp_path / "orders_examples", tmp_path / "users_examples"]
+        assert all((outcome / "example.json").exists() for outcome in outcomes)
+
+
 class TestGenerateSpecmaticTests:
     """Test suite for generate_specmatic_tests function."""
 
@@ -17,9 +17,13 @@ from specfact_cli.models.project import (
     BundleManifest,
     BundleVersions,
     FeatureIndex,
+    LazyFeatureDict,
     PersonaMapping,
     ProjectBundle,
+    diff_content_hashes,
+    merkle_content_hash,
 )
+from specfact_cli.utils.bundle_loader import load_project_bundle, save_project_bundle
 
 
 class TestBundleVersions:
@@ -356,6 +360,281 @@ class TestProjectBundle:
         assert checksum == expected
 
 
+def _save_bundle_with_features(bundle_dir: Path, count: int) -> None:
+    """Save a bundle with `count` single-story features."""
+    bundle = ProjectBundle(
+        manifest=BundleManifest(schema_metadata=None, project_metadata=None),
+        bundle_name=bundle_dir.name,
+        product=Product(themes=["Theme1"]),
+    )
+    for index in range(count):
+        bundle.add_feature(
+            Feature(
+                key=f"FEATURE-{index:03d}",
+                title=f"Feature {index}",
+                stories=[Story(key=f"STORY-{index:03d}", title="Story", story_points=None, value_points=None)],
+            )
+        )
+    bundle.save_to_directory(bundle_dir)
+
+
+class TestLazyProjectBundle:
+    """Tests for lazy (on-demand) feature loading."""
+
+    def test_features_load_on_first_access(self, tmp_path: Path):
+        """Only the manifest index is read up front; features are validated when accessed."""
+        bundle_dir = tmp_path / "lazy-bundle"
+        _save_bundle_with_features(bundle_dir, 3)
+        # A broken feature file only fails when that feature is accessed
+        (bundle_dir / "features" / "FEATURE-002.yaml").write_text("key: [unclosed\n")
+
+        bundle = ProjectBundle.load_from_directory(bundle_dir, lazy=True)
+
+        assert isinstance(bundle.features, LazyFeatureDict)
+        assert len(bundle.features) == 3
+        assert list(bundle.features) == ["FEATURE-000", "FEATURE-001", "FEATURE-002"]
+        assert "FEATURE-001" in bundle.features
+        assert bundle.features.loaded_count() == 0
+
+        feature = bundle.get_feature("FEATURE-001")
+        assert feature is not None
+        assert feature.title == "Feature 1"
+        assert bundle.get_feature("FEATURE-999") is None
+        assert bundle.features.loaded_count() == 1
+        with pytest.raises(ValueError, match=r"FEATURE-002\.yaml"):
+            bundle.features["FEATURE-002"]
+
+    def test_iteration_materialises_features(self, tmp_path: Path):
+        """Iterating values/items loads every feature; results match an eager load."""
+        bundle_dir = tmp_path / "lazy-bundle"
+        _save_bundle_with_features(bundle_dir, 4)
+
+        lazy = ProjectBundle.load_from_directory(bundle_dir, lazy=True)
+        eager = ProjectBundle.load_from_directory(bundle_dir)
+
+        assert [f.key for f in lazy.features.values()] == sorted(eager.features)
+        assert lazy.features == eager.features
+        assert (
+            lazy.compute_summary(include_hash=True).content_hash
+            == eager.compute_summary(include_hash=True).content_hash
+        )
+        assert lazy.model_dump()["features"].keys() == eager.model_dump()["features"].keys()
+
+    def test_save_writes_only_changed_features(self, tmp_path: Path):
+        """Saving a lazy bundle rewrites only materialised features whose content changed."""
+        bundle_dir = tmp_path / "lazy-bundle"
+        _save_bundle_with_features(bundle_dir, 3)
+        features_dir = bundle_dir / "features"
+        before = {path.name: path.stat().st_mtime_ns for path in features_dir.iterdir()}
+        old_manifest = ProjectBundle.load_from_directory(bundle_dir).manifest
+
+        bundle = ProjectBundle.load_from_directory(bundle_dir, lazy=True)
+        bundle.get_feature("FEATURE-000")  # read, not changed
+        feature = bundle.get_feature("FEATURE-001")
+        assert feature is not None
+        feature.stories.append(Story(key="STORY-NEW", title="New", story_points=None, value_points=None))
+        bundle.update_feature("FEATURE-001", feature)
+
+        written: list[str] = []
+        bundle.save_to_directory(bundle_dir, progress_callback=lambda _cur, _total, name: written.append(name))
+
+        after = {path.name: path.stat().st_mtime_ns for path in features_dir.iterdir()}
+        assert after["FEATURE-000.yaml"] == before["FEATURE-000.yaml"]
+        assert after["FEATURE-002.yaml"] == before["FEATURE-002.yaml"]
+        assert "features/FEATURE-001.yaml" in written
+        assert not any(name in written for name in ("features/FEATURE-000.yaml", "features/FEATURE-002.yaml"))
+
+        indices = {index.key: index for index in bundle.manifest.features}
+        assert [index.key for index in bundle.manifest.features] == ["FEATURE-000", "FEATURE-001", "FEATURE-002"]
+        assert indices["FEATURE-001"].stories_count == 2
+        assert indices["FEATURE-002"] == next(i for i in old_manifest.features if i.key == "FEATURE-002")
+
+        reloaded = ProjectBundle.load_from_directory(bundle_dir)
+        assert len(reloaded.features["FEATURE-001"].stories) == 2
+        assert len(reloaded.features) == 3
+
+    def test_save_to_other_directory_copies_unchanged_features(self, tmp_path: Path):
+        """Unchanged features are copied when a lazy bundle is saved elsewhere (e.g., atomic saves)."""
+        bundle_dir = tmp_path / "lazy-bundle"
+        _save_bundle_with_features(bundle_dir, 2)
+
+        bundle = ProjectBundle.load_from_directory(bundle_dir, lazy=True)
+        target_dir = tmp_path / "copy" / "lazy-bundle"
+        bundle.save_to_directory(target_dir)
+
+        assert bundle.features.loaded_count() == 0
+        copied = ProjectBundle.load_from_directory(target_dir)
+        assert sorted(copied.features) == ["FEATURE-000", "FEATURE-001"]
+        assert copied.features["FEATURE-001"].title == "Feature 1"
+
+
+class TestIncrementalSave:
+    """Tests for in-place saves that only rewrite changed sections."""
+
+    def test_save_rewrites_only_changed_files(self, tmp_path: Path):
+        """An edit to one feature and one aspect rewrites those files and the manifest only."""
+        bundle_dir = tmp_path / "bundle"
+        _save_bundle_with_features(bundle_dir, 3)
+        before = {path.relative_to(bundle_dir).as_posix(): path.read_bytes() for path in bundle_dir.rglob("*.yaml")}
+        old_checksums = dict(ProjectBundle.load_from_directory(bundle_dir).manifest.checksums.files)
+
+        bundle = load_project_bundle(bundle_dir)
+        assert bundle.can_save_incrementally(bundle_dir)
+        bundle.features["FEATURE-001"].title = "Renamed"
+        bundle.product.themes.append("Theme2")
+        written: list[str] = []
+        save_project_bundle(bundle, bundle_dir, progress_callback=lambda _cur, _total, name: written.append(name))
+
+        assert sorted(written[:-1]) == ["features/FEATURE-001.yaml", "product.yaml"]
+        assert written[-1] == "bundle.manifest.yaml"
+        after = {path.relative_to(bundle_dir).as_posix(): path.read_bytes() for path in bundle_dir.rglob("*.yaml")}
+        changed = sorted(name for name in after if after[name] != before.get(name))
+        assert changed == ["bundle.manifest.yaml", "features/FEATURE-001.yaml", "product.yaml"]
+        new_checksums = bundle.manifest.checksums.files
+        assert {name for name in new_checksums if new_checksums[name] != old_checksums.get(name)} == {
+            "features/FEATURE-001.yaml",
+            "product.yaml",
+        }
+
+        reloaded = load_project_bundle(bundle_dir, validate_hashes=True)
+        assert reloaded.features["FEATURE-001"].title == "Renamed"
+        assert reloaded.product.themes == ["Theme1", "Theme2"]
+
+    def test_save_deletes_removed_features_and_aspects(self, tmp_path: Path):
+        """Removed features and aspects lose their files and checksum entries."""
+        bundle_dir = tmp_path / "bundle"
+        _save_bundle_with_features(bundle_dir, 3)
+        bundle = load_project_bundle(bundle_dir)
+        bundle.idea = Idea(title="Idea", narrative="Narrative")
+        save_project_bundle(bundle, bundle_dir)
+        assert (bundle_dir / "idea.yaml").exists()
+
+        bundle.idea = None
+        del bundle.features["FEATURE-002"]
+        save_project_bundle(bundle, bundle_dir)
+
+        assert not (bundle_dir / "idea.yaml").exists()
+        assert not (bundle_dir / "features" / "FEATURE-002.yaml").exists()
+        assert "idea.yaml" not in bundle.manifest.checksums.files
+        assert "features/FEATURE-002.yaml" not in bundle.manifest.checksums.files
+        reloaded = load_project_bundle(bundle_dir, validate_hashes=True)
+        assert reloaded.idea is None
+        assert sorted(reloaded.features) == ["FEATURE-000", "FEATURE-001"]
+
+    def test_replaced_feature_mapping_and_new_directories(self, tmp_path: Path):
+        """Replacing the feature dict keeps saves incremental; other directories get a full save."""
+        bundle_dir = tmp_path / "bundle"
+        _save_bundle_with_features(bundle_dir, 2)
+        bundle = load_project_bundle(bundle_dir)
+        # Commands that round-trip through PlanBundle rebuild the mapping from the same features
+        bundle.features = {feature.key: feature for feature in bundle.features.values()}
+        written: list[str] = []
+        save_project_bundle(bundle, bundle_dir, progress_callback=lambda _cur, _total, name: written.append(name))
+        assert written == ["bundle.manifest.yaml"]
+
+        other_dir = tmp_path / "other" / "bundle"
+        assert not bundle.can_save_incrementally(other_dir)
+        save_project_bundle(bundle, other_dir)
+        assert sorted(path.name for path in (other_dir / "features").iterdir()) == [
+            "FEATURE-000.yaml",
+            "FEATURE-001.yaml",
+        ]
+        # After the atomic directory swap, the bundle's baseline follows it to the new directory
+        assert bundle.can_save_incrementally(other_dir)
+        assert not bundle.can_save_incrementally(bundle_dir)
+
+
+class TestContentHash:
+    """Tests for the Merkle content hash over aspects and features."""
+
+    def test_hash_is_stable_and_names_changed_features(self, tmp_path: Path):
+        """The hash survives a reload and feature order; a changed feature changes it and is named."""
+        bundle_dir = tmp_path / "hash-bundle"
+        _save_bundle_with_features(bundle_dir, 3)
+        bundle = ProjectBundle.load_from_directory(bundle_dir)
+        before = bundle.content_hashes()
+
+        reordered = ProjectBundle.load_from_directory(bundle_dir)
+        reordered.features = dict(reversed(list(reordered.features.items())))
+        assert reordered.compute_content_hash() == bundle.compute_content_hash() == merkle_content_hash(before)
+        assert bundle.compute_summary(include_hash=True).content_hash == merkle_content_hash(before)
+
+        # Models modified in place are hashed again
+        bundle.features["FEATURE-001"].stories[0].title = "Changed"
+        bundle.product.themes.append("New theme")
+        after = bundle.content_hashes()
+
+        assert merkle_content_hash(after) != merkle_content_hash(before)
+        assert diff_content_hashes(before, after) == ["feature:FEATURE-001", "product"]
+        assert bundle.compute_content_hash() == merkle_content_hash(after)
+
+    def test_load_hashes_are_reused_for_unmodified_bundles(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """With assume_unmodified, leaf hashes recorded on load or save are reused; replaced models are hashed."""
+        import specfact_cli.models.project as project_module
+
+        bundle_dir = tmp_path / "hash-bundle"
+        _save_bundle_with_features(bundle_dir, 3)
+        bundle = ProjectBundle.load_from_directory(bundle_dir)
+        hashed: list[str] = []
+        fingerprint = project_module._model_fingerprint
+
+        def counting_fingerprint(model):
+            hashed.append(type(model).__name__)
+            return fingerprint(model)
+
+        monkeypatch.setattr(project_module, "_model_fingerprint", counting_fingerprint)
+
+        root, leaves = bundle.content_hash_tree(assume_unmodified=True)
+        assert hashed == []
+        assert root == merkle_content_hash(leaves)
+
+        bundle.update_feature("FEATURE-002", bundle.features["FEATURE-002"].model_copy(update={"title": "Renamed"}))
+        bundle.content_hashes(assume_unmodified=True)
+        assert hashed == ["Feature"]
+
+        bundle.save_to_directory(bundle_dir)
+        hashed.clear()
+        bundle.content_hashes(assume_unmodified=True)
+        assert hashed == []
+
+        # Without assume_unmodified every leaf is hashed again
+        bundle.content_hashes()
+        assert sorted(hashed) == ["Feature", "Feature", "Feature", "Product"]
+
+    def test_unchanged_bundle_is_not_serialized(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Hashing a loaded, unchanged bundle reuses the load fingerprints without dumping any model."""
+        from pydantic import BaseModel
+
+        bundle_dir = tmp_path / "hash-bundle"
+        _save_bundle_with_features(bundle_dir, 3)
+        bundle = ProjectBundle.load_from_directory(bundle_dir)
+
+        def fail_dump(self, **kwargs):
+            raise AssertionError(f"{type(self).__name__} was serialized")
+
+        monkeypatch.setattr(BaseModel, "model_dump", fail_dump)
+        monkeypatch.setattr(BaseModel, "model_dump_json", fail_dump)
+
+        assert len(bundle.content_hashes(assume_unmodified=True)) == 4
+
+    def test_legacy_hash_is_accepted_for_unchanged_content(self):
+        """A pre-Merkle hash (e.g., from an existing SDD manifest) matches until the content changes."""
+        bundle = ProjectBundle(
+            manifest=BundleManifest(schema_metadata=None, project_metadata=None),
+            bundle_name="legacy",
+            product=Product(themes=["Theme1"]),
+            idea=Idea(title="Idea", narrative="Narrative", metrics=None),
+        )
+        bundle.add_feature(Feature(key="FEATURE-001", title="Test", source_tracking=None, contract=None, protocol=None))
+        legacy_hash = bundle._legacy_content_hash()
+
+        assert bundle.compute_content_hash(expected=legacy_hash) == legacy_hash
+        assert bundle.compute_content_hash(expected="0" * 64) == bundle.compute_content_hash()
+
+        bundle.features["FEATURE-001"].title = "Changed"
+        assert bundle.compute_content_hash(expected=legacy_hash) != legacy_hash
+
+
 class TestBundleFormat:
     """Tests for BundleFormat enum."""
 
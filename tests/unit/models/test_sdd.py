@@ -285,3 +285,29 @@ class TestSDDManifest:
 
         assert manifest.provenance["source"] == "test"
         assert manifest.provenance["author"] == "test_user"
+
+    def test_sdd_manifest_describe_content_changes(self):
+        """Test SDDManifest names the bundle leaves that changed since it was written."""
+        why = SDDWhy(intent="Test intent", target_users=None, value_hypothesis=None)  # type: ignore[call-arg]
+        what = SDDWhat(capabilities=["Capability 1"])
+        how = SDDHow(architecture=None)  # type: ignore[call-arg]
+        recorded = {"product": "a", "feature:FEATURE-001": "b", "feature:FEATURE-002": "c"}
+
+        manifest = SDDManifest(
+            version="1.0.0",
+            plan_bundle_id="abc123",
+            plan_bundle_hash="def456",
+            content_hashes=recorded,
+            why=why,
+            what=what,
+            how=how,
+        )  # type: ignore[call-arg]
+
+        assert manifest.describe_content_changes(recorded) is None
+        current = {"product": "x", "feature:FEATURE-001": "b", "feature:FEATURE-003": "d"}
+        assert (
+            manifest.describe_content_changes(current, limit=2)
+            == "changed: feature:FEATURE-002, feature:FEATURE-003 (+1 more)"
+        )
+        # Manifests written before leaf hashes were recorded cannot name changes
+        assert manifest.model_copy(update={"content_hashes": {}}).describe_content_changes(current) is None
@@ -12,6 +12,7 @@ from specfact_cli.telemetry import (
     TelemetryManager,
     TelemetrySettings,
 )
+from specfact_cli.utils.profiling import get_profiler, profile_phase
 
 
 def test_track_command_disabled(tmp_path: Path) -> None:
@@ -91,6 +92,45 @@ def test_track_command_marks_failure(tmp_path: Path) -> None:
     assert event["error"] == "CustomError"
 
 
+def test_track_command_exports_phases_as_child_spans(tmp_path: Path) -> None:
+    """Profiled phases should be exported as OTLP child spans of the command span."""
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    settings = TelemetrySettings(
+        enabled=True,
+        endpoint=None,
+        headers={},
+        local_path=tmp_path / "telemetry.log",
+        debug=False,
+        opt_in_source="env",
+    )
+    manager = TelemetryManager(settings=settings)
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    manager._tracer = provider.get_tracer("test")
+
+    with manager.track_command("import.from_code"):
+        with profile_phase("analysis", files=3, bundle="private-name"), profile_phase("discovery"):
+            pass
+        with profile_phase("save_bundle"):
+            pass
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    command_span = spans["specfact.import.from_code"]
+    analysis_span = spans["specfact.phase.analysis"]
+    assert analysis_span.parent.span_id == command_span.context.span_id
+    assert spans["specfact.phase.discovery"].parent.span_id == analysis_span.context.span_id
+    assert spans["specfact.phase.save_bundle"].parent.span_id == command_span.context.span_id
+    assert dict(analysis_span.attributes) == {"specfact.phase.files": 3}
+    assert command_span.start_time <= analysis_span.start_time <= analysis_span.end_time <= command_span.end_time
+    assert command_span.attributes["specfact.success"] is True
+    # The profiler started for telemetry is stopped with the command
+    assert get_profiler() is None
+
+
 def test_test_environment_detection(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Telemetry should be automatically disabled in test environments."""
     # Set TEST_MODE
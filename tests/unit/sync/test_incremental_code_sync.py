@@ -0,0 +1,182 @@
+"""Unit tests for dependency-aware incremental code sync."""
+
+from __future__ import annotations
+
+from collections import deque
+from pathlib import Path
+
+from specfact_cli.analyzers.code_analyzer import CodeAnalyzer
+from specfact_cli.models.plan import Feature
+from specfact_cli.models.project import BundleManifest, BundleVersions, Product, ProjectBundle
+from specfact_cli.models.source_tracking import SourceTracking
+from specfact_cli.sync.incremental_code_sync import ImportGraph, IncrementalCodeSync, format_sync_latency
+from specfact_cli.sync.watcher_enhanced import EnhancedSyncEventHandler, FileHashCache
+from specfact_cli.utils.bundle_loader import load_project_bundle, save_project_bundle
+from specfact_cli.utils.structure import SpecFactStructure
+
+
+CORE_SOURCE = '''
+class CoreService:
+    """Core service."""
+
+    def get_item(self, item_id: str) -> str:
+        """Get an item."""
+        return item_id
+'''
+
+API_SOURCE = '''
+from app.core import CoreService
+
+
+class ApiHandler:
+    """API handler."""
+
+    def handle_request(self, item_id: str) -> str:
+        """Handle a request."""
+        return CoreService().get_item(item_id)
+'''
+
+CLI_SOURCE = """
+from app.api import ApiHandler
+
+
+def main() -> None:
+    ApiHandler().handle_request("1")
+"""
+
+OTHER_SOURCE = '''
+class Unrelated:
+    """Unrelated component."""
+
+    def run_job(self) -> None:
+        """Run the job."""
+'''
+
+
+def _make_repo(tmp_path: Path) -> Path:
+    app = tmp_path / "app"
+    app.mkdir(parents=True)
+    (app / "__init__.py").write_text("")
+    (app / "core.py").write_text(CORE_SOURCE)
+    (app / "api.py").write_text(API_SOURCE)
+    (app / "cli.py").write_text(CLI_SOURCE)
+    (app / "other.py").write_text(OTHER_SOURCE)
+    return app
+
+
+def _save_bundle(tmp_path: Path, features: dict[str, str]) -> Path:
+    """Save a bundle with one feature per (key -> tracked file)."""
+    bundle_dir = tmp_path / SpecFactStructure.PROJECTS / "demo"
+    bundle_dir.mkdir(parents=True)
+    bundle = ProjectBundle(
+        manifest=BundleManifest(
+            versions=BundleVersions(schema="1.0", project="0.1.0"), schema_metadata=None, project_metadata=None
+        ),
+        bundle_name="demo",
+        product=Product(themes=[], releases=[]),
+        features={},
+    )
+    for key, tracked_file in features.items():
+        tracking = SourceTracking(implementation_files=[tracked_file])
+        tracking.update_hash(tmp_path / tracked_file, tmp_path)
+        bundle.add_feature(
+            Feature(key=key, title=key, confidence=0.1, source_tracking=tracking, contract=None, protocol=None)
+        )
+    save_project_bundle(bundle, bundle_dir, atomic=True)
+    return bundle_dir
+
+
+class TestImportGraph:
+    """Tests for ImportGraph."""
+
+    def test_importers_are_transitive(self, tmp_path: Path) -> None:
+        """A file's importers include importers of its importers."""
+        app = _make_repo(tmp_path)
+        dependencies: dict[str, list[str]] = {}
+        graph = ImportGraph(CodeAnalyzer(tmp_path), dependencies)
+        graph.build()
+
+        assert graph.importers(app / "core.py") == {(app / "api.py").resolve(), (app / "cli.py").resolve()}
+        assert graph.importers(app / "other.py") == set()
+        assert dependencies[str((app / "api.py").resolve())] == [str((app / "core.py").resolve())]
+
+    def test_src_layout_imports_resolve(self, tmp_path: Path) -> None:
+        """Absolute imports resolve to submodules under a src/ directory."""
+        _make_repo(tmp_path / "src")
+        app = tmp_path / "src" / "app"
+        graph = ImportGraph(CodeAnalyzer(tmp_path))
+        graph.build()
+
+        assert (app / "api.py").resolve() in graph.importers(app / "core.py")
+
+    def test_update_file_replaces_imports(self, tmp_path: Path) -> None:
+        """Removing an import drops the edge; deleting a file removes it from the graph."""
+        app = _make_repo(tmp_path)
+        graph = ImportGraph(CodeAnalyzer(tmp_path))
+        graph.build()
+
+        (app / "cli.py").write_text("def main() -> None:\n    pass\n")
+        graph.update_file(app / "cli.py")
+        assert graph.importers(app / "api.py") == set()
+
+        (app / "api.py").unlink()
+        graph.update_file(app / "api.py")
+        assert graph.importers(app / "core.py") == set()
+        assert (app / "api.py").resolve() not in graph.files
+
+    def test_handler_detects_dependents(self, tmp_path: Path) -> None:
+        """The watch handler reports importers from the graph, or from the cached imports."""
+        app = _make_repo(tmp_path)
+        hash_cache = FileHashCache(cache_file=tmp_path / "cache.json")
+        graph = ImportGraph(CodeAnalyzer(tmp_path), hash_cache.dependencies)
+        graph.build()
+        expected = [(app / "api.py").resolve(), (app / "cli.py").resolve()]
+
+        with_graph = EnhancedSyncEventHandler(tmp_path, deque(), hash_cache, import_graph=graph)
+        without_graph = EnhancedSyncEventHandler(tmp_path, deque(), hash_cache)
+
+        assert with_graph._detect_dependencies((app / "core.py").resolve()) == expected
+        assert without_graph._detect_dependencies((app / "core.py").resolve()) == expected
+
+
+class TestIncrementalCodeSync:
+    """Tests for IncrementalCodeSync."""
+
+    def test_only_affected_features_are_patched(self, tmp_path: Path) -> None:
+        """A change re-analyzes the file and its importers and patches only their features."""
+        app = _make_repo(tmp_path)
+        tracked = {
+            "FEATURE-CORESERVICE": "app/core.py",
+            "FEATURE-APIHANDLER": "app/api.py",
+            "FEATURE-UNRELATED": "app/other.py",
+        }
+        bundle_dir = _save_bundle(tmp_path, tracked)
+        code_sync = IncrementalCodeSync(tmp_path, "demo", analyzer=CodeAnalyzer(tmp_path))
+        code_sync.start()
+
+        (app / "core.py").write_text(CORE_SOURCE + "\n    def delete_item(self, item_id: str) -> None:\n        pass\n")
+        result = code_sync.sync([app / "core.py"])
+
+        assert result.changed_files == ["app/core.py"]
+        assert result.reanalyzed_files == ["app/api.py", "app/cli.py", "app/core.py"]
+        assert result.patched_features == ["FEATURE-APIHANDLER", "FEATURE-CORESERVICE"]
+        assert result.added_features == []
+
+        bundle = load_project_bundle(bundle_dir, validate_hashes=False)
+        assert bundle.features["FEATURE-CORESERVICE"].confidence > 0.1
+        assert bundle.features["FEATURE-UNRELATED"].confidence == 0.1
+        assert not bundle.features["FEATURE-CORESERVICE"].source_tracking.has_changed(app / "core.py", tmp_path)
+
+    def test_new_class_becomes_feature(self, tmp_path: Path) -> None:
+        """New classes in a changed file are added as features tracking that file."""
+        app = _make_repo(tmp_path)
+        bundle_dir = _save_bundle(tmp_path, {"FEATURE-UNRELATED": "app/other.py"})
+        code_sync = IncrementalCodeSync(tmp_path, "demo", analyzer=CodeAnalyzer(tmp_path))
+        code_sync.start()
+
+        result = code_sync.sync([app / "api.py", tmp_path / "README.md"])
+
+        assert result.added_features == ["FEATURE-APIHANDLER"]
+        bundle = load_project_bundle(bundle_dir, validate_hashes=False)
+        assert bundle.features["FEATURE-APIHANDLER"].source_tracking.implementation_files == ["app/api.py"]
+        assert "changed" in format_sync_latency(result, 0.0)
@@ -4,9 +4,19 @@ Unit tests for enhanced watch mode with hash-based change detection.
 
 from __future__ import annotations
 
+import threading
+from collections import deque
 from pathlib import Path
 
-from specfact_cli.sync.watcher_enhanced import FileHashCache, compute_file_hash
+from watchdog.events import FileCreatedEvent, FileDeletedEvent, FileModifiedEvent, FileMovedEvent
+
+from specfact_cli.sync.watcher_enhanced import (
+    EnhancedSyncEventHandler,
+    FileChange,
+    FileHashCache,
+    WatchEventPipeline,
+    compute_file_hash,
+)
 
 
 class TestComputeFileHash:
@@ -105,3 +115,134 @@ class TestFileHashCache:
 
         cache.set_dependencies(test_path, deps)
         assert cache.get_dependencies(test_path) == deps
+
+
+def _make_handler(tmp_path: Path, **pipeline_options: float) -> tuple[EnhancedSyncEventHandler, deque[FileChange]]:
+    change_queue: deque[FileChange] = deque()
+    hash_cache = FileHashCache(cache_file=tmp_path / "cache.json")
+    handler = EnhancedSyncEventHandler(tmp_path, change_queue, hash_cache)
+    handler.pipeline = WatchEventPipeline(
+        change_queue, hash_cache, change_classifier=handler._detect_change_type, **pipeline_options
+    )
+    return handler, change_queue
+
+
+class TestWatchEventPipeline:
+    """Test coalescing, trailing-edge debounce and backpressure of the event pipeline."""
+
+    def test_burst_coalesced_to_last_write(self, tmp_path: Path) -> None:
+        """Rapid saves of one file produce one change carrying the final content."""
+        handler, change_queue = _make_handler(tmp_path)
+        module = tmp_path / "module.py"
+        for revision in range(5):
+            module.write_text(f"REVISION = {revision}\n")
+            handler.on_modified(FileModifiedEvent(str(module)))
+
+        assert handler.pipeline.flush() == 1
+        assert len(change_queue) == 1
+        assert change_queue[0].file_hash == compute_file_hash(module)
+        assert handler.pipeline.stats.coalesced == 4
+
+    def test_trailing_edge_flushes_one_batch(self, tmp_path: Path) -> None:
+        """Events are hashed off the dispatch thread and queued once events stop."""
+        handler, change_queue = _make_handler(tmp_path, debounce_interval=0.05)
+        files = [tmp_path / f"module_{i}.py" for i in range(50)]
+        for file_path in files:
+            file_path.write_text("x = 1\n")
+        handler.pipeline.start()
+        try:
+            for file_path in files:
+                handler.on_created(FileCreatedEvent(str(file_path)))
+                handler.on_modified(FileModifiedEvent(str(file_path)))
+            assert handler.pipeline.wait_idle(timeout=10.0)
+        finally:
+            handler.pipeline.stop()
+
+        assert handler.pipeline.batch_ready.is_set()
+        assert handler.pipeline.stats.batches == 1
+        assert {c.file_path for c in change_queue} == {f.resolve() for f in files}
+        assert {c.event_type for c in change_queue} == {"created"}
+
+    def test_unchanged_content_not_queued(self, tmp_path: Path) -> None:
+        """A modification event without a content change is dropped."""
+        handler, change_queue = _make_handler(tmp_path)
+        module = tmp_path / "module.py"
+        module.write_text("x = 1\n")
+        handler.pipeline.hash_cache.set_hash(module.resolve(), compute_file_hash(module) or "")
+
+        handler.on_modified(FileModifiedEvent(str(module)))
+
+        assert handler.pipeline.flush() == 0
+        assert handler.pipeline.stats.unchanged == 1
+        assert not change_queue
+
+    def test_deletes_and_temporary_files(self, tmp_path: Path) -> None:
+        """Deleted tracked files are reported; files created and deleted within a batch are not."""
+        handler, change_queue = _make_handler(tmp_path)
+        tracked = tmp_path / "tracked.py"
+        tracked.write_text("x = 1\n")
+        handler.pipeline.hash_cache.set_hash(tracked.resolve(), compute_file_hash(tracked) or "")
+        tracked.unlink()
+        temporary = tmp_path / "scratch.tmp"
+
+        handler.on_deleted(FileDeletedEvent(str(tracked)))
+        handler.on_created(FileCreatedEvent(str(temporary)))
+        handler.on_deleted(FileDeletedEvent(str(temporary)))
+        handler.pipeline.flush()
+
+        assert [(c.file_path.name, c.event_type) for c in change_queue] == [("tracked.py", "deleted")]
+        assert handler.pipeline.hash_cache.get_hash(tracked.resolve()) is None
+
+    def test_atomic_save_via_rename(self, tmp_path: Path) -> None:
+        """Saving through a temporary file and rename reports the target file."""
+        handler, change_queue = _make_handler(tmp_path)
+        target = tmp_path / "module.py"
+        target.write_text("x = 1\n")
+        handler.pipeline.hash_cache.set_hash(target.resolve(), compute_file_hash(target) or "")
+        temporary = tmp_path / ".module.py.swp"
+        temporary.write_text("x = 2\n")
+        handler.on_created(FileCreatedEvent(str(temporary)))
+        temporary.replace(target)
+        handler.on_moved(FileMovedEvent(str(temporary), str(target)))
+
+        handler.pipeline.flush()
+
+        assert [(c.file_path.name, c.event_type) for c in change_queue] == [("module.py", "modified")]
+
+    def test_backpressure_blocks_until_drained(self, tmp_path: Path) -> None:
+        """Submitting beyond the pending limit blocks while the worker is busy."""
+        release = threading.Event()
+
+        def slow_classifier(file_path: Path) -> str:
+            release.wait(timeout=10)
+            return "code"
+
+        change_queue: deque[FileChange] = deque()
+        hash_cache = FileHashCache(cache_file=tmp_path / "cache.json")
+        pipeline = WatchEventPipeline(
+            change_queue, hash_cache, change_classifier=slow_classifier, debounce_interval=0.0, max_pending=2
+        )
+        files = [tmp_path / f"module_{i}.py" for i in range(4)]
+        for file_path in files:
+            file_path.write_text("x = 1\n")
+        pipeline.start()
+        try:
+            pipeline.submit(files[0], "modified")
+            assert not pipeline.wait_idle(timeout=0.2)  # Worker is stuck classifying the first batch
+            pipeline.submit(files[1], "modified")
+            pipeline.submit(files[2], "modified")
+            blocked = threading.Thread(target=pipeline.submit, args=(files[3], "modified"))
+            blocked.start()
+            blocked.join(timeout=0.2)
+            assert blocked.is_alive()
+
+            release.set()
+            blocked.join(timeout=5.0)
+            assert not blocked.is_alive()
+            assert pipeline.wait_idle(timeout=5.0)
+        finally:
+            release.set()
+            pipeline.stop()
+
+        assert pipeline.stats.backpressure_waits == 1
+        assert {c.file_path for c in change_queue} == set(files)
@@ -0,0 +1,200 @@
+"""Unit tests for the persistent analysis cache."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from specfact_cli.analyzers.code_analyzer import CodeAnalyzer
+from specfact_cli.analyzers.relationship_mapper import RelationshipMapper
+from specfact_cli.cli import app
+from specfact_cli.utils.analysis_cache import AnalysisCache, hash_config_files, prune_cache_dir
+from specfact_cli.utils.ast_cache import parsed_module_cache_scope
+
+
+SERVICE_SOURCE = '''
+"""User service."""
+
+
+class UserService:
+    """Manage users."""
+
+    def create_user(self, name: str) -> dict:
+        """Create a new user."""
+        return {"name": name}
+
+    def get_user(self, user_id: int) -> dict:
+        """Get a user by id."""
+        return {"id": user_id}
+
+    def delete_user(self, user_id: int) -> bool:
+        """Delete a user."""
+        return True
+'''
+
+
+class TestAnalysisCache:
+    """Tests for AnalysisCache."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Stored payloads are returned for unchanged files."""
+        module = tmp_path / "module.py"
+        module.write_text("x = 1\n")
+        cache = AnalysisCache(tmp_path)
+
+        assert cache.get("kind", module) is None
+        cache.put("kind", module, {"value": 1})
+
+        assert cache.get("kind", module) == {"value": 1}
+        stats = cache.get_stats()
+        assert (stats.hits, stats.misses, stats.writes) == (1, 1, 1)
+        assert cache.cache_dir == tmp_path.resolve() / ".specfact" / "cache" / "analysis"
+
+    def test_content_change_is_miss(self, tmp_path: Path) -> None:
+        """Changing a file's content invalidates its entries."""
+        module = tmp_path / "module.py"
+        module.write_text("x = 1\n")
+        cache = AnalysisCache(tmp_path)
+        cache.put("kind", module, {"value": 1})
+
+        with parsed_module_cache_scope():
+            module.write_text("x = 2\n")
+            assert cache.get("kind", module) is None
+
+    def test_key_includes_settings_and_version(self, tmp_path: Path) -> None:
+        """Entries are not shared across analyzer settings or versions."""
+        module = tmp_path / "module.py"
+        module.write_text("x = 1\n")
+        cache = AnalysisCache(tmp_path, analyzer_version="1.0.0")
+        cache.put("kind", module, {"value": 1}, {"threshold": 0.5})
+
+        assert cache.get("kind", module, {"threshold": 0.7}) is None
+        assert AnalysisCache(tmp_path, analyzer_version="2.0.0").get("kind", module, {"threshold": 0.5}) is None
+        assert cache.get("kind", module, {"threshold": 0.5}) == {"value": 1}
+
+    def test_hash_config_files(self, tmp_path: Path) -> None:
+        """Rule hashes change with rule content and configuration."""
+        rules = tmp_path / "rules.yml"
+        rules.write_text("rules: []\n")
+        first = hash_config_files([rules, None])
+
+        rules.write_text("rules: [a]\n")
+        assert hash_config_files([rules, None]) != first
+        assert hash_config_files([None, None]) != hash_config_files([rules, None])
+
+
+class TestPruneCacheDir:
+    """Tests for size-based LRU pruning."""
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Oldest entries are removed first until the cache fits."""
+        now = time.time()
+        for i in range(3):
+            entry = tmp_path / f"entry{i}.json"
+            entry.write_text("x" * 100)
+            os.utime(entry, (now - 100 + i, now - 100 + i))
+
+        result = prune_cache_dir(tmp_path, 250)
+
+        assert result.removed_entries == 1
+        assert result.remaining_entries == 2
+        assert result.remaining_bytes == 200
+        assert not (tmp_path / "entry0.json").exists()
+
+    def test_zero_clears_and_missing_dir(self, tmp_path: Path) -> None:
+        """A zero budget clears everything; a missing directory is a no-op."""
+        (tmp_path / "entry.json").write_text("{}")
+
+        assert prune_cache_dir(tmp_path, 0).remaining_entries == 0
+        assert prune_cache_dir(tmp_path / "missing", 0).removed_entries == 0
+
+
+class TestAnalyzerCacheIntegration:
+    """Tests for analyzers using the persistent cache."""
+
+    def test_code_analyzer_reuses_unchanged_files(self, tmp_path: Path) -> None:
+        """A second analysis serves unchanged files from the cache with identical results."""
+        src_dir = tmp_path / "src"
+        src_dir.mkdir()
+        (src_dir / "service.py").write_text(SERVICE_SOURCE)
+
+        first = CodeAnalyzer(tmp_path, confidence_threshold=0.3, analysis_cache=AnalysisCache(tmp_path)).analyze()
+        analyzer = CodeAnalyzer(tmp_path, confidence_threshold=0.3, analysis_cache=AnalysisCache(tmp_path))
+        second = analyzer.analyze()
+
+        assert analyzer.cached_file_count == 1
+        assert [f.key for f in second.features] == [f.key for f in first.features]
+        assert [len(f.stories) for f in second.features] == [len(f.stories) for f in first.features]
+
+    def test_code_analyzer_misses_after_test_file_changes(self, tmp_path: Path) -> None:
+        """Cached results follow the test files (story acceptance criteria are derived from them)."""
+        src_dir = tmp_path / "src"
+        src_dir.mkdir()
+        (src_dir / "service.py").write_text(SERVICE_SOURCE)
+        tests_dir = tmp_path / "tests"
+        tests_dir.mkdir()
+
+        def analyze() -> CodeAnalyzer:
+            analyzer = CodeAnalyzer(tmp_path, confidence_threshold=0.3, analysis_cache=AnalysisCache(tmp_path))
+            with parsed_module_cache_scope():
+                analyzer.analyze()
+            return analyzer
+
+        analyze()
+        test_file = tests_dir / "test_service.py"
+        test_file.write_text("def test_create_user():\n    assert UserService().create_user('a')\n")
+        assert analyze().cached_file_count == 0
+        assert analyze().cached_file_count == 1
+
+        test_file.write_text("def test_get_user():\n    assert UserService().get_user(1)\n")
+        assert analyze().cached_file_count == 0
+        # Without the test file, the entries of the first run (no tests) apply again
+        test_file.unlink()
+        assert analyze().cached_file_count == 1
+
+    def test_relationship_mapper_reuses_unchanged_files(self, tmp_path: Path) -> None:
+        """Relationship results for unchanged files come from the cache."""
+        module = tmp_path / "module.py"
+        module.write_text("import os\n\n\nclass Handler:\n    pass\n")
+
+        first = RelationshipMapper(tmp_path, analysis_cache=AnalysisCache(tmp_path)).analyze_files([module])
+        cache = AnalysisCache(tmp_path)
+        second = RelationshipMapper(tmp_path, analysis_cache=cache).analyze_files([module])
+
+        assert cache.get_stats().hits == 1
+        assert second["imports"] == first["imports"]
+
+
+class TestCachePruneCommand:
+    """Tests for `specfact cache prune`."""
+
+    def test_prune_all(self, tmp_path: Path) -> None:
+        """--all removes every cache entry."""
+        entry_dir = tmp_path / ".specfact" / "cache" / "analysis" / "ab"
+        entry_dir.mkdir(parents=True)
+        (entry_dir / "abc.json").write_text("{}")
+
+        result = CliRunner().invoke(app, ["cache", "prune", "--repo", str(tmp_path), "--all"])
+
+        assert result.exit_code == 0, result.output
+        assert "Removed 1 cache entries" in result.output
+        assert not (entry_dir / "abc.json").exists()
+
+    def test_prune_keeps_non_cache_state(self, tmp_path: Path) -> None:
+        """Only the LRU-managed cache subdirectories are pruned; other state is kept."""
+        cache_root = tmp_path / ".specfact" / "cache"
+        (cache_root / "contracts" / "ab").mkdir(parents=True)
+        (cache_root / "contracts" / "ab" / "abc.json").write_text("{}")
+        (cache_root / "repro").mkdir()
+        (cache_root / "repro" / "durations.json").write_text("{}")
+        (cache_root / "file_stat_index.json").write_text("{}")
+
+        result = CliRunner().invoke(app, ["cache", "prune", "--repo", str(tmp_path), "--all"])
+
+        assert result.exit_code == 0, result.output
+        assert "Removed 1 cache entries" in result.output
+        assert (cache_root / "repro" / "durations.json").exists()
+        assert (cache_root / "file_stat_index.json").exists()
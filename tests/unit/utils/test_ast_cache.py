@@ -0,0 +1,120 @@
+"""Unit tests for the parse-once AST cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from specfact_cli.analyzers.relationship_mapper import RelationshipMapper
+from specfact_cli.utils.ast_cache import ParsedModuleCache, get_parsed_module_cache, parsed_module_cache_scope
+from specfact_cli.utils.source_scanner import SourceArtifactScanner
+
+
+class TestParsedModuleCache:
+    """Tests for ParsedModuleCache."""
+
+    def test_parses_once(self, tmp_path: Path) -> None:
+        """Repeated lookups of an unchanged file are cache hits."""
+        module = tmp_path / "module.py"
+        module.write_text("def foo():\n    return 1\n")
+        cache = ParsedModuleCache()
+
+        first = cache.get_tree(module)
+        second = cache.get_tree(module)
+        source = cache.get_source(module)
+
+        assert first is second
+        assert "def foo" in source
+        stats = cache.get_stats()
+        assert stats.misses == 1
+        assert stats.hits == 2
+
+    def test_invalidated_by_change(self, tmp_path: Path) -> None:
+        """A changed file (size/mtime) is re-read and re-parsed."""
+        module = tmp_path / "module.py"
+        module.write_text("x = 1\n")
+        cache = ParsedModuleCache()
+        first = cache.get_tree(module)
+
+        module.write_text("x = 1\ny = 2\n")
+        stat = module.stat()
+        os.utime(module, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = cache.get_tree(module)
+
+        assert first is not second
+        assert len(second.body) == 2
+        assert cache.get_stats().misses == 2
+
+    def test_syntax_error_cached_and_reraised(self, tmp_path: Path) -> None:
+        """Parse failures are cached and raised as SyntaxError on every lookup."""
+        module = tmp_path / "broken.py"
+        module.write_text("def broken(:\n")
+        cache = ParsedModuleCache()
+
+        with pytest.raises(SyntaxError) as first:
+            cache.get_tree(module)
+        with pytest.raises(SyntaxError) as second:
+            cache.get_tree(module)
+
+        assert cache.get_stats().hits == 1
+        # Each lookup raises a fresh exception (no traceback carried over from earlier raises)
+        assert first.value is not second.value
+        assert (second.value.msg, second.value.lineno) == (first.value.msg, first.value.lineno)
+        assert "def broken" in cache.get_source(module)
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """Least recently used entries are evicted beyond the entry bound."""
+        cache = ParsedModuleCache(max_entries=2)
+        files = []
+        for i in range(3):
+            module = tmp_path / f"m{i}.py"
+            module.write_text(f"value = {i}\n")
+            files.append(module)
+
+        cache.get_tree(files[0])
+        cache.get_tree(files[1])
+        cache.get_tree(files[0])  # Touch m0 so m1 becomes least recently used
+        cache.get_tree(files[2])
+
+        stats = cache.get_stats()
+        assert stats.entries == 2
+        assert stats.evictions == 1
+        cache.get_tree(files[0])
+        assert cache.get_stats().hits == 2
+
+    def test_byte_bound_eviction(self, tmp_path: Path) -> None:
+        """Entries are evicted when total source size exceeds the byte bound."""
+        cache = ParsedModuleCache(max_bytes=50)
+        for i in range(3):
+            module = tmp_path / f"m{i}.py"
+            module.write_text(f"value_{i} = '{'x' * 30}'\n")
+            cache.get_source(module)
+
+        stats = cache.get_stats()
+        assert stats.entries == 1
+        assert stats.evictions == 2
+
+
+class TestParsedModuleCacheScope:
+    """Tests for the run-scoped shared cache."""
+
+    def test_scope_shared_by_analyzers(self, tmp_path: Path) -> None:
+        """Analyzers in the same run reuse the tree parsed by the first one."""
+        src_dir = tmp_path / "src"
+        src_dir.mkdir()
+        module = src_dir / "service.py"
+        module.write_text("import os\n\ndef handle():\n    return os.getcwd()\n")
+
+        with parsed_module_cache_scope() as cache:
+            assert get_parsed_module_cache() is cache
+            RelationshipMapper(tmp_path).analyze_file(module)
+            functions = SourceArtifactScanner(tmp_path).extract_function_mappings(module)
+
+            assert functions == ["handle"]
+            stats = cache.get_stats()
+            assert stats.misses == 1
+            assert stats.hits == 1
+
+        assert get_parsed_module_cache() is not cache
@@ -0,0 +1,108 @@
+"""Unit tests for the workspace bundle registry."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import yaml
+
+from specfact_cli.models.plan import Feature, Product
+from specfact_cli.models.project import BundleManifest, ProjectBundle
+from specfact_cli.utils.bundle_loader import save_project_bundle
+from specfact_cli.utils.bundle_registry import BundleRegistry
+from specfact_cli.utils.sdd_discovery import get_sdd_by_hash
+from specfact_cli.utils.structure import SpecFactStructure
+
+
+def _save_bundle(base_path: Path, name: str, feature_count: int) -> Path:
+    bundle_dir = SpecFactStructure.project_dir(base_path=base_path, bundle_name=name)
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    features = {
+        f"FEATURE-{index:03d}": Feature(key=f"FEATURE-{index:03d}", title=f"Feature {index}", stories=[])
+        for index in range(feature_count)
+    }
+    bundle = ProjectBundle(
+        manifest=BundleManifest(schema_metadata=None, project_metadata=None),
+        bundle_name=name,
+        product=Product(),
+        features=features,
+    )
+    save_project_bundle(bundle, bundle_dir, atomic=True)
+    return bundle_dir
+
+
+def _write_sdd(path: Path, plan_hash: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    sdd = {
+        "version": "1.0.0",
+        "plan_bundle_id": plan_hash[:16],
+        "plan_bundle_hash": plan_hash,
+        "why": {"intent": "Test intent"},
+        "what": {"capabilities": ["Test capability"]},
+        "how": {"architecture": "Test architecture"},
+    }
+    path.write_text(yaml.dump(sdd))
+
+
+def _touch_later(path: Path) -> None:
+    """Move a file's modification time forward (coarse file system timestamps)."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+
+class TestBundleRegistry:
+    """Tests for registry reuse and invalidation."""
+
+    def test_list_plans_reuses_unchanged_bundles(self, tmp_path: Path) -> None:
+        """Bundles are read once; later listings only re-read bundles whose manifest changed."""
+        _save_bundle(tmp_path, "alpha", 1)
+        beta_dir = _save_bundle(tmp_path, "beta", 2)
+
+        plans = {plan["name"]: plan for plan in SpecFactStructure.list_plans(tmp_path)}
+        assert plans["beta"]["features"] == 2
+        assert int(plans["alpha"]["size"] or 0) > 0
+        assert (tmp_path / SpecFactStructure.REGISTRY / "bundles.json").exists()
+
+        registry = BundleRegistry(tmp_path)
+        assert registry.bundle(beta_dir).features == 2
+        assert registry.parsed == 0
+
+        _save_bundle(tmp_path, "beta", 3)
+        _touch_later(beta_dir / "bundle.manifest.yaml")
+        plans = {plan["name"]: plan for plan in SpecFactStructure.list_plans(tmp_path)}
+        assert plans["beta"]["features"] == 3
+
+    def test_removed_bundles_and_corrupt_registry(self, tmp_path: Path) -> None:
+        """Entries of removed bundles are dropped; an unreadable registry is rebuilt."""
+        alpha_dir = _save_bundle(tmp_path, "alpha", 1)
+        _save_bundle(tmp_path, "beta", 1)
+        SpecFactStructure.list_plans(tmp_path)
+
+        (alpha_dir / "bundle.manifest.yaml").unlink()
+        assert [plan["name"] for plan in SpecFactStructure.list_plans(tmp_path)] == ["beta"]
+        registry_text = (tmp_path / SpecFactStructure.REGISTRY / "bundles.json").read_text()
+        assert '"alpha"' not in registry_text
+
+        (tmp_path / SpecFactStructure.REGISTRY / "bundles.json").write_text("{not json")
+        assert [plan["name"] for plan in SpecFactStructure.list_plans(tmp_path)] == ["beta"]
+
+    def test_sdd_hash_lookup(self, tmp_path: Path) -> None:
+        """Hash lookups are answered from the registry and follow SDD changes."""
+        bundle_dir = _save_bundle(tmp_path, "alpha", 1)
+        _write_sdd(bundle_dir / "sdd.yaml", "hash-alpha")
+        legacy_sdd = tmp_path / SpecFactStructure.SDD / "legacy.yaml"
+        _write_sdd(legacy_sdd, "hash-legacy")
+
+        assert get_sdd_by_hash("hash-legacy", tmp_path) == legacy_sdd.resolve()
+        registry = BundleRegistry(tmp_path)
+        assert registry.find_sdd_by_hash("hash-alpha") == (bundle_dir / "sdd.yaml").resolve()
+        assert registry.parsed == 0
+        assert registry.bundle(bundle_dir).sdd_hash == "hash-alpha"
+
+        _write_sdd(bundle_dir / "sdd.yaml", "hash-alpha-2")
+        _touch_later(bundle_dir / "sdd.yaml")
+        assert get_sdd_by_hash("hash-alpha", tmp_path) is None
+        assert get_sdd_by_hash("hash-alpha-2", tmp_path) == (bundle_dir / "sdd.yaml").resolve()
+        legacy_sdd.unlink()
+        assert get_sdd_by_hash("hash-legacy", tmp_path) is None
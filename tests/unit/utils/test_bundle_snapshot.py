@@ -0,0 +1,144 @@
+"""Unit tests for binary project bundle snapshots."""
+
+from __future__ import annotations
+
+import os
+import pickle
+import struct
+from pathlib import Path
+
+import pytest
+
+from specfact_cli.models.plan import Feature, Idea, Product, Story
+from specfact_cli.models.project import BundleManifest, BundleVersions, ProjectBundle
+from specfact_cli.utils import bundle_snapshot
+from specfact_cli.utils.bundle_loader import load_project_bundle, save_project_bundle
+from specfact_cli.utils.bundle_snapshot import SNAPSHOT_FILE, read_bundle_snapshot
+
+
+def _make_bundle(feature_count: int = 3) -> ProjectBundle:
+    bundle = ProjectBundle(
+        manifest=BundleManifest(
+            versions=BundleVersions(schema="1.0", project="0.1.0"), schema_metadata=None, project_metadata=None
+        ),
+        bundle_name="demo",
+        product=Product(themes=["core"], releases=[]),
+        features={},
+    )
+    for index in range(feature_count):
+        story = Story(key=f"STORY-{index}", title=f"Story {index}", acceptance=["Given a When b Then c"])
+        bundle.add_feature(
+            Feature(
+                key=f"FEATURE-{index:03d}",
+                title=f"Feature {index}",
+                stories=[story],
+                source_tracking=None,
+                contract=None,
+                protocol=None,
+            )
+        )
+    return bundle
+
+
+def _age_files(bundle_dir: Path, seconds: int = 60) -> None:
+    """Move file mtimes out of the racy window so stat data is trusted."""
+    past = os.stat(bundle_dir).st_mtime - seconds
+    for path in bundle_dir.rglob("*.yaml"):
+        os.utime(path, (past, past))
+
+
+@pytest.fixture
+def saved_bundle(tmp_path: Path) -> Path:
+    bundle_dir = tmp_path / ".specfact" / "projects" / "demo"
+    bundle_dir.mkdir(parents=True)
+    save_project_bundle(_make_bundle(), bundle_dir, atomic=True)
+    return bundle_dir
+
+
+class TestBundleSnapshot:
+    """Tests for bundle snapshots."""
+
+    def test_save_writes_snapshot_used_by_load(self, saved_bundle: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Saving writes a snapshot; loading reads it without parsing YAML."""
+        assert (saved_bundle / SNAPSHOT_FILE).exists()
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("YAML files must not be parsed")
+
+        monkeypatch.setattr(ProjectBundle, "load_from_directory", fail)
+        bundle = load_project_bundle(saved_bundle)
+
+        assert list(bundle.features) == ["FEATURE-000", "FEATURE-001", "FEATURE-002"]
+        assert bundle.features["FEATURE-001"].stories[0].acceptance == ["Given a When b Then c"]
+        assert bundle.bundle_name == "demo"
+        assert bundle.can_save_incrementally(saved_bundle)
+
+    def test_changed_yaml_invalidates_snapshot(self, saved_bundle: Path) -> None:
+        """Editing a feature file makes the next load parse YAML and rebuild the snapshot."""
+        _age_files(saved_bundle)
+        feature_path = saved_bundle / "features" / "FEATURE-001.yaml"
+        feature_path.write_text(feature_path.read_text().replace("Feature 1", "Feature one"))
+
+        assert read_bundle_snapshot(saved_bundle) is None
+        assert load_project_bundle(saved_bundle).features["FEATURE-001"].title == "Feature one"
+        snapshot_bundle = read_bundle_snapshot(saved_bundle)
+        assert snapshot_bundle is not None
+        assert snapshot_bundle.features["FEATURE-001"].title == "Feature one"
+
+    def test_touched_file_with_same_content_stays_valid(self, saved_bundle: Path) -> None:
+        """A new mtime alone is checked by content hash and does not invalidate the snapshot."""
+        _age_files(saved_bundle)
+        os.utime(saved_bundle / "product.yaml")
+
+        assert read_bundle_snapshot(saved_bundle) is not None
+
+    def test_added_aspect_invalidates_snapshot(self, saved_bundle: Path) -> None:
+        """An optional aspect file that appears after the snapshot was written is picked up."""
+        bundle = load_project_bundle(saved_bundle, use_snapshot=False)
+        bundle.idea = Idea(title="Demo", narrative="Why", target_users=[], value_hypothesis="", metrics=None)
+        bundle.save_to_directory(saved_bundle)
+
+        assert read_bundle_snapshot(saved_bundle) is None
+        assert load_project_bundle(saved_bundle).idea is not None
+
+    def test_incremental_save_after_snapshot_load(self, saved_bundle: Path) -> None:
+        """A bundle read from the snapshot only rewrites the features that changed."""
+        _age_files(saved_bundle)
+        untouched = saved_bundle / "features" / "FEATURE-000.yaml"
+        mtime_before = untouched.stat().st_mtime_ns
+
+        bundle = load_project_bundle(saved_bundle)
+        bundle.features["FEATURE-002"].title = "Renamed"
+        save_project_bundle(bundle, saved_bundle, atomic=True)
+
+        assert untouched.stat().st_mtime_ns == mtime_before
+        assert load_project_bundle(saved_bundle, use_snapshot=False).features["FEATURE-002"].title == "Renamed"
+        assert load_project_bundle(saved_bundle).features["FEATURE-002"].title == "Renamed"
+
+    def test_foreign_globals_are_rejected(self, saved_bundle: Path) -> None:
+        """A crafted snapshot referencing anything but model classes is ignored, not executed."""
+        snapshot_path = saved_bundle / SNAPSHOT_FILE
+        raw = snapshot_path.read_bytes()
+        offset = len(bundle_snapshot._MAGIC)
+        (header_length,) = struct.unpack(">Q", raw[offset : offset + 8])
+        header = raw[offset : offset + 8 + header_length]
+        marker = saved_bundle / "executed"
+        payload = pickle.dumps(_Exploit(str(marker)))
+        snapshot_path.write_bytes(bundle_snapshot._MAGIC + header + payload)
+
+        assert read_bundle_snapshot(saved_bundle) is None
+        assert not marker.exists()
+
+    def test_other_version_is_rebuilt(self, saved_bundle: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Snapshots written by another SpecFact version are not used."""
+        monkeypatch.setattr(bundle_snapshot, "__version__", "0.0.0")
+
+        assert read_bundle_snapshot(saved_bundle) is None
+
+
+class _Exploit:
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def __reduce__(self) -> tuple[object, tuple[str]]:
+        return (os.mkdir, (self.path,))
@@ -0,0 +1,161 @@
+"""Unit tests for the pluggable analysis executors."""
+
+from __future__ import annotations
+
+import math
+import time
+from pathlib import Path
+
+import pytest
+
+from specfact_cli.analyzers.code_analyzer import CodeAnalyzer
+from specfact_cli.analyzers.relationship_mapper import RelationshipMapper
+from specfact_cli.utils import executors
+from specfact_cli.utils.executors import ExecutorConfig, ExecutorKind, run_ordered
+
+
+class TestExecutorConfig:
+    """Tests for ExecutorConfig.resolve()."""
+
+    def test_test_mode_defaults_to_serial(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """TEST_MODE resolves to serial execution unless a mode is requested."""
+        monkeypatch.setenv("TEST_MODE", "true")
+
+        assert ExecutorConfig().resolve(1000) == ExecutorConfig(kind=ExecutorKind.SERIAL, workers=1)
+        assert ExecutorConfig(kind=ExecutorKind.THREAD).resolve(10).kind == ExecutorKind.THREAD
+
+    def test_auto_mode_from_repo_size(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Large repositories on multi-core hosts use processes; small ones use threads."""
+        monkeypatch.delenv("TEST_MODE", raising=False)
+        monkeypatch.setattr(executors, "available_cpu_count", lambda: 64)
+
+        large = ExecutorConfig().resolve(executors.PROCESS_MODE_MIN_FILES)
+        small = ExecutorConfig().resolve(10)
+
+        assert large == ExecutorConfig(kind=ExecutorKind.PROCESS, workers=64)
+        assert small == ExecutorConfig(kind=ExecutorKind.THREAD, workers=8)
+
+    def test_single_core_never_uses_processes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Automatic selection does not pick processes on a single core."""
+        monkeypatch.delenv("TEST_MODE", raising=False)
+        monkeypatch.setattr(executors, "available_cpu_count", lambda: 1)
+
+        assert ExecutorConfig().resolve(10_000).kind == ExecutorKind.THREAD
+
+    def test_workers_capped_by_task_count(self) -> None:
+        """Explicit worker counts are honoured but never exceed the task count."""
+        assert ExecutorConfig(kind=ExecutorKind.PROCESS, workers=32).resolve(4).workers == 4
+        assert ExecutorConfig(kind=ExecutorKind.THREAD, workers=3).resolve(100).workers == 3
+
+
+class TestRunOrdered:
+    """Tests for run_ordered()."""
+
+    def test_thread_results_in_input_order(self) -> None:
+        """Results are yielded in input order even when later tasks finish first."""
+
+        def task(delay: float) -> float:
+            time.sleep(delay)
+            return delay
+
+        delays = [0.05, 0.01, 0.03, 0.0]
+        results = list(run_ordered(task, delays, ExecutorConfig(kind=ExecutorKind.THREAD, workers=4)))
+
+        assert [result for _, result, _ in results] == delays
+
+    @pytest.mark.parametrize("kind", [ExecutorKind.SERIAL, ExecutorKind.THREAD])
+    def test_errors_are_yielded(self, kind: ExecutorKind) -> None:
+        """Task errors are reported per item instead of aborting the run."""
+        results = list(run_ordered(math.sqrt, [4.0, -1.0, 9.0], ExecutorConfig(kind=kind, workers=2)))
+
+        assert [item for item, _, _ in results] == [4.0, -1.0, 9.0]
+        assert results[0][1] == 2.0
+        assert isinstance(results[1][2], ValueError)
+        assert results[2][1] == 3.0
+
+    @pytest.mark.timeout(60)
+    def test_process_pool(self) -> None:
+        """Process mode runs module-level functions and preserves order and errors."""
+        results = list(run_ordered(math.sqrt, [16.0, -4.0, 25.0], ExecutorConfig(kind=ExecutorKind.PROCESS, workers=2)))
+
+        assert [result for _, result, _ in results] == [4.0, None, 5.0]
+        assert isinstance(results[1][2], ValueError)
+
+    def test_empty_items(self) -> None:
+        """No tasks means no results (and no pool)."""
+        assert list(run_ordered(math.sqrt, [], ExecutorConfig(kind=ExecutorKind.PROCESS))) == []
+
+
+class TestAnalyzerExecutors:
+    """Tests for analyzers running on process pools."""
+
+    @pytest.mark.timeout(120)
+    def test_process_mode_matches_serial(self, tmp_path: Path) -> None:
+        """Process-pool analysis produces the same features and relationships as serial analysis."""
+        src_dir = tmp_path / "src"
+        src_dir.mkdir()
+        for i in range(6):
+            (src_dir / f"service_{i}.py").write_text(
+                f'''"""Service {i}."""
+
+import json
+
+
+class Service{i}:
+    """Manage items for service {i}."""
+
+    def create_item(self, name: str) -> dict:
+        """Create an item."""
+        return json.loads("{{}}")
+
+    def get_item(self, item_id: int) -> dict:
+        """Get an item."""
+        return {{"id": item_id}}
+'''
+            )
+        files = sorted(src_dir.glob("*.py"))
+
+        serial = CodeAnalyzer(
+            tmp_path, confidence_threshold=0.3, executor_config=ExecutorConfig(kind=ExecutorKind.SERIAL)
+        ).analyze()
+        process_analyzer = CodeAnalyzer(
+            tmp_path, confidence_threshold=0.3, executor_config=ExecutorConfig(kind=ExecutorKind.PROCESS, workers=2)
+        )
+        parallel = process_analyzer.analyze()
+
+        assert process_analyzer.last_executor_config == ExecutorConfig(kind=ExecutorKind.PROCESS, workers=2)
+        assert [f.key for f in parallel.features] == [f.key for f in serial.features]
+        assert [len(f.stories) for f in parallel.features] == [len(f.stories) for f in serial.features]
+        assert parallel.product.themes == serial.product.themes
+
+        serial_relationships = RelationshipMapper(
+            tmp_path, executor_config=ExecutorConfig(kind=ExecutorKind.SERIAL)
+        ).analyze_files(files)
+        process_relationships = RelationshipMapper(
+            tmp_path, executor_config=ExecutorConfig(kind=ExecutorKind.PROCESS, workers=2)
+        ).analyze_files(files)
+        assert process_relationships == serial_relationships
+
+    def test_worker_reuses_parent_semgrep_settings(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Process workers take Semgrep and cache settings from the parent instead of probing again."""
+        from unittest.mock import patch
+
+        from specfact_cli.analyzers import code_analyzer
+
+        monkeypatch.delenv("TEST_MODE", raising=False)
+        with patch.object(CodeAnalyzer, "_check_semgrep_available", return_value=True):
+            parent = CodeAnalyzer(tmp_path)
+        options = parent._worker_options()
+
+        def fail(*_args: object) -> None:
+            raise AssertionError("worker probed Semgrep or hashed its rules")
+
+        monkeypatch.setattr(CodeAnalyzer, "_check_semgrep_available", fail)
+        monkeypatch.setattr(code_analyzer, "hash_config_files", fail)
+        code_analyzer._init_analysis_worker(options)
+        worker = code_analyzer._worker_analyzer
+        monkeypatch.setattr(code_analyzer, "_worker_analyzer", None)
+
+        assert worker is not None
+        assert worker.semgrep_enabled == parent.semgrep_enabled
+        assert worker._cache_settings == parent._cache_settings
@@ -0,0 +1,71 @@
+"""Unit tests for the fast (non round-trip) YAML path."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from ruamel.yaml.comments import CommentedMap
+
+from specfact_cli.utils.structured_io import (
+    StructuredFormat,
+    dump_structured_file,
+    load_structured_file,
+    loads_structured_data,
+)
+from specfact_cli.utils.yaml_utils import YAMLUtils, dump_yaml_fast, load_yaml_fast
+
+
+SCALARS = """\
+answer: yes
+negative: No
+switch: on
+flag: true
+upper: FALSE
+padded: 0123
+octal: 0o17
+hex: 0x1F
+grouped: 1_000
+clock: 12:30
+ratio: -.5
+exponent: 1e3
+nothing: ~
+day: 2024-01-01
+"""
+
+
+class TestFastYAML:
+    """Tests for load_yaml_fast / dump_yaml_fast and round_trip=False."""
+
+    def test_scalars_resolve_like_round_trip_loader(self) -> None:
+        """YAML 1.1-only forms (yes/no/on, base-60, leading-zero octal) load as ruamel.yaml loads them."""
+        fast = load_yaml_fast(SCALARS)
+
+        assert fast == dict(YAMLUtils().load_string(SCALARS))
+        assert fast["answer"] == "yes" and fast["negative"] == "No" and fast["switch"] == "on"
+        assert fast["flag"] is True and fast["upper"] is False
+        assert (fast["padded"], fast["octal"], fast["hex"], fast["grouped"]) == (123, 15, 31, 1000)
+        assert fast["clock"] == "12:30"
+        assert fast["ratio"] == -0.5 and fast["exponent"] == 1000.0
+
+    def test_round_trip_flag_selects_loader(self, tmp_path: Path) -> None:
+        """round_trip=False returns plain containers; the default keeps ruamel.yaml's commented ones."""
+        path = tmp_path / "feature.yaml"
+        path.write_text("# comment\nkey: FEATURE-001\nstories:\n- key: STORY-1\n", encoding="utf-8")
+
+        fast = load_structured_file(path, round_trip=False)
+        assert type(fast) is dict and type(fast["stories"][0]) is dict
+        assert isinstance(load_structured_file(path), CommentedMap)
+        assert loads_structured_data(path.read_text(), StructuredFormat.YAML, round_trip=False) == fast
+
+    def test_fast_dump_reloads_unchanged(self, tmp_path: Path) -> None:
+        """Fast dumps quote strings that would load as other types and keep key order."""
+        data = {"title": "No", "version": "1.0", "zeta": None, "alpha": ["on", 3, {"nested": "ü"}]}
+        path = tmp_path / "report.yaml"
+
+        dump_structured_file(data, path, round_trip=False)
+
+        text = path.read_text(encoding="utf-8")
+        assert text == dump_yaml_fast(data)
+        assert text.index("zeta") < text.index("alpha") and "zeta:\n" in text
+        assert load_yaml_fast(path) == data
+        assert dict(YAMLUtils().load(path)) == data
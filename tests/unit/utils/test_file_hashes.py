@@ -0,0 +1,126 @@
+"""Unit tests for stat-first file hashing."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from pathlib import Path
+
+from specfact_cli.models.source_tracking import SourceTracking
+from specfact_cli.utils.file_hashes import FileHashIndex, repo_path_key
+
+
+def _age(file_path: Path, seconds: int = 60) -> None:
+    """Move a file's mtime out of the racy window."""
+    past = time.time() - seconds
+    os.utime(file_path, (past, past))
+
+
+class TestRepoPathKey:
+    """Tests for repo_path_key."""
+
+    def test_relative_and_absolute_paths_share_key(self, tmp_path: Path) -> None:
+        """Absolute paths inside the repo map to their repo-relative POSIX path."""
+        assert repo_path_key(tmp_path / "src" / "a.py", tmp_path) == "src/a.py"
+        assert repo_path_key(Path("src/a.py"), tmp_path) == "src/a.py"
+
+    def test_outside_repo_keeps_absolute_path(self, tmp_path: Path) -> None:
+        """Files outside the repository keep their absolute path."""
+        other = tmp_path.parent / "elsewhere.py"
+        assert repo_path_key(other, tmp_path) == other.resolve().as_posix()
+
+
+class TestFileHashIndex:
+    """Tests for FileHashIndex."""
+
+    def test_hash_matches_sha256(self, tmp_path: Path) -> None:
+        """Hashes are SHA-256 of the file content; missing files hash to None."""
+        module = tmp_path / "module.py"
+        module.write_text("x = 1\n")
+        index = FileHashIndex(tmp_path)
+
+        assert index.hash_file(module) == hashlib.sha256(b"x = 1\n").hexdigest()
+        assert index.hash_file(tmp_path / "missing.py") is None
+
+    def test_memo_hashes_each_file_once(self, tmp_path: Path) -> None:
+        """Repeated lookups in one run are served from the memo."""
+        module = tmp_path / "module.py"
+        module.write_text("x = 1\n")
+        index = FileHashIndex(tmp_path)
+
+        index.hash_file(module)
+        index.hash_file(Path("module.py"))
+
+        assert (index.stats.hashed, index.stats.memo_hits) == (1, 1)
+
+    def test_unchanged_stat_skips_read(self, tmp_path: Path) -> None:
+        """A later run reuses the persisted hash when the stat data is unchanged."""
+        module = tmp_path / "module.py"
+        module.write_text("x = 1\n")
+        _age(module)
+        first = FileHashIndex(tmp_path)
+        digest = first.hash_file(module)
+        first.save()
+
+        assert (tmp_path / ".specfact" / "cache" / "file_stat_index.json").exists()
+        second = FileHashIndex(tmp_path)
+        assert second.hash_file(module) == digest
+        assert (second.stats.stat_hits, second.stats.hashed) == (1, 0)
+
+    def test_changed_content_is_rehashed(self, tmp_path: Path) -> None:
+        """Changing a file's content changes its stat data and is re-read."""
+        module = tmp_path / "module.py"
+        module.write_text("x = 1\n")
+        _age(module, 120)
+        first = FileHashIndex(tmp_path)
+        first.hash_file(module)
+        first.save()
+
+        module.write_text("x = 22\n")
+        _age(module, 60)
+        second = FileHashIndex(tmp_path)
+        assert second.hash_file(module) == hashlib.sha256(b"x = 22\n").hexdigest()
+        assert second.stats.hashed == 1
+
+    def test_recently_modified_files_are_not_persisted(self, tmp_path: Path) -> None:
+        """Files inside the racy window are always re-read on the next run."""
+        module = tmp_path / "module.py"
+        module.write_text("x = 1\n")
+        first = FileHashIndex(tmp_path)
+        first.hash_file(module)
+        first.save()
+
+        second = FileHashIndex(tmp_path)
+        second.hash_file(module)
+        assert second.stats.hashed == 1
+
+
+class TestSourceTrackingKeys:
+    """Tests for normalized SourceTracking file_hashes keys."""
+
+    def test_update_and_check_use_relative_key(self, tmp_path: Path) -> None:
+        """Hashes are stored under the repo-relative key and found from absolute paths."""
+        module = tmp_path / "src" / "module.py"
+        module.parent.mkdir()
+        module.write_text("x = 1\n")
+        tracking = SourceTracking(implementation_files=["src/module.py"])
+
+        tracking.update_hash(module, tmp_path)
+
+        assert set(tracking.file_hashes) == {"src/module.py"}
+        assert not tracking.has_changed(module, tmp_path, hasher=FileHashIndex(tmp_path).hash_file)
+        assert not tracking.has_changed(module)
+
+    def test_legacy_absolute_keys_are_migrated(self, tmp_path: Path) -> None:
+        """Hashes stored under absolute paths are still found, and replaced on update."""
+        module = tmp_path / "module.py"
+        module.write_text("x = 1\n")
+        tracking = SourceTracking(
+            implementation_files=["module.py"],
+            file_hashes={str(module): hashlib.sha256(b"x = 1\n").hexdigest()},
+        )
+
+        assert not tracking.has_changed(module, tmp_path)
+        tracking.update_hash(module, tmp_path)
+        assert set(tracking.file_hashes) == {"module.py"}
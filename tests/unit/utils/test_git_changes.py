@@ -0,0 +1,122 @@
+"""Unit tests for git-backed change detection."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from pathlib import Path
+
+from git import Repo
+
+from specfact_cli.models.plan import Feature
+from specfact_cli.models.source_tracking import SourceTracking
+from specfact_cli.utils.git_changes import ChangeDetectionMode, GitHashIndex, read_synced_commit
+from specfact_cli.utils.incremental_check import get_changed_files
+
+
+def _sha256(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _write(path: Path, content: str, age_seconds: int = 60) -> None:
+    """Write a file with an mtime outside the racy window."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    past = time.time() - age_seconds
+    os.utime(path, (past, past))
+
+
+def _init_repo(base_path: Path) -> Repo:
+    files = [str(p.relative_to(base_path)) for p in base_path.rglob("*") if p.is_file()]
+    repo = Repo.init(base_path)
+    repo.index.add(files)
+    repo.index.commit("init")
+    return repo
+
+
+class TestGitHashIndex:
+    """Tests for GitHashIndex."""
+
+    def test_falls_back_to_hashing_without_git(self, tmp_path: Path) -> None:
+        """Outside a git repository every file is hashed."""
+        _write(tmp_path / "src" / "a.py", "a = 1\n")
+        index = GitHashIndex(tmp_path)
+
+        assert not index.available
+        assert index.head_commit is None
+        assert index.hash_file(tmp_path / "src" / "a.py") == _sha256("a = 1\n")
+
+    def test_unchanged_files_resolved_from_blobs(self, tmp_path: Path) -> None:
+        """Files git reports unchanged are served from their blob hash on later runs."""
+        _write(tmp_path / "src" / "a.py", "a = 1\n")
+        repo = _init_repo(tmp_path)
+
+        first = GitHashIndex(tmp_path)
+        assert first.available
+        assert first.head_commit == repo.head.commit.hexsha
+        assert first.hash_file(tmp_path / "src" / "a.py") == _sha256("a = 1\n")
+        first.save()
+
+        second = GitHashIndex(tmp_path, first.head_commit)
+        assert second.hash_file(tmp_path / "src" / "a.py") == _sha256("a = 1\n")
+        assert (second.stats.blob_hits, second.stats.hashed) == (1, 0)
+
+    def test_changed_and_untracked_files_are_hashed(self, tmp_path: Path) -> None:
+        """Modified, deleted and untracked files are detected since the base commit."""
+        _write(tmp_path / "src" / "a.py", "a = 1\n")
+        _write(tmp_path / "src" / "b.py", "b = 1\n")
+        repo = _init_repo(tmp_path)
+        synced_commit = repo.head.commit.hexsha
+
+        _write(tmp_path / "src" / "a.py", "a = 2\n", age_seconds=10)
+        (tmp_path / "src" / "b.py").unlink()
+        _write(tmp_path / "src" / "c.py", "c = 1\n")
+        index = GitHashIndex(tmp_path, synced_commit)
+
+        assert index.changed_paths == {"src/a.py", "src/b.py"}
+        assert index.hash_file(tmp_path / "src" / "a.py") == _sha256("a = 2\n")
+        assert index.hash_file(tmp_path / "src" / "b.py") is None
+        assert index.hash_file(tmp_path / "src" / "c.py") == _sha256("c = 1\n")
+
+    def test_unknown_base_commit_uses_head(self, tmp_path: Path) -> None:
+        """A synced commit that no longer exists falls back to HEAD."""
+        _write(tmp_path / "a.py", "a = 1\n")
+        repo = _init_repo(tmp_path)
+
+        index = GitHashIndex(tmp_path, "0" * 40)
+
+        assert index.base_commit == repo.head.commit.hexsha
+
+    def test_hash_mode_skips_git(self, tmp_path: Path) -> None:
+        """Hash mode never reads git data."""
+        _write(tmp_path / "a.py", "a = 1\n")
+        _init_repo(tmp_path)
+
+        index = GitHashIndex(tmp_path, mode=ChangeDetectionMode.HASH)
+
+        assert not index.available
+        assert index.hash_file(tmp_path / "a.py") == _sha256("a = 1\n")
+
+
+class TestGitIncrementalChanges:
+    """Tests for git-backed incremental change detection."""
+
+    def test_get_changed_files_uses_synced_commit(self, tmp_path: Path) -> None:
+        """Changed files are reported relative to the commit stored in the bundle manifest."""
+        _write(tmp_path / "src" / "a.py", "a = 1\n")
+        _write(tmp_path / "src" / "b.py", "b = 1\n")
+        repo = _init_repo(tmp_path)
+        bundle_dir = tmp_path / ".specfact" / "projects" / "demo"
+        bundle_dir.mkdir(parents=True)
+        (bundle_dir / "bundle.manifest.yaml").write_text(f"bundle:\n  synced_commit: {repo.head.commit.hexsha}\n")
+        assert read_synced_commit(bundle_dir) == repo.head.commit.hexsha
+
+        tracking = SourceTracking(
+            implementation_files=["src/a.py", "src/b.py"],
+            file_hashes={"src/a.py": _sha256("a = 1\n"), "src/b.py": _sha256("b = 1\n")},
+        )
+        feature = Feature(key="FEATURE-A", title="A", source_tracking=tracking, contract=None, protocol=None)
+        _write(tmp_path / "src" / "b.py", "b = 2\n", age_seconds=10)
+
+        assert get_changed_files(bundle_dir, tmp_path, [feature]) == {"FEATURE-A": ["src/b.py"]}
@@ -0,0 +1,86 @@
+"""Unit tests for lazy CLI command loading."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+import typer
+
+import specfact_cli
+from specfact_cli.cli import SpecFactCommandGroup
+from specfact_cli.utils.lazy_commands import LazyCommand, LazyCommandGroup, load_typer_app
+
+
+def _loaded_modules_after(args: list[str]) -> set[str]:
+    """Invoke the CLI in a fresh interpreter and return the specfact modules it imported."""
+    script = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from specfact_cli.cli import app\n"
+        f"result = CliRunner().invoke(app, {args!r})\n"
+        "assert result.exit_code == 0, result.output\n"
+        "print('\\n'.join(name for name in sys.modules if name.startswith('specfact_cli')))\n"
+    )
+    source_root = str(Path(specfact_cli.__file__).resolve().parents[1])
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [source_root, os.environ.get("PYTHONPATH")]))}
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True)
+    return set(completed.stdout.split())
+
+
+class _DemoGroup(LazyCommandGroup):
+    lazy_commands = (
+        LazyCommand("cache", "specfact_cli.commands.cache_cmd", "Manage caches"),
+        LazyCommand("missing", "specfact_cli.commands.does_not_exist", "Never loaded"),
+    )
+
+
+class TestLazyCommandGroup:
+    """Tests for LazyCommandGroup."""
+
+    def test_help_and_version_do_not_import_commands(self) -> None:
+        """`--help` and `--version` list commands without importing any command module."""
+        for args in (["--help"], ["--version"]):
+            modules = _loaded_modules_after(args)
+            assert "specfact_cli.cli" in modules
+            assert not [name for name in modules if name.startswith("specfact_cli.commands.")]
+
+    def test_running_a_command_imports_only_that_module(self) -> None:
+        """Invoking a command imports its module and no other command module."""
+        modules = _loaded_modules_after(["cache", "--help"])
+
+        assert [name for name in modules if name.startswith("specfact_cli.commands.")] == [
+            "specfact_cli.commands.cache_cmd"
+        ]
+
+    def test_placeholders_keep_order_and_help(self) -> None:
+        """Listing commands returns placeholders in registration order; resolving loads the real group."""
+        group = _DemoGroup(name="demo")
+        ctx = click.Context(group)
+
+        assert group.list_commands(ctx) == ["cache", "missing"]
+        placeholder = group.get_command(ctx, "missing")
+        assert placeholder is not None and placeholder.help == "Never loaded"
+        assert group.get_command(ctx, "unknown") is None
+
+        _, command, _ = group.resolve_command(ctx, ["cache"])
+        assert isinstance(command, typer.core.TyperGroup)
+        assert command.help == "Manage caches"
+        assert "prune" in command.list_commands(ctx)
+        assert group.get_command(ctx, "cache") is command
+
+    def test_root_group_registers_every_command(self) -> None:
+        """The root group registers each command once, with the bridge app under its own attribute."""
+        names = [spec.name for spec in SpecFactCommandGroup.lazy_commands]
+
+        assert len(names) == len(set(names)) == 17
+        assert names[0] == "init" and names[-1] == "bridge"
+        assert SpecFactCommandGroup.lazy_commands[-1].attribute == "bridge_app"
+
+    def test_command_apps_use_registered_help(self) -> None:
+        """Each command module's Typer app takes its help text from the registry."""
+        for spec in SpecFactCommandGroup.lazy_commands:
+            assert load_typer_app(spec).info.help == spec.help, spec.name
@@ -0,0 +1,84 @@
+"""Unit tests for command profiling."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+from specfact_cli.utils.profiling import (
+    Profiler,
+    get_profiler,
+    profile_phase,
+    record_file_timing,
+    start_profiling,
+    stop_profiling,
+)
+
+
+class TestProfiler:
+    """Tests for the phase tree, file outliers and output formats."""
+
+    def test_phases_nest_and_cover_children(self) -> None:
+        """Phases nest under the innermost open phase; a parent lasts at least as long as its children."""
+        profiler = Profiler("specfact import")
+        with profiler.phase("analysis", files=3) as analysis:
+            with profiler.phase("discovery"):
+                time.sleep(0.01)
+            with profiler.phase("dependency_graph"):
+                pass
+        profiler.finish()
+
+        assert [child.name for child in profiler.root.children] == ["analysis"]
+        assert [child.name for child in analysis.children] == ["discovery", "dependency_graph"]
+        assert analysis.attributes == {"files": 3}
+        assert analysis.duration >= analysis.children[0].duration >= 0.01
+        assert profiler.root.duration >= analysis.duration
+        assert analysis.end_ns >= analysis.children[-1].end_ns
+
+    def test_file_outliers_keep_slowest_files(self) -> None:
+        """Only the slowest files are kept per phase, while count and total cover every file."""
+        profiler = Profiler("specfact import", max_file_outliers=2)
+        for index, seconds in enumerate([0.1, 0.5, 0.2, 0.9]):
+            profiler.record_file(Path(f"module_{index}.py"), seconds, "analysis")
+
+        assert [(timing.path, timing.seconds) for timing in profiler.file_outliers("analysis")] == [
+            ("module_3.py", 0.9),
+            ("module_1.py", 0.5),
+        ]
+        files = profiler.to_dict()["files"]["analysis"]
+        assert files["count"] == 4
+        assert files["total_seconds"] == 1.7
+
+    def test_write_json_and_collapsed_stacks(self, tmp_path: Path) -> None:
+        """The profile is written as JSON and as collapsed stacks with self times in microseconds."""
+        profiler = Profiler("specfact import")
+        with profiler.phase("save bundle"), profiler.phase("features;yaml"):
+            time.sleep(0.002)
+
+        json_path, collapsed_path = profiler.write(tmp_path / "profile" / "report.json")
+
+        profile = json.loads(json_path.read_text(encoding="utf-8"))
+        assert profile["root"]["name"] == "specfact import"
+        assert profile["root"]["children"][0]["children"][0]["name"] == "features;yaml"
+        assert profile["peak_rss_bytes"] is None or profile["peak_rss_bytes"]["self"] > 0
+        assert collapsed_path == tmp_path / "profile" / "report.collapsed"
+        stacks = dict(line.rsplit(" ", 1) for line in collapsed_path.read_text(encoding="utf-8").splitlines())
+        assert int(stacks["specfact_import;save_bundle;features:yaml"]) >= 2000
+
+    def test_module_helpers_are_no_ops_without_profiler(self) -> None:
+        """profile_phase and record_file_timing do nothing unless profiling was started."""
+        assert get_profiler() is None
+        with profile_phase("analysis") as span:
+            record_file_timing("module.py", 0.1, "analysis")
+        assert span is None
+
+        profiler = start_profiling("specfact plan")
+        try:
+            with profile_phase("ambiguity_scan", features=2) as span:
+                record_file_timing("module.py", 0.1, "analysis")
+        finally:
+            assert stop_profiling() is profiler
+        assert span is not None and profiler.root.children == [span]
+        assert profiler.to_dict()["files"]["analysis"]["count"] == 1
+        assert get_profiler() is None
@@ -0,0 +1,180 @@
+"""Unit tests for the pruned, ignore-aware repository walker."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from specfact_cli.analyzers.code_analyzer import CodeAnalyzer
+from specfact_cli.utils.repo_walker import (
+    IgnoreRules,
+    RepoWalker,
+    list_python_files,
+    parse_ignore_lines,
+    repo_file_index_scope,
+)
+
+
+def _touch(root: Path, *relative_paths: str) -> None:
+    for relative_path in relative_paths:
+        path = root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+
+
+def _relative(root: Path, files: list[Path]) -> list[str]:
+    return sorted(file_path.relative_to(root).as_posix() for file_path in files)
+
+
+class TestIgnorePatterns:
+    """Tests for .gitignore-style pattern matching."""
+
+    def test_unanchored_pattern_matches_at_any_depth(self) -> None:
+        """Patterns without a slash match the name in any directory."""
+        rules = IgnoreRules(parse_ignore_lines(["*.generated.py"]))
+
+        assert rules.is_ignored("models.generated.py", False)
+        assert rules.is_ignored("src/pkg/models.generated.py", False)
+        assert not rules.is_ignored("src/pkg/models.py", False)
+
+    def test_anchored_and_directory_patterns(self) -> None:
+        """Leading slashes anchor to the ignore file; trailing slashes match directories only."""
+        rules = IgnoreRules(parse_ignore_lines(["/generated", "cache/"]))
+
+        assert rules.is_ignored("generated", True)
+        assert not rules.is_ignored("src/generated", True)
+        assert rules.is_ignored("src/cache", True)
+        assert not rules.is_ignored("src/cache", False)
+
+    def test_double_star_and_negation(self) -> None:
+        """`**` spans directories and the last matching pattern wins."""
+        rules = IgnoreRules(parse_ignore_lines(["# comment", "", "src/**/fixtures/*.py", "!src/**/fixtures/keep.py"]))
+
+        assert rules.is_ignored("src/fixtures/data.py", False)
+        assert rules.is_ignored("src/a/b/fixtures/data.py", False)
+        assert not rules.is_ignored("src/a/fixtures/keep.py", False)
+
+    def test_nested_ignore_file_base(self) -> None:
+        """Patterns from a nested ignore file only apply below its directory."""
+        rules = IgnoreRules(parse_ignore_lines(["/local.py"], base="pkg"))
+
+        assert rules.is_ignored("pkg/local.py", False)
+        assert not rules.is_ignored("local.py", False)
+        assert not rules.is_ignored("pkg/sub/local.py", False)
+
+
+class TestRepoWalker:
+    """Tests for RepoWalker."""
+
+    def test_prunes_excluded_directories(self, tmp_path: Path) -> None:
+        """VCS, virtualenv, dependency and root build directories are never entered."""
+        _touch(
+            tmp_path,
+            "src/app/main.py",
+            ".git/hooks/hook.py",
+            ".venv/lib/site.py",
+            "node_modules/pkg/setup.py",
+            "src/app/__pycache__/main.py",
+            "build/lib/copy.py",
+            "dist/pkg.py",
+            "pkg.egg-info/info.py",
+        )
+
+        walker = RepoWalker(tmp_path)
+
+        assert _relative(tmp_path, walker.list_files()) == ["src/app/main.py"]
+        assert walker.stats.dirs_pruned == 7
+
+    def test_no_substring_false_positives(self, tmp_path: Path) -> None:
+        """Names merely containing "env", "build" or "test" are kept."""
+        _touch(
+            tmp_path,
+            "src/environment.py",
+            "src/build_tools/runner.py",
+            "src/app/build/steps.py",
+            "src/envoy/client.py",
+        )
+
+        files = _relative(tmp_path, RepoWalker(tmp_path).list_files())
+
+        assert files == [
+            "src/app/build/steps.py",
+            "src/build_tools/runner.py",
+            "src/environment.py",
+            "src/envoy/client.py",
+        ]
+
+    def test_detects_virtualenv_by_marker(self, tmp_path: Path) -> None:
+        """Virtual environments with custom names are pruned via pyvenv.cfg."""
+        _touch(tmp_path, "src/main.py", "env/pyvenv.cfg", "env/lib/module.py", "tools/py311/pyvenv.cfg")
+
+        assert _relative(tmp_path, RepoWalker(tmp_path).list_files()) == ["src/main.py"]
+
+    def test_honours_gitignore_and_specfact_ignore(self, tmp_path: Path) -> None:
+        """Root and nested .gitignore files and .specfact/ignore are applied."""
+        _touch(
+            tmp_path,
+            "src/main.py",
+            "src/generated/models.py",
+            "src/pkg/local.py",
+            "src/pkg/module.py",
+            "scripts/tool.py",
+            "scripts/keep.py",
+        )
+        (tmp_path / ".gitignore").write_text("generated/\nscripts/*.py\n")
+        (tmp_path / "src" / "pkg" / ".gitignore").write_text("local.py\n")
+        (tmp_path / ".specfact").mkdir()
+        (tmp_path / ".specfact" / "ignore").write_text("!scripts/keep.py\n")
+
+        walker = RepoWalker(tmp_path)
+        files = _relative(tmp_path, walker.list_files())
+
+        assert files == ["scripts/keep.py", "src/main.py", "src/pkg/module.py"]
+        assert _relative(tmp_path, RepoWalker(tmp_path, use_ignore_files=False).list_files()) == [
+            "scripts/keep.py",
+            "scripts/tool.py",
+            "src/generated/models.py",
+            "src/main.py",
+            "src/pkg/local.py",
+            "src/pkg/module.py",
+        ]
+
+    def test_start_directory_applies_parent_ignore_files(self, tmp_path: Path) -> None:
+        """Walking a subdirectory still honours ignore files above it."""
+        _touch(tmp_path, "src/pkg/module.py", "src/pkg/skip_me.py", "other/module.py")
+        (tmp_path / ".gitignore").write_text("skip_me.py\n")
+
+        files = RepoWalker(tmp_path).list_files(start=Path("src"))
+
+        assert _relative(tmp_path, files) == ["src/pkg/module.py"]
+
+
+class TestRepoFileIndex:
+    """Tests for the shared per-run file list."""
+
+    def test_scope_walks_once(self, tmp_path: Path) -> None:
+        """All callers within a scope share one walk; subdirectories are filtered from it."""
+        _touch(tmp_path, "src/pkg/module.py", "lib/helper.py")
+
+        with repo_file_index_scope() as index:
+            all_files = list_python_files(tmp_path)
+            _touch(tmp_path, "src/pkg/added.py")
+            src_files = list_python_files(tmp_path, subdir=Path("src"))
+
+            resolved_files = list_python_files(tmp_path.resolve())
+
+        assert index.walks == 1
+        assert resolved_files == [tmp_path.resolve() / rel_path for rel_path in ("lib/helper.py", "src/pkg/module.py")]
+        assert _relative(tmp_path, all_files) == ["lib/helper.py", "src/pkg/module.py"]
+        assert _relative(tmp_path, src_files) == ["src/pkg/module.py"]
+        # Outside a scope the repository is walked again
+        assert len(list_python_files(tmp_path)) == 3
+
+    def test_code_analyzer_uses_walker(self, tmp_path: Path) -> None:
+        """CodeAnalyzer skips virtualenvs but keeps env/build-named modules."""
+        _touch(tmp_path, "src/environment.py", "src/build_tools/runner.py", ".venv/lib/module.py")
+        analyzer = CodeAnalyzer(tmp_path)
+
+        assert not analyzer._should_skip_file(tmp_path / "src" / "environment.py")
+        assert not analyzer._should_skip_file(tmp_path / "src" / "build_tools" / "runner.py")
+        assert analyzer._should_skip_file(tmp_path / "build" / "lib" / "module.py")
+        assert _relative(tmp_path, list_python_files(tmp_path)) == ["src/build_tools/runner.py", "src/environment.py"]
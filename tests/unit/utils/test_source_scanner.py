@@ -0,0 +1,89 @@
+"""Unit tests for source artifact linking."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from specfact_cli.models.plan import Feature, Story
+from specfact_cli.utils.source_scanner import FileNameIndex, SourceArtifactScanner
+
+
+def _feature(key: str, title: str, story_count: int = 2) -> Feature:
+    stories = [
+        Story(key=f"{key}-STORY-{index}", title=f"Story {index}", story_points=None, value_points=None)
+        for index in range(story_count)
+    ]
+    return Feature(key=key, title=title, stories=stories)
+
+
+class TestFileNameIndex:
+    """Tests for FileNameIndex."""
+
+    def test_substring_lookup_matches_scan(self) -> None:
+        """Lookups return the same files as a substring scan over stems, in insertion order."""
+        files = [
+            Path("src/user_service.py"),
+            Path("src/UserRepository.py"),
+            Path("src/orders.py"),
+            Path("src/superuser.py"),
+        ]
+        index = FileNameIndex(files)
+
+        for fragment in ["user", "order", "service", "us", "missing"]:
+            expected = [f for f in files if fragment in f.stem.lower()]
+            assert index.search([fragment]) == expected
+
+    def test_search_unions_fragments(self) -> None:
+        """Files matching any fragment are returned once."""
+        files = [Path("a/payment_gateway.py"), Path("a/invoice.py"), Path("a/payment_invoice.py")]
+        index = FileNameIndex(files)
+
+        assert index.search(["payment", "invoice"]) == files
+        assert len(index) == 3
+
+
+class TestSourceArtifactScanner:
+    """Tests for SourceArtifactScanner.link_to_specs."""
+
+    def test_links_matching_files_and_functions(self, tmp_path: Path) -> None:
+        """Features are linked to implementation/test files whose names match key or title words."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "src" / "payment_service.py").write_text("def charge():\n    pass\n")
+        (tmp_path / "src" / "other.py").write_text("def unrelated():\n    pass\n")
+        (tmp_path / "tests" / "test_payment.py").write_text("def test_charge():\n    pass\n")
+        feature = _feature("FEATURE-PAYMENT", "Payment Processing")
+
+        SourceArtifactScanner(tmp_path).link_to_specs([feature], tmp_path)
+
+        tracking = feature.source_tracking
+        assert tracking is not None
+        assert tracking.implementation_files == ["src/payment_service.py"]
+        assert tracking.test_files == ["tests/test_payment.py"]
+        assert set(tracking.file_hashes) == {"src/payment_service.py", "tests/test_payment.py"}
+        for story in feature.stories:
+            assert story.source_functions == ["src/payment_service.py::charge"]
+            assert story.test_functions == ["tests/test_payment.py::test_charge"]
+
+    def test_extracts_each_file_once(self, tmp_path: Path) -> None:
+        """Function lists and hashes are computed once per file across all features and stories."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "user_account.py").write_text("def create():\n    pass\n")
+        features = [_feature(f"FEATURE-{index}", "User Account", story_count=3) for index in range(4)]
+        scanner = SourceArtifactScanner(tmp_path)
+
+        with (
+            patch.object(scanner, "extract_function_mappings", wraps=scanner.extract_function_mappings) as extract,
+            patch(
+                "specfact_cli.models.source_tracking.SourceTracking.compute_hash", autospec=True, return_value="0" * 64
+            ) as compute_hash,
+        ):
+            scanner.link_to_specs(features, tmp_path)
+
+        assert extract.call_count == 1
+        assert compute_hash.call_count == 1
+        for feature in features:
+            assert feature.source_tracking is not None
+            assert feature.source_tracking.implementation_files == ["src/user_account.py"]
+            assert all(story.source_functions == ["src/user_account.py::create"] for story in feature.stories)
@@ -0,0 +1,108 @@
+"""Unit tests for the contract validation result cache."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+from specfact_cli.validators.contract_cache import (
+    OPENAPI_SCHEMA_VALIDATOR,
+    SPECMATIC_VALIDATOR,
+    ContractValidationCache,
+)
+
+
+class TestContractValidationCache:
+    """Tests for keying, replay and eviction of cached validation results."""
+
+    def test_put_then_get_replays_result(self, tmp_path: Path) -> None:
+        """A stored result is replayed for the same contract content, also under another name."""
+        contract = tmp_path / "orders.yaml"
+        contract.write_text("openapi: 3.0.3\n")
+        cache = ContractValidationCache(tmp_path)
+
+        assert cache.get(SPECMATIC_VALIDATOR, "2.0.0", contract) is None
+        cache.put(SPECMATIC_VALIDATOR, "2.0.0", contract, {"is_valid": True})
+
+        cached = cache.get(SPECMATIC_VALIDATOR, "2.0.0", contract)
+        assert cached is not None and cached.result == {"is_valid": True}
+        copy = tmp_path / "copy.yaml"
+        copy.write_text("openapi: 3.0.3\n")
+        assert cache.get(SPECMATIC_VALIDATOR, "2.0.0", copy) is not None
+        stats = cache.get_stats()
+        assert (stats.hits, stats.misses, stats.writes) == (2, 1, 1)
+        assert list((tmp_path / ".specfact" / "cache" / "contracts").rglob("*.json"))
+
+    def test_key_covers_content_previous_version_and_validator(self, tmp_path: Path) -> None:
+        """Changing the contract, the previous version or the validator misses the cache."""
+        contract = tmp_path / "orders.yaml"
+        contract.write_text("openapi: 3.0.3\n")
+        previous = tmp_path / "orders.v1.yaml"
+        previous.write_text("openapi: 3.0.0\n")
+        cache = ContractValidationCache(tmp_path)
+        cache.put(SPECMATIC_VALIDATOR, "2.0.0", contract, {"is_valid": True}, previous_path=previous)
+
+        assert cache.get(SPECMATIC_VALIDATOR, "2.0.0", contract, previous) is not None
+        assert cache.get(SPECMATIC_VALIDATOR, "2.0.0", contract) is None
+        assert cache.get(SPECMATIC_VALIDATOR, "2.1.0", contract, previous) is None
+        assert cache.get(OPENAPI_SCHEMA_VALIDATOR, "2.0.0", contract, previous) is None
+        previous.write_text("openapi: 3.0.1\n")
+        assert cache.get(SPECMATIC_VALIDATOR, "2.0.0", contract, previous) is None
+        previous.write_text("openapi: 3.0.0\n")
+        contract.write_text("openapi: 3.1.0\n")
+        assert cache.get(SPECMATIC_VALIDATOR, "2.0.0", contract, previous) is None
+
+    def test_key_covers_referenced_files_and_examples(self, tmp_path: Path) -> None:
+        """Editing a `$ref`-referenced file or the examples directory misses the cache."""
+        fixtures = Path(__file__).parents[2] / "fixtures" / "contracts"
+        shutil.copy(fixtures / "orders.openapi.yaml", tmp_path)
+        shutil.copy(fixtures / "common.yaml", tmp_path)
+        contract = tmp_path / "orders.openapi.yaml"
+        common = tmp_path / "common.yaml"
+        cache = ContractValidationCache(tmp_path)
+        cache.put(SPECMATIC_VALIDATOR, "2.0.0", contract, {"is_valid": True})
+        assert cache.get(SPECMATIC_VALIDATOR, "2.0.0", contract) is not None
+
+        original = common.read_text()
+        common.write_text(original.replace("Error", "Failure"))
+        assert cache.get(SPECMATIC_VALIDATOR, "2.0.0", contract) is None
+        common.write_text(original)
+        assert cache.get(SPECMATIC_VALIDATOR, "2.0.0", contract) is not None
+
+        common.unlink()
+        assert cache.get(SPECMATIC_VALIDATOR, "2.0.0", contract) is None
+        common.write_text(original)
+
+        examples_dir = tmp_path / "orders.openapi_examples"
+        examples_dir.mkdir()
+        (examples_dir / "list_orders.json").write_text('{"http-request": {}}')
+        assert cache.get(SPECMATIC_VALIDATOR, "2.0.0", contract) is None
+        cache.put(SPECMATIC_VALIDATOR, "2.0.0", contract, {"is_valid": False})
+        (examples_dir / "list_orders.json").write_text('{"http-request": {"method": "GET"}}')
+        assert cache.get(SPECMATIC_VALIDATOR, "2.0.0", contract) is None
+
+    def test_unreadable_contract_and_corrupt_entry_miss(self, tmp_path: Path) -> None:
+        """Missing contracts are never cached and corrupt entries are treated as misses."""
+        cache = ContractValidationCache(tmp_path)
+        missing = tmp_path / "missing.yaml"
+        cache.put(SPECMATIC_VALIDATOR, "2.0.0", missing, {"is_valid": True})
+        assert cache.get(SPECMATIC_VALIDATOR, "2.0.0", missing) is None
+        assert cache.get_stats().writes == 0
+
+        contract = tmp_path / "orders.yaml"
+        contract.write_text("openapi: 3.0.3\n")
+        cache.put(SPECMATIC_VALIDATOR, "2.0.0", contract, {"is_valid": True})
+        for entry in cache.cache_dir.rglob("*.json"):
+            entry.write_text("{not json")
+        assert cache.get(SPECMATIC_VALIDATOR, "2.0.0", contract) is None
+
+    def test_prune_evicts_beyond_size_limit(self, tmp_path: Path) -> None:
+        """Pruning keeps the cache directory within its size limit."""
+        cache = ContractValidationCache(tmp_path, max_bytes=0)
+        contract = tmp_path / "orders.yaml"
+        contract.write_text("openapi: 3.0.3\n")
+        cache.put(SPECMATIC_VALIDATOR, "2.0.0", contract, {"is_valid": True})
+
+        cache.prune()
+
+        assert cache.get(SPECMATIC_VALIDATOR, "2.0.0", contract) is None
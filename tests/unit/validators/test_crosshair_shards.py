@@ -0,0 +1,146 @@
+"""Unit tests for sharded CrossHair runs with per-module caching."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from specfact_cli.validators.crosshair_shards import CrossHairShard, CrossHairShardRunner, merge_shard_results
+from specfact_cli.validators.repro_checker import (
+    CheckSpec,
+    CheckStatus,
+    ReproChecker,
+    _crosshair_target_modules,
+    _extract_findings,
+)
+
+
+# Stands in for `python -m crosshair check <module>`: logs each call, reports a
+# counterexample for modules ending in "bad" and hangs on modules ending in "slow"
+FAKE_CROSSHAIR = """
+import sys
+import time
+from pathlib import Path
+
+module = sys.argv[-1]
+with (Path(__file__).parent / "calls.log").open("a") as log:
+    log.write(module + "\\n")
+if module.endswith("slow"):
+    time.sleep(30)
+if module.endswith("bad"):
+    print(f"{module.replace('.', '/')}.py:3: error: false when calling f(x=0) (counterexample)")
+    sys.exit(1)
+"""
+
+
+def _setup_repo(tmp_path: Path, modules: list[str]) -> tuple[list[str], list[CrossHairShard]]:
+    """Create source modules and the fake CrossHair script; return the base command and shards."""
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "__init__.py").write_text("")
+    for module in modules:
+        (tmp_path / "src" / "pkg" / f"{module}.py").write_text(f"def f(x: int) -> int:\n    return x  # {module}\n")
+    script = tmp_path / "fake_crosshair.py"
+    script.write_text(FAKE_CROSSHAIR)
+    module_files, _excluded_main, _roots = _crosshair_target_modules(tmp_path, ["src/"])
+    shards = [CrossHairShard(name, path) for name, path in sorted(module_files.items()) if name != "pkg"]
+    return [sys.executable, str(script)], shards
+
+
+def _calls(tmp_path: Path) -> list[str]:
+    log = tmp_path / "calls.log"
+    return sorted(log.read_text().split()) if log.exists() else []
+
+
+class TestCrossHairShardRunner:
+    """Tests for CrossHairShardRunner."""
+
+    def test_targets_map_modules_to_files(self, tmp_path: Path) -> None:
+        """Directory targets expand to one module (shard) per source file, excluding __main__.py."""
+        _setup_repo(tmp_path, ["alpha"])
+        (tmp_path / "src" / "pkg" / "__main__.py").write_text("")
+
+        module_files, excluded_main, roots = _crosshair_target_modules(tmp_path, ["src/"])
+
+        assert module_files == {
+            "pkg": (tmp_path / "src" / "pkg" / "__init__.py").resolve(),
+            "pkg.alpha": (tmp_path / "src" / "pkg" / "alpha.py").resolve(),
+        }
+        assert excluded_main
+        assert roots == [str((tmp_path / "src").resolve())]
+
+    def test_runs_one_process_per_module_and_merges(self, tmp_path: Path) -> None:
+        """Each module runs separately; a slow module times out without hiding the others' results."""
+        base_command, shards = _setup_repo(tmp_path, ["good", "bad", "slow"])
+        runner = CrossHairShardRunner(tmp_path, base_command, shard_timeout=4.0, workers=3)
+
+        results = runner.run(shards)
+        merged = merge_shard_results("Contract exploration (CrossHair)", results)
+
+        assert [(r.module, r.status) for r in results] == [
+            ("pkg.bad", CheckStatus.FAILED),
+            ("pkg.good", CheckStatus.PASSED),
+            ("pkg.slow", CheckStatus.TIMEOUT),
+        ]
+        assert merged.status == CheckStatus.FAILED
+        assert "pkg.slow [timeout]" in merged.error
+        findings = _extract_findings("crosshair", merged.output, merged.error)
+        assert findings["total_counterexamples"] == 1
+        assert findings["counterexamples"][0]["file"] == "pkg/bad.py"
+
+    def test_unchanged_modules_served_from_cache(self, tmp_path: Path) -> None:
+        """Only modules whose content changed are explored again; timeouts are never cached."""
+        base_command, shards = _setup_repo(tmp_path, ["good", "bad", "slow"])
+        cache = CrossHairShardRunner.cache_for(tmp_path)
+        runner = CrossHairShardRunner(tmp_path, base_command, shard_timeout=4.0, workers=3, cache=cache)
+
+        runner.run(shards)
+        (tmp_path / "calls.log").unlink()
+        (tmp_path / "src" / "pkg" / "good.py").write_text("def f(x: int) -> int:\n    return x + 1\n")
+        results = runner.run(shards)
+
+        assert _calls(tmp_path) == ["pkg.good", "pkg.slow"]
+        assert [r.cached for r in results] == [True, False, False]
+        assert results[0].status == CheckStatus.FAILED
+        assert cache.cache_dir == tmp_path.resolve() / ".specfact" / "cache" / "repro" / "crosshair"
+
+        # A different CrossHair configuration invalidates all entries
+        (tmp_path / "pyproject.toml").write_text("[tool.crosshair]\nper_condition_timeout = 5\n")
+        (tmp_path / "calls.log").unlink()
+        CrossHairShardRunner(tmp_path, base_command, shard_timeout=4.0, workers=3, cache=cache).run(shards)
+        assert _calls(tmp_path) == ["pkg.bad", "pkg.good", "pkg.slow"]
+
+    def test_overall_timeout_stops_unstarted_shards(self, tmp_path: Path) -> None:
+        """Shards not started before the check's timeout are reported as timed out."""
+        base_command, shards = _setup_repo(tmp_path, ["a_slow", "b_good"])
+        runner = CrossHairShardRunner(tmp_path, base_command, shard_timeout=10.0, workers=1)
+
+        results = runner.run(shards, timeout=1.0)
+
+        assert [r.status for r in results] == [CheckStatus.TIMEOUT, CheckStatus.TIMEOUT]
+        assert _calls(tmp_path) == ["pkg.a_slow"]
+        assert "Not explored" in results[1].error
+        assert merge_shard_results("CrossHair", results).timeout
+
+    def test_scheduler_runs_sharded_check(self, tmp_path: Path) -> None:
+        """CheckSpec runners are executed by the repro scheduler with the check's timeout."""
+        base_command, shards = _setup_repo(tmp_path, ["good"])
+        runner = CrossHairShardRunner(tmp_path, base_command, workers=1)
+        checker = ReproChecker(repo_path=tmp_path, budget=30, max_parallel=1)
+
+        checker.run_scheduled_checks(
+            [
+                CheckSpec(
+                    "Contract exploration (CrossHair)",
+                    "crosshair",
+                    base_command,
+                    runner=lambda timeout: runner.run_check("Contract exploration (CrossHair)", shards, timeout),
+                )
+            ]
+        )
+
+        (result,) = checker.report.checks
+        assert result.status == CheckStatus.PASSED
+        assert result.exit_code == 0
+        assert result.duration is not None
+        assert result.finished_at is not None
+        assert "1 modules (0 cached, 1 explored)" in result.error
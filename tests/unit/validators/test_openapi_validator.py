@@ -0,0 +1,167 @@
+"""Unit tests for the in-process OpenAPI structural validator."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from specfact_cli.validators.openapi_validator import (
+    OpenAPIRefResolver,
+    RefResolutionError,
+    validate_openapi_document,
+    validate_openapi_file,
+)
+
+
+FIXTURES = Path(__file__).parents[2] / "fixtures" / "contracts"
+
+
+def _document(**overrides: object) -> dict[str, object]:
+    document: dict[str, object] = {"openapi": "3.0.3", "info": {"title": "Test API", "version": "1.0.0"}, "paths": {}}
+    document.update(overrides)
+    return document
+
+
+class TestValidateOpenAPIDocument:
+    """Tests for the structural rules."""
+
+    def test_valid_fixture_with_file_references(self) -> None:
+        """A valid contract (with references into another file) has no issues."""
+        result = validate_openapi_file(FIXTURES / "orders.openapi.yaml")
+
+        assert result.is_valid, result.errors
+        assert result.openapi_version == "3.0.3"
+        assert result.endpoints == 4
+
+    def test_broken_fixture_reports_structural_issues(self) -> None:
+        """Bad $refs, missing responses, duplicate operationIds and wrong parameter locations are reported."""
+        result = validate_openapi_file(FIXTURES / "broken.openapi.yaml")
+
+        assert sorted(result.errors) == sorted(
+            [
+                "/paths/~1orders/post/operationId: duplicate operationId 'list_orders' "
+                "(also used by /paths/~1orders/get)",
+                "/paths/~1orders/post: missing required field 'responses'",
+                "/paths/~1orders~1{orderId}/get/parameters/0: parameter 'orderId' has invalid location 'body' "
+                "(query, header, path or cookie)",
+                "/paths/~1orders~1{orderId}/get: path parameter 'orderId' of '/orders/{orderId}' is not declared",
+                "/paths/~1orders/get/responses/200/content/application~1json/schema: unresolved $ref: "
+                "'#/components/schemas/Orders' does not resolve ('Orders' not found)",
+            ]
+        )
+
+    def test_document_level_rules(self) -> None:
+        """Version, info and paths are checked; 3.1 documents may omit paths and responses."""
+        assert validate_openapi_document({"swagger": "2.0"}).errors == [
+            "/swagger: Swagger 2.0 documents are not supported (OpenAPI 3.0.x or 3.1.x)",
+            "/: missing required field 'info'",
+            "/: missing required field 'paths'",
+        ]
+        assert validate_openapi_document(_document(openapi=3.0)).errors == [
+            "/openapi: must be a version string (quote it in YAML)"
+        ]
+        assert not validate_openapi_document(_document(openapi="2.0.1")).is_valid
+
+        webhooks_only = {
+            "openapi": "3.1.0",
+            "info": {"title": "Hooks", "version": 1.0},
+            "webhooks": {"orderCreated": {"post": {"operationId": "order_created"}}},
+        }
+        assert validate_openapi_document(webhooks_only).is_valid
+
+    def test_parameters_and_responses(self) -> None:
+        """Path parameters must be required and declared; parameters need a schema; status codes are checked."""
+        operation = {
+            "parameters": [
+                {"name": "id", "in": "path", "schema": {"type": "string"}},
+                {"name": "X-Trace", "in": "header", "schema": {"type": "string"}},
+                {"name": "x-trace", "in": "header", "content": {}, "schema": {}},
+            ],
+            "responses": {"200": {"description": "OK"}, "600": {"description": "?"}, "404": {}},
+        }
+        result = validate_openapi_document(_document(paths={"/users/{id}": {"get": operation}, "users": {}}))
+
+        assert result.errors == [
+            "/paths/~1users~1{id}/get/parameters/0: path parameter 'id' must have 'required: true'",
+            "/paths/~1users~1{id}/get/parameters/2: parameter 'x-trace' must have either 'schema' or 'content'",
+            "/paths/~1users~1{id}/get/parameters/2: duplicate parameter 'x-trace' in header",
+            "/paths/~1users~1{id}/get/responses/600: invalid response status code '600'",
+            "/paths/~1users~1{id}/get/responses/404: missing required field 'description'",
+            "/paths/users: path must start with '/'",
+        ]
+
+    def test_path_level_parameters_and_equivalent_templates(self) -> None:
+        """Path-level parameters apply to every operation; equivalent templates are reported."""
+        path_item = {
+            "parameters": [{"$ref": "#/components/parameters/Id"}],
+            "get": {"responses": {"200": {"description": "OK"}}},
+        }
+        document = _document(
+            paths={"/users/{id}": path_item, "/users/{userId}": {}},
+            components={"parameters": {"Id": {"name": "id", "in": "path", "required": True, "schema": {}}}},
+        )
+
+        assert validate_openapi_document(document).errors == [
+            "/paths/~1users~1{userId}: path is equivalent to '/users/{id}'"
+        ]
+
+    def test_issue_limit(self) -> None:
+        """Issues beyond max_issues are counted as truncated, not listed."""
+        paths = {f"/items{index}": {"get": {}} for index in range(5)}
+        result = validate_openapi_document(_document(paths=paths), max_issues=2)
+
+        assert len(result.issues) == 2
+        assert result.truncated
+
+    def test_unparseable_file(self, tmp_path: Path) -> None:
+        """A file that cannot be parsed yields a single issue."""
+        contract = tmp_path / "bad.yaml"
+        contract.write_text("openapi: [3.0.3\n")
+
+        result = validate_openapi_file(contract)
+
+        assert len(result.issues) == 1
+        assert "cannot parse bad.yaml" in result.errors[0]
+
+
+class TestOpenAPIRefResolver:
+    """Tests for $ref resolution."""
+
+    def test_resolution_is_memoised_and_follows_chains(self) -> None:
+        """Chains of $refs resolve to the final target; repeated lookups hit the cache."""
+        document = {
+            "components": {
+                "schemas": {"User": {"$ref": "#/components/schemas/Person"}, "Person": {"type": "object"}},
+                "responses": {"200": {"description": "numeric key"}},
+            }
+        }
+        resolver = OpenAPIRefResolver(document)
+
+        assert resolver.resolve("#/components/schemas/User") == (None, {"type": "object"})
+        assert resolver.resolve("#/components/schemas/User")[1] == {"type": "object"}
+        assert (resolver.hits, resolver.misses) == (1, 1)
+        assert resolver.resolve("#/components/responses/200")[1] == {"description": "numeric key"}
+
+    def test_cycles_and_missing_targets(self) -> None:
+        """Circular chains and missing targets raise RefResolutionError (failures are memoised too)."""
+        document = {"a": {"$ref": "#/b"}, "b": {"$ref": "#/a"}}
+        resolver = OpenAPIRefResolver(document)
+
+        with pytest.raises(RefResolutionError, match="circular"):
+            resolver.resolve("#/a")
+        for _ in range(2):
+            with pytest.raises(RefResolutionError, match="'missing' not found"):
+                resolver.resolve("#/missing")
+        assert resolver.hits == 1
+
+    def test_file_references_need_the_document_path(self) -> None:
+        """Relative file references are only checked when the document's path is known."""
+        assert not OpenAPIRefResolver({}).can_resolve("common.yaml#/components/schemas/Error")
+        assert not OpenAPIRefResolver({}, FIXTURES / "orders.openapi.yaml").can_resolve("https://example.com/a.yaml")
+        resolver = OpenAPIRefResolver({}, FIXTURES / "orders.openapi.yaml")
+
+        path, target = resolver.resolve("common.yaml#/components/responses/Error")
+
+        assert path == (FIXTURES / "common.yaml").resolve()
+        assert target["description"] == "Error"
@@ -5,20 +5,82 @@ Focus: Business logic and edge cases only (@beartype handles type validation).
 
 from __future__ import annotations
 
+import io
+import json
+import os
 import subprocess
+import threading
 import time
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from specfact_cli.utils.env_manager import EnvManager, EnvManagerInfo
+from specfact_cli.validators.repro_cache import ReproResultCache
 from specfact_cli.validators.repro_checker import (
+    MAX_CAPTURED_OUTPUT,
+    BoundedOutput,
+    CheckCacheSpec,
     CheckResult,
+    CheckSpec,
     CheckStatus,
     ReproChecker,
     ReproReport,
+    allocate_check_budget,
+    findings_parser_for,
 )
 
 
+class _FakeProcess:
+    """Stand-in for subprocess.Popen with canned output, exit code and run time."""
+
+    def __init__(
+        self,
+        args: list[str],
+        stdout: str = "",
+        stderr: str = "",
+        returncode: int = 0,
+        delay: float = 0.0,
+        hang: bool = False,
+    ) -> None:
+        self.args = args
+        self.stdout = io.StringIO(stdout)
+        self.stderr = io.StringIO(stderr)
+        self.returncode: int | None = None
+        self._exit_code = returncode
+        self._delay = delay
+        self._hang = hang
+
+    def wait(self, timeout: float | None = None) -> int:
+        if self.returncode is None:
+            if self._hang:
+                raise subprocess.TimeoutExpired(self.args, timeout or 0)
+            time.sleep(self._delay)
+            self.returncode = self._exit_code
+        return self.returncode
+
+    def kill(self) -> None:
+        self._hang = False
+        self._exit_code = -9
+
+    def poll(self) -> int | None:
+        return self.returncode
+
+    def communicate(self, input: str | None = None, timeout: float | None = None) -> tuple[str, str]:
+        self.wait(timeout)
+        return self.stdout.read(), self.stderr.read()
+
+    def __enter__(self) -> _FakeProcess:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+
+def _popen(stdout: str = "", stderr: str = "", returncode: int = 0, hang: bool = False):
+    """Build a subprocess.Popen replacement whose processes print the given output."""
+    return lambda command, **kwargs: _FakeProcess(command, stdout, stderr, returncode, hang=hang)
+
+
 class TestReproChecker:
     """Test ReproChecker functionality."""
 
@@ -39,13 +101,7 @@ class TestReproChecker:
         """Test run_check with passing command."""
         checker = ReproChecker(repo_path=tmp_path, budget=30)
 
-        with patch("subprocess.run") as mock_run:
-            mock_proc = MagicMock()
-            mock_proc.returncode = 0
-            mock_proc.stdout = "Success"
-            mock_proc.stderr = ""
-            mock_run.return_value = mock_proc
-
+        with patch("subprocess.Popen", side_effect=_popen(stdout="Success")) as mock_popen:
             result = checker.run_check(
                 name="Test Check",
                 tool="test",
@@ -57,19 +113,13 @@ class TestReproChecker:
             assert result.status == CheckStatus.PASSED
             assert result.exit_code == 0
             assert result.output == "Success"
-            mock_run.assert_called_once()
+            mock_popen.assert_called_once()
 
     def test_run_check_failed(self, tmp_path: Path):
         """Test run_check with failing command."""
         checker = ReproChecker(repo_path=tmp_path, budget=30)
 
-        with patch("subprocess.run") as mock_run:
-            mock_proc = MagicMock()
-            mock_proc.returncode = 1
-            mock_proc.stdout = ""
-            mock_proc.stderr = "Error occurred"
-            mock_run.return_value = mock_proc
-
+        with patch("subprocess.Popen", side_effect=_popen(stderr="Error occurred", returncode=1)):
             result = checker.run_check(
                 name="Test Check",
                 tool="test",
@@ -86,9 +136,7 @@ class TestReproChecker:
         """Test run_check with timeout."""
         checker = ReproChecker(repo_path=tmp_path, budget=30)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.TimeoutExpired("test", 10)
-
+        with patch("subprocess.Popen", side_effect=_popen(stdout="partial\n", hang=True)):
             result = checker.run_check(
                 name="Test Check",
                 tool="test",
@@ -100,6 +148,8 @@ class TestReproChecker:
             assert result.status == CheckStatus.TIMEOUT
             assert result.timeout is True
             assert "timed out" in result.error
+            # Output printed before the timeout is kept
+            assert result.output == "partial\n"
 
     def test_run_check_budget_exceeded(self, tmp_path: Path):
         """Test run_check stops when budget exceeded."""
@@ -135,13 +185,7 @@ class TestReproChecker:
             message="Test",
         )
 
-        with patch("subprocess.run") as mock_run:
-            mock_proc = MagicMock()
-            mock_proc.returncode = 0
-            mock_proc.stdout = "Linting passed"
-            mock_proc.stderr = ""
-            mock_run.return_value = mock_proc
-
+        with patch("subprocess.Popen", side_effect=_popen(stdout="Linting passed")):
             # Mock environment detection and tool availability
             with (
                 patch("specfact_cli.utils.env_manager.detect_env_manager", return_value=env_info),
@@ -173,13 +217,7 @@ class TestReproChecker:
             message="Test",
         )
 
-        with patch("subprocess.run") as mock_run:
-            mock_proc = MagicMock()
-            mock_proc.returncode = 1  # First check fails
-            mock_proc.stdout = ""
-            mock_proc.stderr = "Error"
-            mock_run.return_value = mock_proc
-
+        with patch("subprocess.Popen", side_effect=_popen(stderr="Error", returncode=1)):
             # Mock environment detection and tool availability
             with (
                 patch("specfact_cli.utils.env_manager.detect_env_manager", return_value=env_info),
@@ -216,13 +254,7 @@ class TestReproChecker:
             message="Test",
         )
 
-        with patch("subprocess.run") as mock_run:
-            mock_proc = MagicMock()
-            mock_proc.returncode = 0
-            mock_proc.stdout = ""
-            mock_proc.stderr = ""
-            mock_run.return_value = mock_proc
-
+        with patch("subprocess.Popen", side_effect=_popen()) as mock_popen:
             # Mock environment detection and tool availability
             with (
                 patch("specfact_cli.utils.env_manager.detect_env_manager", return_value=env_info),
@@ -232,7 +264,7 @@ class TestReproChecker:
                 checker.run_all_checks()
 
             # Verify Semgrep was called with --autofix flag
-            semgrep_calls = [call for call in mock_run.call_args_list if "semgrep" in str(call)]
+            semgrep_calls = [call for call in mock_popen.call_args_list if "semgrep" in str(call)]
             if semgrep_calls:
                 # Check that --autofix is in the command
                 semgrep_call = semgrep_calls[0]
@@ -354,13 +386,7 @@ version = "1.0.0"
             message="Detected hatch",
         )
 
-        with patch("subprocess.run") as mock_run:
-            mock_proc = MagicMock()
-            mock_proc.returncode = 0
-            mock_proc.stdout = "Success"
-            mock_proc.stderr = ""
-            mock_run.return_value = mock_proc
-
+        with patch("subprocess.Popen", side_effect=_popen(stdout="Success")) as mock_popen:
             with (
                 patch("specfact_cli.utils.env_manager.detect_env_manager", return_value=env_info),
                 patch("specfact_cli.utils.env_manager.check_tool_in_env", return_value=(True, None)),
@@ -371,7 +397,7 @@ version = "1.0.0"
             # Verify commands were built with hatch prefix
             ruff_calls = [
                 call
-                for call in mock_run.call_args_list
+                for call in mock_popen.call_args_list
                 if "ruff" in str(call.args[0] if hasattr(call, "args") else call)
             ]
             if ruff_calls:
@@ -403,13 +429,7 @@ name = "test-project"
             message="Detected poetry",
         )
 
-        with patch("subprocess.run") as mock_run:
-            mock_proc = MagicMock()
-            mock_proc.returncode = 0
-            mock_proc.stdout = "Success"
-            mock_proc.stderr = ""
-            mock_run.return_value = mock_proc
-
+        with patch("subprocess.Popen", side_effect=_popen(stdout="Success")):
             with (
                 patch("specfact_cli.utils.env_manager.detect_env_manager", return_value=env_info),
                 patch("specfact_cli.utils.env_manager.check_tool_in_env", return_value=(True, None)),
@@ -472,13 +492,7 @@ name = "my-package"
             message="Test",
         )
 
-        with patch("subprocess.run") as mock_run:
-            mock_proc = MagicMock()
-            mock_proc.returncode = 0
-            mock_proc.stdout = "Success"
-            mock_proc.stderr = ""
-            mock_run.return_value = mock_proc
-
+        with patch("subprocess.Popen", side_effect=_popen(stdout="Success")):
             with (
                 patch("specfact_cli.utils.env_manager.detect_env_manager", return_value=env_info),
                 patch("specfact_cli.utils.env_manager.check_tool_in_env", return_value=(True, None)),
@@ -488,3 +502,347 @@ name = "my-package"
 
             # Should have detected my_package/ as source directory
             assert report.total_checks >= 1
+
+
+class TestReproScheduling:
+    """Test parallel, dependency-aware check scheduling."""
+
+    @staticmethod
+    def _fake_popen(delays: dict[str, float], returncodes: dict[str, int] | None = None):
+        """Build a subprocess.Popen replacement that runs for a delay per command and records start order."""
+        started: list[str] = []
+        lock = threading.Lock()
+
+        def popen(command, **kwargs):
+            with lock:
+                started.append(command[0])
+            return _FakeProcess(
+                command, returncode=(returncodes or {}).get(command[0], 0), delay=delays.get(command[0], 0.0)
+            )
+
+        return popen, started
+
+    def test_allocate_budget_scales_when_everything_fits(self):
+        """Allocations grow to use the available capacity when all checks fit."""
+        allocations = allocate_check_budget({"ruff": 5.0, "pytest": 10.0}, budget=100.0, concurrency=2)
+
+        # Requests (2x expected duration) are scaled to the capacity of 2 x 100s, capped at the budget
+        assert allocations["ruff"] == 10.0 * 200 / 30
+        assert allocations["pytest"] == 100.0
+
+    def test_allocate_budget_protects_quick_checks(self):
+        """A slow check is cut before the quick ones when the budget is short."""
+        allocations = allocate_check_budget(
+            {"ruff": 5.0, "pytest": 20.0, "crosshair": 1800.0}, budget=120.0, concurrency=1
+        )
+
+        assert allocations["ruff"] == 10.0
+        assert allocations["pytest"] == 40.0
+        assert allocations["crosshair"] == 70.0
+
+    def test_independent_checks_run_in_parallel(self, tmp_path: Path):
+        """Independent checks overlap in time and record queued/started/finished timestamps."""
+        checker = ReproChecker(repo_path=tmp_path, budget=30, max_parallel=2)
+        popen, _started = self._fake_popen({"slow": 0.3, "fast": 0.05})
+        streamed: list[str] = []
+
+        with patch("subprocess.Popen", side_effect=popen):
+            checker.run_scheduled_checks(
+                [
+                    CheckSpec("Slow", "slow", ["slow"], skip_if_missing=False),
+                    CheckSpec("Fast", "fast", ["fast"], skip_if_missing=False),
+                ],
+                on_result=lambda result: streamed.append(result.name),
+            )
+
+        # Results are streamed in completion order
+        assert streamed == ["Fast", "Slow"]
+        slow, fast = sorted(checker.report.checks, key=lambda c: c.name, reverse=True)
+        assert fast.started_at is not None and slow.started_at is not None and slow.finished_at is not None
+        assert fast.started_at < slow.finished_at
+        assert slow.queued_at is not None and slow.queued_at <= slow.started_at
+        check_dict = slow.to_dict()
+        assert {"queued_at", "started_at", "finished_at"} <= set(check_dict)
+        assert checker.report.to_dict()["metadata"]["max_parallel"] == 2
+
+    def test_dependencies_are_respected(self, tmp_path: Path):
+        """A check starts only after the checks it depends on have finished."""
+        checker = ReproChecker(repo_path=tmp_path, budget=30, max_parallel=4)
+        popen, started = self._fake_popen({"fixer": 0.1})
+
+        with patch("subprocess.Popen", side_effect=popen):
+            checker.run_scheduled_checks(
+                [
+                    CheckSpec("Lint", "lint", ["lint"], skip_if_missing=False, depends_on=("Fix",)),
+                    CheckSpec("Fix", "fixer", ["fixer"], skip_if_missing=False),
+                ]
+            )
+
+        assert started == ["fixer", "lint"]
+        fix, lint = sorted(checker.report.checks, key=lambda c: c.name)
+        assert lint.started_at is not None and fix.finished_at is not None
+        assert lint.started_at >= fix.finished_at
+
+    def test_fail_fast_stops_scheduling(self, tmp_path: Path):
+        """With fail_fast, checks queued behind a failure are not started."""
+        checker = ReproChecker(repo_path=tmp_path, budget=30, fail_fast=True, max_parallel=1)
+        popen, started = self._fake_popen({}, returncodes={"first": 1})
+
+        with patch("subprocess.Popen", side_effect=popen):
+            checker.run_scheduled_checks(
+                [
+                    CheckSpec("First", "first", ["first"], skip_if_missing=False),
+                    CheckSpec("Second", "second", ["second"], skip_if_missing=False),
+                ]
+            )
+
+        assert started == ["first"]
+        assert checker.report.total_checks == 1
+        assert checker.report.failed_checks == 1
+
+    def test_duration_history_drives_allocation(self, tmp_path: Path):
+        """Durations are persisted and used to size each check's timeout on the next run."""
+        popen, _started = self._fake_popen({})
+        with patch("subprocess.Popen", side_effect=popen):
+            ReproChecker(repo_path=tmp_path, budget=30, max_parallel=1).run_scheduled_checks(
+                [CheckSpec("Lint", "lint", ["lint"], skip_if_missing=False)]
+            )
+        history_path = tmp_path / ".specfact" / "cache" / "repro" / "durations.json"
+        assert "Lint" in json.loads(history_path.read_text())
+
+        history_path.write_text(json.dumps({"Lint": 2.0, "Slow": 1000.0}))
+        checker = ReproChecker(repo_path=tmp_path, budget=100, max_parallel=1)
+        with (
+            patch.object(checker, "run_check", wraps=checker.run_check) as run_check,
+            patch("subprocess.Popen", side_effect=popen),
+        ):
+            checker.run_scheduled_checks(
+                [
+                    CheckSpec("Lint", "lint", ["lint"], skip_if_missing=False),
+                    CheckSpec("Slow", "slow", ["slow"], skip_if_missing=False),
+                ]
+            )
+
+        timeouts = {call.args[0]: call.args[3] for call in run_check.call_args_list}
+        assert timeouts["Lint"] == 4.0
+        assert timeouts["Slow"] < 100.0
+
+    def test_fix_runs_semgrep_before_other_checks(self, tmp_path: Path):
+        """Semgrep auto-fixes finish before checks that read the sources start."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "__init__.py").write_text("")
+        semgrep_config = tmp_path / "tools" / "semgrep" / "async.yml"
+        semgrep_config.parent.mkdir(parents=True)
+        semgrep_config.write_text("rules: []")
+        env_info = EnvManagerInfo(manager=EnvManager.UNKNOWN, available=True, command_prefix=[], message="Test")
+        checker = ReproChecker(repo_path=tmp_path, budget=30, fix=True, max_parallel=4)
+        popen, started = self._fake_popen({"semgrep": 0.1})
+
+        with (
+            patch("subprocess.Popen", side_effect=popen),
+            patch("specfact_cli.utils.env_manager.detect_env_manager", return_value=env_info),
+            patch("specfact_cli.utils.env_manager.check_tool_in_env", return_value=(True, None)),
+            patch("shutil.which", return_value="/usr/bin/tool"),
+        ):
+            checker.run_all_checks()
+
+        assert started[0] == "semgrep"
+        assert len(started) > 1
+
+
+class TestReproStreaming:
+    """Test incremental findings, bounded output capture and resumed runs."""
+
+    def test_events_stream_while_check_runs(self, tmp_path: Path):
+        """Check start, each finding and the result are reported as events; findings are parsed once."""
+        events: list[dict] = []
+        checker = ReproChecker(repo_path=tmp_path, budget=30, on_event=events.append)
+        output = "src/a.py:1:1: F401 `os` imported but unused\nsrc/b.py:2:5: E501 Line too long\n"
+
+        with patch("subprocess.Popen", side_effect=_popen(stdout=output, returncode=1)):
+            checker.run_scheduled_checks([CheckSpec("Linting (ruff)", "ruff", ["ruff"], skip_if_missing=False)])
+
+        assert [event["type"] for event in events] == ["check_started", "finding", "finding", "check_result"]
+        assert events[1]["finding"]["file"] == "src/a.py" and events[2]["finding"]["code"] == "E501"
+        result = checker.report.checks[0]
+        assert result.findings is not None and result.findings["total_violations"] == 2
+        assert result.to_dict()["findings"] == result.findings
+        assert CheckResult.from_record(events[-1]["result"]) == result
+
+    def test_output_is_bounded(self, tmp_path: Path):
+        """Only the head and tail of long output are kept; the total length is still reported."""
+        captured = BoundedOutput(limit=20)
+        for index in range(10):
+            captured.append(f"line {index:04d}\n")
+
+        assert captured.total == 100 and captured.omitted == 80
+        assert captured.text() == "line 0000\n\n... [80 characters omitted] ...\nline 0009\n"
+
+        checker = ReproChecker(repo_path=tmp_path, budget=30)
+        noisy = ("x" * 99 + "\n") * 2_000
+        with patch("subprocess.Popen", side_effect=_popen(stdout=noisy)):
+            result = checker.run_check("Noisy", "noisy", ["noisy"], 10, skip_if_missing=False)
+
+        assert result.output_omitted == len(noisy) - MAX_CAPTURED_OUTPUT
+        assert len(result.output) < MAX_CAPTURED_OUTPUT + 100
+        assert result.to_dict()["output_length"] == len(noisy)
+
+    def test_findings_records_are_capped(self):
+        """Beyond the record limit, findings are counted but not stored."""
+        parser = findings_parser_for("ruff")
+        assert parser is not None
+        parser.max_records = 2
+        for index in range(5):
+            parser.feed(f"src/a.py:{index + 1}:1: F401 unused import")
+
+        findings = parser.result()
+        assert findings["total_violations"] == 5
+        assert len(findings["violations"]) == 2
+        assert findings["findings_truncated"] is True
+
+    def test_completed_checks_are_not_run_again(self, tmp_path: Path):
+        """Checks with a result from an interrupted run are reported without running them."""
+        previous = CheckResult(name="Lint", tool="lint", status=CheckStatus.PASSED, duration=1.5)
+        events: list[dict] = []
+        checker = ReproChecker(repo_path=tmp_path, budget=30, on_event=events.append, completed=[previous])
+        popen, started = TestReproScheduling._fake_popen({})
+
+        with patch("subprocess.Popen", side_effect=popen):
+            checker.run_scheduled_checks(
+                [
+                    CheckSpec("Lint", "lint", ["lint"], skip_if_missing=False),
+                    CheckSpec("Tests", "tests", ["tests"], skip_if_missing=False, depends_on=("Lint",)),
+                ]
+            )
+
+        assert started == ["tests"]
+        assert [check.name for check in checker.report.checks] == ["Lint", "Tests"]
+        assert checker.report.passed_checks == 2
+        assert [event["check"] for event in events if event["type"] == "check_result"] == ["Tests"]
+
+
+class TestReproResultCache:
+    """Test replaying check results from the result cache."""
+
+    @staticmethod
+    def _fake_ruff(findings: dict[str, str]):
+        """Build a subprocess.Popen replacement for ruff that reports one violation per listed file."""
+        runs: list[list[str]] = []
+
+        def popen(command, **kwargs):
+            if "--version" in command:
+                return _FakeProcess(command, stdout="ruff 0.9.0\n")
+            runs.append(command)
+            targets = [arg for arg in command[2:] if not arg.startswith("--")]
+            lines = [
+                f"{path}:1:1: F401 {message}"
+                for path, message in findings.items()
+                if any(path == target or path.startswith(target) for target in targets)
+            ]
+            return _FakeProcess(command, stdout="".join(line + "\n" for line in lines), returncode=1 if lines else 0)
+
+        return popen, runs
+
+    @staticmethod
+    def _ruff_spec() -> CheckSpec:
+        return CheckSpec(
+            "Linting (ruff)",
+            "ruff",
+            ["ruff", "check", "src/"],
+            skip_if_missing=False,
+            cache=CheckCacheSpec(
+                version_command=["ruff", "--version"],
+                inputs=("src/",),
+                config_files=("pyproject.toml",),
+                partial_command=lambda files: ["ruff", "check", "--force-exclude", *files],
+            ),
+        )
+
+    def _run(self, repo: Path, popen) -> CheckResult:
+        checker = ReproChecker(repo_path=repo, budget=30)
+        with patch("subprocess.Popen", side_effect=popen):
+            checker.run_scheduled_checks([self._ruff_spec()])
+        return checker.report.checks[0]
+
+    def test_unchanged_inputs_replay_cached_result(self, tmp_path: Path):
+        """A second run with the same tool version, config and inputs does not run the tool."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "a.py").write_text("import os\n")
+        popen, runs = self._fake_ruff({"src/a.py": "`os` imported but unused"})
+
+        first = self._run(tmp_path, popen)
+        second = self._run(tmp_path, popen)
+
+        assert len(runs) == 1
+        assert first.cache is None and second.cache == "hit"
+        assert second.status == CheckStatus.FAILED and second.findings == first.findings
+
+        # Changed configuration invalidates the cached result
+        (tmp_path / "pyproject.toml").write_text("[tool.ruff]\nline-length = 100\n")
+        third = self._run(tmp_path, popen)
+        assert len(runs) == 2 and third.cache is None
+
+    def test_changed_files_are_rechecked_and_merged(self, tmp_path: Path):
+        """Per-file tools re-check only changed files and keep the cached findings of the others."""
+        (tmp_path / "src").mkdir()
+        for name in ("a", "b", "c"):
+            (tmp_path / "src" / f"{name}.py").write_text(f"# {name}\n")
+        popen, runs = self._fake_ruff({"src/a.py": "unused a"})
+        self._run(tmp_path, popen)
+
+        (tmp_path / "src" / "b.py").write_text("import os\n")
+        popen, runs = self._fake_ruff({"src/a.py": "unused a", "src/b.py": "unused b"})
+        result = self._run(tmp_path, popen)
+
+        assert runs == [["ruff", "check", "--force-exclude", "src/b.py"]]
+        assert result.cache == "partial"
+        assert result.status == CheckStatus.FAILED
+        assert result.findings is not None
+        assert [finding["message"] for finding in result.findings["violations"]] == ["unused a", "unused b"]
+        assert result.findings["total_violations"] == 2
+
+        # Removing a file needs no run at all
+        (tmp_path / "src" / "c.py").unlink()
+        popen, runs = self._fake_ruff({})
+        result = self._run(tmp_path, popen)
+        assert runs == []
+        assert result.findings is not None and result.findings["total_violations"] == 2
+
+    def test_cache_is_size_bounded(self, tmp_path: Path):
+        """Entries beyond the size limit are evicted (least recently used first) when the run saves."""
+        cache = ReproResultCache(tmp_path, max_bytes=0)
+        spec = self._ruff_spec().cache
+        assert spec is not None
+
+        with patch("subprocess.Popen", side_effect=self._fake_ruff({})[0]):
+            lookup = cache.lookup("Linting (ruff)", "ruff", ["ruff", "check", "src/"], spec)
+        assert lookup is not None
+        cache.store(lookup, CheckResult("Linting (ruff)", "ruff", CheckStatus.PASSED, exit_code=0), 0.0)
+
+        assert lookup.entry_path.exists()
+        cache.save()
+        assert not lookup.entry_path.exists()
+
+    def test_unchanged_inputs_are_not_read(self, tmp_path: Path):
+        """Input hashes come from the persisted stat index: unchanged files are stat'ed, not read."""
+        (tmp_path / "src").mkdir()
+        for name in ("a", "b"):
+            source = tmp_path / "src" / f"{name}.py"
+            source.write_text(f"# {name}\n")
+            # Outside the racy window, so the stat index persists the hash
+            os.utime(source, (time.time() - 60, time.time() - 60))
+        spec = self._ruff_spec().cache
+        assert spec is not None
+
+        first = ReproResultCache(tmp_path)
+        with patch("subprocess.Popen", side_effect=self._fake_ruff({})[0]):
+            first_lookup = first.lookup("Linting (ruff)", "ruff", ["ruff", "check", "src/"], spec)
+        first.save()
+        second = ReproResultCache(tmp_path)
+        with patch("subprocess.Popen", side_effect=self._fake_ruff({})[0]):
+            second_lookup = second.lookup("Linting (ruff)", "ruff", ["ruff", "check", "src/"], spec)
+
+        assert first_lookup is not None and second_lookup is not None
+        assert second_lookup.inputs == first_lookup.inputs
+        assert first.hash_index.stats.hashed == 2
+        assert second.hash_index.stats.hashed == 0 and second.hash_index.stats.stat_hits == 2
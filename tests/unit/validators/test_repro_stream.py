@@ -0,0 +1,71 @@
+"""Unit tests for streaming repro reports."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from specfact_cli.validators.repro_checker import CheckResult, CheckStatus
+from specfact_cli.validators.repro_stream import (
+    ReproStreamWriter,
+    find_resumable_stream,
+    read_repro_stream,
+    run_finished_record,
+    run_started_record,
+)
+
+
+def _result_record(name: str, status: CheckStatus = CheckStatus.PASSED) -> dict:
+    result = CheckResult(name=name, tool="ruff", status=status, duration=1.0, findings={"total_violations": 0})
+    return {"type": "check_result", "check": name, "result": result.to_record()}
+
+
+class TestReproStream:
+    """Tests for ReproStreamWriter and reading streams back."""
+
+    def test_records_are_flushed_as_written(self, tmp_path: Path) -> None:
+        """Each record is on disk as soon as it is written, one JSON object per line."""
+        stream_path = tmp_path / "reports" / "report.jsonl"
+
+        with ReproStreamWriter(stream_path) as stream:
+            stream.write(run_started_record(tmp_path, tmp_path / "report.yaml", 120, False, False, 4))
+            stream.write(_result_record("Linting (ruff)"))
+            lines = stream_path.read_text(encoding="utf-8").splitlines()
+
+        assert [json.loads(line)["type"] for line in lines] == ["run_started", "check_result"]
+
+    def test_interrupted_stream_is_resumable(self, tmp_path: Path) -> None:
+        """A stream without run_finished is found and its finished checks are restored; cut-off lines are skipped."""
+        stream_path = tmp_path / "report-1.jsonl"
+        with ReproStreamWriter(stream_path) as stream:
+            stream.write(run_started_record(tmp_path, tmp_path / "report-1.yaml", 120, False, False, 4))
+            stream.write(_result_record("Linting (ruff)", CheckStatus.FAILED))
+        with stream_path.open("a", encoding="utf-8") as handle:
+            handle.write('{"type": "check_result", "result": {"na')
+
+        state = find_resumable_stream(tmp_path, tmp_path)
+
+        assert state is not None and state.path == stream_path
+        assert [(result.name, result.status) for result in state.results] == [("Linting (ruff)", CheckStatus.FAILED)]
+        assert state.results[0].findings == {"total_violations": 0}
+
+        # Appending continues on a new line after the cut-off record
+        with ReproStreamWriter(stream_path, append=True) as stream:
+            stream.write(run_finished_record(1, 2.0))
+        assert read_repro_stream(stream_path).finished is True
+        assert find_resumable_stream(tmp_path, tmp_path) is None
+
+    def test_streams_of_other_repositories_are_ignored(self, tmp_path: Path) -> None:
+        """Only interrupted runs of the same repository are resumed, newest first."""
+        other_repo = tmp_path / "other"
+        other_repo.mkdir()
+        for name, repo in (("report-old.jsonl", tmp_path), ("report-other.jsonl", other_repo)):
+            with ReproStreamWriter(tmp_path / name) as stream:
+                stream.write(run_started_record(repo, tmp_path / name.replace(".jsonl", ".yaml"), 120, False, False, 4))
+        os.utime(tmp_path / "report-old.jsonl", (0, 0))
+
+        state = find_resumable_stream(tmp_path, tmp_path)
+
+        assert state is not None and state.path.name == "report-old.jsonl"
+        assert find_resumable_stream(tmp_path / "missing", tmp_path) is None
@@ -0,0 +1,172 @@
+"""Benchmark for the per-file analysis executors (thread vs process vs serial).
+
+Generates a synthetic repository, runs `CodeAnalyzer.analyze()` with each executor
+mode across a range of worker counts and prints the scaling curve (wall time and
+speedup relative to serial). Also verifies that every mode produces identical
+features, since results are merged in deterministic file order.
+
+Usage:
+    python tools/benchmark_analysis_executor.py --files 800 --workers 1,2,4,8,16
+    python tools/benchmark_analysis_executor.py --repo /path/to/repo --modes process
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from specfact_cli.analyzers import code_analyzer
+from specfact_cli.analyzers.code_analyzer import CodeAnalyzer
+from specfact_cli.utils.ast_cache import parsed_module_cache_scope
+from specfact_cli.utils.executors import ExecutorConfig, ExecutorKind, available_cpu_count
+
+
+console = Console()
+
+MODULE_TEMPLATE = '''"""Synthetic module {index}."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+
+
+@dataclass
+class Record{index}:
+    """Record {index} with typed fields."""
+
+    identifier: int
+    name: str
+    payload: dict[str, str]
+
+
+class Service{index}:
+    """Manage records for domain {index}."""
+
+    def __init__(self) -> None:
+        """Initialize service."""
+        self.records: dict[int, Record{index}] = {{}}
+
+{methods}
+'''
+
+METHOD_TEMPLATE = '''    def {verb}_record_{n}(self, identifier: int, name: str = "x") -> Record{index} | None:
+        """{verb_title} record {n} by identifier."""
+        if identifier < 0:
+            raise ValueError("identifier must be non-negative")
+        record = self.records.get(identifier)
+        if record is None and "{verb}" in ("create", "update"):
+            record = Record{index}(identifier=identifier, name=name, payload={{"n": str({n})}})
+            self.records[identifier] = record
+        for key, value in (record.payload.items() if record else []):
+            if key == value:
+                return record
+        return json.loads(json.dumps(None)) or record
+'''
+
+VERBS = ["create", "get", "update", "delete", "list", "validate", "process", "sync"]
+
+
+def generate_repo(root: Path, file_count: int, methods_per_class: int) -> None:
+    """Generate a synthetic Python repository."""
+    package = root / "src" / "bench"
+    for index in range(file_count):
+        subpackage = package / f"pkg_{index % 20}"
+        subpackage.mkdir(parents=True, exist_ok=True)
+        methods = "\n".join(
+            METHOD_TEMPLATE.format(
+                verb=VERBS[n % len(VERBS)], verb_title=VERBS[n % len(VERBS)].title(), n=n, index=index
+            )
+            for n in range(methods_per_class)
+        )
+        (subpackage / f"module_{index}.py").write_text(MODULE_TEMPLATE.format(index=index, methods=methods))
+
+
+def run_once(repo: Path, config: ExecutorConfig) -> tuple[float, list[str], ExecutorConfig | None]:
+    """Run one analysis and return (seconds, feature keys, resolved executor)."""
+    with parsed_module_cache_scope():
+        analyzer = CodeAnalyzer(repo, confidence_threshold=0.3, executor_config=config)
+        # Measure AST analysis only (Semgrep runs a subprocess per file)
+        analyzer.semgrep_enabled = False
+        started = time.perf_counter()
+        plan = analyzer.analyze()
+        elapsed = time.perf_counter() - started
+    return elapsed, [feature.key for feature in plan.features], analyzer.last_executor_config
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark analysis executors (thread/process/serial)")
+    parser.add_argument("--repo", type=Path, help="Benchmark an existing repository instead of a synthetic one")
+    parser.add_argument("--files", type=int, default=800, help="Synthetic repository size (files)")
+    parser.add_argument("--methods", type=int, default=12, help="Methods per synthetic class")
+    parser.add_argument(
+        "--workers",
+        default=None,
+        help="Comma-separated worker counts (default: powers of two up to the CPU count)",
+    )
+    parser.add_argument("--modes", default="thread,process", help="Comma-separated executor modes to compare")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per configuration (best time is reported)")
+    args = parser.parse_args()
+
+    # Executors are chosen explicitly below; TEST_MODE would only change defaults
+    os.environ.pop("TEST_MODE", None)
+    code_analyzer.console.quiet = True
+
+    cpu_count = available_cpu_count()
+    if args.workers:
+        worker_counts = [int(value) for value in args.workers.split(",")]
+    else:
+        worker_counts = []
+        count = 1
+        while count < cpu_count:
+            worker_counts.append(count)
+            count *= 2
+        worker_counts.append(cpu_count)
+    modes = [ExecutorKind(mode.strip()) for mode in args.modes.split(",")]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = args.repo.resolve() if args.repo else Path(tmp)
+        if not args.repo:
+            console.print(f"Generating synthetic repository: {args.files} files, {args.methods} methods/class")
+            generate_repo(repo, args.files, args.methods)
+
+        def best_of(config: ExecutorConfig) -> tuple[float, list[str], ExecutorConfig | None]:
+            runs = [run_once(repo, config) for _ in range(max(1, args.repeat))]
+            return min(runs, key=lambda run: run[0])
+
+        console.print(f"CPUs available: {cpu_count}")
+        baseline, baseline_keys, _ = best_of(ExecutorConfig(kind=ExecutorKind.SERIAL))
+
+        table = Table(title="Analysis executor scaling (CodeAnalyzer.analyze)")
+        table.add_column("Mode", style="cyan")
+        table.add_column("Workers", justify="right")
+        table.add_column("Seconds", justify="right")
+        table.add_column("Speedup", justify="right", style="green")
+        table.add_column("Identical", justify="center")
+        table.add_row("serial", "1", f"{baseline:.2f}", "1.00x", "✓")
+
+        for mode in modes:
+            if mode == ExecutorKind.SERIAL:
+                continue
+            for workers in worker_counts:
+                elapsed, keys, resolved = best_of(ExecutorConfig(kind=mode, workers=workers))
+                used_workers = resolved.workers if resolved else workers
+                table.add_row(
+                    mode.value,
+                    str(used_workers),
+                    f"{elapsed:.2f}",
+                    f"{baseline / elapsed:.2f}x",
+                    "✓" if keys == baseline_keys else "✗",
+                )
+
+        console.print(table)
+
+
+if __name__ == "__main__":
+    main()
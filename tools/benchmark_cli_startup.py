@@ -0,0 +1,196 @@
+"""Import-time regression benchmark for `specfact` CLI startup.
+
+Runs the CLI entry point in fresh interpreters under `python -X importtime` for
+cheap invocations (`--help`, `--version` by default), and reports, per
+invocation, the median total import time, wall time, the heaviest top-level
+imports, and any command modules that were imported although the invocation
+does not run a command. Exits non-zero when an invocation exceeds its import
+budget or imports a command module, so it can gate CI.
+
+Usage:
+    python tools/benchmark_cli_startup.py
+    python tools/benchmark_cli_startup.py --runs 10 --help-budget-ms 600 --version-budget-ms 500
+    python tools/benchmark_cli_startup.py --invocations "--help,--version,plan --help" --top 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+
+console = Console()
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+MODULES_MARKER = "loaded modules:"
+
+# Runs the real entry point (banner, argv handling) the way the console script does. `-X importtime`
+# does not log modules loaded through importlib.import_module, so sys.modules is also reported at exit.
+RUNNER = (
+    "import atexit, sys; "
+    f"atexit.register(lambda: sys.stderr.write('{MODULES_MARKER} ' + ' '.join(sorted(sys.modules)) + '\\n')); "
+    "sys.argv = ['specfact', *sys.argv[1:]]; "
+    "from specfact_cli.cli import cli_main; cli_main()"
+)
+
+# Modules that must not be imported just to print help or the version
+COMMAND_MODULE_PREFIX = "specfact_cli.commands."
+
+
+@dataclass
+class ImportSample:
+    """Import-time data from one interpreter run."""
+
+    total_us: int
+    wall_seconds: float
+    top_level: dict[str, int]  # Cumulative microseconds of each top-level import
+    modules: set[str]
+
+
+@dataclass
+class InvocationResult:
+    """Aggregated measurements for one CLI invocation."""
+
+    args: str
+    budget_ms: float | None
+    samples: list[ImportSample] = field(default_factory=list)
+
+    @property
+    def median_import_ms(self) -> float:
+        return statistics.median(sample.total_us for sample in self.samples) / 1000
+
+    @property
+    def median_wall_ms(self) -> float:
+        return statistics.median(sample.wall_seconds for sample in self.samples) * 1000
+
+    @property
+    def command_modules(self) -> list[str]:
+        modules = set().union(*(sample.modules for sample in self.samples))
+        return sorted(module for module in modules if module.startswith(COMMAND_MODULE_PREFIX))
+
+    @property
+    def within_budget(self) -> bool:
+        return self.budget_ms is None or self.median_import_ms <= self.budget_ms
+
+
+def parse_importtime(stderr: str) -> tuple[int, dict[str, int], set[str]]:
+    """
+    Parse `-X importtime` output.
+
+    Returns:
+        Total cumulative microseconds of top-level imports, the cumulative time per
+        top-level import, and every imported module name
+    """
+    top_level: dict[str, int] = {}
+    modules: set[str] = set()
+    for line in stderr.splitlines():
+        if line.startswith(MODULES_MARKER):
+            modules.update(line[len(MODULES_MARKER) :].split())
+            continue
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # Header line
+        module = name.strip()
+        modules.add(module)
+        if not name[1:].startswith(" "):  # Nested imports are indented by two spaces per level
+            top_level[module] = int(cumulative)
+    return sum(top_level.values()), top_level, modules
+
+
+def run_once(args: list[str]) -> ImportSample:
+    """Run the CLI once in a fresh interpreter and collect its import times."""
+    python_path = [str(REPO_ROOT / "src"), os.environ.get("PYTHONPATH", "")]
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, python_path))}
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", RUNNER, "--no-banner", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    wall_seconds = time.perf_counter() - started
+    total_us, top_level, modules = parse_importtime(completed.stderr)
+    return ImportSample(total_us=total_us, wall_seconds=wall_seconds, top_level=top_level, modules=modules)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import-time regression benchmark for CLI startup")
+    parser.add_argument("--runs", type=int, default=5, help="Interpreter runs per invocation (median is reported)")
+    parser.add_argument(
+        "--invocations",
+        default="--help,--version",
+        help="Comma-separated CLI invocations to measure (space-separated arguments)",
+    )
+    parser.add_argument("--help-budget-ms", type=float, default=900.0, help="Import budget for `--help`")
+    parser.add_argument("--version-budget-ms", type=float, default=800.0, help="Import budget for `--version`")
+    parser.add_argument("--top", type=int, default=10, help="Heaviest top-level imports to list")
+    args = parser.parse_args()
+
+    budgets = {"--help": args.help_budget_ms, "--version": args.version_budget_ms}
+    results: list[InvocationResult] = []
+    for invocation in (item.strip() for item in args.invocations.split(",")):
+        if not invocation:
+            continue
+        result = InvocationResult(args=invocation, budget_ms=budgets.get(invocation))
+        for _ in range(args.runs):
+            result.samples.append(run_once(invocation.split()))
+        results.append(result)
+
+    table = Table(title=f"CLI startup (median of {args.runs} runs)")
+    table.add_column("Invocation", style="cyan")
+    table.add_column("Import time", justify="right")
+    table.add_column("Budget", justify="right")
+    table.add_column("Wall time", justify="right")
+    table.add_column("Command modules", justify="right")
+    table.add_column("OK", justify="center")
+    for result in results:
+        budget = f"{result.budget_ms:.0f} ms" if result.budget_ms is not None else "-"
+        ok = result.within_budget and (result.budget_ms is None or not result.command_modules)
+        table.add_row(
+            result.args,
+            f"{result.median_import_ms:.0f} ms",
+            budget,
+            f"{result.median_wall_ms:.0f} ms",
+            str(len(result.command_modules)),
+            "✓" if ok else "✗",
+        )
+    console.print(table)
+
+    failed = False
+    for result in results:
+        heaviest = sorted(result.samples[-1].top_level.items(), key=lambda item: item[1], reverse=True)[: args.top]
+        console.print(f"\n[bold]Heaviest imports for `{result.args}`:[/bold]")
+        for module, micros in heaviest:
+            console.print(f"  {micros / 1000:8.1f} ms  {module}")
+        if result.budget_ms is None:
+            continue
+        if not result.within_budget:
+            failed = True
+            console.print(
+                f"[red]✗ `{result.args}` imports take {result.median_import_ms:.0f} ms "
+                f"(budget {result.budget_ms:.0f} ms)[/red]"
+            )
+        if result.command_modules:
+            failed = True
+            modules = ", ".join(result.command_modules)
+            console.print(f"[red]✗ `{result.args}` imported command modules: {modules}[/red]")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Benchmark for OpenAPI contract validation: in-process structural pre-pass vs. Specmatic.
+
+Validates the contracts in `tests/fixtures/contracts/` (or `--contracts DIR`) and,
+with `--generate N`, N contracts generated by `OpenAPIExtractor` from synthetic
+features (as `specfact generate contracts` would) with:
+
+- the shallow top-level check (`models.contract.validate_openapi_schema`)
+- the in-process structural validator (`validators.openapi_validator`)
+- Specmatic (`--specmatic`; one run, all contracts concurrently, as `spec validate` does)
+
+and reports the median total time, time per contract and the number of invalid
+contracts per validator.
+
+Usage:
+    python tools/benchmark_openapi_validation.py
+    python tools/benchmark_openapi_validation.py --generate 200 --runs 5
+    python tools/benchmark_openapi_validation.py --contracts .specfact/projects/legacy-api/contracts --specmatic
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from specfact_cli.generators.openapi_extractor import OpenAPIExtractor
+from specfact_cli.models.contract import load_openapi_contract, validate_openapi_schema
+from specfact_cli.models.plan import Feature, Story
+from specfact_cli.utils.structured_io import dump_structured_file
+from specfact_cli.validators.openapi_validator import validate_openapi_file
+
+
+console = Console()
+
+FIXTURES_DIR = Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "contracts"
+
+
+def find_contracts(contracts_dir: Path) -> list[Path]:
+    """Collect OpenAPI contract files (`*.openapi.yaml`/`.yml`/`.json`)."""
+    return sorted(path for path in contracts_dir.rglob("*.openapi.*") if path.suffix in (".yaml", ".yml", ".json"))
+
+
+def generate_contracts(root: Path, count: int) -> list[Path]:
+    """Write `count` contracts generated from synthetic features and return their paths."""
+    extractor = OpenAPIExtractor(root)
+    paths: list[Path] = []
+    for index in range(count):
+        stories = [
+            Story(
+                key=f"STORY-{index}-{story}",
+                title=f"Manage resource {index}.{story}",
+                acceptance=[
+                    f"{method} /api/resource-{index}/items-{story} returns the items"
+                    for method in ("GET", "POST", "PUT", "DELETE")
+                ],
+                story_points=None,
+                value_points=None,
+                scenarios=None,
+                contracts=None,
+            )
+            for story in range(5)
+        ]
+        feature = Feature(key=f"FEATURE-{index:04d}", title=f"Resource {index}", stories=stories)
+        path = root / f"FEATURE-{index:04d}.openapi.yaml"
+        dump_structured_file(extractor.extract_openapi_from_verbose(feature), path)
+        paths.append(path)
+    return paths
+
+
+def shallow_check(contract_path: Path) -> bool:
+    try:
+        return validate_openapi_schema(load_openapi_contract(contract_path))
+    except ValueError:
+        return False
+
+
+def structural_check(contract_path: Path) -> bool:
+    return validate_openapi_file(contract_path).is_valid
+
+
+def run_in_process(contracts: list[Path], check: Callable[[Path], bool], runs: int) -> tuple[float, int]:
+    """Median total seconds over `runs` runs, and the number of invalid contracts."""
+    durations: list[float] = []
+    invalid = 0
+    for _ in range(runs):
+        started = time.perf_counter()
+        invalid = sum(1 for contract_path in contracts if not check(contract_path))
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations), invalid
+
+
+def run_specmatic(contracts: list[Path]) -> tuple[float, int] | None:
+    """Total seconds of one Specmatic run over all contracts (None if Specmatic is unavailable)."""
+    from specfact_cli.integrations.specmatic import check_specmatic_available, validate_specs_with_specmatic
+
+    is_available, error_msg = check_specmatic_available()
+    if not is_available:
+        console.print(f"[yellow]Specmatic not available ({error_msg}); skipping[/yellow]")
+        return None
+    started = time.perf_counter()
+    results = asyncio.run(validate_specs_with_specmatic(contracts))
+    return time.perf_counter() - started, sum(1 for result in results if not result.is_valid)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark in-process OpenAPI validation against Specmatic")
+    parser.add_argument("--contracts", type=Path, default=FIXTURES_DIR, help="Directory with *.openapi.yaml files")
+    parser.add_argument("--generate", type=int, default=0, help="Also benchmark N generated contracts")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per in-process validator (median is reported)")
+    parser.add_argument("--specmatic", action="store_true", help="Also time Specmatic (one run)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        contracts = find_contracts(args.contracts)
+        if args.generate:
+            console.print(f"Generating {args.generate} contracts...")
+            contracts += generate_contracts(Path(tmp), args.generate)
+        if not contracts:
+            console.print("[red]No contracts found; pass --contracts DIR or --generate N[/red]")
+            sys.exit(2)
+        total_bytes = sum(path.stat().st_size for path in contracts)
+
+        measurements: list[tuple[str, float, int, str]] = []
+        for name, check in (("shallow top-level check", shallow_check), ("structural (in-process)", structural_check)):
+            seconds, invalid = run_in_process(contracts, check, args.runs)
+            measurements.append((name, seconds, invalid, f"median of {args.runs}"))
+        if args.specmatic:
+            specmatic = run_specmatic(contracts)
+            if specmatic is not None:
+                measurements.append(("Specmatic", specmatic[0], specmatic[1], "1 run"))
+
+    table = Table(title=f"OpenAPI validation: {len(contracts)} contracts, {total_bytes / 1024:.0f} KiB")
+    table.add_column("Validator", style="cyan")
+    table.add_column("Total", justify="right")
+    table.add_column("Per contract", justify="right")
+    table.add_column("Invalid", justify="right")
+    table.add_column("Runs", style="dim")
+    for name, seconds, invalid, runs in measurements:
+        table.add_row(name, f"{seconds * 1000:.0f} ms", f"{seconds / len(contracts) * 1000:.2f} ms", str(invalid), runs)
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
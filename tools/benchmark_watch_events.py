@@ -0,0 +1,237 @@
+"""Stress benchmark for the watch-mode event pipeline.
+
+Replays synthetic filesystem event storms into `EnhancedSyncEventHandler` (the
+same callbacks watchdog invokes) and reports, per scenario, the cost of event
+dispatch (the dispatch thread never hashes), how many batches were queued, the
+flush latency after the last event, backpressure waits, and whether the queued
+changes match the final state of the files.
+
+Scenarios:
+- checkout:    a `git checkout` rewriting N files, several events per file
+- editor-save: one file saved repeatedly within the debounce interval
+- atomic-save: saves through a temporary file and rename (vim, most IDEs)
+- delete:      tracked files removed (e.g., switching to a branch without them)
+- overflow:    more paths than the pending limit (exercises backpressure)
+
+Usage:
+    python tools/benchmark_watch_events.py --files 10000
+    python tools/benchmark_watch_events.py --scenarios checkout --events-per-file 5 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+from watchdog.events import (
+    FileCreatedEvent,
+    FileDeletedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+    FileSystemEvent,
+)
+
+from specfact_cli.sync.watcher_enhanced import (
+    EnhancedSyncEventHandler,
+    FileChange,
+    FileHashCache,
+    WatchEventPipeline,
+    compute_file_hash,
+)
+
+
+console = Console()
+
+# A storm applies its file writes and returns the events to replay (callback name, event) and
+# the expected queued hash per path (None = deleted)
+Storm = Callable[[FileHashCache], tuple[list[tuple[str, FileSystemEvent]], dict[Path, str | None]]]
+
+
+@dataclass
+class ScenarioResult:
+    """Measurements for one replayed event storm."""
+
+    name: str
+    events: int
+    dispatch_seconds: float
+    batches: int
+    changes: int
+    flush_latency: float  # Seconds from the last event until the final batch was queued
+    backpressure_waits: int
+    correct: bool
+
+
+def replay(name: str, repo: Path, storm: Storm, args: argparse.Namespace, max_pending: int) -> ScenarioResult:
+    """Replay a storm through a started pipeline and check the queued changes."""
+    change_queue: deque[FileChange] = deque()
+    hash_cache = FileHashCache(cache_file=repo / ".bench-cache.json")
+    handler = EnhancedSyncEventHandler(repo, change_queue, hash_cache, debounce_interval=args.debounce)
+    handler.pipeline = WatchEventPipeline(
+        change_queue,
+        hash_cache,
+        change_classifier=handler._detect_change_type,
+        debounce_interval=args.debounce,
+        max_pending=max_pending,
+        hash_workers=args.workers,
+    )
+    events, expected = storm(hash_cache)
+    handler.pipeline.start()
+
+    started = time.perf_counter()
+    for callback_name, event in events:
+        getattr(handler, callback_name)(event)
+    last_event = time.perf_counter()
+    handler.pipeline.wait_idle(timeout=args.debounce + 120)
+    flush_latency = time.perf_counter() - last_event
+    handler.pipeline.stop()
+
+    queued = {change.file_path: change.file_hash for change in change_queue}
+    return ScenarioResult(
+        name=name,
+        events=len(events),
+        dispatch_seconds=last_event - started,
+        batches=handler.pipeline.stats.batches,
+        changes=len(change_queue),
+        flush_latency=flush_latency,
+        backpressure_waits=handler.pipeline.stats.backpressure_waits,
+        correct=queued == expected,
+    )
+
+
+def checkout_storm(repo: Path, file_count: int, events_per_file: int) -> Storm:
+    """Rewrite many tracked files (as a checkout does), with several events per file."""
+    files = [repo / "src" / f"pkg_{i % 50}" / f"module_{i}.py" for i in range(file_count)]
+    for path in files:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"VALUE = {path.stem!r}\n")
+
+    def storm(hash_cache: FileHashCache) -> tuple[list[tuple[str, FileSystemEvent]], dict[Path, str | None]]:
+        for path in files:
+            hash_cache.set_hash(path, compute_file_hash(path) or "")
+            path.write_text(f"VALUE = {path.stem!r}  # checked out\n")
+        events: list[tuple[str, FileSystemEvent]] = [
+            ("on_modified", FileModifiedEvent(str(path))) for _ in range(events_per_file) for path in files
+        ]
+        return events, {path: compute_file_hash(path) for path in files}
+
+    return storm
+
+
+def editor_save_storm(repo: Path, saves: int) -> Storm:
+    """Save one file repeatedly; only the last write should be reported."""
+    path = repo / "src" / "edited.py"
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    def storm(hash_cache: FileHashCache) -> tuple[list[tuple[str, FileSystemEvent]], dict[Path, str | None]]:
+        events: list[tuple[str, FileSystemEvent]] = []
+        for index in range(saves):
+            path.write_text(f"REVISION = {index}\n")
+            events.append(("on_modified", FileModifiedEvent(str(path))))
+        return events, {path: compute_file_hash(path)}
+
+    return storm
+
+
+def atomic_save_storm(repo: Path, saves: int) -> Storm:
+    """Save through a temporary file and rename; temporary files must not be reported."""
+    path = repo / "src" / "atomic.py"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("REVISION = -1\n")
+
+    def storm(hash_cache: FileHashCache) -> tuple[list[tuple[str, FileSystemEvent]], dict[Path, str | None]]:
+        hash_cache.set_hash(path, compute_file_hash(path) or "")
+        events: list[tuple[str, FileSystemEvent]] = []
+        for index in range(saves):
+            temp = path.with_name(f".atomic.py.{index}.tmp")
+            temp.write_text(f"REVISION = {index}\n")
+            events.append(("on_created", FileCreatedEvent(str(temp))))
+            temp.replace(path)
+            events.append(("on_moved", FileMovedEvent(str(temp), str(path))))
+        return events, {path: compute_file_hash(path)}
+
+    return storm
+
+
+def delete_storm(repo: Path, file_count: int) -> Storm:
+    """Delete tracked files."""
+    files = [repo / "gone" / f"file_{i}.py" for i in range(file_count)]
+    for path in files:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("X = 1\n")
+
+    def storm(hash_cache: FileHashCache) -> tuple[list[tuple[str, FileSystemEvent]], dict[Path, str | None]]:
+        for path in files:
+            hash_cache.set_hash(path, compute_file_hash(path) or "")
+            path.unlink()
+        return [("on_deleted", FileDeletedEvent(str(path))) for path in files], dict.fromkeys(files)
+
+    return storm
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stress benchmark for the watch event pipeline")
+    parser.add_argument("--files", type=int, default=10_000, help="Files touched by the checkout storm")
+    parser.add_argument("--events-per-file", type=int, default=3, help="Events per file in the checkout storm")
+    parser.add_argument("--saves", type=int, default=200, help="Saves in the editor storms")
+    parser.add_argument("--debounce", type=float, default=0.2, help="Trailing-edge debounce interval (seconds)")
+    parser.add_argument("--workers", type=int, default=4, help="Hashing pool size")
+    parser.add_argument("--max-pending", type=int, default=50_000, help="Pending path limit (backpressure)")
+    parser.add_argument(
+        "--scenarios",
+        default="checkout,editor-save,atomic-save,delete,overflow",
+        help="Comma-separated scenarios to run",
+    )
+    args = parser.parse_args()
+    selected = [name.strip() for name in args.scenarios.split(",")]
+
+    results: list[ScenarioResult] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp).resolve()
+        scenarios: dict[str, tuple[Callable[[Path], Storm], int]] = {
+            "checkout": (lambda repo: checkout_storm(repo, args.files, args.events_per_file), args.max_pending),
+            "editor-save": (lambda repo: editor_save_storm(repo, args.saves), args.max_pending),
+            "atomic-save": (lambda repo: atomic_save_storm(repo, args.saves), args.max_pending),
+            "delete": (lambda repo: delete_storm(repo, min(args.files, 2_000)), args.max_pending),
+            "overflow": (lambda repo: checkout_storm(repo, min(args.files, 5_000), 1), 500),
+        }
+        for name in selected:
+            if name not in scenarios:
+                console.print(f"[yellow]Unknown scenario: {name}[/yellow]")
+                continue
+            make_storm, max_pending = scenarios[name]
+            repo = root / name
+            repo.mkdir()
+            results.append(replay(name, repo, make_storm(repo), args, max_pending))
+
+    table = Table(title=f"Watch event pipeline (debounce {args.debounce}s, {args.workers} hash workers)")
+    table.add_column("Scenario", style="cyan")
+    table.add_column("Events", justify="right")
+    table.add_column("Dispatch µs/event", justify="right")
+    table.add_column("Batches", justify="right")
+    table.add_column("Changes", justify="right")
+    table.add_column("Flush latency", justify="right")
+    table.add_column("Backpressure", justify="right")
+    table.add_column("Correct", justify="center")
+    for result in results:
+        table.add_row(
+            result.name,
+            str(result.events),
+            f"{result.dispatch_seconds / max(1, result.events) * 1e6:.1f}",
+            str(result.batches),
+            str(result.changes),
+            f"{result.flush_latency * 1000:.0f} ms",
+            str(result.backpressure_waits),
+            "✓" if result.correct else "✗",
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Micro-benchmark for YAML loading: ruamel.yaml round-trip vs. the fast (libyaml) path.
+
+Parses the YAML files of real project bundles (`.specfact/projects/<bundle>/`,
+manifest, aspects and features) with both loaders used by
+`load_structured_file` and reports, per loader, the median total parse time,
+throughput and time per file, plus the time to validate the parsed features
+into `Feature` models. Both loaders must produce the same data; files that
+parse differently are listed and make the benchmark exit non-zero.
+
+Without bundles in the repository, pass `--bundle` to point at one, or
+`--generate N` to benchmark a synthetic bundle with N features.
+
+Usage:
+    python tools/benchmark_yaml_loading.py
+    python tools/benchmark_yaml_loading.py --repo ../my-project --runs 5
+    python tools/benchmark_yaml_loading.py --bundle .specfact/projects/legacy-api
+    python tools/benchmark_yaml_loading.py --generate 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+from rich.table import Table
+
+from specfact_cli.models.plan import Feature, Product, Story
+from specfact_cli.models.project import BundleManifest, BundleVersions, ProjectBundle
+from specfact_cli.utils.structured_io import load_structured_file
+from specfact_cli.utils.yaml_utils import LIBYAML_AVAILABLE
+
+
+console = Console()
+
+
+@dataclass
+class LoaderResult:
+    """Measurements for one loader over all benchmarked files."""
+
+    name: str
+    parse_seconds: list[float] = field(default_factory=list)
+    validate_seconds: list[float] = field(default_factory=list)
+
+    @property
+    def median_parse(self) -> float:
+        return statistics.median(self.parse_seconds)
+
+    @property
+    def median_validate(self) -> float:
+        return statistics.median(self.validate_seconds)
+
+
+def find_bundle_files(bundle_dirs: list[Path]) -> list[Path]:
+    """Collect the YAML files of the given bundle directories (manifest and aspects first)."""
+    files: list[Path] = []
+    for bundle_dir in bundle_dirs:
+        files.extend(sorted(bundle_dir.glob("*.yaml")))
+        files.extend(sorted((bundle_dir / "features").glob("*.yaml")))
+    return files
+
+
+def generate_bundle(root: Path, feature_count: int) -> Path:
+    """Write a synthetic bundle with realistic feature files and return its directory."""
+    bundle_dir = root / ".specfact" / "projects" / "synthetic"
+    bundle = ProjectBundle(
+        manifest=BundleManifest(
+            versions=BundleVersions(schema="1.0", project="0.1.0"), schema_metadata=None, project_metadata=None
+        ),
+        bundle_name="synthetic",
+        product=Product(themes=["core", "api"], releases=[]),
+        features={},
+    )
+    for index in range(feature_count):
+        stories = [
+            Story(
+                key=f"STORY-{index}-{story}",
+                title=f"As a user I want capability {index}.{story}",
+                acceptance=[f"Given state {step} When action Then outcome {step}" for step in range(4)],
+                tasks=[f"src/module_{index}.py::task_{task}" for task in range(3)],
+                story_points=3,
+                value_points=5,
+                scenarios={"primary": ["Given a", "When b", "Then c"], "edge": ["Given d", "Then e"]},
+            )
+            for story in range(4)
+        ]
+        bundle.add_feature(
+            Feature(
+                key=f"FEATURE-{index:04d}",
+                title=f"Feature {index}",
+                outcomes=[f"Outcome {index}-{outcome}" for outcome in range(3)],
+                acceptance=["Feature works end to end"],
+                stories=stories,
+                confidence=0.8,
+                source_tracking=None,
+                contract=None,
+                protocol=None,
+            )
+        )
+    bundle.save_to_directory(bundle_dir)
+    return bundle_dir
+
+
+def run_loader(files: list[Path], round_trip: bool) -> tuple[float, float, list[Any]]:
+    """Parse all files with one loader; return parse time, feature validation time and the parsed data."""
+    started = time.perf_counter()
+    parsed = [load_structured_file(path, round_trip=round_trip) for path in files]
+    parse_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for path, data in zip(files, parsed, strict=True):
+        if path.parent.name == "features":
+            Feature.model_validate(data)
+    return parse_seconds, time.perf_counter() - started, parsed
+
+
+def to_plain(value: Any) -> Any:
+    """Convert ruamel.yaml's commented containers and scalar subclasses to plain Python values."""
+    if isinstance(value, dict):
+        return {key: to_plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_plain(item) for item in value]
+    for plain_type in (bool, int, float, str):
+        if isinstance(value, plain_type):
+            return plain_type(value)
+    return value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmark for round-trip vs. fast YAML loading")
+    parser.add_argument("--repo", type=Path, default=Path("."), help="Repository whose bundles are benchmarked")
+    parser.add_argument("--bundle", type=Path, action="append", help="Bundle directory (repeatable)")
+    parser.add_argument("--generate", type=int, default=0, help="Benchmark a synthetic bundle with N features")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per loader (median is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.generate:
+            console.print(f"Generating a synthetic bundle with {args.generate} features...")
+            bundle_dirs = [generate_bundle(Path(tmp), args.generate)]
+        elif args.bundle:
+            bundle_dirs = args.bundle
+        else:
+            projects_dir = args.repo / ".specfact" / "projects"
+            bundle_dirs = sorted(path for path in projects_dir.glob("*") if (path / "bundle.manifest.yaml").exists())
+        files = find_bundle_files(bundle_dirs)
+        if not files:
+            console.print("[red]No bundle YAML files found; pass --bundle or --generate N[/red]")
+            sys.exit(2)
+
+        results = [LoaderResult("round-trip (ruamel.yaml)"), LoaderResult("fast (PyYAML)")]
+        parsed_by_loader: list[list[Any]] = []
+        for result, round_trip in zip(results, (True, False), strict=True):
+            parsed: list[Any] = []
+            for _ in range(args.runs):
+                parse_seconds, validate_seconds, parsed = run_loader(files, round_trip)
+                result.parse_seconds.append(parse_seconds)
+                result.validate_seconds.append(validate_seconds)
+            parsed_by_loader.append(parsed)
+
+        total_bytes = sum(path.stat().st_size for path in files)
+        mismatches = [
+            path
+            for path, round_trip_data, fast_data in zip(files, *parsed_by_loader, strict=True)
+            if to_plain(round_trip_data) != fast_data
+        ]
+
+        backend = "libyaml" if LIBYAML_AVAILABLE else "pure Python (libyaml not available)"
+        title = f"YAML loading: {len(files)} files, {total_bytes / 1024:.0f} KiB (median of {args.runs} runs)"
+        table = Table(title=title)
+        table.add_column("Loader", style="cyan")
+        table.add_column("Parse", justify="right")
+        table.add_column("Per file", justify="right")
+        table.add_column("Throughput", justify="right")
+        table.add_column("Feature validation", justify="right")
+        table.add_column("Speedup", justify="right")
+        baseline = results[0].median_parse
+        for result in results:
+            table.add_row(
+                result.name,
+                f"{result.median_parse * 1000:.0f} ms",
+                f"{result.median_parse / len(files) * 1000:.2f} ms",
+                f"{total_bytes / 1024 / 1024 / result.median_parse:.1f} MiB/s",
+                f"{result.median_validate * 1000:.0f} ms",
+                f"{baseline / result.median_parse:.1f}x",
+            )
+        console.print(table)
+        console.print(f"Fast path backend: {backend}")
+
+    if mismatches:
+        console.print(f"[red]✗ {len(mismatches)} file(s) parse differently with the fast loader:[/red]")
+        for path in mismatches[:20]:
+            console.print(f"  {path}")
+        sys.exit(1)
+    console.print("[green]✓ Both loaders produce the same data[/green]")
+
+
+if __name__ == "__main__":
+    main()